@@ -17,6 +17,7 @@ from elastica.boundary_conditions import (
     GeneralConstraint,
     FixedConstraint,
     HelicalBucklingBC,
+    PrescribedMotion,
 )
 from elastica.external_forces import (
     NoForces,
@@ -31,6 +32,8 @@ from elastica.interaction import (
     AnisotropicFrictionalPlane,
     InteractionPlane,
     SlenderBodyTheory,
+    RegularizedStokesletForces,
+    GriddedFlowForces,
 )
 from elastica.joint import (
     FreeJoint,
@@ -47,7 +50,22 @@ from elastica.contact_forces import (
     RodPlaneContactWithAnisotropicFriction,
     CylinderPlaneContact,
 )
-from elastica.callback_functions import CallBackBaseClass, ExportCallBack, MyCallBack
+from elastica.callback_functions import (
+    CallBackBaseClass,
+    ExportCallBack,
+    MyCallBack,
+    RecorderCallBack,
+    MemoryBlockSnapshotCallBack,
+    EventRecorderCallBack,
+    TrajectoryCallBack,
+)
+from elastica.event_triggers import (
+    TriggerBase,
+    NodalSpeedTrigger,
+    KineticEnergyChangeTrigger,
+    RegionTrigger,
+    PlanePenetrationTrigger,
+)
 from elastica.dissipation import (
     DamperBase,
     AnalyticalLinearDamper,
@@ -60,6 +78,7 @@ from elastica.modules.constraints import Constraints
 from elastica.modules.forcing import Forcing
 from elastica.modules.damping import Damping
 from elastica.modules.contact import Contact
+from elastica.modules.sleeping import Sleeping
 
 from elastica.transformations import inv_skew_symmetrize
 from elastica.transformations import rotate
@@ -80,4 +99,14 @@ from elastica.timestepper import (
 from elastica.timestepper.symplectic_steppers import PositionVerlet, PEFRL
 from elastica.memory_block.memory_block_rigid_body import MemoryBlockRigidBody
 from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
-from elastica.restart import save_state, load_state
+from elastica.restart import (
+    save_state,
+    load_state,
+    save_checkpoint,
+    load_checkpoint,
+    Checkpointer,
+    save_simulator,
+    load_simulator,
+)
+from elastica.trajectory import TrajectoryReader, TrajectoryWriter
+from elastica.compression import TrajectoryCompression, decompress
@@ -85,12 +85,37 @@ def _trapezoidal_for_block_structure(
     User should use this function with extreme care, since this function is rewritten for
     block structure.
 
+    """
+    temp_collection = np.empty((3, array_collection.shape[1] + 1))
+    _trapezoidal_for_block_structure_into(array_collection, ghost_idx, temp_collection)
+    return temp_collection
+
+
+@njit(cache=True)  # type: ignore
+def _trapezoidal_for_block_structure_into(
+    array_collection: NDArray[np.float64],
+    ghost_idx: NDArray[np.int32],
+    temp_collection: NDArray[np.float64],
+) -> None:
+    """
+    Same as _trapezoidal_for_block_structure, but writes the result into the given
+    array instead of allocating it.
+
+    Parameters
+    ----------
+    array_collection : numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type. Its ghosts are
+        reset.
+    ghost_idx : numpy.ndarray
+        1D (n_ghost) array containing data with 'int' type.
+    temp_collection : numpy.ndarray
+        2D (dim, blocksize+1) array into which the result is written.
+
     """
 
     _reset_vector_ghost(array_collection, ghost_idx)
 
     blocksize = array_collection.shape[1]
-    temp_collection = np.empty((3, blocksize + 1))
 
     temp_collection[0, 0] = 0.5 * array_collection[0, 0]
     temp_collection[1, 0] = 0.5 * array_collection[1, 0]
@@ -106,8 +131,6 @@ def _trapezoidal_for_block_structure(
                 array_collection[i, k] + array_collection[i, k - 1]
             )
 
-    return temp_collection
-
 
 @njit(cache=True)  # type: ignore
 def _two_point_difference(
@@ -183,12 +206,39 @@ def _two_point_difference_for_block_structure(
     User should use this function with extreme care, since this function is rewritten for
     block structure.
 
+    """
+    temp_collection = np.empty((3, array_collection.shape[1] + 1))
+    _two_point_difference_for_block_structure_into(
+        array_collection, ghost_idx, temp_collection
+    )
+    return temp_collection
+
+
+@njit(cache=True)  # type: ignore
+def _two_point_difference_for_block_structure_into(
+    array_collection: NDArray[np.float64],
+    ghost_idx: NDArray[np.int32],
+    temp_collection: NDArray[np.float64],
+) -> None:
+    """
+    Same as _two_point_difference_for_block_structure, but writes the result into
+    the given array instead of allocating it.
+
+    Parameters
+    ----------
+    array_collection : numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type. Its ghosts are
+        reset.
+    ghost_idx : numpy.ndarray
+        1D (n_ghost) array containing data with 'int' type.
+    temp_collection : numpy.ndarray
+        2D (dim, blocksize+1) array into which the result is written.
+
     """
 
     _reset_vector_ghost(array_collection, ghost_idx)
 
     blocksize = array_collection.shape[1]
-    temp_collection = np.empty((3, blocksize + 1))
 
     temp_collection[0, 0] = array_collection[0, 0]
     temp_collection[1, 0] = array_collection[1, 0]
@@ -202,8 +252,6 @@ def _two_point_difference_for_block_structure(
         for k in range(1, blocksize):
             temp_collection[i, k] = array_collection[i, k] - array_collection[i, k - 1]
 
-    return temp_collection
-
 
 @njit(cache=True)  # type: ignore
 def _difference(vector: NDArray[np.float64]) -> NDArray[np.float64]:
@@ -334,3 +382,7 @@ quadrature_kernel = _trapezoidal
 difference_kernel = _two_point_difference
 quadrature_kernel_for_block_structure = _trapezoidal_for_block_structure
 difference_kernel_for_block_structure = _two_point_difference_for_block_structure
+quadrature_kernel_for_block_structure_into = _trapezoidal_for_block_structure_into
+difference_kernel_for_block_structure_into = (
+    _two_point_difference_for_block_structure_into
+)
@@ -80,6 +80,61 @@ def _rotate(
     )
 
 
+@njit(cache=True)  # type: ignore
+def _rotate_into(
+    director_collection: NDArray[np.float64],
+    scale: np.float64,
+    axis_collection: NDArray[np.float64],
+) -> None:
+    """
+    Same as _rotate, but rotates the directors in place, element by element,
+    instead of allocating the rotation matrices and the rotated directors.
+
+    Parameters
+    ----------
+    director_collection : The collection of frames/directors at every element,
+    numpy.ndarray of shape (dim, dim, n), which is rotated in place
+    scale
+    axis_collection : numpy.ndarray of shape (dim, n)
+
+    """
+    blocksize = axis_collection.shape[1]
+
+    for k in range(blocksize):
+        v0 = axis_collection[0, k]
+        v1 = axis_collection[1, k]
+        v2 = axis_collection[2, k]
+
+        theta = sqrt(v0 * v0 + v1 * v1 + v2 * v2)
+
+        v0 /= theta + 1e-14
+        v1 /= theta + 1e-14
+        v2 /= theta + 1e-14
+
+        theta *= scale
+        u_prefix = sin(theta)
+        u_sq_prefix = 1.0 - cos(theta)
+
+        r00 = 1.0 - u_sq_prefix * (v1 * v1 + v2 * v2)
+        r11 = 1.0 - u_sq_prefix * (v0 * v0 + v2 * v2)
+        r22 = 1.0 - u_sq_prefix * (v0 * v0 + v1 * v1)
+
+        r01 = u_prefix * v2 + u_sq_prefix * v0 * v1
+        r10 = -u_prefix * v2 + u_sq_prefix * v0 * v1
+        r02 = -u_prefix * v1 + u_sq_prefix * v0 * v2
+        r20 = u_prefix * v1 + u_sq_prefix * v0 * v2
+        r12 = u_prefix * v0 + u_sq_prefix * v1 * v2
+        r21 = -u_prefix * v0 + u_sq_prefix * v1 * v2
+
+        for m in range(3):
+            q0 = director_collection[0, m, k]
+            q1 = director_collection[1, m, k]
+            q2 = director_collection[2, m, k]
+            director_collection[0, m, k] = r00 * q0 + r01 * q1 + r02 * q2
+            director_collection[1, m, k] = r10 * q0 + r11 * q1 + r12 * q2
+            director_collection[2, m, k] = r20 * q0 + r21 * q1 + r22 * q2
+
+
 @njit(cache=True)  # type: ignore
 def _inv_rotate(director_collection: NDArray[np.float64]) -> NDArray[np.float64]:
     """
@@ -99,9 +154,29 @@ def _inv_rotate(director_collection: NDArray[np.float64]) -> NDArray[np.float64]
     ----
     TODO: Benchmark missing
 
+    """
+    vector_collection = np.empty((3, director_collection.shape[2] - 1))
+    _inv_rotate_into(director_collection, vector_collection)
+    return vector_collection
+
+
+@njit(cache=True)  # type: ignore
+def _inv_rotate_into(
+    director_collection: NDArray[np.float64], vector_collection: NDArray[np.float64]
+) -> None:
+    """
+    Same as _inv_rotate, but writes the axes into the given array instead of
+    allocating it.
+
+    Parameters
+    ----------
+    director_collection : The collection of frames/directors at every element,
+    numpy.ndarray of shape (dim, dim, n)
+    vector_collection : numpy.ndarray of shape (dim, n-1), into which the axes
+    around which the body rotates are written
+
     """
     blocksize = director_collection.shape[2] - 1
-    vector_collection = np.empty((3, blocksize))
 
     for k in range(blocksize):
         # Q_{i+i}Q^T_{i} collection
@@ -164,8 +239,6 @@ def _inv_rotate(director_collection: NDArray[np.float64]) -> NDArray[np.float64]
         vector_collection[1, k] *= magnitude
         vector_collection[2, k] *= magnitude
 
-    return vector_collection
-
 
 _generate_skew_map_sentinel = (0, 0, 0)
 
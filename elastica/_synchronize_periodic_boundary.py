@@ -12,7 +12,7 @@ from elastica.typing import RodType
 
 @njit(cache=True)  # type: ignore
 def _synchronize_periodic_boundary_of_vector_collection(
-    input_array: NDArray[np.float64], periodic_idx: NDArray[np.float64]
+    input_array: NDArray[np.float64], periodic_idx: NDArray[np.int32]
 ) -> None:
     """
     This function synchronizes the periodic boundaries of a vector collection.
@@ -21,7 +21,7 @@ def _synchronize_periodic_boundary_of_vector_collection(
     input_array : numpy.ndarray
         2D (dim, blocksize) array containing data with 'float' type. Vector that is going to be synched.
     periodic_idx : numpy.ndarray
-        2D (2, n_periodic_boundary) array containing data with 'float' type. Vector containing periodic boundary
+        2D (2, n_periodic_boundary) array containing data with 'int' type. Vector containing periodic boundary
         index. First dimension is the periodic boundary index, second dimension is the referenced cell index.
 
     Returns
@@ -35,7 +35,7 @@ def _synchronize_periodic_boundary_of_vector_collection(
 
 @njit(cache=True)  # type: ignore
 def _synchronize_periodic_boundary_of_matrix_collection(
-    input_array: NDArray[np.float64], periodic_idx: NDArray[np.float64]
+    input_array: NDArray[np.float64], periodic_idx: NDArray[np.int32]
 ) -> None:
     """
     This function synchronizes the periodic boundaries of a matrix collection.
@@ -44,7 +44,7 @@ def _synchronize_periodic_boundary_of_matrix_collection(
     input_array : numpy.ndarray
         2D (dim, dim, blocksize) array containing data with 'float' type. Matrix collection that is going to be synched.
     periodic_idx : numpy.ndarray
-        2D (2, n_periodic_boundary) array containing data with 'float' type. Vector containing periodic boundary
+        2D (2, n_periodic_boundary) array containing data with 'int' type. Vector containing periodic boundary
         index. First dimension is the periodic boundary index, second dimension is the referenced cell index.
 
     Returns
@@ -61,7 +61,7 @@ def _synchronize_periodic_boundary_of_matrix_collection(
 
 @njit(cache=True)  # type: ignore
 def _synchronize_periodic_boundary_of_scalar_collection(
-    input_array: NDArray[np.float64], periodic_idx: NDArray[np.float64]
+    input_array: NDArray[np.float64], periodic_idx: NDArray[np.int32]
 ) -> None:
     """
     This function synchronizes the periodic boundaries of a scalar collection.
@@ -71,7 +71,7 @@ def _synchronize_periodic_boundary_of_scalar_collection(
     input_array : numpy.ndarray
         2D (dim, dim, blocksize) array containing data with 'float' type. Scalar collection that is going to be synched.
     periodic_idx : numpy.ndarray
-        2D (2, n_periodic_boundary) array containing data with 'float' type. Vector containing periodic boundary
+        2D (2, n_periodic_boundary) array containing data with 'int' type. Vector containing periodic boundary
         index. First dimension is the periodic boundary index, second dimension is the referenced cell index.
 
     Returns
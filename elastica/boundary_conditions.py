@@ -1,6 +1,6 @@
 __doc__ = """ Built-in boundary condition implementationss """
 
-from typing import Any, Optional, TypeVar, Generic
+from typing import Any, Optional, TypeVar, Generic, TypeAlias, cast
 
 import numpy as np
 from numpy.typing import NDArray
@@ -10,10 +10,10 @@ from abc import ABC, abstractmethod
 from numba import njit
 
 from elastica._linalg import _batch_matvec, _batch_matrix_transpose
-from elastica._rotations import _get_rotation_matrix
+from elastica._rotations import _get_rotation_matrix, _inv_rotate, _rotate
+from elastica.rod.cosserat_rod import _compute_all_dilatations
 from elastica.typing import SystemType, RodType, RigidBodyType, ConstrainingIndex
 
-
 S = TypeVar("S")
 
 
@@ -771,3 +771,497 @@ class HelicalBucklingBC(ConstraintBase):
 
             system.velocity_collection[..., -1] = -self.shrink_vel
             system.omega_collection[..., -1] = -self.ang_vel
+
+
+class PrescribedMotion(ConstraintBase):
+    """
+    This boundary condition class drives all the nodes and elements of a rod or
+    rigid body along a trajectory, e.g. recorded from an actuator. The positions
+    and directors are interpolated between the frames of the trajectory,
+    linearly for positions and along the rotation between consecutive frames for
+    directors, and the velocities and angular velocities are their rates between
+    the frames. Before the first frame and after the last frame, the system stays
+    at rest at the first or last frame.
+
+    The dynamics of the driven system are skipped: its internal forces,
+    accelerations and kinematic updates are not computed by its memory block (see
+    `set_driven`), while it still takes part in contact and connections. The
+    frames can be memory mapped, e.g. loaded by `numpy.load(path, mmap_mode="r")`,
+    so that only the frames in use are read.
+
+    Examples
+    --------
+    How to drive a rod along a recorded trajectory:
+
+    >>> simulator.constrain(rod).using(
+    ...    PrescribedMotion,
+    ...    times=np.load("times.npy"),
+    ...    positions=np.load("positions.npy", mmap_mode="r"),
+    ...    directors=np.load("directors.npy", mmap_mode="r"),
+    ... )
+
+        Attributes
+        ----------
+        times: numpy.ndarray
+            1D (n_frames) array containing data with 'float' type.
+            Times of the frames, increasing.
+        positions: numpy.ndarray
+            3D (n_frames, dim, n_nodes) array containing data with 'float' type.
+            Positions of the nodes at each frame.
+        directors: numpy.ndarray
+            4D (n_frames, dim, dim, n_elems) array containing data with 'float' type.
+            Directors of the elements at each frame.
+    """
+
+    def __init__(
+        self,
+        times: NDArray[np.float64],
+        positions: NDArray[np.float64],
+        directors: NDArray[np.float64],
+        **kwargs: Any,
+    ) -> None:
+        """
+
+        Initialization of the prescribed motion.
+
+        Parameters
+        ----------
+        times : numpy.ndarray
+            1D (n_frames) array containing data with 'float' type.
+            Times of the frames, increasing.
+        positions : numpy.ndarray
+            3D (n_frames, dim, n_nodes) array containing data with 'float' type.
+            Positions of the nodes at each frame.
+        directors : numpy.ndarray
+            4D (n_frames, dim, dim, n_elems) array containing data with 'float' type.
+            Directors of the elements at each frame.
+        """
+        super().__init__(**kwargs)
+        system = self._system
+        self.times = np.asarray(times, dtype=np.float64)
+        n_frames = self.times.shape[0]
+        assert n_frames > 0 and np.all(
+            np.diff(self.times) > 0.0
+        ), "Times of the frames must be increasing."
+        assert positions.shape == (
+            n_frames,
+            3,
+            system.position_collection.shape[1],
+        ), "Positions must be of shape (n_frames, 3, n_nodes) of the system."
+        assert directors.shape == (
+            n_frames,
+            3,
+            3,
+            system.director_collection.shape[2],
+        ), "Directors must be of shape (n_frames, 3, 3, n_elems) of the system."
+        self.positions = positions
+        self.directors = directors
+
+        # Geometry of rods is used by contact, and is updated with their positions.
+        self._update_geometry = hasattr(system, "rest_voronoi_lengths")
+        # Rotation vectors between the frames of the current interval
+        self._rotation_vectors = np.zeros((3, directors.shape[3]))
+        self._rotation_frame = -1
+
+    def _locate(self, time: np.float64) -> tuple[int, np.float64, np.float64]:
+        """
+        Returns the frame before the time, the fraction of the interval to the next
+        frame, and the inverse of the interval, zero out of the trajectory.
+        """
+        times = self.times
+        if time <= times[0]:
+            return 0, np.float64(0.0), np.float64(0.0)
+        if time >= times[-1]:
+            return times.shape[0] - 1, np.float64(0.0), np.float64(0.0)
+        frame = int(np.searchsorted(times, time, side="right")) - 1
+        inv_interval = np.float64(1.0 / (times[frame + 1] - times[frame]))
+        if frame != self._rotation_frame:
+            # Interleave the directors of both frames, so that _inv_rotate computes
+            # the rotation of each element between the frames.
+            n_elems = self._rotation_vectors.shape[1]
+            interleaved_directors = np.empty((3, 3, 2 * n_elems))
+            interleaved_directors[..., 0::2] = self.directors[frame]
+            interleaved_directors[..., 1::2] = self.directors[frame + 1]
+            self._rotation_vectors = np.ascontiguousarray(
+                _inv_rotate(interleaved_directors)[:, 0::2]
+            )
+            self._rotation_frame = frame
+        return frame, np.float64((time - times[frame]) * inv_interval), inv_interval
+
+    def constrain_values(
+        self, system: "RodType | RigidBodyType", time: np.float64
+    ) -> None:
+        frame, fraction, inv_interval = self._locate(time)
+        if inv_interval == 0.0:
+            system.position_collection[...] = self.positions[frame]
+            system.director_collection[...] = self.directors[frame]
+        else:
+            self.nb_interpolate_positions(
+                system.position_collection,
+                np.asarray(self.positions[frame]),
+                np.asarray(self.positions[frame + 1]),
+                fraction,
+            )
+            system.director_collection[...] = _rotate(
+                np.asarray(self.directors[frame]), fraction, self._rotation_vectors
+            )
+
+        if self._update_geometry:
+            rod = cast(RodType, system)
+            _compute_all_dilatations(
+                rod.position_collection,
+                rod.volume,
+                rod.lengths,
+                rod.tangents,
+                rod.radius,
+                rod.dilatation,
+                rod.rest_lengths,
+                rod.rest_voronoi_lengths,
+                rod.voronoi_dilatation,
+            )
+
+    @staticmethod
+    @njit(cache=True)  # type: ignore
+    def nb_interpolate_positions(
+        position_collection: NDArray[np.float64],
+        position_before: NDArray[np.float64],
+        position_after: NDArray[np.float64],
+        fraction: np.float64,
+    ) -> None:
+        """
+        Interpolates linearly the positions between two frames, in place.
+
+        Parameters
+        ----------
+        position_collection : numpy.ndarray
+            2D (dim, n_nodes) array containing data with `float` type.
+        position_before : numpy.ndarray
+            2D (dim, n_nodes) array containing data with `float` type.
+            Positions at the frame before.
+        position_after : numpy.ndarray
+            2D (dim, n_nodes) array containing data with `float` type.
+            Positions at the frame after.
+        fraction : float
+            Fraction of the interval between the frames.
+        """
+        for i in range(3):
+            for k in range(position_collection.shape[1]):
+                position_collection[i, k] = position_before[i, k] + fraction * (
+                    position_after[i, k] - position_before[i, k]
+                )
+
+    def constrain_rates(
+        self, system: "RodType | RigidBodyType", time: np.float64
+    ) -> None:
+        frame, _, inv_interval = self._locate(time)
+        if inv_interval == 0.0:
+            system.velocity_collection[...] = 0.0
+            system.omega_collection[...] = 0.0
+        else:
+            system.velocity_collection[...] = inv_interval * (
+                np.asarray(self.positions[frame + 1])
+                - np.asarray(self.positions[frame])
+            )
+            system.omega_collection[...] = inv_interval * self._rotation_vectors
+
+
+# Constraints that _BlockConstraint gathers. FixedConstraint is a GeneralConstraint.
+_FusedConstraint: TypeAlias = OneEndFixedBC | GeneralConstraint
+
+
+class _BlockConstraint(ConstraintBase):
+    """
+    Fused OneEndFixedBC, FixedConstraint and GeneralConstraint for the rods of a
+    memory block.
+
+    The constrained nodes and elements of all constraints are gathered into block
+    indices, together with their fixed values and constraint selectors, and the whole
+    group is applied with one scatter kernel per stage.
+
+        Attributes
+        ----------
+        position_idx: numpy.ndarray
+            1D (n_positions) array of constrained node indices in the block.
+        fixed_positions: numpy.ndarray
+            2D (dim, n_positions) array containing data with 'float' type.
+        translational_constraint_selector: numpy.ndarray
+            2D (dim, n_positions) array containing data with 'bool' type.
+        fixed_director_idx: numpy.ndarray
+            1D (n_fixed_directors) array of element indices in the block whose
+            directors are fixed.
+        fixed_directors: numpy.ndarray
+            3D (dim, dim, n_fixed_directors) array containing data with 'float' type.
+        director_idx: numpy.ndarray
+            1D (n_directors) array of element indices in the block whose rotational
+            rates are constrained.
+        rotational_constraint_selector: numpy.ndarray
+            2D (dim, n_directors) array containing data with 'bool' type.
+    """
+
+    FUSED_CONSTRAINTS = (OneEndFixedBC, FixedConstraint, GeneralConstraint)
+
+    def __init__(
+        self, constraints: list[tuple[_FusedConstraint, int]], **kwargs: Any
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        constraints : list[tuple[OneEndFixedBC | GeneralConstraint, int]]
+            Constraints of FUSED_CONSTRAINTS type, with the position of their rod in
+            the memory block. Each rod must appear at most once.
+        """
+        super().__init__(**kwargs)
+        self._constraints = constraints
+        self._gather_constraints()
+
+    def _gather_constraints(self) -> None:
+        """
+        Gather the constrained indices, fixed values and selectors of the
+        constraints into block arrays.
+        """
+        block = self._system
+
+        position_idx = []
+        fixed_positions = [np.empty((3, 0))]
+        translational_selector = [np.empty((3, 0), dtype=np.bool_)]
+        fixed_director_idx = []
+        fixed_directors = [np.empty((3, 3, 0))]
+        director_idx = []
+        rotational_selector = [np.empty((3, 0), dtype=np.bool_)]
+
+        # Each OneEndFixedBC constrains a single node and element. These are
+        # gathered separately and stacked at once.
+        one_end_fixed_rods = []
+        one_end_fixed_positions = []
+        one_end_fixed_directors = []
+
+        for constraint, rod_idx in self._constraints:
+            assert type(constraint) in _BlockConstraint.FUSED_CONSTRAINTS
+
+            if isinstance(constraint, OneEndFixedBC):
+                one_end_fixed_rods.append(rod_idx)
+                one_end_fixed_positions.append(constraint.fixed_position_collection)
+                one_end_fixed_directors.append(constraint.fixed_directors_collection)
+                continue
+
+            # FixedConstraint and GeneralConstraint
+            node_start = block.start_idx_in_rod_nodes[rod_idx]
+            elem_start = block.start_idx_in_rod_elems[rod_idx]
+            n_nodes = constraint.system.position_collection.shape[-1]
+            n_elems = constraint.system.director_collection.shape[-1]
+            constrained_position_idx = constraint.constrained_position_idx
+            constrained_director_idx = constraint.constrained_director_idx
+            if constrained_position_idx.size:
+                position_idx.append(node_start + constrained_position_idx % n_nodes)
+                fixed_positions.append(constraint.fixed_positions)
+                translational_selector.append(
+                    np.repeat(
+                        constraint.translational_constraint_selector.astype(np.bool_)[
+                            :, None
+                        ],
+                        constrained_position_idx.size,
+                        axis=1,
+                    )
+                )
+            if constrained_director_idx.size:
+                block_director_idx = elem_start + constrained_director_idx % n_elems
+                if isinstance(constraint, FixedConstraint):
+                    fixed_director_idx.append(block_director_idx)
+                    fixed_directors.append(constraint.fixed_directors)
+                director_idx.append(block_director_idx)
+                rotational_selector.append(
+                    np.repeat(
+                        constraint.rotational_constraint_selector.astype(np.bool_)[
+                            :, None
+                        ],
+                        constrained_director_idx.size,
+                        axis=1,
+                    )
+                )
+
+        if one_end_fixed_rods:
+            n_one_end_fixed = len(one_end_fixed_rods)
+            node_start = block.start_idx_in_rod_nodes[one_end_fixed_rods]
+            elem_start = block.start_idx_in_rod_elems[one_end_fixed_rods]
+            position_idx.append(node_start)
+            fixed_positions.append(np.stack(one_end_fixed_positions, axis=-1))
+            translational_selector.append(np.ones((3, n_one_end_fixed), dtype=np.bool_))
+            fixed_director_idx.append(elem_start)
+            fixed_directors.append(np.stack(one_end_fixed_directors, axis=-1))
+            director_idx.append(elem_start)
+            rotational_selector.append(np.ones((3, n_one_end_fixed), dtype=np.bool_))
+
+        def gather_idx(idx: list[NDArray[np.int64]]) -> NDArray[np.int64]:
+            return np.concatenate([np.empty(0, dtype=np.int64), *idx]).astype(np.int64)
+
+        self.position_idx = gather_idx(position_idx)
+        self.fixed_positions = np.concatenate(fixed_positions, axis=1)
+        self.translational_constraint_selector = np.concatenate(
+            translational_selector, axis=1
+        )
+        self.fixed_director_idx = gather_idx(fixed_director_idx)
+        self.fixed_directors = np.concatenate(fixed_directors, axis=2)
+        self.director_idx = gather_idx(director_idx)
+        self.rotational_constraint_selector = np.concatenate(
+            rotational_selector, axis=1
+        )
+
+    def remove_systems(self, systems: list[Any]) -> bool:
+        """
+        Remove the constraints acting on the given rods, e.g. when the rods are
+        retired from the simulation.
+
+        Parameters
+        ----------
+        systems : list
+            Rods whose constraints are removed.
+
+        Returns
+        -------
+        bool
+            True if constraints on other rods remain.
+        """
+        system_ids = {id(system) for system in systems}
+        constraints = [
+            (constraint, rod_idx)
+            for constraint, rod_idx in self._constraints
+            if id(constraint.system) not in system_ids
+        ]
+        if len(constraints) != len(self._constraints):
+            self._constraints = constraints
+            self._gather_constraints()
+        return bool(self._constraints)
+
+    def constrain_values(self, system: RodType, time: np.float64) -> None:
+        self.nb_constrain_values(
+            system.position_collection,
+            system.director_collection,
+            self.position_idx,
+            self.fixed_positions,
+            self.translational_constraint_selector,
+            self.fixed_director_idx,
+            self.fixed_directors,
+        )
+
+    def constrain_rates(self, system: RodType, time: np.float64) -> None:
+        self.nb_constrain_rates(
+            system.velocity_collection,
+            system.omega_collection,
+            system.director_collection,
+            self.position_idx,
+            self.translational_constraint_selector,
+            self.director_idx,
+            self.rotational_constraint_selector,
+        )
+
+    @staticmethod
+    @njit(cache=True)  # type: ignore
+    def nb_constrain_values(
+        position_collection: NDArray[np.float64],
+        director_collection: NDArray[np.float64],
+        position_idx: NDArray[np.int64],
+        fixed_positions: NDArray[np.float64],
+        translational_constraint_selector: NDArray[np.bool_],
+        fixed_director_idx: NDArray[np.int64],
+        fixed_directors: NDArray[np.float64],
+    ) -> None:
+        """
+        Scatter the fixed positions and directors into the block in numba njit decorator
+
+        Parameters
+        ----------
+        position_collection : numpy.ndarray
+            2D (dim, blocksize) array containing data with `float` type.
+        director_collection : numpy.ndarray
+            3D (dim, dim, blocksize) array containing data with `float` type.
+        position_idx : numpy.ndarray
+            1D array containing the index of constrained nodes.
+        fixed_positions : numpy.ndarray
+            2D (dim, n_positions) array containing data with `float` type.
+        translational_constraint_selector : numpy.ndarray
+            2D (dim, n_positions) array containing data with `bool` type.
+        fixed_director_idx : numpy.ndarray
+            1D array containing the index of elements with fixed directors.
+        fixed_directors : numpy.ndarray
+            3D (dim, dim, n_fixed_directors) array containing data with `float` type.
+        """
+        for i in range(position_idx.size):
+            k = position_idx[i]
+            for d in range(3):
+                if translational_constraint_selector[d, i]:
+                    position_collection[d, k] = fixed_positions[d, i]
+
+        for i in range(fixed_director_idx.size):
+            k = fixed_director_idx[i]
+            for a in range(3):
+                for b in range(3):
+                    director_collection[a, b, k] = fixed_directors[a, b, i]
+
+    @staticmethod
+    @njit(cache=True)  # type: ignore
+    def nb_constrain_rates(
+        velocity_collection: NDArray[np.float64],
+        omega_collection: NDArray[np.float64],
+        director_collection: NDArray[np.float64],
+        position_idx: NDArray[np.int64],
+        translational_constraint_selector: NDArray[np.bool_],
+        director_idx: NDArray[np.int64],
+        rotational_constraint_selector: NDArray[np.bool_],
+    ) -> None:
+        """
+        Remove the constrained rates of the block in numba njit decorator
+
+        Parameters
+        ----------
+        velocity_collection : numpy.ndarray
+            2D (dim, blocksize) array containing data with `float` type.
+        omega_collection : numpy.ndarray
+            2D (dim, blocksize) array containing data with `float` type.
+        director_collection : numpy.ndarray
+            3D (dim, dim, blocksize) array containing data with `float` type.
+        position_idx : numpy.ndarray
+            1D array containing the index of constrained nodes.
+        translational_constraint_selector : numpy.ndarray
+            2D (dim, n_positions) array containing data with `bool` type.
+            Selected translational DoFs are constrained in the inertial frame.
+        director_idx : numpy.ndarray
+            1D array containing the index of constrained elements.
+        rotational_constraint_selector : numpy.ndarray
+            2D (dim, n_directors) array containing data with `bool` type.
+            Selected rotational DoFs are constrained in the inertial frame.
+        """
+        for i in range(position_idx.size):
+            k = position_idx[i]
+            for d in range(3):
+                if translational_constraint_selector[d, i]:
+                    velocity_collection[d, k] = 0.0
+
+        omega_lab_frame = np.empty(3)
+        for i in range(director_idx.size):
+            k = director_idx[i]
+            if (
+                rotational_constraint_selector[0, i]
+                and rotational_constraint_selector[1, i]
+                and rotational_constraint_selector[2, i]
+            ):
+                omega_collection[0, k] = 0.0
+                omega_collection[1, k] = 0.0
+                omega_collection[2, k] = 0.0
+                continue
+
+            # rotate angular velocities to lab frame, remove constrained DoFs,
+            # and rotate back to the local frame
+            for a in range(3):
+                omega_lab_frame[a] = 0.0
+                if not rotational_constraint_selector[a, i]:
+                    for b in range(3):
+                        omega_lab_frame[a] += (
+                            director_collection[b, a, k] * omega_collection[b, k]
+                        )
+            for a in range(3):
+                omega_collection[a, k] = 0.0
+                for b in range(3):
+                    omega_collection[a, k] += (
+                        director_collection[a, b, k] * omega_lab_frame[b]
+                    )
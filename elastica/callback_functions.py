@@ -1,9 +1,13 @@
 __doc__ = """ Module contains callback classes to save simulation data for rod-like objects """
-from typing import Any, Optional, TypeVar, Generic
+from typing import Any, Callable, Optional, TypeVar, Generic
 from elastica.typing import RodType, RigidBodyType, SystemType
+from elastica.trajectory import TrajectoryWriter
+from elastica.compression import TrajectoryCompression
 
 import os
 import sys
+import queue
+import threading
 import numpy as np
 from numpy.typing import NDArray
 import logging
@@ -11,7 +15,6 @@ import logging
 
 from collections import defaultdict
 
-
 T = TypeVar("T")
 
 
@@ -45,6 +48,34 @@ class CallBackBaseClass(Generic[T]):
         """
         pass
 
+    def next_callback_step(self, current_step: int) -> Optional[int]:
+        """
+        Return the first step, not before `current_step`, at which make_callback
+        has to be called, or None if it does not have to be called anymore.
+
+        Callbacks that only act on some steps, e.g. every `step_skip` steps, can
+        override this method. The simulator then keeps these callbacks in a queue
+        ordered by their next step, and calls make_callback only on the steps they
+        are due. Callbacks that do not override this method are called every time
+        step.
+
+        Parameters
+        ----------
+        current_step : int
+            Simulation step.
+
+        Returns
+        -------
+        int | None
+
+        """
+        return current_step
+
+
+def _next_multiple(current_step: int, period: int) -> int:
+    """Smallest multiple of period that is not smaller than current_step."""
+    return -(-current_step // period) * period
+
 
 class MyCallBack(CallBackBaseClass):
     """
@@ -88,6 +119,596 @@ class MyCallBack(CallBackBaseClass):
 
             return
 
+    def next_callback_step(self, current_step: int) -> int:
+        return _next_multiple(current_step, self.sample_every)
+
+    def snapshot_state(self) -> dict[str, int]:
+        """
+        Number of collected values of each parameter, see
+        BaseSystemCollection.snapshot.
+        """
+        return {key: len(values) for key, values in self.callback_params.items()}
+
+    def restore_state(self, state: dict[str, int]) -> None:
+        """
+        Discard the values collected after the snapshot was taken.
+        """
+        for key, values in self.callback_params.items():
+            del values[state.get(key, 0) :]
+
+
+class RecorderCallBack(CallBackBaseClass):
+    """
+    RecorderCallBack records selected fields of a system into preallocated,
+    contiguous buffers of shape (n_samples, *field_shape), e.g. (n_samples, 3, n_nodes)
+    for positions. Samples are copied in place, so no small arrays are created during
+    the simulation and the recorded data is available as NumPy arrays without stacking.
+
+    The buffers are used as a ring buffer. Once `n_samples` samples are recorded, the
+    oldest samples are overwritten, unless a `directory` is given, in which case the
+    full buffers are first spilled to disk as npz files with the same keys as the
+    files written by ExportCallBack.
+
+        Attributes
+        ----------
+        FIELDS: dict
+            Short field names and the system attributes they record. Other attribute
+            names of the system can be used as fields directly.
+        step_skip: int
+            Collect data using make_callback method every step_skip step.
+        n_samples: int
+            Number of samples the buffers can hold.
+        sample_count: int
+            Total number of recorded samples, including overwritten and spilled ones.
+    """
+
+    FIELDS = {
+        "position": "position_collection",
+        "directors": "director_collection",
+        "velocity": "velocity_collection",
+        "omega": "omega_collection",
+    }
+
+    def __init__(
+        self,
+        step_skip: int,
+        n_samples: int,
+        fields: tuple[str, ...] = ("position", "directors", "velocity"),
+        directory: Optional[str] = None,
+        filename: str = "recording",
+    ) -> None:
+        """
+        Parameters
+        ----------
+        step_skip : int
+            Collect data using make_callback method every step_skip step.
+        n_samples : int
+            Expected number of samples. The buffers are preallocated for this number
+            of samples.
+        fields : tuple[str, ...]
+            Recorded fields, either short names in FIELDS or attribute names of the
+            system. Time and step are always recorded.
+        directory : str, optional
+            If given, full buffers are spilled into this directory instead of being
+            overwritten. Files are saved with the name <filename>_<number>.npz.
+        filename : str
+            Name of the spilled files without extension.
+        """
+        assert step_skip > 0, f"step_skip ({step_skip}) must be positive."
+        assert n_samples > 0, f"n_samples ({n_samples}) must be positive."
+        CallBackBaseClass.__init__(self)
+        self.step_skip = step_skip
+        self.n_samples = n_samples
+        self.fields = tuple(fields)
+        self.sample_count = 0
+
+        self.save_path: Optional[str] = None
+        self.file_count = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self.save_path = os.path.join(directory, filename) + "_{:02d}.npz"
+
+        # Buffers of the fields are allocated at the first sample, once their
+        # shapes are known.
+        self._buffers: dict[str, NDArray[Any]] = {
+            "time": np.empty(n_samples, dtype=np.float64),
+            "step": np.empty(n_samples, dtype=np.int64),
+        }
+        self._write_idx = 0
+        self._n_buffered = 0
+
+    def make_callback(
+        self, system: "RodType | RigidBodyType", time: np.float64, current_step: int
+    ) -> None:
+        if current_step % self.step_skip != 0:
+            return
+
+        if self._n_buffered == self.n_samples and self.save_path is not None:
+            self._dump()
+
+        self._record(system, time, current_step)
+
+    def _record(
+        self, system: "RodType | RigidBodyType", time: np.float64, current_step: int
+    ) -> None:
+        """
+        Copy one sample into the buffers, overwriting the oldest sample if they
+        are full.
+        """
+        if len(self._buffers) == 2:
+            for field in self.fields:
+                value = np.asarray(getattr(system, self.FIELDS.get(field, field)))
+                self._buffers[field] = np.empty(
+                    (self.n_samples,) + value.shape, dtype=value.dtype
+                )
+
+        idx = self._write_idx
+        self._buffers["time"][idx] = time
+        self._buffers["step"][idx] = current_step
+        for field in self.fields:
+            self._buffers[field][idx] = getattr(system, self.FIELDS.get(field, field))
+
+        self._write_idx = (idx + 1) % self.n_samples
+        self._n_buffered = min(self._n_buffered + 1, self.n_samples)
+        self.sample_count += 1
+
+    def next_callback_step(self, current_step: int) -> int:
+        return _next_multiple(current_step, self.step_skip)
+
+    def snapshot_state(self) -> tuple[int, ...]:
+        """
+        Position in the buffers, see BaseSystemCollection.snapshot.
+        """
+        return (self._write_idx, self._n_buffered, self.sample_count, self.file_count)
+
+    def restore_state(self, state: tuple[int, ...]) -> None:
+        """
+        Discard the samples recorded after the snapshot was taken. Samples that
+        were overwritten or spilled to disk in the meantime are not recovered.
+        """
+        self._write_idx, self._n_buffered, self.sample_count, self.file_count = state
+
+    def __getitem__(self, field: str) -> NDArray[Any]:
+        """
+        Return the buffered samples of a field in chronological order. Unless the
+        ring buffer has wrapped around, this is a view into the buffer.
+        """
+        buffer = self._buffers[field]
+        if self._n_buffered < self.n_samples or self._write_idx == 0:
+            return buffer[: self._n_buffered]
+        return np.concatenate(
+            (buffer[self._write_idx :], buffer[: self._write_idx]), axis=0
+        )
+
+    @property
+    def data(self) -> dict[str, NDArray[Any]]:
+        """
+        Buffered samples of time, step and all recorded fields.
+        """
+        return {field: self[field] for field in self._buffers}
+
+    def _dump(self) -> None:
+        """
+        Spill buffered samples to a file and empty the buffers.
+        """
+        assert self.save_path is not None
+        data: dict[str, Any] = self.data
+        np.savez(self.save_path.format(self.file_count), **data)
+        self.file_count += 1
+        self._write_idx = 0
+        self._n_buffered = 0
+
+    def get_last_saved_path(self) -> Optional[str]:
+        """
+        Return last spilled file path. If no file has been saved,
+        return None
+        """
+        if self.save_path is None or self.file_count == 0:
+            return None
+        return self.save_path.format(self.file_count - 1)
+
+    def close(self) -> None:
+        """
+        Spill residual samples, if a directory is given.
+        """
+        if self.save_path is not None and self._n_buffered:
+            self._dump()
+
+
+class MemoryBlockSnapshotCallBack(RecorderCallBack):
+    """
+    MemoryBlockSnapshotCallBack records whole memory blocks
+    (MemoryBlockCosseratRod or MemoryBlockRigidBody), copying each contiguous block
+    array in one copy per field instead of one callback per system. The layout of
+    the block (system indices and start and end indices of each system in nodes,
+    elements and voronoi) is stored as `metadata`, and saved with spilled files, so
+    that per-system views are reconstructed at read time with `system_view`.
+
+    Use it with `collect_block_diagnostics` of the simulator, since memory blocks
+    are only created at finalize. When systems are placed in or released from the
+    block, the layout is refreshed: the samples buffered with the previous layout
+    are spilled first, or dropped with a warning if no directory is given.
+
+        Attributes
+        ----------
+        METADATA_KEYS: tuple[str, ...]
+            Keys of the block layout stored in metadata.
+        metadata: dict
+            Layout of the recorded block, available after the first sample and
+            refreshed when the system indices of the block change.
+    """
+
+    METADATA_KEYS = (
+        "system_idx_list",
+        "n_nodes",
+        "n_elems",
+        "n_voronoi",
+        "start_idx_in_rod_nodes",
+        "end_idx_in_rod_nodes",
+        "start_idx_in_rod_elems",
+        "end_idx_in_rod_elems",
+        "start_idx_in_rod_voronoi",
+        "end_idx_in_rod_voronoi",
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Parameters are the same as RecorderCallBack.
+        """
+        super().__init__(*args, **kwargs)
+        self.metadata: dict[str, NDArray[np.int64]] = {}
+
+    def make_callback(
+        self, system: "RodType | RigidBodyType", time: np.float64, current_step: int
+    ) -> None:
+        if current_step % self.step_skip == 0 and self._layout_changed(system):
+            self._refresh_layout(system)
+        super().make_callback(system, time, current_step)
+
+    def _layout_changed(self, block: Any) -> bool:
+        """
+        Checks if systems were placed in or released from the block since the
+        layout was recorded.
+        """
+        return not self.metadata or not np.array_equal(
+            block.system_idx_list, self.metadata["system_idx_list"]
+        )
+
+    def _refresh_layout(self, block: Any) -> None:
+        """
+        Record the layout of the block, once the samples buffered with the previous
+        layout are spilled or dropped.
+        """
+        if self._n_buffered > 0:
+            if self.save_path is not None:
+                self._dump()
+            else:
+                logging.warning(
+                    f"The layout of the recorded memory block changed: "
+                    f"{self._n_buffered} buffered samples of the previous layout "
+                    f"are dropped. Give a directory to spill them instead."
+                )
+                self._write_idx = 0
+                self._n_buffered = 0
+        self.metadata = self._block_layout(block)
+        # Buffers of the fields are allocated again, in case the block was resized.
+        self._buffers = {
+            "time": self._buffers["time"],
+            "step": self._buffers["step"],
+        }
+
+    @staticmethod
+    def _block_layout(block: Any) -> dict[str, NDArray[np.int64]]:
+        """
+        Layout of a memory block. Rigid bodies have one node and one element each.
+        """
+        layout = {"system_idx_list": np.array(block.system_idx_list, dtype=np.int64)}
+        if hasattr(block, "start_idx_in_rod_nodes"):
+            for key in MemoryBlockSnapshotCallBack.METADATA_KEYS[1:]:
+                layout[key] = np.array(getattr(block, key), dtype=np.int64)
+        else:
+            start_idx = np.arange(block.n_elems, dtype=np.int64)
+            layout["n_nodes"] = np.array(block.n_nodes, dtype=np.int64)
+            layout["n_elems"] = np.array(block.n_elems, dtype=np.int64)
+            layout["n_voronoi"] = np.array(0, dtype=np.int64)
+            for domain in ["nodes", "elems", "voronoi"]:
+                layout[f"start_idx_in_rod_{domain}"] = start_idx
+                layout[f"end_idx_in_rod_{domain}"] = start_idx + 1
+        return layout
+
+    @property
+    def data(self) -> dict[str, NDArray[Any]]:
+        """
+        Buffered samples of time, step and all recorded fields, and the block layout.
+        """
+        return {**super().data, **self.metadata}
+
+    def system_view(self, field: str, system_idx: int) -> NDArray[Any]:
+        """
+        Return the buffered samples of a field for one system of the block.
+        """
+        return MemoryBlockSnapshotCallBack.system_view_from(
+            self.data, field, system_idx
+        )
+
+    @staticmethod
+    def system_view_from(
+        data: "dict[str, NDArray[Any]] | Any", field: str, system_idx: int
+    ) -> NDArray[Any]:
+        """
+        Return the samples of a field for one system, given recorded block data,
+        e.g. the `data` of the callback or a spilled npz file loaded with np.load.
+        The domain of the field (nodes, elements or voronoi) is found from the
+        size of its last axis.
+
+        Parameters
+        ----------
+        data : dict | NpzFile
+            Recorded field and layout of the block.
+        field : str
+            Field name.
+        system_idx : int
+            Index of the system in the simulator.
+
+        Returns
+        -------
+        ndarray
+            View of shape (n_samples, ..., n_domain of the system).
+        """
+        values = data[field]
+        (block_idx,) = np.flatnonzero(np.asarray(data["system_idx_list"]) == system_idx)
+        size = values.shape[-1]
+        for domain, n_domain in [
+            ("nodes", "n_nodes"),
+            ("elems", "n_elems"),
+            ("voronoi", "n_voronoi"),
+        ]:
+            if size == int(data[n_domain]):
+                start_idx = int(data[f"start_idx_in_rod_{domain}"][block_idx])
+                end_idx = int(data[f"end_idx_in_rod_{domain}"][block_idx])
+                return values[..., start_idx:end_idx]
+        raise ValueError(
+            f"The field {field} is not defined on nodes, elements or voronoi."
+        )
+
+
+class EventRecorderCallBack(RecorderCallBack):
+    """
+    EventRecorderCallBack records the state of a system only around events, instead
+    of at a fixed rate. A trigger, i.e. a predicate on the state of the system such
+    as the ones in `event_triggers.py`, is evaluated every `step_skip` steps. The
+    latest samples are held in a rolling buffer, so that each recorded event
+    contains the `pre_trigger` samples before the triggering sample, the triggering
+    sample and the `post_trigger` samples after it. If the trigger fires again
+    within the post-trigger window, the window is extended, so overlapping events
+    are merged into one.
+
+    Events are kept in `events`, or saved in a directory as npz files with the same
+    keys as the files written by ExportCallBack, and the step of the first
+    triggering sample in `trigger_step`.
+
+        Attributes
+        ----------
+        trigger: callable
+            Predicate with signature (system, time, current_step) -> bool.
+        pre_trigger: int
+            Number of samples recorded before the triggering sample.
+        post_trigger: int
+            Number of samples recorded after the triggering sample.
+        events: list
+            Recorded events, if no directory is given.
+        event_count: int
+            Number of recorded events.
+    """
+
+    def __init__(
+        self,
+        trigger: Callable[[Any, np.float64, int], bool],
+        pre_trigger: int,
+        post_trigger: int,
+        step_skip: int = 1,
+        fields: tuple[str, ...] = ("position", "directors", "velocity"),
+        directory: Optional[str] = None,
+        filename: str = "event",
+    ) -> None:
+        """
+        Parameters
+        ----------
+        trigger : callable
+            Predicate with signature (system, time, current_step) -> bool, e.g. a
+            trigger from `event_triggers.py`.
+        pre_trigger : int
+            Number of samples recorded before the triggering sample.
+        post_trigger : int
+            Number of samples recorded after the triggering sample.
+        step_skip : int
+            Sample and evaluate the trigger every step_skip step. (default = 1)
+        fields : tuple[str, ...]
+            Recorded fields, either short names in FIELDS or attribute names of the
+            system. Time and step are always recorded.
+        directory : str, optional
+            If given, events are saved into this directory instead of being kept in
+            memory. Files are saved with the name <filename>_<number>.npz.
+        filename : str
+            Name of the saved files without extension.
+        """
+        assert pre_trigger >= 0, f"pre_trigger ({pre_trigger}) must be non-negative."
+        assert post_trigger >= 0, f"post_trigger ({post_trigger}) must be non-negative."
+        super().__init__(
+            step_skip, pre_trigger + 1 + post_trigger, fields, directory, filename
+        )
+        self.trigger = trigger
+        self.pre_trigger = pre_trigger
+        self.post_trigger = post_trigger
+        self.events: list[dict[str, NDArray[Any]]] = []
+        self.event_count = 0
+
+        # Number of samples left in the post-trigger window, or -1 between events.
+        self._remaining_samples = -1
+        self._trigger_step = 0
+        # Samples of events longer than the buffers.
+        self._event_chunks: list[dict[str, NDArray[Any]]] = []
+
+    def make_callback(
+        self, system: "RodType | RigidBodyType", time: np.float64, current_step: int
+    ) -> None:
+        if current_step % self.step_skip != 0:
+            return
+
+        recording = self._remaining_samples >= 0
+        if recording and self._n_buffered == self.n_samples:
+            self._event_chunks.append(
+                {field: buffer.copy() for field, buffer in self.data.items()}
+            )
+            self._write_idx = 0
+            self._n_buffered = 0
+
+        self._record(system, time, current_step)
+
+        if self.trigger(system, time, current_step):
+            if not recording:
+                self._start_event(current_step)
+            self._remaining_samples = self.post_trigger
+        elif recording:
+            self._remaining_samples -= 1
+
+        if self._remaining_samples == 0:
+            self._finish_event()
+
+    def _start_event(self, current_step: int) -> None:
+        """
+        Keep the pre-trigger window and the triggering sample at the beginning of
+        the buffers.
+        """
+        n_kept = min(self._n_buffered, self.pre_trigger + 1)
+        for field, buffer in self._buffers.items():
+            buffer[:n_kept] = self[field][-n_kept:]
+        self._write_idx = n_kept % self.n_samples
+        self._n_buffered = n_kept
+        self._trigger_step = current_step
+
+    def _finish_event(self) -> None:
+        chunks = self._event_chunks + [self.data]
+        event: dict[str, Any] = {
+            field: np.concatenate([chunk[field] for chunk in chunks])
+            for field in self._buffers
+        }
+        event["trigger_step"] = np.array(self._trigger_step, dtype=np.int64)
+        if self.save_path is not None:
+            np.savez(self.save_path.format(self.file_count), **event)
+            self.file_count += 1
+        else:
+            self.events.append(event)
+        self.event_count += 1
+
+        # Samples of the event are not reused in the next pre-trigger window.
+        self._event_chunks = []
+        self._write_idx = 0
+        self._n_buffered = 0
+        self._remaining_samples = -1
+
+    def snapshot_state(self) -> tuple[Any, ...]:
+        """
+        Position in the buffers and in the current event, see
+        BaseSystemCollection.snapshot.
+        """
+        return (
+            super().snapshot_state(),
+            self._remaining_samples,
+            self._trigger_step,
+            len(self._event_chunks),
+            len(self.events),
+            self.event_count,
+            getattr(self.trigger, "snapshot_state", lambda: None)(),
+        )
+
+    def restore_state(self, state: tuple[Any, ...]) -> None:
+        """
+        Discard the samples and events recorded after the snapshot was taken.
+        """
+        recorder_state, self._remaining_samples, self._trigger_step = state[:3]
+        n_chunks, n_events, self.event_count, trigger_state = state[3:]
+        super().restore_state(recorder_state)
+        del self._event_chunks[n_chunks:]
+        del self.events[n_events:]
+        if hasattr(self.trigger, "restore_state"):
+            self.trigger.restore_state(trigger_state)
+
+    def close(self) -> None:
+        """
+        Record an event whose post-trigger window is not complete.
+        """
+        if self._remaining_samples >= 0:
+            self._finish_event()
+
+
+class TrajectoryCallBack(CallBackBaseClass):
+    """
+    TrajectoryCallBack appends selected fields of a system to a chunked,
+    appendable and memory-mappable trajectory (see `elastica.trajectory`),
+    which can be read back with TrajectoryReader.
+
+        Attributes
+        ----------
+        step_skip: int
+            Collect data using make_callback method every step_skip step.
+        fields: tuple[str, ...]
+            Recorded fields, either short names in RecorderCallBack.FIELDS or
+            attribute names of the system. Time and step are always recorded.
+        writer: TrajectoryWriter
+            Writer of the trajectory.
+    """
+
+    def __init__(
+        self,
+        step_skip: int,
+        directory: str,
+        fields: tuple[str, ...] = ("position", "directors", "velocity"),
+        chunk_size: int = 64,
+        append: bool = False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        step_skip : int
+            Collect data using make_callback method every step_skip step.
+        directory : str
+            Directory of the trajectory.
+        fields : tuple[str, ...]
+            Recorded fields.
+        chunk_size : int
+            Number of samples collected in memory before they are written.
+        append : bool
+            If True, samples are appended to an existing trajectory in directory.
+        """
+        assert step_skip > 0, f"step_skip ({step_skip}) must be positive."
+        CallBackBaseClass.__init__(self)
+        self.step_skip = step_skip
+        self.fields = tuple(fields)
+        self.writer = TrajectoryWriter(directory, chunk_size=chunk_size, append=append)
+
+    def make_callback(
+        self, system: "RodType | RigidBodyType", time: np.float64, current_step: int
+    ) -> None:
+        if current_step % self.step_skip == 0:
+            self.writer.append(
+                time=np.float64(time),
+                step=np.int64(current_step),
+                **{
+                    field: getattr(system, RecorderCallBack.FIELDS.get(field, field))
+                    for field in self.fields
+                },
+            )
+
+    def next_callback_step(self, current_step: int) -> int:
+        return _next_multiple(current_step, self.step_skip)
+
+    def close(self) -> None:
+        """
+        Write the remaining samples.
+        """
+        self.writer.close()
+
 
 class ExportCallBack(CallBackBaseClass):
     """
@@ -120,6 +741,9 @@ class ExportCallBack(CallBackBaseClass):
         method: str,
         initial_file_count: int = 0,
         file_save_interval: int = 100_000_000,
+        asynchronous: bool = False,
+        max_queue_size: int = 2,
+        compression: Optional[TrajectoryCompression] = None,
     ) -> None:
         """
         Parameters
@@ -144,6 +768,20 @@ class ExportCallBack(CallBackBaseClass):
         file_save_interval : int
             Interval, in steps, to export/save collected buffer
             as file. (default = 1e8)
+        asynchronous : bool
+            If True, filled buffers are written by a background thread, so
+            the simulation does not wait for the file to be written. Call
+            `close` at the end to flush the remaining buffers and wait for
+            the writes to finish. (default = False)
+        max_queue_size : int
+            Maximum number of filled buffers waiting to be written in
+            asynchronous mode. If the queue is full, the simulation waits
+            until a buffer is written. (default = 2)
+        compression : TrajectoryCompression, optional
+            If given, buffers are encoded before they are written. In
+            asynchronous mode, encoding is done by the background thread.
+            Saved files are decoded with `elastica.compression.decompress`.
+            (default = None)
         """
         # Assertions
         MIN_STEP_SKIP = 100
@@ -154,6 +792,9 @@ class ExportCallBack(CallBackBaseClass):
         assert (
             method in ExportCallBack.AVAILABLE_METHOD
         ), f"The exporting method ({method}) is not supported. Please use one of {ExportCallBack.AVAILABLE_METHOD}."
+        assert (
+            max_queue_size > 0
+        ), f"max_queue_size ({max_queue_size}) must be positive."
 
         # Create directory
         if os.path.exists(directory):
@@ -168,6 +809,7 @@ class ExportCallBack(CallBackBaseClass):
         self.method = method
         self.file_count = initial_file_count
         self.file_save_interval = file_save_interval
+        self.compression = compression
 
         # Data collector
         self.buffer: dict[str, list[NDArray[np.float64] | np.float64 | int]] = (
@@ -194,6 +836,18 @@ class ExportCallBack(CallBackBaseClass):
             self._pickle = pickle
             self._ext = "pkl"
 
+        # Background writer
+        self.asynchronous = asynchronous
+        self._write_error: Optional[BaseException] = None
+        if asynchronous:
+            self._write_queue: queue.Queue[
+                Optional[tuple[str, dict[str, NDArray[Any]]]]
+            ] = queue.Queue(maxsize=max_queue_size)
+            self._writer = threading.Thread(
+                target=self._write_from_queue, name="ExportCallBackWriter", daemon=True
+            )
+            self._writer.start()
+
     def make_callback(
         self, system: "RodType | RigidBodyType", time: np.float64, current_step: int
     ) -> None:
@@ -231,6 +885,14 @@ class ExportCallBack(CallBackBaseClass):
         ):
             self._dump()
 
+    def next_callback_step(self, current_step: int) -> int:
+        # Data is collected every step_skip steps, and the buffer is also
+        # written on the steps before multiples of file_save_interval.
+        return min(
+            _next_multiple(current_step, self.step_skip),
+            _next_multiple(current_step + 1, self.file_save_interval) - 1,
+        )
+
     def _dump(self, **kwargs: Any) -> None:
         """
         Dump dictionary buffer (self.buffer) to a file and clear
@@ -238,6 +900,24 @@ class ExportCallBack(CallBackBaseClass):
         """
         file_path = self.save_path.format(self.file_count, self._ext)
         data = {k: np.array(v) for k, v in self.buffer.items()}
+        if self.asynchronous and self._writer.is_alive():
+            self._raise_write_error()
+            # Blocks while the queue is full, so that at most max_queue_size
+            # buffers are waiting to be written.
+            self._write_queue.put((file_path, data))
+        else:
+            self._write(file_path, data)
+
+        self.file_count += 1
+        self.buffer_size = 0
+        self.buffer.clear()
+
+    def _write(self, file_path: str, data: dict[str, NDArray[Any]]) -> None:
+        """
+        Write data to a file using the export method.
+        """
+        if self.compression is not None:
+            data = self.compression.encode(data)
         if self.method == ExportCallBack.AVAILABLE_METHOD[0]:
             # pickle
             with open(file_path, "wb") as file:
@@ -247,12 +927,44 @@ class ExportCallBack(CallBackBaseClass):
             self._savez(file_path, **data)  # type: ignore
         elif self.method == ExportCallBack.AVAILABLE_METHOD[2]:
             # tempfile
-            file = open(self._tempfile.name, "wb")
-            self._pickle.dump(data, file)
+            with open(self._tempfile.name, "wb") as file:
+                self._pickle.dump(data, file)
 
-        self.file_count += 1
-        self.buffer_size = 0
-        self.buffer.clear()
+    def _write_from_queue(self) -> None:
+        """
+        Background writer loop. Writes queued buffers until None is queued.
+        After a write error, the remaining buffers are discarded and the
+        error is raised on the main thread.
+        """
+        while True:
+            item = self._write_queue.get()
+            try:
+                if item is None:
+                    return
+                if self._write_error is None:
+                    self._write(*item)
+            except BaseException as error:
+                self._write_error = error
+            finally:
+                self._write_queue.task_done()
+
+    def _raise_write_error(self) -> None:
+        """
+        Raise the error of a failed background write on the main thread.
+        """
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise RuntimeError(
+                "ExportCallBack failed to write a buffer in the background."
+            ) from error
+
+    def flush(self) -> None:
+        """
+        Wait until all buffers handed to the background writer are written.
+        """
+        if self.asynchronous:
+            self._write_queue.join()
+            self._raise_write_error()
 
     def get_last_saved_path(self) -> Optional[str]:
         """
@@ -266,10 +978,15 @@ class ExportCallBack(CallBackBaseClass):
 
     def close(self) -> None:
         """
-        Save residual buffer
+        Save residual buffer. In asynchronous mode, also wait for the
+        background writer to finish.
         """
         if self.buffer_size:
             self._dump()
+        if self.asynchronous and self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join()
+        self._raise_write_error()
 
     def clear(self) -> None:
         """
@@ -0,0 +1,410 @@
+__doc__ = """Lossy and lossless compression of recorded trajectories."""
+from typing import Any, Literal, Mapping, Optional
+
+import json
+import time as timer
+import numpy as np
+from numpy.typing import NDArray
+
+from elastica._rotations import _get_rotation_matrix, _inv_rotate
+
+COMPRESSION_KEY = "compression"
+KEYFRAME_SUFFIX = "_keyframe"
+INTEGER_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+# Rotations closer than this angle to pi are not converted with _inv_rotate.
+NEAR_PI_ANGLE = 0.05
+
+
+def directors_to_rotation_vectors(
+    director_collection: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Convert directors to rotation vectors, using the Rodrigues formula in
+    _inv_rotate.
+
+    Parameters
+    ----------
+    director_collection : numpy.ndarray
+        Directors of shape (..., 3, 3, n).
+
+    Returns
+    -------
+    numpy.ndarray
+        Rotation vectors of shape (..., 3, n), such that
+        `_get_rotation_matrix(1.0, rotation_vector)` is the director.
+    """
+    leading_shape = director_collection.shape[:-3]
+    n_elems = director_collection.shape[-1]
+    directors: NDArray[np.float64] = np.moveaxis(
+        director_collection.reshape(-1, 3, 3, n_elems), 0, -2
+    )
+    directors = directors.reshape(3, 3, -1)
+    # _inv_rotate returns the rotation between consecutive directors, hence each
+    # director is preceded by the identity.
+    paired_directors = np.empty((3, 3, 2 * directors.shape[2]))
+    paired_directors[:, :, 0::2] = np.eye(3)[:, :, np.newaxis]
+    paired_directors[:, :, 1::2] = directors
+    rotation_vectors = _inv_rotate(paired_directors)[:, 0::2]
+
+    # The angle in _inv_rotate comes from the trace, which is ill-conditioned near
+    # pi, so that the slight non-orthogonality of simulated directors leads to large
+    # errors. Near pi, the axis is found from the symmetric part instead.
+    cos_angle = 0.5 * (np.einsum("iik->k", directors) - 1.0)
+    near_pi = np.flatnonzero(cos_angle < np.cos(np.pi - NEAR_PI_ANGLE))
+    if near_pi.size:
+        rotation_vectors[:, near_pi] = _rotation_vectors_near_pi(
+            directors[:, :, near_pi]
+        )
+
+    rotation_vectors = np.moveaxis(rotation_vectors.reshape(3, -1, n_elems), 1, 0)
+    return rotation_vectors.reshape(*leading_shape, 3, n_elems)
+
+
+def _rotation_vectors_near_pi(
+    directors: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Rotation vectors of directors of shape (3, 3, n), for rotation angles near pi.
+    """
+    # Director is I - sin(angle) [n]x + (1 - cos(angle)) [n]x^2 for the axis n.
+    skew = 0.5 * np.array(
+        [
+            directors[2, 1] - directors[1, 2],
+            directors[0, 2] - directors[2, 0],
+            directors[1, 0] - directors[0, 1],
+        ]
+    )
+    cos_angle = 0.5 * (np.einsum("iik->k", directors) - 1.0)
+    angle = np.arctan2(np.linalg.norm(skew, axis=0), cos_angle)
+    # n n^T = (sym(director) - cos(angle) I) / (1 - cos(angle))
+    outer = 0.5 * (directors + directors.transpose(1, 0, 2))
+    outer -= cos_angle * np.eye(3)[:, :, np.newaxis]
+    outer /= 1.0 - cos_angle
+    column = np.argmax(np.einsum("iik->ik", outer), axis=0)
+    elems = np.arange(directors.shape[2])
+    axis = outer[:, column, elems] / np.sqrt(outer[column, column, elems])
+    axis *= np.where(np.einsum("ik,ik->k", axis, skew) < 0.0, -1.0, 1.0)
+    return -axis * angle
+
+
+def rotation_vectors_to_directors(
+    rotation_vectors: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Convert rotation vectors of shape (..., 3, n) to directors of shape
+    (..., 3, 3, n), using _get_rotation_matrix.
+    """
+    leading_shape = rotation_vectors.shape[:-2]
+    n_elems = rotation_vectors.shape[-1]
+    vectors = np.moveaxis(rotation_vectors.reshape(-1, 3, n_elems), 0, -2)
+    directors = _get_rotation_matrix(
+        np.float64(1.0), np.ascontiguousarray(vectors.reshape(3, -1))
+    )
+    directors = np.moveaxis(directors.reshape(3, 3, -1, n_elems), 2, 0)
+    return directors.reshape(*leading_shape, 3, 3, n_elems)
+
+
+def directors_to_quaternions(
+    director_collection: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Convert directors of shape (..., 3, 3, n) to unit quaternions of shape
+    (..., 4, n), stored as (w, x, y, z) with w >= 0.
+    """
+    rotation_vectors = directors_to_rotation_vectors(director_collection)
+    angle = np.linalg.norm(rotation_vectors, axis=-2, keepdims=True)
+    # sin(angle / 2) / angle, continuous at zero angle
+    scale = 0.5 * np.sinc(angle / (2.0 * np.pi))
+    return np.concatenate((np.cos(0.5 * angle), scale * rotation_vectors), axis=-2)
+
+
+def quaternions_to_directors(
+    quaternions: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Convert quaternions of shape (..., 4, n), stored as (w, x, y, z), to
+    directors of shape (..., 3, 3, n). Quaternions do not need to be normalized.
+    """
+    w = quaternions[..., :1, :]
+    xyz = quaternions[..., 1:, :]
+    sin_half_angle = np.linalg.norm(xyz, axis=-2, keepdims=True)
+    angle = 2.0 * np.arctan2(sin_half_angle, w)
+    rotation_vectors = xyz * (angle / np.maximum(sin_half_angle, 1e-300))
+    return rotation_vectors_to_directors(rotation_vectors)
+
+
+def _narrowest_integer(values: NDArray[np.int64]) -> NDArray[np.integer]:
+    """
+    Cast integers to the narrowest integer dtype holding all values.
+    """
+    if values.size == 0:
+        return values.astype(np.int8)
+    low, high = values.min(), values.max()
+    for dtype in INTEGER_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return values.astype(dtype)
+    return values
+
+
+class TrajectoryCompression:
+    """
+    Compression of recorded trajectories, i.e. dictionaries of arrays whose first
+    axis is the sample, as collected by ExportCallBack. Time, step and non-float
+    entries are kept as they are. Other fields are encoded as follows:
+
+    1. Spatial decimation keeps every `node_stride`-th entry of the last axis
+       (nodes or elements).
+    2. The directors field is converted to rotation vectors or quaternions.
+    3. Values are quantized, either to float16 (relative error of at most
+       2**-11, absolute error of at most 2**-25 for values below 2**-14) or to
+       fixed-point integers with an absolute error of at most `tolerance`.
+       Fixed-point integers are stored with the narrowest integer dtype that
+       holds them.
+    4. Fields in `delta_fields` are stored as the first sample (keyframe) and
+       the differences between consecutive samples. Differences are taken after
+       quantization, in integers, or, for float16, against the reconstructed
+       previous sample, so that errors do not accumulate over time.
+
+    The configuration is stored with the encoded data, so `decompress` decodes it
+    without knowing the compression.
+
+        Attributes
+        ----------
+        quantization: str, optional
+            None, "float16" or "fixed_point".
+        tolerance: float
+            Maximum absolute error of fixed-point quantization.
+        directors: str
+            Representation of directors: "matrix", "rotation_vector" or "quaternion".
+        delta_fields: tuple[str, ...]
+            Fields stored with temporal delta encoding.
+        node_stride: int
+            Stride of spatial decimation.
+    """
+
+    def __init__(
+        self,
+        quantization: Optional[Literal["float16", "fixed_point"]] = None,
+        tolerance: float = 1e-6,
+        directors: Literal["matrix", "rotation_vector", "quaternion"] = "matrix",
+        delta_fields: tuple[str, ...] = ("position",),
+        node_stride: int = 1,
+        directors_field: str = "directors",
+    ) -> None:
+        """
+        Parameters
+        ----------
+        quantization : str, optional
+            None for lossless storage, "float16" or "fixed_point".
+        tolerance : float
+            Maximum absolute error of fixed-point quantization. (default = 1e-6)
+        directors : str
+            Representation of the directors field. (default = "matrix")
+        delta_fields : tuple[str, ...]
+            Fields stored with temporal delta encoding, if values are quantized.
+            (default = ("position",))
+        node_stride : int
+            Keep every node_stride-th node or element. (default = 1)
+        directors_field : str
+            Name of the directors field. (default = "directors")
+        """
+        assert quantization in (
+            None,
+            "float16",
+            "fixed_point",
+        ), f"Unknown quantization ({quantization})."
+        assert directors in (
+            "matrix",
+            "rotation_vector",
+            "quaternion",
+        ), f"Unknown directors representation ({directors})."
+        assert tolerance > 0, f"tolerance ({tolerance}) must be positive."
+        assert node_stride > 0, f"node_stride ({node_stride}) must be positive."
+        self.quantization = quantization
+        self.tolerance = tolerance
+        self.directors = directors
+        self.delta_fields = tuple(delta_fields)
+        self.node_stride = node_stride
+        self.directors_field = directors_field
+
+    def _config(self, fields: list[str]) -> dict[str, Any]:
+        return {
+            "quantization": self.quantization,
+            "step": 2.0 * self.tolerance,
+            "directors": self.directors,
+            "directors_field": self.directors_field,
+            "node_stride": self.node_stride,
+            "fields": fields,
+            "delta_fields": [
+                field
+                for field in fields
+                if field in self.delta_fields and self.quantization is not None
+            ],
+        }
+
+    @staticmethod
+    def _is_compressed_field(field: str, values: NDArray[Any]) -> bool:
+        return (
+            field not in ("time", "step")
+            and values.ndim >= 2
+            and np.issubdtype(values.dtype, np.floating)
+        )
+
+    def encode(self, data: Mapping[str, Any]) -> dict[str, NDArray[Any]]:
+        """
+        Encode a trajectory.
+
+        Parameters
+        ----------
+        data : dict
+            Arrays whose first axis is the sample.
+
+        Returns
+        -------
+        dict
+            Encoded arrays and the compression configuration.
+        """
+        values_dict = {field: np.asarray(values) for field, values in data.items()}
+        fields = [
+            field
+            for field, values in values_dict.items()
+            if self._is_compressed_field(field, values)
+        ]
+        config = self._config(fields)
+        step = config["step"]
+
+        encoded: dict[str, NDArray[Any]] = {}
+        for field, values in values_dict.items():
+            if field not in fields:
+                encoded[field] = values
+                continue
+
+            if self.node_stride > 1:
+                values = values[..., :: self.node_stride]
+            if field == self.directors_field:
+                if self.directors == "rotation_vector":
+                    values = directors_to_rotation_vectors(values)
+                elif self.directors == "quaternion":
+                    values = directors_to_quaternions(values)
+            delta = field in config["delta_fields"] and values.shape[0] > 0
+
+            if self.quantization == "fixed_point":
+                quantized = np.rint(values / step).astype(np.int64)
+                if delta:
+                    encoded[field + KEYFRAME_SUFFIX] = quantized[0]
+                    quantized = np.diff(quantized, axis=0)
+                encoded[field] = _narrowest_integer(quantized)
+            elif self.quantization == "float16":
+                if delta:
+                    encoded[field + KEYFRAME_SUFFIX] = values[0].copy()
+                    differences = np.empty(
+                        (values.shape[0] - 1, *values.shape[1:]), dtype=np.float16
+                    )
+                    reconstructed = values[0].copy()
+                    for sample in range(1, values.shape[0]):
+                        difference = (values[sample] - reconstructed).astype(np.float16)
+                        differences[sample - 1] = difference
+                        reconstructed += difference
+                    encoded[field] = differences
+                else:
+                    encoded[field] = values.astype(np.float16)
+            else:
+                encoded[field] = np.ascontiguousarray(values)
+
+        encoded[COMPRESSION_KEY] = np.array(json.dumps(config))
+        return encoded
+
+    def report(self, data: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Encode and decode a trajectory, and report the compression ratio, the encode
+        throughput and the maximum absolute reconstruction error of each field.
+        Reconstruction errors are measured on the decimated original, and for
+        directors on the director matrices.
+
+        Parameters
+        ----------
+        data : dict
+            Arrays whose first axis is the sample.
+
+        Returns
+        -------
+        dict
+            "compression_ratio", "encode_throughput" (in bytes per second) and
+            "max_error" (dictionary of fields).
+        """
+        original = {field: np.asarray(values) for field, values in data.items()}
+        start = timer.perf_counter()
+        encoded = self.encode(original)
+        encode_time = timer.perf_counter() - start
+        decoded = decompress(encoded)
+
+        original_nbytes = sum(values.nbytes for values in original.values())
+        encoded_nbytes = sum(
+            values.nbytes
+            for field, values in encoded.items()
+            if field != COMPRESSION_KEY
+        )
+        max_error = {}
+        for field in json.loads(str(encoded[COMPRESSION_KEY]))["fields"]:
+            reference = original[field][..., :: self.node_stride]
+            max_error[field] = float(np.max(np.abs(decoded[field] - reference)))
+        return {
+            "compression_ratio": original_nbytes / encoded_nbytes,
+            "encode_throughput": original_nbytes / max(encode_time, 1e-12),
+            "max_error": max_error,
+        }
+
+
+def decompress(data: Mapping[str, Any]) -> dict[str, NDArray[Any]]:
+    """
+    Decode a trajectory encoded by TrajectoryCompression, e.g. a file saved by
+    ExportCallBack with compression and loaded with np.load or pickle. Data
+    without compression is returned as it is.
+
+    Parameters
+    ----------
+    data : dict | NpzFile
+        Encoded arrays.
+
+    Returns
+    -------
+    dict
+        Decoded arrays. Decimated fields stay decimated.
+    """
+    if COMPRESSION_KEY not in data:
+        return {field: np.asarray(values) for field, values in data.items()}
+    config = json.loads(str(np.asarray(data[COMPRESSION_KEY])))
+    step = config["step"]
+
+    decoded: dict[str, NDArray[Any]] = {}
+    for field in data.keys():
+        if field == COMPRESSION_KEY or field.endswith(KEYFRAME_SUFFIX):
+            continue
+        values = np.asarray(data[field])
+        if field not in config["fields"]:
+            decoded[field] = values
+            continue
+
+        if field in config["delta_fields"]:
+            keyframe = np.asarray(data[field + KEYFRAME_SUFFIX])
+            if config["quantization"] == "fixed_point":
+                values = np.concatenate(
+                    (keyframe[np.newaxis], values.astype(np.int64))
+                ).cumsum(axis=0)
+            else:
+                values = np.concatenate(
+                    (keyframe[np.newaxis], values.astype(np.float64))
+                ).cumsum(axis=0)
+        if config["quantization"] == "fixed_point":
+            values = values * step
+        else:
+            values = values.astype(np.float64)
+
+        if field == config["directors_field"]:
+            if config["directors"] == "rotation_vector":
+                values = rotation_vectors_to_directors(values)
+            elif config["directors"] == "quaternion":
+                values = quaternions_to_directors(values)
+        decoded[field] = values
+    return decoded
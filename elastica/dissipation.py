@@ -5,7 +5,7 @@ Built in damper module implementations
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar, TypeAlias, Callable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, TypeAlias, Callable
 
 from elastica.typing import RodType
 
@@ -14,6 +14,9 @@ from numba import njit
 import numpy as np
 from numpy.typing import NDArray
 
+if TYPE_CHECKING:
+    from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
 
 T = TypeVar("T")
 
@@ -151,6 +154,7 @@ class AnalyticalLinearDamper(DamperBase):
         rotational_damping_constant = kwargs.get("rotational_damping_constant", None)
 
         self._dampen_rates_protocol: DampenType
+        self._scale_with_dilatation: bool
 
         if (
             (damping_constant is not None)
@@ -227,13 +231,8 @@ class AnalyticalLinearDamper(DamperBase):
             * np.diagonal(self._system.inv_mass_second_moment_of_inertia).T
         )
 
-        def dampen_rates_protocol(rod: RodType) -> None:
-            rod.velocity_collection *= self._translational_damping_coefficient
-            rod.omega_collection *= np.power(
-                self._rotational_damping_coefficient, rod.dilatation
-            )
-
-        return dampen_rates_protocol
+        self._scale_with_dilatation = True
+        return self._dilatation_scaled_damping_protocol()
 
     def _uniform_damping_protocol(
         self, uniform_damping_constant: np.float64, time_step: np.float64
@@ -242,11 +241,34 @@ class AnalyticalLinearDamper(DamperBase):
             self._rotational_damping_coefficient
         ) = np.exp(-uniform_damping_constant * time_step)
 
-        def dampen_rates_protocol(rod: RodType) -> None:
-            rod.velocity_collection *= self._translational_damping_coefficient
-            rod.omega_collection *= self._rotational_damping_coefficient
-
-        return dampen_rates_protocol
+        self._scale_with_dilatation = False
+        return self._uniform_dampen_rates
+
+    def _uniform_dampen_rates(self, rod: RodType) -> None:
+        rod.velocity_collection *= self._translational_damping_coefficient
+        rod.omega_collection *= self._rotational_damping_coefficient
+
+    def _dilatation_scaled_damping_protocol(self) -> DampenType:
+        # The rotational coefficient is raised to the element dilatation on every
+        # call. The result is written into a buffer allocated once, on the first call.
+        self._rotational_damping_factor: NDArray[np.float64] | None = None
+        return self._dilatation_scaled_dampen_rates
+
+    def _dilatation_scaled_dampen_rates(self, rod: RodType) -> None:
+        if self._rotational_damping_factor is None:
+            self._rotational_damping_factor = np.empty(
+                np.broadcast_shapes(
+                    np.shape(self._rotational_damping_coefficient),
+                    np.shape(rod.dilatation),
+                )
+            )
+        rod.velocity_collection *= self._translational_damping_coefficient
+        np.power(
+            self._rotational_damping_coefficient,
+            rod.dilatation,
+            out=self._rotational_damping_factor,
+        )
+        rod.omega_collection *= self._rotational_damping_factor
 
     def _physical_damping_protocol(
         self,
@@ -264,13 +286,8 @@ class AnalyticalLinearDamper(DamperBase):
             -rotational_damping_constant * inv_moi * time_step
         )
 
-        def dampen_rates_protocol(rod: RodType) -> None:
-            rod.velocity_collection *= self._translational_damping_coefficient
-            rod.omega_collection *= np.power(
-                self._rotational_damping_coefficient, rod.dilatation
-            )
-
-        return dampen_rates_protocol
+        self._scale_with_dilatation = True
+        return self._dilatation_scaled_damping_protocol()
 
     def dampen_rates(self, system: RodType, time: np.float64) -> None:
         self._dampen_rates_protocol(system)
@@ -467,3 +484,292 @@ def nb_filter_rate(
         filter_term[..., 0] = 0.0
         filter_term[..., -1] = 0.0
     rate_collection[...] = rate_collection - filter_term
+
+
+_DamperT = TypeVar("_DamperT", bound=DamperBase)
+
+
+class _BlockDamper(DamperBase, Generic[_DamperT]):
+    """
+    Base class of the dampers fused over the rods of a memory block. The fused
+    damper is built from the dampers of the rods, with the position of their rod in
+    the block, by `_gather_dampers`.
+    """
+
+    _dampers: list[tuple[_DamperT, int]]
+
+    @abstractmethod
+    def _gather_dampers(self) -> None:
+        """Gather the dampers into block arrays."""
+
+    def remove_systems(self, systems: list[Any]) -> bool:
+        """
+        Remove the dampers acting on the given rods, e.g. when the rods are
+        retired from the simulation.
+
+        Parameters
+        ----------
+        systems : list
+            Rods whose dampers are removed.
+
+        Returns
+        -------
+        bool
+            True if dampers on other rods remain.
+        """
+        system_ids = {id(system) for system in systems}
+        dampers = [
+            (damper, rod_idx)
+            for damper, rod_idx in self._dampers
+            if id(damper.system) not in system_ids
+        ]
+        if len(dampers) != len(self._dampers):
+            self._dampers = dampers
+            self._gather_dampers()
+        return bool(self._dampers)
+
+
+class _BlockAnalyticalLinearDamper(_BlockDamper[AnalyticalLinearDamper]):
+    """
+    Fused AnalyticalLinearDamper for the rods of a memory block.
+
+    The damping coefficients of all dampers are gathered into block-sized arrays,
+    and the rates of the whole block are damped in one compiled pass. Nodes and
+    elements of rods without a damper have unit coefficients.
+
+    Attributes
+    ----------
+    translational_damping_coefficient: numpy.ndarray
+        1D (n_nodes) array containing data with 'float' type.
+    rotational_damping_coefficient: numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    scale_with_dilatation: numpy.ndarray
+        1D (n_elems) array containing data with 'bool' type. Elements whose
+        rotational coefficient is raised to the element dilatation.
+    """
+
+    def __init__(
+        self,
+        dampers: list[tuple[AnalyticalLinearDamper, int]],
+        **kwargs: Any,
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        dampers : list[tuple[AnalyticalLinearDamper, int]]
+            Dampers with the position of their rod in the memory block. Each rod
+            must appear at most once.
+        """
+        super().__init__(**kwargs)
+        self._dampers = dampers
+        self._gather_dampers()
+
+    def _gather_dampers(self) -> None:
+        block: "MemoryBlockCosseratRod" = self._system
+        self.translational_damping_coefficient = np.ones(block.n_nodes)
+        self.rotational_damping_coefficient = np.ones((3, block.n_elems))
+        self.scale_with_dilatation = np.zeros(block.n_elems, dtype=np.bool_)
+
+        for damper, rod_idx in self._dampers:
+            node_slice = slice(
+                block.start_idx_in_rod_nodes[rod_idx],
+                block.end_idx_in_rod_nodes[rod_idx],
+            )
+            elem_slice = slice(
+                block.start_idx_in_rod_elems[rod_idx],
+                block.end_idx_in_rod_elems[rod_idx],
+            )
+            self.translational_damping_coefficient[node_slice] = (
+                damper._translational_damping_coefficient
+            )
+            self.rotational_damping_coefficient[:, elem_slice] = (
+                damper._rotational_damping_coefficient
+            )
+            self.scale_with_dilatation[elem_slice] = damper._scale_with_dilatation
+
+    def dampen_rates(self, system: "MemoryBlockCosseratRod", time: np.float64) -> None:
+        _dampen_rates_analytical_linear(
+            system.velocity_collection,
+            system.omega_collection,
+            self.translational_damping_coefficient,
+            self.rotational_damping_coefficient,
+            self.scale_with_dilatation,
+            system.dilatation,
+        )
+
+
+@njit(cache=True)  # type: ignore
+def _dampen_rates_analytical_linear(
+    velocity_collection: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    translational_damping_coefficient: NDArray[np.float64],
+    rotational_damping_coefficient: NDArray[np.float64],
+    scale_with_dilatation: NDArray[np.bool_],
+    dilatation: NDArray[np.float64],
+) -> None:
+    """
+    Dampen the rates in-place with precomputed analytical damping coefficients.
+
+    Parameters
+    ----------
+    velocity_collection : numpy.ndarray
+        2D (dim, n_nodes) array containing data with 'float' type.
+    omega_collection : numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    translational_damping_coefficient : numpy.ndarray
+        1D (n_nodes) array containing data with 'float' type.
+    rotational_damping_coefficient : numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    scale_with_dilatation : numpy.ndarray
+        1D (n_elems) array containing data with 'bool' type.
+    dilatation : numpy.ndarray
+        1D (n_elems) array containing data with 'float' type.
+    """
+    n_nodes = velocity_collection.shape[1]
+    for k in range(n_nodes):
+        for i in range(3):
+            velocity_collection[i, k] *= translational_damping_coefficient[k]
+
+    n_elems = omega_collection.shape[1]
+    for k in range(n_elems):
+        if scale_with_dilatation[k]:
+            for i in range(3):
+                omega_collection[i, k] *= (
+                    rotational_damping_coefficient[i, k] ** dilatation[k]
+                )
+        else:
+            for i in range(3):
+                omega_collection[i, k] *= rotational_damping_coefficient[i, k]
+
+
+class _BlockLaplaceDissipationFilter(_BlockDamper[LaplaceDissipationFilter]):
+    """
+    Fused LaplaceDissipationFilter for the straight rods of a memory block, sharing
+    the same filter order.
+
+    The filter runs once over the whole block. The end nodes and elements of every
+    filtered rod are boundaries of the filter, which leaves the ghosts and the rods
+    without a filter untouched.
+
+    Attributes
+    ----------
+    filter_order : int
+        Filter order, which corresponds to the number of times the Laplacian
+        operator is applied.
+    velocity_filter_term: numpy.ndarray
+        2D (dim, n_nodes) array containing data with 'float' type.
+    omega_filter_term: numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    node_interior: numpy.ndarray
+        1D (n_nodes) array containing data with 'bool' type. Filtered nodes.
+    elem_interior: numpy.ndarray
+        1D (n_elems) array containing data with 'bool' type. Filtered elements.
+    """
+
+    def __init__(
+        self,
+        filter_order: int,
+        dampers: list[tuple[LaplaceDissipationFilter, int]],
+        **kwargs: Any,
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        filter_order : int
+            Filter order shared by all dampers.
+        dampers : list[tuple[LaplaceDissipationFilter, int]]
+            Dampers with the position of their straight rod in the memory block.
+        """
+        super().__init__(**kwargs)
+        block: "MemoryBlockCosseratRod" = self._system
+        self.filter_order = filter_order
+        self.velocity_filter_term = np.zeros((3, block.n_nodes))
+        self.omega_filter_term = np.zeros((3, block.n_elems))
+        self._dampers = dampers
+        self._gather_dampers()
+
+    def _gather_dampers(self) -> None:
+        block: "MemoryBlockCosseratRod" = self._system
+        self.node_interior = np.zeros(block.n_nodes, dtype=np.bool_)
+        self.elem_interior = np.zeros(block.n_elems, dtype=np.bool_)
+
+        for damper, rod_idx in self._dampers:
+            assert damper.filter_order == self.filter_order
+            self.node_interior[
+                block.start_idx_in_rod_nodes[rod_idx]
+                + 1 : block.end_idx_in_rod_nodes[rod_idx]
+                - 1
+            ] = True
+            self.elem_interior[
+                block.start_idx_in_rod_elems[rod_idx]
+                + 1 : block.end_idx_in_rod_elems[rod_idx]
+                - 1
+            ] = True
+
+    def dampen_rates(self, system: "MemoryBlockCosseratRod", time: np.float64) -> None:
+        _nb_filter_rate_with_boundaries(
+            system.velocity_collection,
+            self.velocity_filter_term,
+            self.filter_order,
+            self.node_interior,
+        )
+        _nb_filter_rate_with_boundaries(
+            system.omega_collection,
+            self.omega_filter_term,
+            self.filter_order,
+            self.elem_interior,
+        )
+
+
+@njit(cache=True)  # type: ignore
+def _nb_filter_rate_with_boundaries(
+    rate_collection: NDArray[np.float64],
+    filter_term: NDArray[np.float64],
+    filter_order: int,
+    interior: NDArray[np.bool_],
+) -> None:
+    """
+    Filters the rates of several rods stacked in one array. This is equivalent to
+    calling `nb_filter_rate` on every rod, where the boundary values of each rod are
+    the entries next to the interior ones. Entries outside the interior are not
+    modified.
+
+    Parameters
+    ----------
+    rate_collection : numpy.ndarray
+        2D array containing data with 'float' type.
+        Array containing rod rates (velocities).
+    filter_term: numpy.ndarray
+        2D array containing data with 'float' type.
+        Filter term that modifies rod rates (velocities).
+    filter_order : int
+        Filter order, which corresponds to the number of times the Laplacian
+        operator is applied.
+    interior : numpy.ndarray
+        1D array containing data with 'bool' type. Entries to be filtered.
+    """
+    blocksize = rate_collection.shape[1]
+    for i in range(3):
+        for k in range(blocksize):
+            filter_term[i, k] = rate_collection[i, k]
+
+        for _ in range(filter_order):
+            # Value of the left neighbour before it is overwritten in this sweep
+            previous = filter_term[i, 0]
+            for k in range(1, blocksize - 1):
+                current = filter_term[i, k]
+                if interior[k]:
+                    filter_term[i, k] = (
+                        -filter_term[i, k + 1] - previous + 2.0 * current
+                    ) / 4.0
+                else:
+                    filter_term[i, k] = 0.0
+                previous = current
+            # dont touch boundary values
+            filter_term[i, 0] = 0.0
+            filter_term[i, blocksize - 1] = 0.0
+
+        for k in range(blocksize):
+            rate_collection[i, k] -= filter_term[i, k]
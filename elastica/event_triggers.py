@@ -0,0 +1,422 @@
+__doc__ = """ Numba implementation module of predicates on the state of systems, used to
+trigger event recording (see EventRecorderCallBack in `callback_functions.py`)."""
+
+from typing import Any, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+from numba import njit
+
+from elastica.rod.rod_base import RodBase
+
+
+def _system_indices(system: Any, domain: str, n_points: int) -> NDArray[np.int64]:
+    """
+    Indices of the nodes or elements of a system. Ghost nodes and elements between
+    the rods of a memory block are excluded.
+    """
+    start_idx = getattr(system, f"start_idx_in_rod_{domain}", None)
+    if start_idx is None:
+        return np.arange(n_points, dtype=np.int64)
+    end_idx = getattr(system, f"end_idx_in_rod_{domain}")
+    return np.concatenate(
+        [
+            np.arange(start, end, dtype=np.int64)
+            for start, end in zip(start_idx, end_idx)
+        ]
+    )
+
+
+class TriggerBase:
+    """
+    This is the base class of triggers. A trigger is a predicate on the state of a
+    system, e.g. a rod or a memory block of rods, evaluated by EventRecorderCallBack
+    on every sampled step. Predicates are meant to be cheap, so the provided
+    triggers evaluate compiled kernels on the state arrays of the system and return
+    as soon as the condition is met.
+
+    Indices of the nodes and elements of the system are computed at the first
+    evaluation, hence a trigger should be used for a single system.
+
+    Notes
+    -----
+    Any callable with the signature of `__call__` can be used as a trigger.
+    """
+
+    def __init__(self) -> None:
+        self._system: Optional[Any] = None
+        self._nodes: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._elements: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+
+    def _update_indices(self, system: Any) -> None:
+        if system is self._system:
+            return
+        self._system = system
+        self._nodes = _system_indices(
+            system, "nodes", system.position_collection.shape[-1]
+        )
+        self._elements = _system_indices(
+            system, "elems", system.director_collection.shape[-1]
+        )
+
+    def __call__(self, system: Any, time: np.float64, current_step: int) -> bool:
+        """
+        Evaluate the predicate.
+
+        Parameters
+        ----------
+        system : object
+            System is a rod-like object or a memory block.
+        time : float
+            The time of the simulation.
+        current_step : int
+            Simulation step.
+
+        Returns
+        -------
+        bool
+            True if an event is triggered.
+        """
+        return False
+
+
+class NodalSpeedTrigger(TriggerBase):
+    """
+    Triggers when the speed of any node exceeds a limit.
+
+        Attributes
+        ----------
+        max_speed: float
+            Speed limit.
+    """
+
+    def __init__(self, max_speed: float) -> None:
+        """
+        Parameters
+        ----------
+        max_speed : float
+            Speed limit.
+        """
+        super().__init__()
+        assert max_speed >= 0.0, f"max_speed ({max_speed}) must be non-negative."
+        self.max_speed = max_speed
+
+    def __call__(self, system: Any, time: np.float64, current_step: int) -> bool:
+        self._update_indices(system)
+        return _any_nodal_speed_above(
+            system.velocity_collection, self._nodes, np.float64(self.max_speed**2)
+        )
+
+
+class KineticEnergyChangeTrigger(TriggerBase):
+    """
+    Triggers when the total kinetic energy, translational and rotational, changes
+    between two evaluations by more than
+    `relative_change * previous_energy + absolute_change`.
+
+        Attributes
+        ----------
+        relative_change: float
+            Change threshold relative to the previous kinetic energy.
+        absolute_change: float
+            Absolute change threshold.
+        kinetic_energy: float
+            Kinetic energy at the last evaluation.
+    """
+
+    def __init__(self, relative_change: float, absolute_change: float = 0.0) -> None:
+        """
+        Parameters
+        ----------
+        relative_change : float
+            Change threshold relative to the previous kinetic energy.
+        absolute_change : float
+            Absolute change threshold, which prevents triggering on round-off
+            errors of a system at rest. (default = 0.0)
+        """
+        super().__init__()
+        assert (
+            relative_change >= 0.0 and absolute_change >= 0.0
+        ), "Change thresholds must be non-negative."
+        self.relative_change = relative_change
+        self.absolute_change = absolute_change
+        self.kinetic_energy = np.nan
+        self._dilatation: NDArray[np.float64] = np.empty(0)
+        self._inertia: NDArray[np.float64] = np.empty(0)
+        self._diagonal_inertia = False
+
+    def _update_indices(self, system: Any) -> None:
+        if system is self._system:
+            return
+        super()._update_indices(system)
+        # Rigid bodies do not stretch.
+        self._dilatation = getattr(
+            system, "dilatation", np.ones(system.director_collection.shape[-1])
+        )
+        # Rods in lean memory mode only store the diagonal of the inertia, and
+        # rebuild the full tensor whenever it is read.
+        diagonal = getattr(system, "mass_second_moment_of_inertia_diagonal", None)
+        self._diagonal_inertia = diagonal is not None
+        self._inertia = (
+            system.mass_second_moment_of_inertia if diagonal is None else diagonal
+        )
+        self.kinetic_energy = np.nan
+
+    def __call__(self, system: Any, time: np.float64, current_step: int) -> bool:
+        self._update_indices(system)
+        previous_energy = self.kinetic_energy
+        self.kinetic_energy = (
+            _kinetic_energy_with_diagonal_inertia
+            if self._diagonal_inertia
+            else _kinetic_energy
+        )(
+            system.mass,
+            system.velocity_collection,
+            self._nodes,
+            self._inertia,
+            system.omega_collection,
+            self._dilatation,
+            self._elements,
+        )
+        # The first evaluation only sets the reference energy.
+        return bool(
+            abs(self.kinetic_energy - previous_energy)
+            > self.relative_change * previous_energy + self.absolute_change
+        )
+
+    def snapshot_state(self) -> float:
+        """
+        Kinetic energy at the last evaluation, see BaseSystemCollection.snapshot.
+        """
+        return float(self.kinetic_energy)
+
+    def restore_state(self, state: float) -> None:
+        self.kinetic_energy = state
+
+
+class RegionTrigger(TriggerBase):
+    """
+    Triggers when any node is inside an axis-aligned box.
+
+        Attributes
+        ----------
+        lower_corner: numpy.ndarray
+            1D (dim) array containing data with 'float' type. Lower corner of the box.
+        upper_corner: numpy.ndarray
+            1D (dim) array containing data with 'float' type. Upper corner of the box.
+    """
+
+    def __init__(
+        self, lower_corner: NDArray[np.float64], upper_corner: NDArray[np.float64]
+    ) -> None:
+        """
+        Parameters
+        ----------
+        lower_corner : numpy.ndarray
+            1D (dim) array containing data with 'float' type. Lower corner of the box.
+        upper_corner : numpy.ndarray
+            1D (dim) array containing data with 'float' type. Upper corner of the box.
+        """
+        super().__init__()
+        self.lower_corner = np.asarray(lower_corner, dtype=np.float64).reshape(3)
+        self.upper_corner = np.asarray(upper_corner, dtype=np.float64).reshape(3)
+        assert np.all(
+            self.lower_corner <= self.upper_corner
+        ), "lower_corner must be smaller than upper_corner."
+
+    def __call__(self, system: Any, time: np.float64, current_step: int) -> bool:
+        self._update_indices(system)
+        return _any_node_in_box(
+            system.position_collection,
+            self._nodes,
+            self.lower_corner,
+            self.upper_corner,
+        )
+
+
+class PlanePenetrationTrigger(TriggerBase):
+    """
+    Triggers when any element of a rod penetrates a plane by more than a threshold.
+    The penetration of an element is its radius minus the distance of its center to
+    the plane, as in RodPlaneContact. The system must be a rod or a memory block of
+    rods.
+
+        Attributes
+        ----------
+        plane_origin: numpy.ndarray
+            1D (dim) array containing data with 'float' type. Origin of the plane.
+        plane_normal: numpy.ndarray
+            1D (dim) array containing data with 'float' type. Normal of the plane.
+        threshold: float
+            Penetration depth triggering an event.
+    """
+
+    def __init__(
+        self,
+        plane_origin: NDArray[np.float64],
+        plane_normal: NDArray[np.float64],
+        threshold: float = 0.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        plane_origin : numpy.ndarray
+            1D (dim) array containing data with 'float' type. Origin of the plane.
+        plane_normal : numpy.ndarray
+            1D (dim) array containing data with 'float' type. Normal of the plane,
+            pointing away from the penetrated side.
+        threshold : float
+            Penetration depth triggering an event. (default = 0.0)
+        """
+        super().__init__()
+        self.plane_origin = np.asarray(plane_origin, dtype=np.float64).reshape(3)
+        plane_normal = np.asarray(plane_normal, dtype=np.float64).reshape(3)
+        self.plane_normal = plane_normal / np.linalg.norm(plane_normal)
+        self.threshold = threshold
+
+    def _update_indices(self, system: Any) -> None:
+        if system is not self._system and not isinstance(system, RodBase):
+            raise TypeError(
+                f"PlanePenetrationTrigger requires a rod, not {type(system).__name__}: "
+                "elements are located between consecutive nodes."
+            )
+        super()._update_indices(system)
+
+    def __call__(self, system: Any, time: np.float64, current_step: int) -> bool:
+        self._update_indices(system)
+        return _any_plane_penetration_above(
+            system.position_collection,
+            system.radius,
+            self._elements,
+            self.plane_origin,
+            self.plane_normal,
+            np.float64(self.threshold),
+        )
+
+
+@njit(cache=True)  # type: ignore
+def _any_nodal_speed_above(
+    velocity_collection: NDArray[np.float64],
+    nodes: NDArray[np.int64],
+    max_speed_squared: np.float64,
+) -> bool:
+    for k in nodes:
+        speed_squared = (
+            velocity_collection[0, k] ** 2
+            + velocity_collection[1, k] ** 2
+            + velocity_collection[2, k] ** 2
+        )
+        if speed_squared > max_speed_squared:
+            return True
+    return False
+
+
+@njit(cache=True)  # type: ignore
+def _kinetic_energy(
+    mass: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    nodes: NDArray[np.int64],
+    mass_second_moment_of_inertia: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    elements: NDArray[np.int64],
+) -> np.float64:
+    translational_energy = _translational_energy(mass, velocity_collection, nodes)
+
+    rotational_energy = 0.0
+    for k in elements:
+        J_omega_omega = 0.0
+        for i in range(3):
+            for j in range(3):
+                J_omega_omega += (
+                    omega_collection[i, k]
+                    * mass_second_moment_of_inertia[i, j, k]
+                    * omega_collection[j, k]
+                )
+        rotational_energy += J_omega_omega / dilatation[k]
+
+    return np.float64(0.5 * (translational_energy + rotational_energy))
+
+
+@njit(cache=True)  # type: ignore
+def _kinetic_energy_with_diagonal_inertia(
+    mass: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    nodes: NDArray[np.int64],
+    mass_second_moment_of_inertia_diagonal: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    elements: NDArray[np.int64],
+) -> np.float64:
+    translational_energy = _translational_energy(mass, velocity_collection, nodes)
+
+    rotational_energy = 0.0
+    for k in elements:
+        J_omega_omega = 0.0
+        for i in range(3):
+            J_omega_omega += (
+                mass_second_moment_of_inertia_diagonal[i, k]
+                * omega_collection[i, k] ** 2
+            )
+        rotational_energy += J_omega_omega / dilatation[k]
+
+    return np.float64(0.5 * (translational_energy + rotational_energy))
+
+
+@njit(cache=True)  # type: ignore
+def _translational_energy(
+    mass: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    nodes: NDArray[np.int64],
+) -> float:
+    translational_energy = 0.0
+    for k in nodes:
+        translational_energy += mass[k] * (
+            velocity_collection[0, k] ** 2
+            + velocity_collection[1, k] ** 2
+            + velocity_collection[2, k] ** 2
+        )
+    return translational_energy
+
+
+@njit(cache=True)  # type: ignore
+def _any_node_in_box(
+    position_collection: NDArray[np.float64],
+    nodes: NDArray[np.int64],
+    lower_corner: NDArray[np.float64],
+    upper_corner: NDArray[np.float64],
+) -> bool:
+    for k in nodes:
+        inside = True
+        for i in range(3):
+            if (
+                position_collection[i, k] < lower_corner[i]
+                or position_collection[i, k] > upper_corner[i]
+            ):
+                inside = False
+                break
+        if inside:
+            return True
+    return False
+
+
+@njit(cache=True)  # type: ignore
+def _any_plane_penetration_above(
+    position_collection: NDArray[np.float64],
+    radius: NDArray[np.float64],
+    elements: NDArray[np.int64],
+    plane_origin: NDArray[np.float64],
+    plane_normal: NDArray[np.float64],
+    threshold: np.float64,
+) -> bool:
+    # Element k is between nodes k and k + 1, also in memory blocks of rods.
+    for k in elements:
+        distance = 0.0
+        for i in range(3):
+            element_position = 0.5 * (
+                position_collection[i, k] + position_collection[i, k + 1]
+            )
+            distance += (element_position - plane_origin[i]) * plane_normal[i]
+        if radius[k] - distance > threshold:
+            return True
+    return False
@@ -17,6 +17,7 @@ from elastica._contact_functions import (
 from numpy.typing import NDArray
 
 from elastica.typing import SystemType, RodType, RigidBodyType
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
 
 
 # base class for interaction
@@ -420,6 +421,1242 @@ class SlenderBodyTheory(NoForces):
         _elements_to_nodes_inplace(stokes_force, system.external_forces)
 
 
+def _element_body_index(system: RodType) -> NDArray[np.int32]:
+    """
+    Label every element of a rod-like system with the index of the rod it belongs to.
+
+    Rods stacked in a memory block are separated by ghost elements, and ring rods carry
+    periodic elements at both ends. These elements do not belong to any rod and are
+    labelled with -1, as are the elements of the free slots of a memory block (see
+    `MemoryBlockCosseratRod.release_systems`). For a single rod, all elements are
+    labelled with 0.
+
+    Parameters
+    ----------
+    system: RodType
+        Rod-like object or memory block of rods.
+
+    Returns
+    -------
+    element_body_index: numpy.ndarray
+        1D (n_elems) array containing data with 'int' type.
+    """
+    n_elems = system.lengths.shape[0]
+    excluded = np.zeros(n_elems, dtype=np.bool_)
+    excluded[np.asarray(system.ghost_elems_idx, dtype=np.int64)] = True
+    periodic_boundary_elems_idx = getattr(system, "periodic_boundary_elems_idx", None)
+    if periodic_boundary_elems_idx is not None and periodic_boundary_elems_idx.size:
+        excluded[periodic_boundary_elems_idx[0]] = True
+    if isinstance(system, MemoryBlockCosseratRod):
+        for block_idx in np.flatnonzero(system.system_idx_list < 0).tolist():
+            excluded[system._system_slice("element", block_idx)] = True
+
+    valid = ~excluded
+    # A new rod starts at every valid element that follows an excluded one
+    body_start = valid & np.concatenate((np.array([True]), excluded[:-1]))
+    element_body_index = (np.cumsum(body_start) - 1).astype(np.int32)
+    element_body_index[excluded] = -1
+    return element_body_index
+
+
+def _element_layout(system: RodType) -> NDArray[np.int64]:
+    """
+    Number of elements of a rod-like system and, for a memory block, the indices of
+    the rods in its slots, which determine `_element_body_index`. It changes when
+    rods are placed in or released from the slots of the block.
+    """
+    if isinstance(system, MemoryBlockCosseratRod):
+        return np.append(system.lengths.shape[0], system.system_idx_list)
+    return np.array([system.lengths.shape[0]], dtype=np.int64)
+
+
+@njit(cache=True)  # type: ignore
+def _add_regularized_stokeslet(
+    r0: np.float64,
+    r1: np.float64,
+    r2: np.float64,
+    f0: np.float64,
+    f1: np.float64,
+    f2: np.float64,
+    epsilon_sq: np.float64,
+    induced_velocity: NDArray[np.float64],
+    i: int,
+) -> None:
+    """
+    Add the velocity (times 8*pi*mu) of a regularized Stokeslet of strength f at
+    offset r to the i-th column of induced_velocity.
+    """
+    r_sq = r0 * r0 + r1 * r1 + r2 * r2
+    denominator = r_sq + epsilon_sq
+    denominator = 1.0 / (denominator * np.sqrt(denominator))
+    isotropic = (r_sq + 2.0 * epsilon_sq) * denominator
+    f_dot_r = (f0 * r0 + f1 * r1 + f2 * r2) * denominator
+    induced_velocity[0, i] += isotropic * f0 + f_dot_r * r0
+    induced_velocity[1, i] += isotropic * f1 + f_dot_r * r1
+    induced_velocity[2, i] += isotropic * f2 + f_dot_r * r2
+
+
+@njit(cache=True)  # type: ignore
+def _regularized_stokeslet_velocity_direct(
+    position: NDArray[np.float64],
+    strength: NDArray[np.float64],
+    element_body_index: NDArray[np.int32],
+    regularization_length: np.float64,
+    induced_velocity: NDArray[np.float64],
+) -> None:
+    r"""
+    Direct O(N^2) summation of the regularized Stokeslet velocity induced on every
+    element by the elements of all other rods. Contributions from the element's own
+    rod are excluded, since the local resistive force theory already accounts for them.
+
+    .. math::
+        8\pi\mu\mathbf{u}(\mathbf{x}_i)=\sum_{j}
+        \frac{(r^2+2\epsilon^2)\mathbf{F}_j+(\mathbf{F}_j\cdot\mathbf{r})\mathbf{r}}
+        {(r^2+\epsilon^2)^{3/2}},\quad \mathbf{r}=\mathbf{x}_i-\mathbf{x}_j
+
+    Parameters
+    ----------
+    position: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+        Element centers.
+    strength: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+        Stokeslet strength (force exerted on the fluid) of each element.
+    element_body_index: numpy.ndarray
+        1D (blocksize) array containing data with 'int' type.
+        Rod index of each element, -1 for ghost and periodic elements.
+    regularization_length: float
+        Regularization (blob) length of the Stokeslets.
+    induced_velocity: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+        Output, velocity induced on each element times 8*pi*mu.
+    """
+    blocksize = position.shape[1]
+    epsilon_sq = regularization_length * regularization_length
+
+    for i in range(blocksize):
+        induced_velocity[0, i] = 0.0
+        induced_velocity[1, i] = 0.0
+        induced_velocity[2, i] = 0.0
+        body_i = element_body_index[i]
+        if body_i < 0:
+            continue
+
+        for j in range(blocksize):
+            body_j = element_body_index[j]
+            if body_j < 0 or body_j == body_i:
+                continue
+            _add_regularized_stokeslet(
+                position[0, i] - position[0, j],
+                position[1, i] - position[1, j],
+                position[2, i] - position[2, j],
+                strength[0, j],
+                strength[1, j],
+                strength[2, j],
+                epsilon_sq,
+                induced_velocity,
+                i,
+            )
+
+
+# Octree node layout. Integer and floating point data of the nodes are packed into two
+# arrays, so the tree can be grown by reallocating only two buffers.
+# node_int columns
+_NODE_START = 0
+_NODE_END = 1
+_NODE_CHILD = 2
+_NODE_N_CHILD = 3
+_NODE_BODY_MIN = 4
+_NODE_BODY_MAX = 5
+# node_float columns
+_NODE_CENTROID = 0
+_NODE_STRENGTH = 3
+_NODE_BOX_CENTER = 6
+_NODE_HALF_WIDTH = 9
+_OCTREE_MAX_DEPTH = 32
+_SQRT_3 = np.sqrt(3.0)
+
+
+@njit(cache=True)  # type: ignore
+def _valid_element_order(element_body_index: NDArray[np.int32]) -> NDArray[np.int64]:
+    """
+    Indices of the valid elements, i.e. the elements with a non-negative rod index.
+    """
+    blocksize = element_body_index.shape[0]
+    n_valid = 0
+    for k in range(blocksize):
+        if element_body_index[k] >= 0:
+            n_valid += 1
+
+    order = np.empty(n_valid, dtype=np.int64)
+    n_valid = 0
+    for k in range(blocksize):
+        if element_body_index[k] >= 0:
+            order[n_valid] = k
+            n_valid += 1
+    return order
+
+
+@njit(cache=True)  # type: ignore
+def _set_octree_root(
+    position: NDArray[np.float64],
+    order: NDArray[np.int64],
+    node_int: NDArray[np.int64],
+    node_float: NDArray[np.float64],
+) -> None:
+    """
+    Make the root node the bounding cube of all valid elements.
+    """
+    n_valid = order.shape[0]
+    lower = np.full(3, np.inf)
+    upper = np.full(3, -np.inf)
+    for idx in range(n_valid):
+        k = order[idx]
+        for d in range(3):
+            lower[d] = min(lower[d], position[d, k])
+            upper[d] = max(upper[d], position[d, k])
+    half_width = 0.0
+    for d in range(3):
+        node_float[0, _NODE_BOX_CENTER + d] = 0.5 * (lower[d] + upper[d])
+        half_width = max(half_width, 0.5 * (upper[d] - lower[d]))
+    node_float[0, _NODE_HALF_WIDTH] = half_width
+    node_int[0, _NODE_START] = 0
+    node_int[0, _NODE_END] = n_valid
+
+
+@njit(cache=True)  # type: ignore
+def _compute_octree_node_moments(
+    node: int,
+    position: NDArray[np.float64],
+    strength: NDArray[np.float64],
+    element_body_index: NDArray[np.int32],
+    order: NDArray[np.int64],
+    node_int: NDArray[np.int64],
+    node_float: NDArray[np.float64],
+) -> None:
+    """
+    Compute the centroid, total strength and rod index range of the elements of a node.
+    """
+    start = node_int[node, _NODE_START]
+    end = node_int[node, _NODE_END]
+
+    body_min = element_body_index[order[start]]
+    body_max = body_min
+    for d in range(3):
+        node_float[node, _NODE_CENTROID + d] = 0.0
+        node_float[node, _NODE_STRENGTH + d] = 0.0
+    for idx in range(start, end):
+        k = order[idx]
+        body_min = min(body_min, element_body_index[k])
+        body_max = max(body_max, element_body_index[k])
+        for d in range(3):
+            node_float[node, _NODE_CENTROID + d] += position[d, k]
+            node_float[node, _NODE_STRENGTH + d] += strength[d, k]
+    for d in range(3):
+        node_float[node, _NODE_CENTROID + d] /= end - start
+    node_int[node, _NODE_BODY_MIN] = body_min
+    node_int[node, _NODE_BODY_MAX] = body_max
+
+
+@njit(cache=True)  # type: ignore
+def _sort_octree_node_into_octants(
+    node: int,
+    position: NDArray[np.float64],
+    order: NDArray[np.int64],
+    node_int: NDArray[np.int64],
+    node_float: NDArray[np.float64],
+    buffer: NDArray[np.int64],
+    octant: NDArray[np.int64],
+    octant_count: NDArray[np.int64],
+) -> None:
+    """
+    Counting sort of the elements of a node into its octants. After the sort,
+    octant_count[code] is the end of octant `code`, relative to the node start.
+    """
+    start = node_int[node, _NODE_START]
+    end = node_int[node, _NODE_END]
+
+    octant_count[:] = 0
+    for idx in range(start, end):
+        k = order[idx]
+        code = 0
+        for d in range(3):
+            if position[d, k] >= node_float[node, _NODE_BOX_CENTER + d]:
+                code += 1 << d
+        octant[idx] = code
+        octant_count[code + 1] += 1
+    for code in range(8):
+        octant_count[code + 1] += octant_count[code]
+    for idx in range(start, end):
+        code = octant[idx]
+        buffer[start + octant_count[code]] = order[idx]
+        octant_count[code] += 1
+    order[start:end] = buffer[start:end]
+
+
+@njit(cache=True)  # type: ignore
+def _grow_octree_buffers(
+    node_int: NDArray[np.int64],
+    node_float: NDArray[np.float64],
+    node_depth: NDArray[np.int64],
+    n_nodes: int,
+) -> tuple[NDArray[np.int64], NDArray[np.float64], NDArray[np.int64]]:
+    """
+    Reallocate the node buffers with twice their capacity, keeping the first
+    `n_nodes` nodes.
+    """
+    capacity = 2 * node_int.shape[0]
+    new_node_int = np.zeros((capacity, 6), dtype=np.int64)
+    new_node_float = np.zeros((capacity, 10))
+    new_node_depth = np.zeros(capacity, dtype=np.int64)
+    new_node_int[:n_nodes] = node_int[:n_nodes]
+    new_node_float[:n_nodes] = node_float[:n_nodes]
+    new_node_depth[:n_nodes] = node_depth[:n_nodes]
+    return new_node_int, new_node_float, new_node_depth
+
+
+@njit(cache=True)  # type: ignore
+def _add_octree_children(
+    node: int,
+    n_nodes: int,
+    octant_count: NDArray[np.int64],
+    node_int: NDArray[np.int64],
+    node_float: NDArray[np.float64],
+    node_depth: NDArray[np.int64],
+) -> int:
+    """
+    Append a child node for every non-empty octant of a sorted node, and return the
+    new number of nodes.
+    """
+    start = node_int[node, _NODE_START]
+    child_half_width = 0.5 * node_float[node, _NODE_HALF_WIDTH]
+    node_int[node, _NODE_CHILD] = n_nodes
+    n_child = 0
+    child_start = start
+    for code in range(8):
+        child_end = start + octant_count[code]
+        if child_end == child_start:
+            continue
+        node_int[n_nodes, _NODE_START] = child_start
+        node_int[n_nodes, _NODE_END] = child_end
+        for d in range(3):
+            sign = 1.0 if (code >> d) & 1 else -1.0
+            node_float[n_nodes, _NODE_BOX_CENTER + d] = (
+                node_float[node, _NODE_BOX_CENTER + d] + sign * child_half_width
+            )
+        node_float[n_nodes, _NODE_HALF_WIDTH] = child_half_width
+        node_depth[n_nodes] = node_depth[node] + 1
+        n_nodes += 1
+        n_child += 1
+        child_start = child_end
+    node_int[node, _NODE_N_CHILD] = n_child
+    return n_nodes
+
+
+@njit(cache=True)  # type: ignore
+def _build_octree(
+    position: NDArray[np.float64],
+    strength: NDArray[np.float64],
+    element_body_index: NDArray[np.int32],
+    leaf_size: int,
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64], int]:
+    """
+    Build a Barnes-Hut octree over the element centers of all valid elements.
+
+    Each node covers a contiguous range of the returned element ordering, and stores the
+    centroid, the total Stokeslet strength and the range of rod indices of the elements
+    it contains.
+
+    Parameters
+    ----------
+    position: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+        Element centers.
+    strength: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+        Stokeslet strength of each element.
+    element_body_index: numpy.ndarray
+        1D (blocksize) array containing data with 'int' type.
+        Rod index of each element, -1 for ghost and periodic elements.
+    leaf_size: int
+        Maximum number of elements in a leaf node.
+
+    Returns
+    -------
+    order: numpy.ndarray
+        1D array containing the valid element indices sorted by tree node.
+    node_int: numpy.ndarray
+        2D (n_nodes, 6) array containing the integer data of the nodes.
+    node_float: numpy.ndarray
+        2D (n_nodes, 10) array containing the floating point data of the nodes.
+    n_nodes: int
+        Number of nodes in the tree.
+    """
+    order = _valid_element_order(element_body_index)
+    n_valid = order.shape[0]
+
+    capacity = max(16, 2 * n_valid)
+    node_int = np.zeros((capacity, 6), dtype=np.int64)
+    node_float = np.zeros((capacity, 10))
+    node_depth = np.zeros(capacity, dtype=np.int64)
+    if n_valid == 0:
+        return order, node_int, node_float, 0
+
+    _set_octree_root(position, order, node_int, node_float)
+    n_nodes = 1
+
+    buffer = np.empty(n_valid, dtype=np.int64)
+    octant = np.empty(n_valid, dtype=np.int64)
+    octant_count = np.zeros(9, dtype=np.int64)
+
+    # Nodes are processed in the order they are created (breadth first)
+    node = 0
+    while node < n_nodes:
+        _compute_octree_node_moments(
+            node, position, strength, element_body_index, order, node_int, node_float
+        )
+
+        n_elements = node_int[node, _NODE_END] - node_int[node, _NODE_START]
+        if n_elements <= leaf_size or node_depth[node] >= _OCTREE_MAX_DEPTH:
+            node += 1
+            continue
+
+        _sort_octree_node_into_octants(
+            node, position, order, node_int, node_float, buffer, octant, octant_count
+        )
+        if n_nodes + 8 > node_int.shape[0]:
+            node_int, node_float, node_depth = _grow_octree_buffers(
+                node_int, node_float, node_depth, n_nodes
+            )
+        n_nodes = _add_octree_children(
+            node, n_nodes, octant_count, node_int, node_float, node_depth
+        )
+        node += 1
+
+    return order, node_int, node_float, n_nodes
+
+
+@njit(cache=True)  # type: ignore
+def _regularized_stokeslet_velocity_tree(
+    position: NDArray[np.float64],
+    strength: NDArray[np.float64],
+    element_body_index: NDArray[np.int32],
+    regularization_length: np.float64,
+    opening_angle: np.float64,
+    leaf_size: int,
+    induced_velocity: NDArray[np.float64],
+) -> None:
+    """
+    Barnes-Hut O(N log N) approximation of `_regularized_stokeslet_velocity_direct`.
+
+    A tree node is replaced by a single Stokeslet at its centroid carrying the total
+    strength of the node if its size over its distance to the target is smaller than
+    the opening angle, and if it holds no element of the target's own rod. An opening
+    angle of zero recovers the direct summation.
+
+    Parameters
+    ----------
+    position: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+        Element centers.
+    strength: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+        Stokeslet strength (force exerted on the fluid) of each element.
+    element_body_index: numpy.ndarray
+        1D (blocksize) array containing data with 'int' type.
+        Rod index of each element, -1 for ghost and periodic elements.
+    regularization_length: float
+        Regularization (blob) length of the Stokeslets.
+    opening_angle: float
+        Barnes-Hut opening angle. Smaller values are more accurate.
+    leaf_size: int
+        Maximum number of elements in a leaf node.
+    induced_velocity: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+        Output, velocity induced on each element times 8*pi*mu.
+    """
+    blocksize = position.shape[1]
+    epsilon_sq = regularization_length * regularization_length
+    opening_angle_sq = opening_angle * opening_angle
+
+    order, node_int, node_float, n_nodes = _build_octree(
+        position, strength, element_body_index, leaf_size
+    )
+    stack = np.empty(8 * (_OCTREE_MAX_DEPTH + 1), dtype=np.int64)
+
+    # Bounding sphere of each rod. A node can only hold elements of the target's own
+    # rod if its rod index range covers the target rod and its box meets the sphere.
+    n_bodies = 0
+    for k in range(blocksize):
+        n_bodies = max(n_bodies, element_body_index[k] + 1)
+    body_center = np.zeros((3, n_bodies))
+    body_count = np.zeros(n_bodies)
+    body_radius = np.zeros(n_bodies)
+    for k in range(blocksize):
+        body = element_body_index[k]
+        if body >= 0:
+            body_count[body] += 1.0
+            for d in range(3):
+                body_center[d, body] += position[d, k]
+    for body in range(n_bodies):
+        for d in range(3):
+            body_center[d, body] /= max(body_count[body], 1.0)
+    for k in range(blocksize):
+        body = element_body_index[k]
+        if body >= 0:
+            body_radius[body] = max(
+                body_radius[body],
+                np.sqrt(
+                    (position[0, k] - body_center[0, body]) ** 2
+                    + (position[1, k] - body_center[1, body]) ** 2
+                    + (position[2, k] - body_center[2, body]) ** 2
+                ),
+            )
+
+    for i in range(blocksize):
+        induced_velocity[0, i] = 0.0
+        induced_velocity[1, i] = 0.0
+        induced_velocity[2, i] = 0.0
+        body_i = element_body_index[i]
+        if body_i < 0 or n_nodes == 0:
+            continue
+
+        stack[0] = 0
+        stack_size = 1
+        while stack_size > 0:
+            stack_size -= 1
+            node = stack[stack_size]
+
+            r0 = position[0, i] - node_float[node, _NODE_CENTROID + 0]
+            r1 = position[1, i] - node_float[node, _NODE_CENTROID + 1]
+            r2 = position[2, i] - node_float[node, _NODE_CENTROID + 2]
+            size = 2.0 * node_float[node, _NODE_HALF_WIDTH]
+            far_from_target = size * size < opening_angle_sq * (
+                r0 * r0 + r1 * r1 + r2 * r2
+            )
+            holds_target_body = (
+                node_int[node, _NODE_BODY_MIN] <= body_i
+                and body_i <= node_int[node, _NODE_BODY_MAX]
+            )
+            if holds_target_body:
+                c0 = node_float[node, _NODE_BOX_CENTER + 0] - body_center[0, body_i]
+                c1 = node_float[node, _NODE_BOX_CENTER + 1] - body_center[1, body_i]
+                c2 = node_float[node, _NODE_BOX_CENTER + 2] - body_center[2, body_i]
+                reach = (
+                    body_radius[body_i] + _SQRT_3 * node_float[node, _NODE_HALF_WIDTH]
+                )
+                holds_target_body = c0 * c0 + c1 * c1 + c2 * c2 <= reach * reach
+
+            if far_from_target and not holds_target_body:
+                _add_regularized_stokeslet(
+                    r0,
+                    r1,
+                    r2,
+                    node_float[node, _NODE_STRENGTH + 0],
+                    node_float[node, _NODE_STRENGTH + 1],
+                    node_float[node, _NODE_STRENGTH + 2],
+                    epsilon_sq,
+                    induced_velocity,
+                    i,
+                )
+            elif node_int[node, _NODE_N_CHILD] == 0:
+                for idx in range(
+                    node_int[node, _NODE_START], node_int[node, _NODE_END]
+                ):
+                    j = order[idx]
+                    if element_body_index[j] == body_i:
+                        continue
+                    _add_regularized_stokeslet(
+                        position[0, i] - position[0, j],
+                        position[1, i] - position[1, j],
+                        position[2, i] - position[2, j],
+                        strength[0, j],
+                        strength[1, j],
+                        strength[2, j],
+                        epsilon_sq,
+                        induced_velocity,
+                        i,
+                    )
+            else:
+                first_child = node_int[node, _NODE_CHILD]
+                for child in range(
+                    first_child, first_child + node_int[node, _NODE_N_CHILD]
+                ):
+                    stack[stack_size] = child
+                    stack_size += 1
+
+
+@njit(cache=True)  # type: ignore
+def regularized_stokeslet_forces(
+    tangents: NDArray[np.float64],
+    position_collection: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    dynamic_viscosity: np.float64,
+    lengths: NDArray[np.float64],
+    radius: NDArray[np.float64],
+    mass: NDArray[np.float64],
+    element_body_index: NDArray[np.int32],
+    regularization_length: np.float64,
+    opening_angle: np.float64,
+    leaf_size: int,
+    use_tree: bool,
+) -> NDArray[np.float64]:
+    r"""
+    This function computes hydrodynamic forces on rods, using the local slender body
+    theory of Eq. 4.13 in Gazzola et al. RSoS. (2018) corrected by the flow induced
+    by all other rods. Each element exerts the force :math:`-\mathbf{F}_{h}` on the
+    fluid, which is represented by a regularized Stokeslet (Cortez et al. 2005) at
+    the element center. The resulting velocity :math:`\mathbf{u}` is the background
+    flow seen by the elements of the other rods:
+
+    .. math::
+        \mathbf{F}_{h}=\frac{-4\pi\mu}{\ln{(L/r)}}\left(\mathbf{I}-\frac{1}{2}\mathbf{t}^{\textrm{T}}\mathbf{t}\right)(\mathbf{v}-\mathbf{u})
+
+    Parameters
+    ----------
+    tangents: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+        Rod-like element tangent directions.
+    position_collection: numpy.ndarray
+        2D (dim, blocksize+1) array containing data with 'float' type.
+        Rod-like object node positions.
+    velocity_collection: numpy.ndarray
+        2D (dim, blocksize+1) array containing data with 'float' type.
+        Rod-like object velocity collection.
+    dynamic_viscosity: float
+        Dynamic viscosity of the fluid.
+    lengths: numpy.ndarray
+        1D (blocksize) array containing data with 'float' type.
+        Rod-like object element lengths.
+    radius: numpy.ndarray
+        1D (blocksize) array containing data with 'float' type.
+        Rod-like object element radius.
+    mass: numpy.ndarray
+        1D (blocksize+1) array containing data with 'float' type.
+        Rod-like object node mass.
+    element_body_index: numpy.ndarray
+        1D (blocksize) array containing data with 'int' type.
+        Rod index of each element, -1 for ghost and periodic elements.
+    regularization_length: float
+        Regularization (blob) length of the Stokeslets.
+    opening_angle: float
+        Barnes-Hut opening angle, only used with the tree summation.
+    leaf_size: int
+        Maximum number of elements in a leaf node, only used with the tree summation.
+    use_tree: bool
+        Use the O(N log N) tree summation instead of the O(N^2) direct summation.
+
+    Returns
+    -------
+    stokes_force: numpy.ndarray
+       2D (dim, blocksize) array containing data with 'float' type.
+    """
+    blocksize = tangents.shape[1]
+    element_velocity = _node_to_element_velocity(
+        mass=mass, node_velocity_collection=velocity_collection
+    )
+
+    # Total length of each rod, used in the slender body resistance
+    n_bodies = 0
+    for k in range(blocksize):
+        n_bodies = max(n_bodies, element_body_index[k] + 1)
+    body_length = np.zeros(n_bodies)
+    for k in range(blocksize):
+        if element_body_index[k] >= 0:
+            body_length[element_body_index[k]] += lengths[k]
+
+    # Local slender body resistance and the Stokeslet strength
+    factor = np.zeros(blocksize)
+    element_position = np.empty((3, blocksize))
+    strength = np.empty((3, blocksize))
+    for k in range(blocksize):
+        for d in range(3):
+            element_position[d, k] = 0.5 * (
+                position_collection[d, k] + position_collection[d, k + 1]
+            )
+        if element_body_index[k] >= 0:
+            # factor = - 4*pi*mu/ln(L/r)
+            factor[k] = (
+                -4.0
+                * np.pi
+                * dynamic_viscosity
+                / np.log(body_length[element_body_index[k]] / radius[k])
+                * lengths[k]
+            )
+        t_dot_v = (
+            tangents[0, k] * element_velocity[0, k]
+            + tangents[1, k] * element_velocity[1, k]
+            + tangents[2, k] * element_velocity[2, k]
+        )
+        for d in range(3):
+            # The fluid receives the opposite of the local hydrodynamic force
+            strength[d, k] = -factor[k] * (
+                element_velocity[d, k] - 0.5 * tangents[d, k] * t_dot_v
+            )
+
+    induced_velocity = np.empty((3, blocksize))
+    if use_tree:
+        _regularized_stokeslet_velocity_tree(
+            element_position,
+            strength,
+            element_body_index,
+            regularization_length,
+            opening_angle,
+            leaf_size,
+            induced_velocity,
+        )
+    else:
+        _regularized_stokeslet_velocity_direct(
+            element_position,
+            strength,
+            element_body_index,
+            regularization_length,
+            induced_velocity,
+        )
+
+    f = np.empty((3, blocksize))
+    inv_eight_pi_mu = 1.0 / (8.0 * np.pi * dynamic_viscosity)
+    for k in range(blocksize):
+        relative_velocity_0 = (
+            element_velocity[0, k] - inv_eight_pi_mu * induced_velocity[0, k]
+        )
+        relative_velocity_1 = (
+            element_velocity[1, k] - inv_eight_pi_mu * induced_velocity[1, k]
+        )
+        relative_velocity_2 = (
+            element_velocity[2, k] - inv_eight_pi_mu * induced_velocity[2, k]
+        )
+        t_dot_v = (
+            tangents[0, k] * relative_velocity_0
+            + tangents[1, k] * relative_velocity_1
+            + tangents[2, k] * relative_velocity_2
+        )
+        # Fh = factor * ((I - 0.5 * a) * (v - u)), zero on ghost elements
+        f[0, k] = factor[k] * (relative_velocity_0 - 0.5 * tangents[0, k] * t_dot_v)
+        f[1, k] = factor[k] * (relative_velocity_1 - 0.5 * tangents[1, k] * t_dot_v)
+        f[2, k] = factor[k] * (relative_velocity_2 - 0.5 * tangents[2, k] * t_dot_v)
+
+    return f
+
+
+class RegularizedStokesletForces(NoForces):
+    """
+    This class applies hydrodynamic forces on rods, including the rod-rod
+    hydrodynamic interactions. Each rod is subject to the local slender body theory
+    of `SlenderBodyTheory`, evaluated relative to the flow induced by the other rods.
+    That flow is computed by representing every element as a regularized Stokeslet.
+
+    Rods are told apart through the ghost elements of the memory block, so the
+    interactions are only captured if the forcing is applied to the memory block.
+    For a single rod, this class is equivalent to `SlenderBodyTheory`.
+
+    The induced flow is either summed directly in O(N^2), or approximated with a
+    Barnes-Hut octree over the element centers in O(N log N). The accuracy of the
+    tree summation is controlled by the `opening_angle`.
+
+    Examples
+    --------
+    How to add hydrodynamic interactions between all rods:
+
+    >>> simulator.add_forcing_to_block(RodBase).using(
+    ...     RegularizedStokesletForces,
+    ...     dynamic_viscosity=1.0,
+    ...     regularization_length=0.01,
+    ...     opening_angle=0.5,
+    ... )
+
+        Attributes
+        ----------
+        dynamic_viscosity: float
+            Dynamic viscosity of the fluid.
+        regularization_length: float
+            Regularization (blob) length of the Stokeslets.
+        method: str
+            Summation method, "tree" or "direct".
+        opening_angle: float
+            Barnes-Hut opening angle.
+        leaf_size: int
+            Maximum number of elements in a leaf node of the tree.
+
+    """
+
+    AVAILABLE_METHOD = ["tree", "direct"]
+
+    def __init__(
+        self,
+        dynamic_viscosity: float,
+        regularization_length: float,
+        method: str = "tree",
+        opening_angle: float = 0.5,
+        leaf_size: int = 8,
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        dynamic_viscosity : float
+            Dynamic viscosity of the fluid.
+        regularization_length : float
+            Regularization (blob) length of the Stokeslets. Typically of the order of
+            the rod radius.
+        method : str
+            Summation method. "tree" for the O(N log N) Barnes-Hut approximation, or
+            "direct" for the O(N^2) reference summation. (default: "tree")
+        opening_angle : float
+            Barnes-Hut opening angle. A tree node is approximated by a single Stokeslet
+            if its size over its distance to the target element is smaller than this
+            value. Zero recovers the direct summation. (default: 0.5)
+        leaf_size : int
+            Maximum number of elements in a leaf node of the tree. (default: 8)
+        """
+        super(RegularizedStokesletForces, self).__init__()
+        assert (
+            method in RegularizedStokesletForces.AVAILABLE_METHOD
+        ), f"The summation method ({method}) is not supported. Please use one of {RegularizedStokesletForces.AVAILABLE_METHOD}."
+        assert regularization_length > 0.0, "Regularization length must be positive."
+        assert opening_angle >= 0.0, "Opening angle must be non-negative."
+        assert leaf_size > 0, "Leaf size must be positive."
+        self.dynamic_viscosity = np.float64(dynamic_viscosity)
+        self.regularization_length = np.float64(regularization_length)
+        self.method = method
+        self.opening_angle = np.float64(opening_angle)
+        self.leaf_size = int(leaf_size)
+        self._element_body_index: NDArray[np.int32] = np.empty(0, dtype=np.int32)
+        self._element_layout: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+
+    def apply_forces(self, system: RodType, time: np.float64 = np.float64(0.0)) -> None:
+        """
+        This function applies hydrodynamic forces, including the flow induced by
+        the other rods, on every rod of the system. Free slots of a memory block
+        neither induce a flow nor are forced.
+
+        Parameters
+        ----------
+        system
+
+        """
+        element_layout = _element_layout(system)
+        if not np.array_equal(element_layout, self._element_layout):
+            self._element_layout = element_layout
+            self._element_body_index = _element_body_index(system)
+
+        stokes_force = regularized_stokeslet_forces(
+            system.tangents,
+            system.position_collection,
+            system.velocity_collection,
+            self.dynamic_viscosity,
+            system.lengths,
+            system.radius,
+            system.mass,
+            self._element_body_index,
+            self.regularization_length,
+            self.opening_angle,
+            self.leaf_size,
+            self.method == "tree",
+        )
+        _elements_to_nodes_inplace(stokes_force, system.external_forces)
+
+
+@njit(cache=True)  # type: ignore
+def _interpolate_gridded_field(
+    field: NDArray[np.floating],
+    origin: NDArray[np.float64],
+    inverse_spacing: NDArray[np.float64],
+    position_collection: NDArray[np.float64],
+    element_mask: NDArray[np.bool_],
+    weight: np.float64,
+    element_field: NDArray[np.float64],
+) -> None:
+    """
+    This function trilinearly interpolates a vector field sampled on a regular grid
+    at the element centers, and adds the result times weight to element_field.
+    Element centers outside the grid are clamped onto its boundary.
+
+    Parameters
+    ----------
+    field: numpy.ndarray
+        4D (nx, ny, nz, dim) array containing the field sampled on the grid nodes.
+    origin: numpy.ndarray
+        1D (dim) array containing data with 'float' type. Position of grid node (0, 0, 0).
+    inverse_spacing: numpy.ndarray
+        1D (dim) array containing data with 'float' type. Inverse of the grid spacing.
+    position_collection: numpy.ndarray
+        2D (dim, n_nodes) array containing data with 'float' type.
+    element_mask: numpy.ndarray
+        1D (n_elems) array containing data with 'bool' type. Only masked elements
+        are evaluated.
+    weight: float
+        Weight of the interpolated field, used to blend time frames.
+    element_field: numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    """
+    grid_shape = field.shape
+    n_elems = element_mask.shape[0]
+    corner_index = np.empty((3, 2), dtype=np.int64)
+    corner_weight = np.empty((3, 2))
+
+    for k in range(n_elems):
+        if not element_mask[k]:
+            continue
+
+        for d in range(3):
+            grid_coordinate = (
+                0.5 * (position_collection[d, k] + position_collection[d, k + 1])
+                - origin[d]
+            ) * inverse_spacing[d]
+            grid_coordinate = min(max(grid_coordinate, 0.0), grid_shape[d] - 1.0)
+            lower = min(int(grid_coordinate), max(grid_shape[d] - 2, 0))
+            upper = min(lower + 1, grid_shape[d] - 1)
+            fraction = grid_coordinate - lower
+            corner_index[d, 0] = lower
+            corner_index[d, 1] = upper
+            corner_weight[d, 0] = 1.0 - fraction
+            corner_weight[d, 1] = fraction
+
+        v0 = 0.0
+        v1 = 0.0
+        v2 = 0.0
+        for a in range(2):
+            for b in range(2):
+                for c in range(2):
+                    w = corner_weight[0, a] * corner_weight[1, b] * corner_weight[2, c]
+                    i = corner_index[0, a]
+                    j = corner_index[1, b]
+                    kz = corner_index[2, c]
+                    v0 += w * field[i, j, kz, 0]
+                    v1 += w * field[i, j, kz, 1]
+                    v2 += w * field[i, j, kz, 2]
+
+        element_field[0, k] += weight * v0
+        element_field[1, k] += weight * v1
+        element_field[2, k] += weight * v2
+
+
+@njit(cache=True)  # type: ignore
+def _compute_gridded_flow_drag(
+    tangents: NDArray[np.float64],
+    element_velocity: NDArray[np.float64],
+    flow_velocity: NDArray[np.float64],
+    lengths: NDArray[np.float64],
+    tangential_drag_coefficient: np.float64,
+    normal_drag_coefficient: np.float64,
+    element_mask: NDArray[np.bool_],
+    element_forces: NDArray[np.float64],
+) -> None:
+    """
+    This function computes the anisotropic linear drag on every element, given the
+    velocity of the background flow at the element centers.
+
+    Parameters
+    ----------
+    tangents: numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    element_velocity: numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    flow_velocity: numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    lengths: numpy.ndarray
+        1D (n_elems) array containing data with 'float' type.
+    tangential_drag_coefficient: float
+        Drag per unit length and unit relative velocity along the tangent.
+    normal_drag_coefficient: float
+        Drag per unit length and unit relative velocity normal to the tangent.
+    element_mask: numpy.ndarray
+        1D (n_elems) array containing data with 'bool' type.
+    element_forces: numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    """
+    n_elems = lengths.shape[0]
+    for k in range(n_elems):
+        if not element_mask[k]:
+            element_forces[0, k] = 0.0
+            element_forces[1, k] = 0.0
+            element_forces[2, k] = 0.0
+            continue
+
+        relative_velocity_0 = element_velocity[0, k] - flow_velocity[0, k]
+        relative_velocity_1 = element_velocity[1, k] - flow_velocity[1, k]
+        relative_velocity_2 = element_velocity[2, k] - flow_velocity[2, k]
+        tangential_velocity = (
+            tangents[0, k] * relative_velocity_0
+            + tangents[1, k] * relative_velocity_1
+            + tangents[2, k] * relative_velocity_2
+        )
+        factor = (
+            tangential_drag_coefficient - normal_drag_coefficient
+        ) * tangential_velocity
+        element_forces[0, k] = -lengths[k] * (
+            normal_drag_coefficient * relative_velocity_0 + factor * tangents[0, k]
+        )
+        element_forces[1, k] = -lengths[k] * (
+            normal_drag_coefficient * relative_velocity_1 + factor * tangents[1, k]
+        )
+        element_forces[2, k] = -lengths[k] * (
+            normal_drag_coefficient * relative_velocity_2 + factor * tangents[2, k]
+        )
+
+
+@njit(cache=True)  # type: ignore
+def _compute_gridded_body_forces(
+    force_density: NDArray[np.float64],
+    volume: NDArray[np.float64],
+    element_mask: NDArray[np.bool_],
+    element_forces: NDArray[np.float64],
+) -> None:
+    """
+    This function integrates a force density over the element volumes.
+
+    Parameters
+    ----------
+    force_density: numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    volume: numpy.ndarray
+        1D (n_elems) array containing data with 'float' type.
+    element_mask: numpy.ndarray
+        1D (n_elems) array containing data with 'bool' type.
+    element_forces: numpy.ndarray
+        2D (dim, n_elems) array containing data with 'float' type.
+    """
+    n_elems = volume.shape[0]
+    for k in range(n_elems):
+        factor = volume[k] if element_mask[k] else 0.0
+        element_forces[0, k] = factor * force_density[0, k]
+        element_forces[1, k] = factor * force_density[1, k]
+        element_forces[2, k] = factor * force_density[2, k]
+
+
+class GriddedFlowForces(NoForces):
+    """
+    This class applies forces from a background field sampled on a regular 3D grid,
+    such as the output of an external CFD solver. The field is either the flow
+    velocity, in which case an anisotropic linear drag relative to the flow is applied
+    on every element, or a force density (per unit volume) that is integrated over the
+    element volumes. The field is trilinearly interpolated at the element centers, and
+    linearly interpolated in time if a time axis is given.
+
+    The field can be given as the path to a `.npy` file, which is memory-mapped
+    instead of loaded, so only the grid cells visited by the rods are read from disk.
+    The forcing can be applied to a single rod or, batched over all rods, to the memory
+    block using `add_forcing_to_block`.
+
+    Examples
+    --------
+    How to drive all rods with a time-dependent flow field:
+
+    >>> simulator.add_forcing_to_block(RodBase).using(
+    ...     GriddedFlowForces,
+    ...     field="flow.npy",  # shape (nt, nx, ny, nz, 3)
+    ...     origin=np.zeros(3),
+    ...     spacing=0.01,
+    ...     field_time=np.linspace(0.0, 1.0, nt),
+    ...     normal_drag_coefficient=1.0,
+    ... )
+
+        Attributes
+        ----------
+        field: numpy.ndarray
+            4D (nx, ny, nz, dim) or 5D (nt, nx, ny, nz, dim) array of the sampled field.
+        field_type: str
+            "velocity" or "force_density".
+        origin: numpy.ndarray
+            1D (dim) array containing data with 'float' type. Position of grid node (0, 0, 0).
+        spacing: numpy.ndarray
+            1D (dim) array containing data with 'float' type. Grid spacing.
+        field_time: numpy.ndarray | None
+            1D (nt) array containing the sample times of the field.
+        tangential_drag_coefficient: float
+            Drag per unit length and unit relative velocity along the rod tangent.
+        normal_drag_coefficient: float
+            Drag per unit length and unit relative velocity normal to the rod tangent.
+
+    """
+
+    AVAILABLE_FIELD_TYPE = ["velocity", "force_density"]
+
+    def __init__(
+        self,
+        field: "str | NDArray[np.floating]",
+        origin: NDArray[np.float64],
+        spacing: "float | NDArray[np.float64]",
+        field_type: str = "velocity",
+        field_time: "NDArray[np.float64] | None" = None,
+        normal_drag_coefficient: float = 0.0,
+        tangential_drag_coefficient: "float | None" = None,
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        field : str | numpy.ndarray
+            Field sampled on the grid nodes, or the path to a `.npy` file containing it.
+            The file is memory-mapped in read-only mode. The shape is (nx, ny, nz, 3)
+            for a steady field, or (nt, nx, ny, nz, 3) if field_time is given.
+        origin : numpy.ndarray
+            1D (dim) array containing data with 'float' type. Position of grid node
+            (0, 0, 0).
+        spacing : float | numpy.ndarray
+            Grid spacing, either uniform or 1D (dim) array for each direction.
+        field_type : str
+            "velocity" if the field is the flow velocity, "force_density" if the field
+            is a force per unit volume. (default: "velocity")
+        field_time : numpy.ndarray | None
+            1D (nt) array of increasing sample times of the field. The field is
+            linearly interpolated in time, and held constant outside the sampled
+            interval. (default: None)
+        normal_drag_coefficient : float
+            Drag per unit length and unit relative velocity normal to the rod tangent.
+            Only used for velocity fields. (default: 0.0)
+        tangential_drag_coefficient : float | None
+            Drag per unit length and unit relative velocity along the rod tangent.
+            Only used for velocity fields. If None, half of the normal drag coefficient
+            is used, as for slender bodies in Stokes flow. (default: None)
+        """
+        super(GriddedFlowForces, self).__init__()
+        assert (
+            field_type in GriddedFlowForces.AVAILABLE_FIELD_TYPE
+        ), f"The field type ({field_type}) is not supported. Please use one of {GriddedFlowForces.AVAILABLE_FIELD_TYPE}."
+        if isinstance(field, np.ndarray):
+            self.field = field
+        else:
+            self.field = np.load(field, mmap_mode="r")
+        if isinstance(self.field, np.memmap):
+            # Plain view of the mapped buffer: nothing is read until it is indexed.
+            self.field = self.field.view(np.ndarray)
+
+        expected_ndim = 4 if field_time is None else 5
+        assert (
+            self.field.ndim == expected_ndim and self.field.shape[-1] == 3
+        ), f"Field shape {self.field.shape} is not valid. Expected (nx, ny, nz, 3), or (nt, nx, ny, nz, 3) with a time axis."
+        if field_time is None:
+            self.field_time = None
+        else:
+            self.field_time = np.asarray(field_time, dtype=np.float64)
+            assert (
+                self.field_time.shape[0] == self.field.shape[0]
+            ), "Number of field time samples does not match the field."
+            assert np.all(
+                np.diff(self.field_time) > 0.0
+            ), "Field time must be increasing."
+
+        self.field_type = field_type
+        self.origin = np.asarray(origin, dtype=np.float64).reshape(3)
+        self.spacing = np.broadcast_to(
+            np.asarray(spacing, dtype=np.float64), (3,)
+        ).copy()
+        assert np.all(self.spacing > 0.0), "Grid spacing must be positive."
+        self._inverse_spacing = 1.0 / self.spacing
+
+        assert normal_drag_coefficient >= 0.0, "Drag coefficients must be non-negative."
+        if tangential_drag_coefficient is None:
+            tangential_drag_coefficient = 0.5 * normal_drag_coefficient
+        assert (
+            tangential_drag_coefficient >= 0.0
+        ), "Drag coefficients must be non-negative."
+        self.normal_drag_coefficient = np.float64(normal_drag_coefficient)
+        self.tangential_drag_coefficient = np.float64(tangential_drag_coefficient)
+
+        self._element_layout: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._element_mask: NDArray[np.bool_] = np.empty(0, dtype=np.bool_)
+        self._element_field: NDArray[np.float64] = np.empty((3, 0))
+        self._element_forces: NDArray[np.float64] = np.empty((3, 0))
+
+    def interpolate(
+        self, system: RodType, time: np.float64 = np.float64(0.0)
+    ) -> NDArray[np.float64]:
+        """
+        This function interpolates the field at the element centers of the system.
+
+        Parameters
+        ----------
+        system
+        time
+
+        Returns
+        -------
+        element_field: numpy.ndarray
+            2D (dim, n_elems) array containing the interpolated field. The buffer is
+            reused by the forcing, copy it to keep the values.
+        """
+        n_elems = system.lengths.shape[0]
+        if self._element_field.shape[1] != n_elems:
+            self._element_field = np.zeros((3, n_elems))
+            self._element_forces = np.zeros((3, n_elems))
+        element_layout = _element_layout(system)
+        if not np.array_equal(element_layout, self._element_layout):
+            # Ghost elements and free slots of a memory block are not forced
+            self._element_layout = element_layout
+            self._element_mask = _element_body_index(system) >= 0
+
+        self._element_field[:] = 0.0
+        frames: tuple[tuple[NDArray[np.floating], float], ...]
+        if self.field_time is None:
+            frames = ((self.field, 1.0),)
+        else:
+            frames = self._time_frames(time)
+        for frame, weight in frames:
+            _interpolate_gridded_field(
+                frame,
+                self.origin,
+                self._inverse_spacing,
+                system.position_collection,
+                self._element_mask,
+                np.float64(weight),
+                self._element_field,
+            )
+        return self._element_field
+
+    def _time_frames(
+        self, time: np.float64
+    ) -> "tuple[tuple[NDArray[np.floating], float], ...]":
+        field_time = self.field_time
+        assert field_time is not None
+        if time <= field_time[0] or field_time.shape[0] == 1:
+            return ((self.field[0], 1.0),)
+        if time >= field_time[-1]:
+            return ((self.field[-1], 1.0),)
+        upper = int(np.searchsorted(field_time, time, side="right"))
+        fraction = (time - field_time[upper - 1]) / (
+            field_time[upper] - field_time[upper - 1]
+        )
+        return (
+            (self.field[upper - 1], 1.0 - fraction),
+            (self.field[upper], fraction),
+        )
+
+    def apply_forces(self, system: RodType, time: np.float64 = np.float64(0.0)) -> None:
+        """
+        This function applies the forces from the gridded field on every element
+        of the system.
+
+        Parameters
+        ----------
+        system
+        time
+
+        """
+        element_field = self.interpolate(system, time)
+
+        if self.field_type == "velocity":
+            _compute_gridded_flow_drag(
+                system.tangents,
+                _node_to_element_velocity(system.mass, system.velocity_collection),
+                element_field,
+                system.lengths,
+                self.tangential_drag_coefficient,
+                self.normal_drag_coefficient,
+                self._element_mask,
+                self._element_forces,
+            )
+        else:
+            _compute_gridded_body_forces(
+                element_field,
+                system.volume,
+                self._element_mask,
+                self._element_forces,
+            )
+        _elements_to_nodes_inplace(self._element_forces, system.external_forces)
+
+
 # base class for interaction
 # only applies normal force no friction
 class InteractionPlaneRigidBody(NoForces):
@@ -1,10 +1,14 @@
 __doc__ = """Create block-structure class for collection of rigid body systems."""
 from typing import Literal
 import numpy as np
+from numpy.typing import NDArray
 from elastica.typing import SystemIdxType, RigidBodyType
 
 from elastica.rigidbody import RigidBodyBase
 from elastica.rigidbody.data_structures import _RigidRodSymplecticStepperMixin
+from elastica.rod.data_structures import _KinematicState
+
+from .utils import contiguous_runs
 
 
 class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
@@ -16,6 +20,13 @@ class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
         self.n_elems = self.n_systems
         self.n_nodes = self.n_elems
         self.system_idx_list = np.array(system_idx_list, dtype=np.int32)
+        # Attributes of the systems that are stored in the block.
+        self._system_fields: list[str] = []
+        # Bodies asleep (see set_awake) and driven (see set_driven), and segments of
+        # the other bodies if some bodies are asleep or driven.
+        self.awake: NDArray[np.bool_] = np.ones(self.n_systems, dtype=np.bool_)
+        self.driven: NDArray[np.bool_] = np.zeros(self.n_systems, dtype=np.bool_)
+        self.awake_segments: list[MemoryBlockRigidBody] | None = None
 
         # Allocate block structure using system collection.
         self._allocate_block_variables_scalars(systems)
@@ -178,6 +189,139 @@ class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
             self.rate_collection[2:-1], (2, 3 * self.n_elems)
         )
 
+    def release_systems(
+        self, block_indices: list[int], systems: list[RigidBodyType]
+    ) -> None:
+        """
+        Remove rigid bodies from the block, e.g. when they are retired during a
+        simulation. The bodies keep copies of their attributes, and their slots
+        are left at rest, so that they can be used by other rigid bodies (see
+        `place_systems`). Forcing or contact must not be applied on a free slot.
+
+        Parameters
+        ----------
+        block_indices: list[int]
+            Positions of the rigid bodies in the block.
+        systems: list[RigidBodyType]
+            Rigid bodies to remove.
+
+        """
+        for block_idx, system in zip(block_indices, systems):
+            for field in self._system_fields:
+                system.__dict__[field] = self.__dict__[field][
+                    ..., block_idx : block_idx + 1
+                ].copy()
+            self.system_idx_list[block_idx] = -1
+            self.velocity_collection[:, block_idx] = 0.0
+            self.omega_collection[:, block_idx] = 0.0
+            self.acceleration_collection[:, block_idx] = 0.0
+            self.alpha_collection[:, block_idx] = 0.0
+        if np.any(self.driven[block_indices]):
+            self.driven[block_indices] = False
+            self._update_awake_segments()
+
+    def place_systems(
+        self,
+        block_indices: list[int],
+        systems: list[RigidBodyType],
+        system_idx_list: list[SystemIdxType],
+    ) -> None:
+        """
+        Place rigid bodies in free slots of the block (see `release_systems`),
+        e.g. when they are added during a simulation. The attributes of the bodies
+        are copied into the block, and the bodies become views into the block.
+
+        Parameters
+        ----------
+        block_indices: list[int]
+            Positions of the free slots in the block.
+        systems: list[RigidBodyType]
+            Rigid bodies to place.
+        system_idx_list: list[SystemIdxType]
+            Indices of the rigid bodies in the simulator.
+
+        """
+        for block_idx, system, system_idx in zip(
+            block_indices, systems, system_idx_list
+        ):
+            assert self.system_idx_list[block_idx] < 0, "The slot is not free."
+            for field in self._system_fields:
+                block_view = self.__dict__[field]
+                block_view[..., block_idx : block_idx + 1] = system.__dict__[field]
+                system.__dict__[field] = np.ndarray.view(
+                    block_view[..., block_idx : block_idx + 1]
+                )
+            self.system_idx_list[block_idx] = system_idx
+
+    def set_awake(self, awake: NDArray[np.bool_]) -> None:
+        """
+        Set which rigid bodies of the block are awake. Bodies asleep are skipped in
+        the computation of accelerations, and in the kinematic update of the
+        time-stepper, which steps the segments of contiguous bodies awake and not
+        driven instead of the block (see `awake_segments`, and `set_driven`).
+        Bodies must be at rest when they are put asleep: their velocities and
+        accelerations have to be zero.
+
+        Parameters
+        ----------
+        awake: NDArray[np.bool_]
+            Whether each rigid body of the block is awake.
+
+        """
+        self.awake = awake
+        self._update_awake_segments()
+
+    def set_driven(self, driven: NDArray[np.bool_]) -> None:
+        """
+        Set which bodies of the block are driven, i.e. their motion is prescribed
+        (see PrescribedMotion). Like bodies asleep, driven bodies are skipped in
+        the computation of accelerations, and in the kinematic update of the
+        time-stepper.
+
+        Parameters
+        ----------
+        driven: NDArray[np.bool_]
+            Whether each body of the block is driven.
+
+        """
+        self.driven = driven
+        self._update_awake_segments()
+
+    def _update_awake_segments(self) -> None:
+        stepped = self.awake & ~self.driven
+        if np.all(stepped):
+            self.awake_segments = None
+        else:
+            self.awake_segments = [
+                self._make_segment(first, stop)
+                for first, stop in contiguous_runs(stepped)
+            ]
+
+    def _make_segment(self, first: int, stop: int) -> "MemoryBlockRigidBody":
+        """
+        Returns the rigid bodies from `first` to `stop` (excluded) of the block, as
+        a memory block whose attributes are views into this block.
+        """
+        segment = MemoryBlockRigidBody.__new__(MemoryBlockRigidBody)
+        for field in self._system_fields:
+            segment.__dict__[field] = self.__dict__[field][..., first:stop]
+        segment.n_systems = stop - first
+        segment.n_elems = segment.n_nodes = stop - first
+        segment.awake = np.ones(segment.n_systems, dtype=np.bool_)
+        segment.driven = np.zeros(segment.n_systems, dtype=np.bool_)
+        segment.awake_segments = None
+        segment.kinematic_states = _KinematicState(
+            segment.position_collection, segment.director_collection
+        )
+        return segment
+
+    def update_accelerations(self, time: np.float64) -> None:
+        if self.awake_segments is not None:
+            for segment in self.awake_segments:
+                segment.update_accelerations(time)
+            return
+        super().update_accelerations(time)
+
     def _map_system_properties_to_block_memory(
         self,
         mapping_dict: dict,
@@ -216,6 +360,7 @@ class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
             )
 
         for k, v in mapping_dict.items():
+            self._system_fields.append(k)
             self.__dict__[k] = np.lib.stride_tricks.as_strided(
                 block_memory[v],
                 shape=view_shape,
@@ -1,12 +1,20 @@
 __doc__ = """Create block-structure class for collection of Cosserat rod systems."""
 import numpy as np
-from typing import Literal, Callable
+from numpy.typing import NDArray
+from typing import Literal, Callable, Iterable
+from typing_extensions import Self
 from elastica.typing import SystemIdxType, RodType
-from elastica.rod.data_structures import _RodSymplecticStepperMixin
+from elastica.rod.data_structures import _RodSymplecticStepperMixin, _KinematicState
 from elastica.reset_functions_for_block_structure import _reset_scalar_ghost
 from elastica.rod.cosserat_rod import (
     CosseratRod,
+    _LEAN_MEMORY_DERIVED_FIELDS,
+    _DIAGONAL_MATERIAL_TENSORS,
+    _diagonal_tensor,
     _compute_sigma_kappa_for_blockstructure,
+    _compute_internal_forces_with_diagonal_material,
+    _compute_internal_torques_with_diagonal_material,
+    _update_accelerations_with_diagonal_material,
 )
 from elastica._synchronize_periodic_boundary import (
     _synchronize_periodic_boundary_of_vector_collection,
@@ -15,10 +23,18 @@ from elastica._synchronize_periodic_boundary import (
 )
 
 from .utils import (
+    contiguous_runs,
     make_block_memory_metadata,
     make_block_memory_periodic_boundary_metadata,
 )
 
+# Workspace of the internal force and torque kernels, with its domain.
+_WORKSPACE_FIELDS: dict[str, str] = {
+    "element_workspace": "element",
+    "J_omega_upon_e": "element",
+    "voronoi_workspace": "voronoi",
+}
+
 
 class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
     """
@@ -27,13 +43,43 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
     arrays to store the system data and returns a reference of that data to the systems.
     Thus each system is now in contiguous memory, so it is faster to compute Cosserat rod equations.
 
+    In lean memory mode, only the state, the rest configuration and the quantities
+    used across the stages of a step (e.g. lengths, tangents, internal forces) are
+    stored. Strains, stresses and dilatation rates are computed chunk by chunk of
+    rods into a small workspace, which is reused. The rods of the block do not store
+    these quantities either: they are computed when they are read (e.g.
+    `rod.sigma`). Lean memory mode supports straight rods only.
+
+    The shear matrix, bend matrix and (inverse) mass second moment of inertia must
+    be diagonal in lean memory mode, which is the case for isotropic circular rods,
+    and only their diagonals are stored, as compact (3, n) arrays used by
+    specialised kernels instead of the full (3, 3, n) tensors. The systems store the
+    diagonals as well (e.g. `rod.shear_matrix_diagonal`), which are modified instead
+    of the material tensors: these are rebuilt from the diagonals when they are
+    read, as new read-only arrays.
+    See `nbytes_per_element` for the memory used in each mode.
+
     TODO: need more documentation!
     """
 
+    # Maximum number of elements of the chunks of rods, whose strains and stresses
+    # are computed together in lean memory mode, unless a rod is longer.
+    LEAN_MEMORY_CHUNK_ELEMS: int = 2**14
+
+    # Diagonals of the material tensors, stored in lean memory mode
+    mass_second_moment_of_inertia_diagonal: NDArray[np.float64]
+    inv_mass_second_moment_of_inertia_diagonal: NDArray[np.float64]
+    shear_matrix_diagonal: NDArray[np.float64]
+    bend_matrix_diagonal: NDArray[np.float64]
+
     def __init__(
-        self, systems: list[RodType], system_idx_list: list[SystemIdxType]
+        self,
+        systems: list[RodType],
+        system_idx_list: list[SystemIdxType],
+        lean_memory: bool = False,
     ) -> None:
         self.n_systems = len(systems)
+        self.lean_memory = lean_memory
 
         # separate straight and ring rods
         system_straight_rod = []
@@ -63,12 +109,258 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
             [x.n_elems for x in system_ring_rod], dtype=np.int32
         )
 
-        n_straight_rods: int = len(system_straight_rod)
         n_ring_rods: int = len(system_ring_rod)
+        assert not (
+            lean_memory and n_ring_rods
+        ), "Lean memory mode supports straight rods only."
+
+        self._make_block_metadata(n_elems_straight_rods, n_elems_ring_rods)
+
+        # Material tensors are only stored as diagonals in lean memory mode.
+        self.diagonal_material_flag = lean_memory
+        assert not lean_memory or self._has_diagonal_material(
+            systems
+        ), "Lean memory mode requires diagonal material tensors."
+
+        # Straight rods built together by CosseratRod.straight_rods are views into a
+        # preallocated block memory. If the block contains exactly these rods, the
+        # preallocated memory is used instead of copying the rods. In lean memory
+        # mode, the rods are copied, so that the preallocated memory, which has room
+        # for all quantities, is released.
+        self._block_memory: dict[str, NDArray[np.float64]] = {}
+        self._preallocated_block = (
+            self._find_preallocated_block(systems)
+            if n_ring_rods == 0 and not lean_memory
+            else None
+        )
+        if self._preallocated_block is None:
+            for system in systems:
+                system.__dict__.pop("_preallocated_block", None)
+                system.__dict__.pop("_preallocated_block_idx", None)
+        self._store_material_tensors(systems)
+        if lean_memory:
+            self._make_lean_memory_systems(systems)
+        # Domain of every attribute of the systems that is stored in the block.
+        self._system_fields: dict[str, str] = {}
+        # Rods asleep (see set_awake) and driven (see set_driven), and segments of
+        # the other rods if some rods are asleep or driven.
+        self.awake: NDArray[np.bool_] = np.ones(self.n_systems, dtype=np.bool_)
+        self.driven: NDArray[np.bool_] = np.zeros(self.n_systems, dtype=np.bool_)
+        self.awake_segments: list[MemoryBlockCosseratRod] | None = None
+
+        # Allocate block structure using system collection.
+        self._allocate_block_variables_in_nodes(systems)
+        self._allocate_block_variables_in_elements(systems)
+        self._allocate_blocks_variables_in_voronoi(systems)
+        self._allocate_blocks_variables_for_symplectic_stepper(systems)
+        self._allocate_blocks_variables_for_diagonal_material(systems)
+
+        # Reset ghosts of mass, rest length and rest voronoi length to 1. Otherwise
+        # since ghosts are not modified, this causes a division by zero error.
+        _reset_scalar_ghost(self.mass, self.ghost_nodes_idx, np.float64(1.0))
+        _reset_scalar_ghost(self.rest_lengths, self.ghost_elems_idx, np.float64(1.0))
+        _reset_scalar_ghost(
+            self.rest_voronoi_lengths, self.ghost_voronoi_idx, np.float64(1.0)
+        )
+
+        if lean_memory:
+            # Strains are computed with the internal forces, into the workspace.
+            self._allocate_lean_memory_workspace()
+            self._allocate_workspace()
+            self._update_awake_segments()
+            _RodSymplecticStepperMixin.__init__(self)
+            return
+
+        self._allocate_workspace()
+
+        # Compute strains for the block
+        _compute_sigma_kappa_for_blockstructure(self)
+
+        # If n_elems_with_boundary defined and passed with kwargs, then this rod is ring and we need to know
+        # how many boundary elements is rod containing.
+        if n_ring_rods != 0:
+            for sys_idx, system_to_be_added in enumerate(system_ring_rod):
+                if np.count_nonzero(system_to_be_added.rest_sigma) == 0:
+                    # Ring rod has to have non-zero rest sigma. If user did not set something, then Elastica will
+                    # calculate it.
+                    system_to_be_added.rest_sigma[:] = system_to_be_added.sigma[:]
+                if np.count_nonzero(system_to_be_added.rest_kappa) == 0:
+                    # Ring rod has to have non-zero rest kappa. If user did not set something, then Elastica will
+                    # calculate it.
+                    system_to_be_added.rest_kappa[:] = system_to_be_added.kappa[:]
+
+            # We update periodic elements and voronoi because they are used in difference and trapezoidal kernels.
+            _synchronize_periodic_boundary_of_vector_collection(
+                self.rest_sigma, self.periodic_boundary_elems_idx
+            )
+            _synchronize_periodic_boundary_of_vector_collection(
+                self.rest_kappa, self.periodic_boundary_voronoi_idx
+            )
+
+        # Initialize the mixin class for symplectic time-stepper.
+        _RodSymplecticStepperMixin.__init__(self)
+
+    @classmethod
+    def preallocate_straight_rods(cls, n_elems_in_rods: NDArray[np.int32]) -> Self:
+        """
+        Allocate the block memory of straight rods, before the rods are built.
+
+        The returned object is not a usable memory block: it only holds the
+        block-level arrays and the indices of the rods in the block, so that the rods
+        can be built as views into the block memory (see CosseratRod.straight_rods).
+        The memory block created at finalize, from exactly these rods in the same
+        order, then uses this memory instead of copying the rods.
+
+        Parameters
+        ----------
+        n_elems_in_rods: NDArray[np.int32]
+            Number of elements of each rod.
+
+        Returns
+        -------
+        MemoryBlockCosseratRod
+            Block-level arrays and indices of the rods in the block.
+
+        """
+        layout = cls.__new__(cls)
+        layout.n_systems = len(n_elems_in_rods)
+        layout._make_block_metadata(
+            np.asarray(n_elems_in_rods, dtype=np.int32), np.empty(0, dtype=np.int32)
+        )
+        layout.lean_memory = False
+        layout.diagonal_material_flag = False
+        layout._block_memory = {}
+        layout._preallocated_block = None
+        layout._system_fields = {}
+        layout.awake = np.ones(layout.n_systems, dtype=np.bool_)
+        layout.driven = np.zeros(layout.n_systems, dtype=np.bool_)
+        layout.awake_segments = None
+        layout._allocate_block_variables_in_nodes([])
+        layout._allocate_block_variables_in_elements([])
+        layout._allocate_blocks_variables_in_voronoi([])
+        layout._allocate_blocks_variables_for_symplectic_stepper([])
+        layout._allocate_blocks_variables_for_diagonal_material([])
+        return layout
+
+    def _find_preallocated_block(
+        self, systems: list[RodType]
+    ) -> "MemoryBlockCosseratRod | None":
+        """
+        Returns the block memory preallocated for the systems, if the systems are
+        exactly the rods built together by CosseratRod.straight_rods, in the same
+        order. Otherwise, returns None.
+        """
+        if not systems:
+            return None
+        preallocated_block = getattr(systems[0], "_preallocated_block", None)
+        if preallocated_block is None or preallocated_block.n_nodes != self.n_nodes:
+            return None
+        for k, system in enumerate(systems):
+            if (
+                getattr(system, "_preallocated_block", None) is not preallocated_block
+                or getattr(system, "_preallocated_block_idx", None) != k
+            ):
+                return None
+        return preallocated_block
+
+    def _allocate_block_memory(
+        self, name: str, shape: tuple[int, int]
+    ) -> NDArray[np.float64]:
+        """
+        Allocate an array of the block memory, or use the preallocated one.
+        """
+        if self._preallocated_block is None:
+            block_memory = np.zeros(shape)
+        else:
+            block_memory = self._preallocated_block._block_memory[name]
+        self._block_memory[name] = block_memory
+        return block_memory
+
+    def _stored_fields(self, mapping_dict: dict[str, int]) -> dict[str, int]:
+        """
+        Returns the attributes of the mapping that are stored in the block, with
+        their row in the block memory. Material tensors, which are stored as
+        diagonals, and derived quantities are not stored in lean memory mode, and
+        the rows of the others are packed.
+        """
+        stored_fields = [
+            field
+            for field in mapping_dict
+            if not (self.lean_memory and field in _LEAN_MEMORY_DERIVED_FIELDS)
+            and not (
+                self.diagonal_material_flag and field in _DIAGONAL_MATERIAL_TENSORS
+            )
+        ]
+        return {field: row for row, field in enumerate(stored_fields)}
+
+    @staticmethod
+    def _has_diagonal_material(systems: list[RodType]) -> bool:
+        """
+        Returns True if the material tensors of all systems are diagonal. Systems
+        storing the diagonals of their material tensors, e.g. rods released by a
+        block, have diagonal material tensors.
+        """
+        off_diagonal = ~np.eye(3, dtype=bool)
+        return not any(
+            np.any(system.__dict__[field][off_diagonal])
+            for system in systems
+            for field in _DIAGONAL_MATERIAL_TENSORS
+            if field in system.__dict__
+        )
+
+    def _store_material_tensors(self, systems: list[RodType]) -> None:
+        """
+        Make the systems store their material tensors as the block does: as
+        diagonals in lean memory mode, otherwise as full tensors. Material tensors stored by the systems take precedence over
+        their diagonals.
+        """
+        for system in systems:
+            for field in _DIAGONAL_MATERIAL_TENSORS:
+                tensor = system.__dict__.pop(field, None)
+                diagonal = system.__dict__.pop(field + "_diagonal", None)
+                if self.diagonal_material_flag:
+                    system.__dict__[field + "_diagonal"] = (
+                        diagonal if tensor is None else np.einsum("iik->ik", tensor)
+                    )
+                else:
+                    system.__dict__[field] = (
+                        _diagonal_tensor(diagonal) if tensor is None else tensor
+                    )
+
+    @staticmethod
+    def _make_lean_memory_systems(systems: list[RodType]) -> None:
+        """
+        Remove the attributes of the rods that are not stored in lean memory mode.
+        These attributes are then computed when they are read.
+        """
+        for system in systems:
+            for field in _LEAN_MEMORY_DERIVED_FIELDS:
+                system.__dict__.pop(field, None)
+
+    def _make_block_metadata(
+        self,
+        n_elems_straight_rods: NDArray[np.int32],
+        n_elems_ring_rods: NDArray[np.int32],
+    ) -> None:
+        """
+        This function computes the number of nodes, elements and voronoi of the
+        block, and the indices of ghosts, periodic boundaries and rods in the block.
+        Straight rods are placed first, then ring rods.
+
+        Parameters
+        ----------
+        n_elems_straight_rods: NDArray[np.int32]
+            Number of elements of each straight rod.
+        n_elems_ring_rods: NDArray[np.int32]
+            Number of elements of each ring rod.
+
+        """
+        n_straight_rods: int = len(n_elems_straight_rods)
+        n_ring_rods: int = len(n_elems_ring_rods)
 
         # self.n_elems_in_rods = np.array([x.n_elems for x in systems], dtype=np.int32)
         self.n_elems_in_rods = np.hstack((n_elems_straight_rods, n_elems_ring_rods + 2))
-        self.n_rods = len(systems)
+        self.n_rods = n_straight_rods + n_ring_rods
         (
             self.n_elems,
             self.ghost_nodes_idx,
@@ -163,45 +455,6 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
                 self.periodic_boundary_voronoi_idx[0, :] + 1
             )
 
-        # Allocate block structure using system collection.
-        self._allocate_block_variables_in_nodes(systems)
-        self._allocate_block_variables_in_elements(systems)
-        self._allocate_blocks_variables_in_voronoi(systems)
-        self._allocate_blocks_variables_for_symplectic_stepper(systems)
-
-        # Reset ghosts of mass, rest length and rest voronoi length to 1. Otherwise
-        # since ghosts are not modified, this causes a division by zero error.
-        _reset_scalar_ghost(self.mass, self.ghost_nodes_idx, 1.0)
-        _reset_scalar_ghost(self.rest_lengths, self.ghost_elems_idx, 1.0)
-        _reset_scalar_ghost(self.rest_voronoi_lengths, self.ghost_voronoi_idx, 1.0)
-
-        # Compute strains for the block
-        _compute_sigma_kappa_for_blockstructure(self)
-
-        # If n_elems_with_boundary defined and passed with kwargs, then this rod is ring and we need to know
-        # how many boundary elements is rod containing.
-        if n_ring_rods != 0:
-            for sys_idx, system_to_be_added in enumerate(system_ring_rod):
-                if np.count_nonzero(system_to_be_added.rest_sigma) == 0:
-                    # Ring rod has to have non-zero rest sigma. If user did not set something, then Elastica will
-                    # calculate it.
-                    system_to_be_added.rest_sigma[:] = system_to_be_added.sigma[:]
-                if np.count_nonzero(system_to_be_added.rest_kappa) == 0:
-                    # Ring rod has to have non-zero rest kappa. If user did not set something, then Elastica will
-                    # calculate it.
-                    system_to_be_added.rest_kappa[:] = system_to_be_added.kappa[:]
-
-            # We update periodic elements and voronoi because they are used in difference and trapezoidal kernels.
-            _synchronize_periodic_boundary_of_vector_collection(
-                self.rest_sigma, self.periodic_boundary_elems_idx
-            )
-            _synchronize_periodic_boundary_of_vector_collection(
-                self.rest_kappa, self.periodic_boundary_voronoi_idx
-            )
-
-        # Initialize the mixin class for symplectic time-stepper.
-        _RodSymplecticStepperMixin.__init__(self)
-
     def _allocate_block_variables_in_nodes(self, systems: list[RodType]) -> None:
         """
         This function takes system collection and allocates the variables on
@@ -220,8 +473,9 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
         # Things in nodes that are scalars
         #             0 ("mass", float64[:]),
         map_scalar_dofs_in_rod_nodes = {"mass": 0}
-        self.scalar_dofs_in_rod_nodes = np.zeros(
-            (len(map_scalar_dofs_in_rod_nodes), self.n_nodes)
+        self.scalar_dofs_in_rod_nodes = self._allocate_block_memory(
+            "scalar_dofs_in_rod_nodes",
+            (len(map_scalar_dofs_in_rod_nodes), self.n_nodes),
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_scalar_dofs_in_rod_nodes,
@@ -241,8 +495,9 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
             "internal_forces": 1,
             "external_forces": 2,
         }
-        self.vector_dofs_in_rod_nodes = np.zeros(
-            (len(map_vector_dofs_in_rod_nodes), 3 * self.n_nodes)
+        self.vector_dofs_in_rod_nodes = self._allocate_block_memory(
+            "vector_dofs_in_rod_nodes",
+            (len(map_vector_dofs_in_rod_nodes), 3 * self.n_nodes),
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_vector_dofs_in_rod_nodes,
@@ -275,17 +530,20 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
         #             4 ("rest_lengths", float64[:]),
         #             5 ("dilatation", float64[:]),
         #             6 ("dilatation_rate", float64[:]),
-        map_scalar_dofs_in_rod_elems = {
-            "radius": 0,
-            "volume": 1,
-            "density": 2,
-            "lengths": 3,
-            "rest_lengths": 4,
-            "dilatation": 5,
-            "dilatation_rate": 6,
-        }
-        self.scalar_dofs_in_rod_elems = np.zeros(
-            (len(map_scalar_dofs_in_rod_elems), self.n_elems)
+        map_scalar_dofs_in_rod_elems = self._stored_fields(
+            {
+                "radius": 0,
+                "volume": 1,
+                "density": 2,
+                "lengths": 3,
+                "rest_lengths": 4,
+                "dilatation": 5,
+                "dilatation_rate": 6,
+            }
+        )
+        self.scalar_dofs_in_rod_elems = self._allocate_block_memory(
+            "scalar_dofs_in_rod_elems",
+            (len(map_scalar_dofs_in_rod_elems), self.n_elems),
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_scalar_dofs_in_rod_elems,
@@ -302,16 +560,19 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
         #             3 ("internal_torques", float64[:, :]),
         #             4 ("external_torques", float64[:, :]),
         #             6 ("internal_stress", float64[:, :]),
-        map_vector_dofs_in_rod_elems = {
-            "tangents": 0,
-            "sigma": 1,
-            "rest_sigma": 2,
-            "internal_torques": 3,
-            "external_torques": 4,
-            "internal_stress": 5,
-        }
-        self.vector_dofs_in_rod_elems = np.zeros(
-            (len(map_vector_dofs_in_rod_elems), 3 * self.n_elems)
+        map_vector_dofs_in_rod_elems = self._stored_fields(
+            {
+                "tangents": 0,
+                "sigma": 1,
+                "rest_sigma": 2,
+                "internal_torques": 3,
+                "external_torques": 4,
+                "internal_stress": 5,
+            }
+        )
+        self.vector_dofs_in_rod_elems = self._allocate_block_memory(
+            "vector_dofs_in_rod_elems",
+            (len(map_vector_dofs_in_rod_elems), 3 * self.n_elems),
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_vector_dofs_in_rod_elems,
@@ -326,14 +587,17 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
         #             1 ("mass_second_moment_of_inertia", float64[:, :, :]),
         #             2 ("inv_mass_second_moment_of_inertia", float64[:, :, :]),
         #             3 ("shear_matrix", float64[:, :, :]),
-        map_matrix_dofs_in_rod_elems = {
-            "director_collection": 0,
-            "mass_second_moment_of_inertia": 1,
-            "inv_mass_second_moment_of_inertia": 2,
-            "shear_matrix": 3,
-        }
-        self.matrix_dofs_in_rod_elems = np.zeros(
-            (len(map_matrix_dofs_in_rod_elems), 9 * self.n_elems)
+        map_matrix_dofs_in_rod_elems = self._stored_fields(
+            {
+                "director_collection": 0,
+                "mass_second_moment_of_inertia": 1,
+                "inv_mass_second_moment_of_inertia": 2,
+                "shear_matrix": 3,
+            }
+        )
+        self.matrix_dofs_in_rod_elems = self._allocate_block_memory(
+            "matrix_dofs_in_rod_elems",
+            (len(map_matrix_dofs_in_rod_elems), 9 * self.n_elems),
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_matrix_dofs_in_rod_elems,
@@ -361,12 +625,15 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
         # Things in voronoi that are scalars
         #             0 ("voronoi_dilatation", float64[:]),
         #             1 ("rest_voronoi_lengths", float64[:]),
-        map_scalar_dofs_in_rod_voronois = {
-            "voronoi_dilatation": 0,
-            "rest_voronoi_lengths": 1,
-        }
-        self.scalar_dofs_in_rod_voronois = np.zeros(
-            (len(map_scalar_dofs_in_rod_voronois), self.n_voronoi)
+        map_scalar_dofs_in_rod_voronois = self._stored_fields(
+            {
+                "voronoi_dilatation": 0,
+                "rest_voronoi_lengths": 1,
+            }
+        )
+        self.scalar_dofs_in_rod_voronois = self._allocate_block_memory(
+            "scalar_dofs_in_rod_voronois",
+            (len(map_scalar_dofs_in_rod_voronois), self.n_voronoi),
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_scalar_dofs_in_rod_voronois,
@@ -380,13 +647,16 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
         #             0 ("kappa", float64[:, :]),
         #             1 ("rest_kappa", float64[:, :]),
         #             2 ("internal_couple", float64[:, :]),
-        map_vector_dofs_in_rod_voronois = {
-            "kappa": 0,
-            "rest_kappa": 1,
-            "internal_couple": 2,
-        }
-        self.vector_dofs_in_rod_voronois = np.zeros(
-            (len(map_vector_dofs_in_rod_voronois), 3 * self.n_voronoi)
+        map_vector_dofs_in_rod_voronois = self._stored_fields(
+            {
+                "kappa": 0,
+                "rest_kappa": 1,
+                "internal_couple": 2,
+            }
+        )
+        self.vector_dofs_in_rod_voronois = self._allocate_block_memory(
+            "vector_dofs_in_rod_voronois",
+            (len(map_vector_dofs_in_rod_voronois), 3 * self.n_voronoi),
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_vector_dofs_in_rod_voronois,
@@ -398,9 +668,10 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
 
         # Things in voronoi that are matrices
         #             0 ("bend_matrix", float64[:, :, :]),
-        map_matrix_dofs_in_rod_voronois = {"bend_matrix": 0}
-        self.matrix_dofs_in_rod_voronois = np.zeros(
-            (len(map_matrix_dofs_in_rod_voronois), 9 * self.n_voronoi)
+        map_matrix_dofs_in_rod_voronois = self._stored_fields({"bend_matrix": 0})
+        self.matrix_dofs_in_rod_voronois = self._allocate_block_memory(
+            "matrix_dofs_in_rod_voronois",
+            (len(map_matrix_dofs_in_rod_voronois), 9 * self.n_voronoi),
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_matrix_dofs_in_rod_voronois,
@@ -431,7 +702,9 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
             "acceleration_collection": 2,
             "alpha_collection": 3,
         }
-        self.rate_collection = np.zeros((len(map_rate_collection), 3 * self.n_nodes))
+        self.rate_collection = self._allocate_block_memory(
+            "rate_collection", (len(map_rate_collection), 3 * self.n_nodes)
+        )
 
         # For Dynamic state update of position Verlet create references
         self.v_w_collection = np.lib.stride_tricks.as_strided(
@@ -468,6 +741,499 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
             value_type="vector",
         )
 
+    def _allocate_blocks_variables_for_diagonal_material(
+        self, systems: list[RodType]
+    ) -> None:
+        """
+        This function allocates the compact (3, n) storage for the diagonals of the
+        material tensors in lean memory mode, and references allocated variables
+        back to the systems, which store the diagonals instead of the material
+        tensors.
+        """
+        if not self.diagonal_material_flag:
+            return
+
+        # Things in elements that are diagonals of matrices
+        #             0 ("mass_second_moment_of_inertia_diagonal", float64[:, :]),
+        #             1 ("inv_mass_second_moment_of_inertia_diagonal", float64[:, :]),
+        #             2 ("shear_matrix_diagonal", float64[:, :]),
+        map_diagonal_matrix_dofs_in_rod_elems = {
+            "mass_second_moment_of_inertia_diagonal": 0,
+            "inv_mass_second_moment_of_inertia_diagonal": 1,
+            "shear_matrix_diagonal": 2,
+        }
+        self.diagonal_matrix_dofs_in_rod_elems = self._allocate_block_memory(
+            "diagonal_matrix_dofs_in_rod_elems",
+            (len(map_diagonal_matrix_dofs_in_rod_elems), 3 * self.n_elems),
+        )
+        self._map_system_properties_to_block_memory(
+            mapping_dict=map_diagonal_matrix_dofs_in_rod_elems,
+            systems=systems,
+            block_memory=self.diagonal_matrix_dofs_in_rod_elems,
+            domain_type="element",
+            value_type="vector",
+        )
+
+        # Things in voronoi that are diagonals of matrices
+        #             0 ("bend_matrix_diagonal", float64[:, :]),
+        map_diagonal_matrix_dofs_in_rod_voronois = {"bend_matrix_diagonal": 0}
+        self.diagonal_matrix_dofs_in_rod_voronois = self._allocate_block_memory(
+            "diagonal_matrix_dofs_in_rod_voronois",
+            (len(map_diagonal_matrix_dofs_in_rod_voronois), 3 * self.n_voronoi),
+        )
+        self._map_system_properties_to_block_memory(
+            mapping_dict=map_diagonal_matrix_dofs_in_rod_voronois,
+            systems=systems,
+            block_memory=self.diagonal_matrix_dofs_in_rod_voronois,
+            domain_type="voronoi",
+            value_type="vector",
+        )
+
+    def _allocate_lean_memory_workspace(self) -> None:
+        """
+        This function allocates the workspace of lean memory mode, into which the
+        derived quantities are computed chunk by chunk of rods (see
+        `LEAN_MEMORY_CHUNK_ELEMS`). It has room for the longest chunk.
+        """
+        self.lean_memory_capacity = min(
+            self.n_elems,
+            max(self.LEAN_MEMORY_CHUNK_ELEMS, int(np.max(self.n_elems_in_rods))),
+        )
+        n_components = sum(
+            n_components for _, n_components in _LEAN_MEMORY_DERIVED_FIELDS.values()
+        )
+        self.lean_memory_workspace = np.zeros(n_components * self.lean_memory_capacity)
+
+    def _allocate_workspace(self) -> None:
+        """
+        This function allocates the workspace of the internal force and torque
+        kernels, so that time steps do not allocate memory. In lean memory mode,
+        forces and torques are computed chunk by chunk of rods, and the workspace
+        has room for the longest chunk.
+        """
+        n_elems, n_voronoi = (
+            (self.lean_memory_capacity, self.lean_memory_capacity)
+            if self.lean_memory
+            else (self.n_elems, self.n_voronoi)
+        )
+        for field, domain_type in _WORKSPACE_FIELDS.items():
+            setattr(
+                self,
+                field,
+                np.zeros((3, n_elems if domain_type == "element" else n_voronoi)),
+            )
+
+    def _system_slice(self, domain_type: str, block_idx: int) -> slice:
+        """
+        Returns the slice of the rod at `block_idx` in the block arrays of the
+        given domain.
+        """
+        if domain_type == "node":
+            start_idx, end_idx = self.start_idx_in_rod_nodes, self.end_idx_in_rod_nodes
+        elif domain_type == "element":
+            start_idx, end_idx = self.start_idx_in_rod_elems, self.end_idx_in_rod_elems
+        else:
+            start_idx, end_idx = (
+                self.start_idx_in_rod_voronoi,
+                self.end_idx_in_rod_voronoi,
+            )
+        return slice(int(start_idx[block_idx]), int(end_idx[block_idx]))
+
+    def release_systems(self, block_indices: list[int], systems: list[RodType]) -> None:
+        """
+        Remove rods from the block, e.g. when they are retired during a
+        simulation. The rods keep copies of their attributes, and their slots are
+        left at rest, so that they can be used by other rods of the same number of
+        elements (see `place_systems`).
+
+        A free slot is still integrated with the block, but its rates are zero and
+        its rest strains are its current strains, so that no internal load acts on
+        it. Forcing, damping or contact must not be applied on it; the forcings of
+        `elastica.interaction` acting on the whole block skip free slots.
+
+        Parameters
+        ----------
+        block_indices: list[int]
+            Positions of the rods in the block.
+        systems: list[RodType]
+            Rods to remove.
+
+        """
+        for block_idx, system in zip(block_indices, systems):
+            for field, domain_type in self._system_fields.items():
+                system.__dict__[field] = self.__dict__[field][
+                    ..., self._system_slice(domain_type, block_idx)
+                ].copy()
+            self.system_idx_list[block_idx] = -1
+
+        if not self.lean_memory:
+            _compute_sigma_kappa_for_blockstructure(self)
+        for block_idx, system in zip(block_indices, systems):
+            node_slice = self._system_slice("node", block_idx)
+            elem_slice = self._system_slice("element", block_idx)
+            voronoi_slice = self._system_slice("voronoi", block_idx)
+            self.velocity_collection[:, node_slice] = 0.0
+            self.acceleration_collection[:, node_slice] = 0.0
+            self.omega_collection[:, elem_slice] = 0.0
+            self.alpha_collection[:, elem_slice] = 0.0
+            if self.lean_memory:
+                # Strains are not stored, they are computed from the copies.
+                self.rest_sigma[:, elem_slice] = system.sigma
+                self.rest_kappa[:, voronoi_slice] = system.kappa
+            else:
+                self.rest_sigma[:, elem_slice] = self.sigma[:, elem_slice]
+                self.rest_kappa[:, voronoi_slice] = self.kappa[:, voronoi_slice]
+        _synchronize_periodic_boundary_of_vector_collection(
+            self.rest_sigma, self.periodic_boundary_elems_idx
+        )
+        _synchronize_periodic_boundary_of_vector_collection(
+            self.rest_kappa, self.periodic_boundary_voronoi_idx
+        )
+        if np.any(self.driven[block_indices]):
+            self.driven[block_indices] = False
+            self._update_awake_segments()
+
+    def place_systems(
+        self,
+        block_indices: list[int],
+        systems: list[RodType],
+        system_idx_list: list[SystemIdxType],
+    ) -> None:
+        """
+        Place straight rods in free slots of the block (see `release_systems`),
+        e.g. when they are added during a simulation. Each rod must have the same
+        number of elements as its slot. The attributes of the rods are copied into
+        the block, and the rods become views into the block, as if they were part
+        of the block when it was created.
+
+        Parameters
+        ----------
+        block_indices: list[int]
+            Positions of the free slots in the block.
+        systems: list[RodType]
+            Straight rods to place.
+        system_idx_list: list[SystemIdxType]
+            Indices of the rods in the simulator.
+
+        """
+        n_straight_rods = self.n_rods - self.periodic_boundary_voronoi_idx.shape[1]
+        for block_idx, system, system_idx in zip(
+            block_indices, systems, system_idx_list
+        ):
+            assert (
+                not system.ring_rod_flag
+                and block_idx < n_straight_rods
+                and system.n_elems == self.n_elems_in_rods[block_idx]
+            ), "Only straight rods with the same number of elements fit in the slot."
+            assert self.system_idx_list[block_idx] < 0, "The slot is not free."
+            assert not self.diagonal_material_flag or self._has_diagonal_material(
+                [system]
+            ), "Rods placed in a lean memory block must have diagonal material tensors."
+            system.__dict__.pop("_preallocated_block", None)
+            system.__dict__.pop("_preallocated_block_idx", None)
+            self._store_material_tensors([system])
+            if self.lean_memory:
+                self._make_lean_memory_systems([system])
+            for field, domain_type in self._system_fields.items():
+                system_slice = self._system_slice(domain_type, block_idx)
+                block_view = self.__dict__[field]
+                block_view[..., system_slice] = system.__dict__[field]
+                system.__dict__[field] = block_view[..., system_slice]
+            self.system_idx_list[block_idx] = system_idx
+
+    def set_awake(self, awake: NDArray[np.bool_]) -> None:
+        """
+        Set which rods of the block are awake. Rods asleep are skipped in the
+        computation of internal forces and accelerations, and in the kinematic
+        update of the time-stepper, which steps the segments of contiguous rods
+        awake and not driven instead of the block (see `awake_segments`, and
+        `set_driven`). Rods must be at rest when
+        they are put asleep: their velocities and accelerations have to be zero.
+
+        Parameters
+        ----------
+        awake: NDArray[np.bool_]
+            Whether each rod of the block is awake.
+
+        """
+        self.awake = awake
+        self._update_awake_segments()
+
+    def set_driven(self, driven: NDArray[np.bool_]) -> None:
+        """
+        Set which rods of the block are driven, i.e. their motion is prescribed
+        (see PrescribedMotion). Like rods asleep, driven rods are skipped in the
+        computation of internal forces and accelerations, and in the kinematic
+        update of the time-stepper.
+
+        Parameters
+        ----------
+        driven: NDArray[np.bool_]
+            Whether each rod of the block is driven.
+
+        """
+        self.driven = driven
+        self._update_awake_segments()
+
+    def _update_awake_segments(self) -> None:
+        stepped = self.awake & ~self.driven
+        if np.all(stepped):
+            self.awake_segments = None
+        else:
+            self.awake_segments = [
+                self._make_segment(first, stop)
+                for first, stop in contiguous_runs(stepped)
+            ]
+        if self.lean_memory:
+            self._lean_memory_chunks = [
+                self._make_lean_memory_chunk(first, stop)
+                for first, stop in self._split_into_chunks(contiguous_runs(stepped))
+            ]
+
+    def _split_into_chunks(
+        self, runs: Iterable[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """
+        Split runs of contiguous rods into chunks of at most
+        `lean_memory_capacity` elements, ghosts included, unless a rod is longer.
+        """
+        chunks = []
+        for first, stop in runs:
+            while first < stop:
+                # Last rod ending within the capacity, or the first rod if longer
+                chunk_stop = int(
+                    np.searchsorted(
+                        self.end_idx_in_rod_elems[first:stop],
+                        self.start_idx_in_rod_elems[first] + self.lean_memory_capacity,
+                        side="right",
+                    )
+                )
+                chunk_stop = first + max(chunk_stop, 1)
+                chunks.append((first, chunk_stop))
+                first = chunk_stop
+        return chunks
+
+    def _make_lean_memory_chunk(
+        self, first: int, stop: int
+    ) -> "MemoryBlockCosseratRod":
+        """
+        Returns the rods from `first` to `stop` (excluded) of the block as a segment
+        (see `_make_segment`), whose derived quantities are views into the
+        workspace of lean memory mode. The workspace of the kernels is shared by
+        all chunks as well.
+        """
+        chunk = self._make_segment(first, stop)
+        for field, domain_type in _WORKSPACE_FIELDS.items():
+            n = chunk.n_elems if domain_type == "element" else chunk.n_voronoi
+            chunk.__dict__[field] = self.__dict__[field][..., :n]
+        offset = 0
+        for field, (domain_type, n_components) in _LEAN_MEMORY_DERIVED_FIELDS.items():
+            n = chunk.n_elems if domain_type == "element" else chunk.n_voronoi
+            workspace = self.lean_memory_workspace[offset : offset + n_components * n]
+            chunk.__dict__[field] = (
+                workspace if n_components == 1 else workspace.reshape(3, n)
+            )
+            offset += n_components * n
+        return chunk
+
+    def _make_segment(self, first: int, stop: int) -> "MemoryBlockCosseratRod":
+        """
+        Returns the rods from `first` to `stop` (excluded) of the block, as a
+        memory block whose attributes are views into this block. Segments are
+        separated by the ghosts between rods, so that the kernels of the block
+        apply to them unchanged.
+        """
+        node_start, elem_start, voronoi_start = (
+            (0, 0, 0)
+            if first == 0
+            else (
+                int(self.ghost_nodes_idx[first - 1]) + 1,
+                int(self.ghost_elems_idx[2 * first - 1]) + 1,
+                int(self.ghost_voronoi_idx[3 * first - 1]) + 1,
+            )
+        )
+        node_stop, elem_stop, voronoi_stop = (
+            (self.n_nodes, self.n_elems, self.n_voronoi)
+            if stop == self.n_systems
+            else (
+                int(self.ghost_nodes_idx[stop - 1]),
+                int(self.ghost_elems_idx[2 * stop - 2]),
+                int(self.ghost_voronoi_idx[3 * stop - 3]),
+            )
+        )
+        domain_slices = {
+            "node": slice(node_start, node_stop),
+            "element": slice(elem_start, elem_stop),
+            "voronoi": slice(voronoi_start, voronoi_stop),
+        }
+
+        segment = MemoryBlockCosseratRod.__new__(MemoryBlockCosseratRod)
+        for field, domain_type in self._system_fields.items():
+            segment.__dict__[field] = self.__dict__[field][
+                ..., domain_slices[domain_type]
+            ]
+        if not self.lean_memory:
+            # Workspaces of lean memory chunks are set in _make_lean_memory_chunk
+            for field, domain_type in _WORKSPACE_FIELDS.items():
+                segment.__dict__[field] = self.__dict__[field][
+                    ..., domain_slices[domain_type]
+                ]
+        segment.ghost_nodes_idx = self.ghost_nodes_idx[first : stop - 1] - node_start
+        segment.ghost_elems_idx = (
+            self.ghost_elems_idx[2 * first : 2 * stop - 2] - elem_start
+        )
+        segment.ghost_voronoi_idx = (
+            self.ghost_voronoi_idx[3 * first : 3 * stop - 3] - voronoi_start
+        )
+        segment.n_systems = stop - first
+        segment.n_nodes = node_stop - node_start
+        segment.n_elems = elem_stop - elem_start
+        segment.n_voronoi = voronoi_stop - voronoi_start
+        segment.lean_memory = False
+        segment.diagonal_material_flag = self.diagonal_material_flag
+        segment.awake = np.ones(segment.n_systems, dtype=np.bool_)
+        segment.driven = np.zeros(segment.n_systems, dtype=np.bool_)
+        segment.awake_segments = None
+        segment.kinematic_states = _KinematicState(
+            segment.position_collection, segment.director_collection
+        )
+        return segment
+
+    def nbytes_per_element(self) -> float:
+        """
+        Memory used by the arrays of the block, including the workspaces and the
+        states of the time-stepper, in bytes per element of the rods.
+
+        Returns
+        -------
+        float
+            Bytes per element.
+
+        """
+        roots: dict[int, NDArray] = {}
+        for value in [
+            *self.__dict__.values(),
+            *self.kinematic_states.__dict__.values(),
+            *self.dynamic_states.__dict__.values(),
+        ]:
+            if not isinstance(value, np.ndarray):
+                continue
+            # Arrays of the block are views, e.g. into the block memory
+            root, base = value, value.base
+            while base is not None:
+                if isinstance(base, np.ndarray):
+                    root = base
+                base = getattr(base, "base", None)
+            roots[id(root)] = root
+        n_elems = int(np.sum(self.n_elems_in_rods))
+        return sum(root.nbytes for root in roots.values()) / n_elems
+
+    def compute_internal_forces_and_torques(self, time: np.float64) -> None:
+        """
+        Compute internal forces and torques, using the specialised kernels if the
+        material tensors are diagonal. Rods asleep or driven are
+        skipped (see `set_awake` and `set_driven`). In lean memory mode, forces
+        and torques are computed chunk by chunk of rods, with the derived
+        quantities in the workspace.
+
+        Parameters
+        ----------
+        time: np.float64
+            current time
+
+        """
+        if self.lean_memory:
+            for chunk in self._lean_memory_chunks:
+                chunk.compute_internal_forces_and_torques(time)
+            return
+
+        if self.awake_segments is not None:
+            for segment in self.awake_segments:
+                segment.compute_internal_forces_and_torques(time)
+            return
+
+        if not self.diagonal_material_flag:
+            super().compute_internal_forces_and_torques(time)
+            return
+
+        _compute_internal_forces_with_diagonal_material(
+            self.position_collection,
+            self.volume,
+            self.lengths,
+            self.tangents,
+            self.radius,
+            self.rest_lengths,
+            self.rest_voronoi_lengths,
+            self.dilatation,
+            self.voronoi_dilatation,
+            self.director_collection,
+            self.sigma,
+            self.rest_sigma,
+            self.shear_matrix_diagonal,
+            self.internal_stress,
+            self.internal_forces,
+            self.ghost_elems_idx,
+            self.element_workspace,
+        )
+
+        _compute_internal_torques_with_diagonal_material(
+            self.position_collection,
+            self.velocity_collection,
+            self.tangents,
+            self.lengths,
+            self.rest_lengths,
+            self.director_collection,
+            self.rest_voronoi_lengths,
+            self.bend_matrix_diagonal,
+            self.rest_kappa,
+            self.kappa,
+            self.voronoi_dilatation,
+            self.mass_second_moment_of_inertia_diagonal,
+            self.omega_collection,
+            self.internal_stress,
+            self.internal_couple,
+            self.dilatation,
+            self.dilatation_rate,
+            self.internal_torques,
+            self.ghost_voronoi_idx,
+            self.J_omega_upon_e,
+            self.element_workspace,
+            self.voronoi_workspace,
+        )
+
+    def update_accelerations(self, time: np.float64) -> None:
+        """
+        Updates the acceleration variables, using the specialised kernel if the
+        material tensors are diagonal. Rods asleep or driven are
+        skipped (see `set_awake` and `set_driven`).
+
+        Parameters
+        ----------
+        time: np.float64
+            current time
+
+        """
+        if self.awake_segments is not None:
+            for segment in self.awake_segments:
+                segment.update_accelerations(time)
+            return
+
+        if not self.diagonal_material_flag:
+            super().update_accelerations(time)
+            return
+
+        _update_accelerations_with_diagonal_material(
+            self.acceleration_collection,
+            self.internal_forces,
+            self.external_forces,
+            self.mass,
+            self.alpha_collection,
+            self.inv_mass_second_moment_of_inertia_diagonal,
+            self.internal_torques,
+            self.external_torques,
+            self.dilatation,
+        )
+
     def _map_system_properties_to_block_memory(
         self,
         mapping_dict: dict,
@@ -554,22 +1320,44 @@ class MemoryBlockCosseratRod(CosseratRod, _RodSymplecticStepperMixin):
                 "Incorrect value type. Must be one of scalar, vector, and tensor."
             )
 
+        preallocated_block = self._preallocated_block
+        system_slices = [
+            (Ellipsis, slice(start_idx, end_idx))
+            for start_idx, end_idx in zip(
+                start_idx_list[: len(systems)].tolist(),
+                end_idx_list[: len(systems)].tolist(),
+            )
+        ]
+
         for k, v in mapping_dict.items():
+            self._system_fields[k] = domain_type
             # Map class attributes to block memory
-            self.__dict__[k] = np.lib.stride_tricks.as_strided(
-                block_memory[v],
-                shape=view_shape,
-            )
+            if preallocated_block is None:
+                self.__dict__[k] = np.lib.stride_tricks.as_strided(
+                    block_memory[v],
+                    shape=view_shape,
+                )
+            else:
+                self.__dict__[k] = preallocated_block.__dict__[k]
+            block_view = self.__dict__[k]
 
             # Copy system attributes into block memory, then make system attributes
-            # views into the block memory
-            for system_idx, system in enumerate(systems):
-                start_idx = start_idx_list[system_idx]
-                end_idx = end_idx_list[system_idx]
-                self.__dict__[k][..., start_idx:end_idx] = system.__dict__[k].copy()
-                system.__dict__[k] = np.ndarray.view(
-                    self.__dict__[k][..., start_idx:end_idx]
-                )
+            # views into the block memory. Attributes of systems built in the
+            # preallocated block memory are views already, unless reassigned.
+            if preallocated_block is None:
+                for system, system_slice in zip(systems, system_slices):
+                    block_view[system_slice] = system.__dict__[k]
+                    system.__dict__[k] = block_view[system_slice]
+            else:
+                reassigned_systems = [
+                    system_idx
+                    for system_idx, system in enumerate(systems)
+                    if system.__dict__[k].base is not block_view
+                ]
+                for system_idx in reassigned_systems:
+                    system_slice = system_slices[system_idx]
+                    block_view[system_slice] = systems[system_idx].__dict__[k].copy()
+                    systems[system_idx].__dict__[k] = block_view[system_slice]
 
             # Synchronize periodic boundaries
-            synchronize_periodic_boundary(self.__dict__[k], periodic_boundary_idx)
+            synchronize_periodic_boundary(block_view, periodic_boundary_idx)
@@ -1,4 +1,8 @@
-from typing import Protocol
+from typing import Any, Protocol
+from elastica.typing import SystemIdxType
+
+import numpy as np
+from numpy.typing import NDArray
 from elastica.rod.protocol import CosseratRodProtocol
 from elastica.rigidbody.protocol import RigidBodyProtocol
 from elastica.systems.protocol import SystemProtocol
@@ -9,6 +13,30 @@ class BlockProtocol(Protocol):
     def n_systems(self) -> int:
         """Number of systems in the block."""
 
+    @property
+    def system_idx_list(self) -> NDArray[np.integer]:
+        """Indices of the systems in the simulator, negative for free slots."""
+
+    @property
+    def awake_segments(self) -> "list[Any] | None":
+        """
+        Segments of systems awake and not driven, or None if all systems are awake
+        and none is driven.
+        """
+
+    def set_awake(self, awake: NDArray[np.bool_]) -> None: ...
+
+    def set_driven(self, driven: NDArray[np.bool_]) -> None: ...
+
+    def release_systems(self, block_indices: list[int], systems: list[Any]) -> None: ...
+
+    def place_systems(
+        self,
+        block_indices: list[int],
+        systems: list[Any],
+        system_idx_list: list[SystemIdxType],
+    ) -> None: ...
+
 
 class BlockSystemProtocol(SystemProtocol, BlockProtocol, Protocol):
     pass
@@ -161,3 +161,22 @@ def make_block_memory_periodic_boundary_metadata(
         periodic_boundary_elems_idx,
         periodic_boundary_voronoi_idx,
     )
+
+
+def contiguous_runs(mask: NDArray[np.bool_]) -> list[tuple[int, int]]:
+    """
+    This function returns the contiguous runs of True values of a boolean mask.
+
+    Parameters
+    ----------
+    mask: NDArray[np.bool_]
+        Boolean mask.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Start (included) and stop (excluded) indices of each run.
+    """
+    padded_mask = np.concatenate(([False], mask, [False]))
+    edges = np.flatnonzero(padded_mask[1:] != padded_mask[:-1]).tolist()
+    return list(zip(edges[::2], edges[1::2]))
@@ -11,3 +11,4 @@ from .forcing import Forcing
 from .callbacks import CallBacks
 from .damping import Damping
 from .contact import Contact
+from .sleeping import Sleeping
@@ -5,8 +5,8 @@ Base System
 Basic coordinating for multiple, smaller systems that have an independently integrable
 interface (i.e. works with symplectic or explicit routines `timestepper.py`.)
 """
-from typing import TYPE_CHECKING, Type, Generator, Any, overload
-from typing import final
+from typing import TYPE_CHECKING, Type, Generator, Any, Optional, overload
+from typing import Callable, Iterable, Iterator, cast, final
 from elastica.typing import (
     SystemType,
     StaticSystemType,
@@ -17,7 +17,14 @@ from elastica.typing import (
     OperatorFinalizeType,
 )
 
+import functools
+import gc
+import logging
+import time
+from contextlib import contextmanager
+
 import numpy as np
+from numpy.typing import NDArray
 from itertools import chain
 
 from collections.abc import MutableSequence
@@ -26,9 +33,49 @@ from elastica.rod.rod_base import RodBase
 from elastica.rigidbody.rigid_body import RigidBodyBase
 from elastica.surface.surface_base import SurfaceBase
 
-from .memory_block import construct_memory_block_structures
+from elastica.restart import block_state_fields
+
+from .memory_block import (
+    SlotKey,
+    block_slot_key,
+    construct_memory_block_structures,
+    locate_systems_in_blocks,
+    place_systems_in_blocks,
+)
 from .operator_group import OperatorGroupFIFO
-from .protocol import ModuleProtocol
+from .protocol import ModuleProtocol, M
+
+logger = logging.getLogger(__name__)
+
+
+class SystemSnapshot:
+    """
+    In-memory copy of the state of a system collection, taken by
+    `BaseSystemCollection.snapshot` and restored by `BaseSystemCollection.restore`.
+
+        Attributes
+        ----------
+        fields: list[tuple[int, str]]
+            Index of the memory block and name of each saved array.
+        arrays: list[numpy.ndarray]
+            Copies of the dynamic state arrays of the memory blocks.
+        operator_states: list
+            States of the registered stateful operators.
+        time: float, optional
+            Simulation time of the snapshot.
+        system_revision: int
+            Number of changes of the systems (retired or added after finalize)
+            when the snapshot was taken.
+    """
+
+    def __init__(
+        self, fields: list[tuple[int, str]], arrays: list[NDArray[Any]]
+    ) -> None:
+        self.fields = fields
+        self.arrays = arrays
+        self.operator_states: list[Any] = []
+        self.time: Optional[float] = None
+        self.system_revision: int = 0
 
 
 class BaseSystemCollection(MutableSequence):
@@ -45,6 +92,9 @@ class BaseSystemCollection(MutableSequence):
             Returns all system objects. Once finalize, block objects are also included.
         blocks: Callable
             Returns block objects. Should be called after finalize.
+        finalize_timings: dict[str, float]
+            Wall time in seconds of each phase of finalize: construction of the
+            memory blocks, then finalization of each module (e.g. "constraints").
 
     Note
     ----
@@ -73,6 +123,8 @@ class BaseSystemCollection(MutableSequence):
             OperatorCallbackType, ModuleProtocol
         ] = OperatorGroupFIFO()
         self._feature_group_finalize: list[OperatorFinalizeType] = []
+        # Functions to register features again, for systems added after finalize.
+        self._feature_group_open: list[Callable[[], None]] = []
         # We need to initialize our mixin classes
         super().__init__()
 
@@ -86,10 +138,37 @@ class BaseSystemCollection(MutableSequence):
         # List of systems to be integrated
         self.__systems: list[StaticSystemType] = []
         self.__final_blocks: list[BlockSystemType] = []
+        # Index of each system, keyed by the identity of the system. It is kept up
+        # to date while systems are appended, and rebuilt after other changes.
+        self.__system_indices: Optional[dict[int, SystemIdxType]] = {}
 
         # Flag Finalize: Finalizing twice will cause an error,
         # but the error message is very misleading
         self._finalize_flag: bool = False
+        self.finalize_timings: dict[str, float] = {}
+        self.__lean_memory: bool = False
+
+        # Systems retired or added after finalize. Free slots of memory blocks are
+        # kept by slot key (see block_slot_key), with the number of slots created
+        # after finalize.
+        self._adding_systems: bool = False
+        self.__retired_systems: set[SystemIdxType] = set()
+        self.__system_locations: Optional[
+            dict[SystemIdxType, tuple[BlockSystemType, int]]
+        ] = None
+        self.__free_slots: dict[SlotKey, list[tuple[BlockSystemType, int]]] = {}
+        self.__n_added_slots: dict[SlotKey, int] = {}
+        self.__system_revision: int = 0
+
+        # Operators with a state that is saved by snapshot and set by restore
+        self._stateful_operators: list[Any] = []
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        # Indices are keyed by the identity of the systems, which is not kept when
+        # the collection is pickled. They are rebuilt on the next lookup.
+        state["_BaseSystemCollection__system_indices"] = None
+        return state
 
     @final
     def _check_type(self, sys_to_be_added: Any) -> bool:
@@ -128,13 +207,23 @@ class BaseSystemCollection(MutableSequence):
 
     def __delitem__(self, idx, /):  # type: ignore
         del self.__systems[idx]
+        self.__system_indices = None
 
     def __setitem__(self, idx, system, /):  # type: ignore
         self._check_type(system)
         self.__systems[idx] = system
+        self.__system_indices = None
 
     def insert(self, idx, system) -> None:  # type: ignore
         self._check_type(system)
+        assert (
+            not self._finalize_flag or self._adding_systems
+        ), "Systems can only be added after finalize within additions()."
+        if self.__system_indices is not None and idx >= len(self.__systems):
+            # Appended, indices of other systems are unchanged
+            self.__system_indices.setdefault(id(system), len(self.__systems))
+        else:
+            self.__system_indices = None
         self.__systems.insert(idx, system)
 
     def __str__(self) -> str:
@@ -189,10 +278,13 @@ class BaseSystemCollection(MutableSequence):
             sys_idx = int(system)
         elif self._check_type(system):
             # 2. If they are system object (most likely), lookup indices
-            # index might have some problems : https://stackoverflow.com/a/176921
+            if self.__system_indices is None:
+                self.__system_indices = {}
+                for idx, registered_system in enumerate(self.__systems):
+                    self.__system_indices.setdefault(id(registered_system), idx)
             try:
-                sys_idx = self.__systems.index(system)
-            except ValueError:
+                sys_idx = self.__system_indices[id(system)]
+            except KeyError:
                 raise ValueError(
                     "System {} was not found, did you append it to the system?".format(
                         system
@@ -219,30 +311,371 @@ class BaseSystemCollection(MutableSequence):
             yield block
 
     @final
-    def finalize(self) -> None:
+    def active_block_systems(self) -> Generator[BlockSystemType, None, None]:
+        """
+        Iterate over the block systems to step. If some systems of a block are
+        asleep (see Sleeping) or driven (see PrescribedMotion), the segments of
+        the other systems of the block are yielded instead of the block.
+        """
+        for block in self.__final_blocks:
+            if block.awake_segments is None:
+                yield block
+            else:
+                yield from block.awake_segments
+
+    @final
+    def finalize(self, lean_memory: bool = False) -> None:
         """
         This method finalizes the simulator class. When it is called, it is assumed that the user has appended
         all rod-like objects to the simulator as well as all boundary conditions, callbacks, etc.,
         acting on these rod-like objects. After the finalize method called,
         the user cannot add new features to the simulator class.
+
+        Parameters
+        ----------
+        lean_memory: bool
+            If True, the memory blocks of rods only store the state and the rest
+            configuration of the rods, and compute their strains and stresses into
+            a small workspace (see MemoryBlockCosseratRod). Rods must be straight,
+            with diagonal material tensors.
         """
 
         assert not self._finalize_flag, "The finalize cannot be called twice."
         self._finalize_flag = True
+        self.__lean_memory = lean_memory
+
+        # Finalize creates a few objects per system, and the cyclic garbage
+        # collector would traverse all the systems many times for large scenes.
+        # Nothing created here is garbage, so the collector is paused meanwhile.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            # Construct memory block
+            tic = time.perf_counter()
+            self.__final_blocks = construct_memory_block_structures(
+                self.__systems, lean_memory
+            )
+            # FIXME: We need this to make ring-rod working.
+            # But probably need to be refactored
+            self.__systems.extend(self.__final_blocks)
+            self.__system_indices = None
+            self.finalize_timings["memory_blocks"] = time.perf_counter() - tic
+
+            # Recurrent call finalize functions for all components.
+            for finalize in self._feature_group_finalize:
+                tic = time.perf_counter()
+                finalize()
+                phase = getattr(finalize, "__name__", repr(finalize))
+                phase = phase.removeprefix("_finalize_")
+                self.finalize_timings[phase] = (
+                    self.finalize_timings.get(phase, 0.0) + time.perf_counter() - tic
+                )
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        logger.debug(
+            "Finalized %d systems: %s",
+            len(self) - len(self.__final_blocks),
+            ", ".join(
+                f"{phase} {timing:.3f} s"
+                for phase, timing in self.finalize_timings.items()
+            ),
+        )
 
-        # Construct memory block
-        self.__final_blocks = construct_memory_block_structures(self.__systems)
-        # FIXME: We need this to make ring-rod working.
-        # But probably need to be refactored
-        self.__systems.extend(self.__final_blocks)
+        # The finalize functions are kept to finalize the features of systems
+        # added later (see additions).
+        for feature_group in self._feature_groups():
+            feature_group.forget_features()
 
-        # Recurrent call finalize functions for all components.
-        for finalize in self._feature_group_finalize:
-            finalize()
+    @final
+    def _feature_groups(self) -> tuple[OperatorGroupFIFO, ...]:
+        return (
+            self._feature_group_synchronize,
+            self._feature_group_constrain_values,
+            self._feature_group_constrain_rates,
+            self._feature_group_damping,
+            self._feature_group_callback,
+        )
+
+    @final
+    @contextmanager
+    def additions(self) -> Iterator[None]:
+        """
+        Add systems and features after finalize, e.g. rods growing, attached or
+        replacing retired ones during a simulation. Within the context, systems are
+        appended and their features registered as before finalize. When the
+        context exits, the new systems are stored in memory blocks and only the new
+        features are finalized. Their operators are applied after the existing
+        ones, which are not rebuilt.
+
+        Rods take the free slots left by retired rods with the same number of
+        elements, and rigid bodies the slots left by retired rigid bodies.
+        Otherwise, they are stored in a new memory block, with free slots for the
+        systems added later: the number of slots created after finalize is doubled
+        at each growth. Ring rods cannot be added. Constraints and callbacks of the
+        new features are applied from the next step on.
+
+        Examples
+        --------
+        >>> with simulator.additions():
+        ...     simulator.append(branch)
+        ...     simulator.connect(rod, branch, -1, 0).using(
+        ...         FixedJoint, k=1e5, nu=0.0, kt=1e3
+        ...     )
+        """
+        assert self._finalize_flag, "Systems are added with additions after finalize."
+        assert not self._adding_systems, "additions cannot be nested."
+        n_systems = len(self.__systems)
+        for open_features in self._feature_group_open:
+            open_features()
+
+        self._adding_systems = True
+        try:
+            try:
+                yield
+            except BaseException:
+                # Systems appended in the context are discarded.
+                del self.__systems[n_systems:]
+                self.__system_indices = None
+                raise
+
+            new_blocks = place_systems_in_blocks(
+                self.__systems[n_systems:],
+                list(range(n_systems, len(self.__systems))),
+                self.__free_slots,
+                self.__n_added_slots,
+                self.__lean_memory,
+            )
+            for block in new_blocks:
+                self.__final_blocks.append(block)
+                self.append(block)
+            self.__system_locations = None
+            self.__system_revision += 1
+
+            for finalize in self._feature_group_finalize:
+                finalize()
+            for feature_group in self._feature_groups():
+                feature_group.forget_features()
+        finally:
+            self._adding_systems = False
+
+        logger.debug(
+            "Added %d systems in %d new memory blocks",
+            len(self.__systems) - n_systems - len(new_blocks),
+            len(new_blocks),
+        )
+
+    @final
+    def retire(self, system: SystemType) -> None:
+        """
+        Retire a system after finalize (see `retire_many`).
 
-        # Clear the finalize feature group, just for the safety.
-        self._feature_group_finalize.clear()
-        del self._feature_group_finalize
+        Parameters
+        ----------
+        system: SystemType
+            System to retire.
+        """
+        self.retire_many([system])
+
+    @final
+    def retire_many(self, systems: Iterable[SystemType]) -> None:
+        """
+        Remove systems from the simulation after finalize, e.g. rods cut or
+        detached during a simulation.
+
+        The operators of the features acting on the systems, i.e. forcing,
+        constraints, damping, connections, contact and callbacks, are removed.
+        Operators fused over a memory block only stop acting on the systems, and
+        other operators are not modified. Operators of custom features are removed
+        if the system is given to them as a keyword argument. The systems keep
+        their index and a copy of their last state, and their slots in the memory
+        blocks are left at rest, to be used by systems added later (see
+        `additions`). Features acting on a whole memory block still act on the
+        free slots.
+
+        Parameters
+        ----------
+        systems: Iterable[SystemType]
+            Systems to retire.
+        """
+        assert self._finalize_flag, "Systems can only be retired after finalize."
+        retired_systems: list[StaticSystemType] = []
+        retired_indices: list[SystemIdxType] = []
+        for system in systems:
+            sys_idx = self.get_system_index(system)
+            assert (
+                sys_idx not in self.__retired_systems
+            ), "System {} is already retired.".format(sys_idx)
+            assert not any(
+                self.__systems[sys_idx] is block for block in self.__final_blocks
+            ), "Memory blocks cannot be retired."
+            retired_systems.append(self.__systems[sys_idx])
+            retired_indices.append(sys_idx)
+
+        system_ids = {id(system) for system in retired_systems}
+        for feature_group in self._feature_groups():
+            feature_group.remove_operators(
+                functools.partial(
+                    _remove_systems_from_operator,
+                    systems=retired_systems,
+                    system_ids=system_ids,
+                )
+            )
+
+        if self.__system_locations is None:
+            self.__system_locations = locate_systems_in_blocks(self.__final_blocks)
+        releases: dict[int, tuple[BlockSystemType, list[int], list[Any]]] = {}
+        for sys_idx, retired_system in zip(retired_indices, retired_systems):
+            self.__retired_systems.add(sys_idx)
+            location = self.__system_locations.pop(sys_idx, None)
+            if location is None:
+                # Not stored in a memory block, e.g. surfaces
+                continue
+            block, block_idx = location
+            release = releases.setdefault(id(block), (block, [], []))
+            release[1].append(block_idx)
+            release[2].append(retired_system)
+            # Systems stored in memory blocks have a slot key
+            slot_key = cast(SlotKey, block_slot_key(retired_system))
+            self.__free_slots.setdefault(slot_key, []).append((block, block_idx))
+        for block, block_indices, block_systems in releases.values():
+            block.release_systems(block_indices, block_systems)
+        self.__system_revision += 1
+
+    @final
+    def is_retired(self, system: "SystemType | StaticSystemType") -> bool:
+        """
+        Checks if the system is retired (see `retire_many`).
+
+        Parameters
+        ----------
+        system: SystemType
+        """
+        return self.get_system_index(system) in self.__retired_systems
+
+    @final
+    def register_state(self, operator: Any) -> None:
+        """
+        Register an operator whose state is saved by `snapshot` and set by
+        `restore`, in addition to the state of the systems. The operator must
+        implement `snapshot_state()`, returning its state, and
+        `restore_state(state)`. Forcing, damping, constraints, connections,
+        contacts and callbacks implementing these methods are registered when
+        they are instantiated (see `_instantiate_feature`).
+
+        Parameters
+        ----------
+        operator: object
+            Stateful operator, e.g. a callback recording data.
+        """
+        assert hasattr(operator, "snapshot_state") and hasattr(
+            operator, "restore_state"
+        ), "{} does not implement snapshot_state and restore_state.".format(operator)
+        if not any(operator is registered for registered in self._stateful_operators):
+            self._stateful_operators.append(operator)
+
+    @final
+    def _instantiate_feature(self, feature: ModuleProtocol[M], *args: Any) -> M:
+        """
+        Instantiate the object of a registered feature at finalize, and register
+        its state if it implements `snapshot_state` (see `register_state`).
+
+        Parameters
+        ----------
+        feature: ModuleProtocol
+            Registered feature, e.g. a forcing or a callback.
+        *args
+            Arguments of the `instantiate` method of the feature.
+
+        Returns
+        -------
+        Object acting on the systems.
+        """
+        instance = feature.instantiate(*args)
+        if hasattr(instance, "snapshot_state"):
+            self.register_state(instance)
+        return instance
+
+    @final
+    def snapshot(
+        self,
+        out: Optional[SystemSnapshot] = None,
+        time: Optional[float] = None,
+        rest_state: bool = False,
+    ) -> SystemSnapshot:
+        """
+        Copy the dynamic state of the memory blocks (positions, directors,
+        velocities and angular velocities) and the state of the registered
+        operators into memory, e.g. to evaluate several rollouts from the same
+        state. Should be called after finalize.
+
+        Parameters
+        ----------
+        out: SystemSnapshot, optional
+            Snapshot of this collection whose arrays are overwritten, so that no
+            memory is allocated.
+        time: float, optional
+            Simulation time stored with the snapshot.
+        rest_state: bool
+            If True, the rest state of rods is also copied. (default: False)
+
+        Returns
+        -------
+        SystemSnapshot
+        """
+        fields = [
+            (block_idx, field)
+            for block_idx, block in enumerate(self.__final_blocks)
+            for field in block_state_fields(block, rest_state)
+        ]
+        if out is None:
+            out = SystemSnapshot(
+                fields,
+                [
+                    np.empty_like(getattr(self.__final_blocks[block_idx], field))
+                    for block_idx, field in fields
+                ],
+            )
+        assert (
+            out.fields == fields
+        ), "The snapshot was not taken from this system collection."
+
+        for (block_idx, field), array in zip(fields, out.arrays):
+            np.copyto(array, getattr(self.__final_blocks[block_idx], field))
+        out.operator_states = [
+            operator.snapshot_state() for operator in self._stateful_operators
+        ]
+        out.time = time
+        out.system_revision = self.__system_revision
+        return out
+
+    @final
+    def restore(self, snapshot: SystemSnapshot) -> Optional[float]:
+        """
+        Restore a snapshot taken by `snapshot`.
+
+        Parameters
+        ----------
+        snapshot: SystemSnapshot
+            Snapshot of this collection.
+
+        Returns
+        -------
+        time: float, optional
+            Simulation time stored with the snapshot.
+        """
+        assert len(snapshot.operator_states) == len(
+            self._stateful_operators
+        ), "The snapshot was not taken from this system collection."
+        assert (
+            snapshot.system_revision == self.__system_revision
+        ), "Systems were retired or added since the snapshot was taken."
+        for (block_idx, field), array in zip(snapshot.fields, snapshot.arrays):
+            np.copyto(getattr(self.__final_blocks[block_idx], field), array)
+        for operator, state in zip(self._stateful_operators, snapshot.operator_states):
+            operator.restore_state(state)
+        return snapshot.time
 
     @final
     def synchronize(self, time: np.float64) -> None:
@@ -283,6 +716,27 @@ class BaseSystemCollection(MutableSequence):
             func(time=time, current_step=current_step)
 
 
+def _remove_systems_from_operator(
+    operator: Any, systems: list[Any], system_ids: set[int]
+) -> bool:
+    """
+    Removes the systems from an operator, and returns True if the operator has to be
+    removed. Operators of features are partials bound to their systems by keyword,
+    and are removed if they are bound to one of the systems. Operators fused over a
+    memory block, and the callback scheduler, implement `remove_systems`, which
+    returns False once they do not act on any system.
+    """
+    owner = operator
+    if isinstance(operator, functools.partial):
+        if any(id(value) in system_ids for value in operator.keywords.values()):
+            return True
+        owner = getattr(operator.func, "__self__", None)
+    remove_systems = getattr(owner, "remove_systems", None)
+    if remove_systems is None:
+        return False
+    return not remove_systems(systems)
+
+
 if TYPE_CHECKING:
     from .protocol import SystemCollectionProtocol
     from .constraints import Constraints
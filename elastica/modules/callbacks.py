@@ -4,16 +4,19 @@ CallBacks
 
 Provides the callBack interface to collect data over time (see `callback_functions.py`).
 """
-from typing import Type, Any
+from typing import Type, Any, Optional
 from typing_extensions import Self  # 3.11: from typing import Self
 from elastica.typing import SystemType, SystemIdxType, OperatorFinalizeType
 from .protocol import ModuleProtocol
 
 import functools
+import heapq
 
 import numpy as np
 
 from elastica.callback_functions import CallBackBaseClass
+from elastica.rod.rod_base import RodBase
+from .memory_block import find_block_index
 from .protocol import SystemCollectionWithCallbackProtocol
 
 
@@ -33,6 +36,7 @@ class CallBacks:
         self._callback_list: list[ModuleProtocol] = []
         super(CallBacks, self).__init__()
         self._feature_group_finalize.append(self._finalize_callback)
+        self._feature_group_open.append(self._open_callback)
 
     def collect_diagnostics(
         self: SystemCollectionWithCallbackProtocol, system: SystemType
@@ -60,11 +64,57 @@ class CallBacks:
 
         return _callback
 
+    def collect_block_diagnostics(
+        self: SystemCollectionWithCallbackProtocol, system_type: Type = RodBase
+    ) -> ModuleProtocol:
+        """
+        This method calls user-defined call-back classes for the memory block
+        that collects all systems of the given type. The memory block is only
+        created at finalize, so the callback is attached to it then. This is
+        intended for callbacks recording many systems at once, such as
+        MemoryBlockSnapshotCallBack.
+
+        Parameters
+        ----------
+        system_type: Type
+            Type of the systems in the memory block. (default: RodBase)
+
+        Returns
+        -------
+
+        """
+        _callback: ModuleProtocol = _BlockCallBack(system_type)
+        self._callback_list.append(_callback)
+        self._feature_group_callback.append_id(_callback)
+
+        return _callback
+
+    def _open_callback(self: SystemCollectionWithCallbackProtocol) -> None:
+        # Register features again, for systems added after finalize.
+        self._callback_list = []
+
     def _finalize_callback(self: SystemCollectionWithCallbackProtocol) -> None:
+        # Callbacks on memory blocks can only be resolved now that blocks exist.
+        for callback in self._callback_list:
+            if isinstance(callback, _BlockCallBack):
+                callback.resolve(self)
+
         # dev : the first index stores the rod index to collect data.
+        # Callbacks that declare the steps they act on are called through a single
+        # scheduler, registered in place of the first of them. Other callbacks are
+        # called every step.
+        scheduler = _CallBackScheduler()
         for callback in self._callback_list:
+            if callback.id() is None:
+                continue
             sys_id = callback.id()
-            callback_instance = callback.instantiate()
+            callback_instance = self._instantiate_feature(callback)
+
+            if _CallBackScheduler.is_scheduled(callback_instance):
+                if not scheduler:
+                    self._feature_group_callback.add_operators(callback, [scheduler])
+                scheduler.add(callback_instance, self[sys_id])
+                continue
 
             callback_operator = functools.partial(
                 callback_instance.make_callback, system=self[sys_id]
@@ -74,8 +124,10 @@ class CallBacks:
         self._callback_list.clear()
         del self._callback_list
 
-        # First callback execution
-        self.apply_callbacks(time=np.float64(0.0), current_step=0)
+        # First callback execution. Callbacks added after finalize are called from
+        # the next step on.
+        if not self._adding_systems:
+            self.apply_callbacks(time=np.float64(0.0), current_step=0)
 
 
 class _CallBack:
@@ -153,3 +205,115 @@ class _CallBack:
                 r"Unable to construct callback class.\n"
                 r"Did you provide all necessary callback properties?"
             )
+
+
+class _BlockCallBack(_CallBack):
+    """
+    CallBack module private class for callbacks on a memory block
+
+        Attributes
+        ----------
+        _system_type: Type
+            Type of the systems collected in the memory block.
+    """
+
+    def __init__(self, system_type: Type) -> None:
+        """
+
+        Parameters
+        ----------
+        system_type: Type
+        """
+        super().__init__(None)  # type: ignore[arg-type]
+        self._system_type = system_type
+
+    def resolve(self, system_collection: SystemCollectionWithCallbackProtocol) -> None:
+        """Find the index of the memory block once the simulator is finalized"""
+        block_idx = find_block_index(
+            system_collection,
+            self._system_type,
+            "callback {}".format(getattr(self, "_callback_cls", None)),
+        )
+        if block_idx is not None:
+            self._sys_idx = block_idx
+
+
+class _CallBackScheduler:
+    """
+    Calls the callbacks that declare their next step (see
+    CallBackBaseClass.next_callback_step) only on the steps they are due. The
+    callbacks are kept in a priority queue keyed on their next step, so a step on
+    which no callback is due costs a single comparison, instead of one Python call
+    per callback. Callbacks due on the same step are called in the order they were
+    registered.
+
+        Attributes
+        ----------
+        _callbacks: list
+            Registered callbacks and the systems they act on.
+        _queue: list
+            Heap of (next step, registration order) of the callbacks to call.
+        _last_step: int
+            Last step the callbacks were applied on.
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: list[tuple[CallBackBaseClass, SystemType]] = []
+        self._queue: list[tuple[int, int]] = []
+        self._last_step: Optional[int] = None
+
+    @staticmethod
+    def is_scheduled(callback: CallBackBaseClass) -> bool:
+        """Checks if the callback declares the steps it has to be called on."""
+        return (
+            type(callback).next_callback_step
+            is not CallBackBaseClass.next_callback_step
+        )
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    def add(self, callback: CallBackBaseClass, system: SystemType) -> None:
+        self._callbacks.append((callback, system))
+        # Schedule again from the next step the scheduler is called on.
+        self._last_step = None
+
+    def remove_systems(self, systems: list[Any]) -> bool:
+        """
+        Remove the callbacks on the given systems, e.g. when the systems are
+        retired from the simulation. Returns True if callbacks remain.
+        """
+        system_ids = {id(system) for system in systems}
+        self._callbacks = [
+            (callback, system)
+            for callback, system in self._callbacks
+            if id(system) not in system_ids
+        ]
+        # Orders in the queue refer to the previous list of callbacks.
+        self._last_step = None
+        return bool(self._callbacks)
+
+    def _push(self, order: int, current_step: int) -> None:
+        next_step = self._callbacks[order][0].next_callback_step(current_step)
+        if next_step is not None:
+            heapq.heappush(self._queue, (next_step, order))
+
+    def _reschedule(self, current_step: int) -> None:
+        self._queue.clear()
+        for order in range(len(self._callbacks)):
+            self._push(order, current_step)
+
+    def __call__(self, time: np.float64, current_step: int) -> None:
+        # Steps increase during a simulation. Otherwise, e.g. when the callbacks
+        # are applied again on a step, or after restoring an earlier state, the
+        # queue is built again from the current step.
+        if self._last_step is None or current_step <= self._last_step:
+            self._reschedule(current_step)
+        self._last_step = current_step
+
+        queue = self._queue
+        while queue and queue[0][0] <= current_step:
+            _, order = heapq.heappop(queue)
+            callback, system = self._callbacks[order]
+            callback.make_callback(system, time=time, current_step=current_step)
+            self._push(order, current_step + 1)
@@ -5,7 +5,7 @@ Connect
 Provides the connections interface to connect entities (rods,
 rigid bodies) using joints (see `joints.py`).
 """
-from typing import Type, cast, Any
+from typing import Type, Iterable, cast, Any
 from typing_extensions import Self
 from elastica.typing import (
     SystemIdxType,
@@ -18,6 +18,7 @@ import numpy as np
 import functools
 from elastica.joint import FreeJoint
 
+from .operator_group import ModuleGroup
 from .protocol import ConnectedSystemCollectionProtocol, ModuleProtocol
 
 
@@ -37,6 +38,7 @@ class Connections:
         self._connections: list[ModuleProtocol] = []
         super(Connections, self).__init__()
         self._feature_group_finalize.append(self._finalize_connections)
+        self._feature_group_open.append(self._open_connections)
 
     def connect(
         self: ConnectedSystemCollectionProtocol,
@@ -81,6 +83,44 @@ class Connections:
 
         return _connect
 
+    def connect_pairs(
+        self: ConnectedSystemCollectionProtocol,
+        pairs: Iterable[tuple["RodType | RigidBodyType", "RodType | RigidBodyType"]],
+        first_connect_idx: ConnectionIndex = (),
+        second_connect_idx: ConnectionIndex = (),
+    ) -> ModuleGroup:
+        """
+        This method connects many pairs of rod-like objects using the same joint
+        class, at the same element indexes. It is equivalent to calling `connect`
+        for each pair, and `using` on the returned group sets the joint class of
+        all of them.
+
+        Parameters
+        ----------
+        pairs : Iterable[tuple[RodType | RigidBodyType, RodType | RigidBodyType]]
+            Pairs of rod-like objects
+        first_connect_idx : ConnectionIndex
+            Index of first rod of each pair for joint.
+        second_connect_idx : ConnectionIndex
+            Index of second rod of each pair for joint.
+
+        Returns
+        -------
+
+        """
+        return ModuleGroup(
+            [
+                self.connect(
+                    first_rod, second_rod, first_connect_idx, second_connect_idx
+                )
+                for first_rod, second_rod in pairs
+            ]
+        )
+
+    def _open_connections(self: ConnectedSystemCollectionProtocol) -> None:
+        # Register features again, for systems added after finalize.
+        self._connections = []
+
     def _finalize_connections(self: ConnectedSystemCollectionProtocol) -> None:
         # From stored _Connect objects, instantiate the joints and store it
         # dev : the first indices stores the
@@ -91,7 +131,7 @@ class Connections:
             first_sys_idx, second_sys_idx, first_connect_idx, second_connect_idx = (
                 connection.id()
             )
-            connect_instance: FreeJoint = connection.instantiate()
+            connect_instance: FreeJoint = self._instantiate_feature(connection)
 
             func_force = functools.partial(
                 connect_instance.apply_forces,
@@ -4,14 +4,18 @@ Constraints
 
 Provides the constraints interface to enforce displacement boundary conditions (see `boundary_conditions.py`).
 """
-from typing import Any, Type, cast
+from typing import Any, Type, Iterable, cast
 from typing_extensions import Self
 
 import functools
 
 import numpy as np
 
-from elastica.boundary_conditions import ConstraintBase
+from elastica.boundary_conditions import (
+    ConstraintBase,
+    PrescribedMotion,
+    _BlockConstraint,
+)
 
 from elastica.typing import (
     SystemIdxType,
@@ -20,6 +24,9 @@ from elastica.typing import (
     RodType,
 )
 from elastica.memory_block.protocol import BlockRodProtocol
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from .memory_block import locate_systems_in_blocks, schedule_block_features
+from .operator_group import ModuleGroup
 from .protocol import ConstrainedSystemCollectionProtocol, ModuleProtocol
 
 
@@ -39,6 +46,7 @@ class Constraints:
         self._constraints_list: list[ModuleProtocol] = []
         super(Constraints, self).__init__()
         self._feature_group_finalize.append(self._finalize_constraints)
+        self._feature_group_open.append(self._open_constraints)
 
     def constrain(
         self: ConstrainedSystemCollectionProtocol, system: "RodType | RigidBodyType"
@@ -67,6 +75,31 @@ class Constraints:
 
         return _constraint
 
+    def constrain_many(
+        self: ConstrainedSystemCollectionProtocol,
+        systems: Iterable["RodType | RigidBodyType"],
+    ) -> ModuleGroup:
+        """
+        This method enforces the same displacement boundary conditions on many
+        user-defined systems or rod-like objects. It is equivalent to calling
+        `constrain` for each system, and `using` on the returned group sets the
+        boundary condition class of all of them.
+
+        Parameters
+        ----------
+        systems: Iterable[object]
+            Systems are rod-like objects.
+
+        Returns
+        -------
+
+        """
+        return ModuleGroup([self.constrain(system) for system in systems])
+
+    def _open_constraints(self: ConstrainedSystemCollectionProtocol) -> None:
+        # Register features again, for systems added after finalize.
+        self._constraints_list = []
+
     def _finalize_constraints(self: ConstrainedSystemCollectionProtocol) -> None:
         """
         In case memory block have ring rod, then periodic boundaries have to be synched. In order to synchronize
@@ -74,7 +107,8 @@ class Constraints:
         constrain will synchronize the only periodic boundaries of position, director, velocity and omega variables.
         """
 
-        for block in self.block_systems():
+        # Memory blocks added after finalize have no ring rods.
+        for block in [] if self._adding_systems else self.block_systems():
             # append the memory block to the simulation as a system. Memory block is the final system in the simulation.
             if hasattr(block, "ring_rod_flag"):
                 from elastica._synchronize_periodic_boundary import (
@@ -100,29 +134,93 @@ class Constraints:
         # [(0, ConstraintBase, OneEndFixedBC), (1, HelicalBucklingBC), ... ]
         # Thus using lambda we iterate over the list of tuples and use rod number (x[0])
         # to sort constraints.
+        registered_constraints = list(self._constraints_list)
         self._constraints_list.sort(key=lambda x: x.id())
+        constraint_instances = {}
         for constraint in self._constraints_list:
             sys_id = constraint.id()
-            constraint_instance = constraint.instantiate(self[sys_id])
-
-            constrain_values = functools.partial(
-                constraint_instance.constrain_values, system=self[sys_id]
-            )
-            constrain_rates = functools.partial(
-                constraint_instance.constrain_rates, system=self[sys_id]
+            constraint_instances[id(constraint)] = self._instantiate_feature(
+                constraint, self[sys_id]
             )
 
-            self._feature_group_constrain_values.add_operators(
-                constraint, [constrain_values]
-            )
-            self._feature_group_constrain_rates.add_operators(
-                constraint, [constrain_rates]
-            )
+        # Fixed and general constraints acting on rods of the same memory block are
+        # gathered into one constraint over the block, applied with a single
+        # scatter kernel. Constraints on the whole block (periodic boundaries) are
+        # kept in place.
+        system_locations = locate_systems_in_blocks(self.block_systems())
+        block_indices = {self.get_system_index(block) for block in self.block_systems()}
+
+        # Systems with a prescribed motion skip the dynamics of their memory block.
+        driven_systems: dict[int, tuple[Any, list[int]]] = {}
+        for constraint in self._constraints_list:
+            location = system_locations.get(constraint.id(), None)
+            if location is not None and isinstance(
+                constraint_instances[id(constraint)], PrescribedMotion
+            ):
+                block, block_idx = location
+                driven_systems.setdefault(id(block), (block, []))[1].append(block_idx)
+        for block, driven_indices in driven_systems.values():
+            driven = block.driven.copy()
+            driven[driven_indices] = True
+            block.set_driven(driven)
+
+        def fusion_key(constraint: ModuleProtocol) -> "MemoryBlockCosseratRod | None":
+            location = system_locations.get(constraint.id(), None)
+            if (
+                location is not None
+                and isinstance(location[0], MemoryBlockCosseratRod)
+                and type(constraint_instances[id(constraint)])
+                in _BlockConstraint.FUSED_CONSTRAINTS
+            ):
+                return location[0]
+            return None
+
+        schedule = schedule_block_features(
+            registered_constraints,
+            system_idx=lambda constraint: constraint.id(),
+            fusion_key=fusion_key,
+            is_barrier=lambda constraint: constraint.id() in block_indices,
+        )
+
+        for anchor, groups in schedule:
+            for group in groups:
+                if len(group) == 1:
+                    (constraint,) = group
+                    system = self[constraint.id()]
+                    constraint_instance = constraint_instances[id(constraint)]
+                else:
+                    system = fusion_key(group[0])
+                    constraint_instance = _BlockConstraint(
+                        [
+                            (
+                                constraint_instances[id(constraint)],
+                                system_locations[constraint.id()][1],
+                            )
+                            for constraint in group
+                        ],
+                        _system=system,
+                    )
+
+                constrain_values = functools.partial(
+                    constraint_instance.constrain_values, system=system
+                )
+                constrain_rates = functools.partial(
+                    constraint_instance.constrain_rates, system=system
+                )
+
+                self._feature_group_constrain_values.add_operators(
+                    anchor, [constrain_values]
+                )
+                self._feature_group_constrain_rates.add_operators(
+                    anchor, [constrain_rates]
+                )
 
         # At t=0.0, constrain all the boundary conditions (for compatability with
-        # initial conditions)
-        self.constrain_values(time=np.float64(0.0))
-        self.constrain_rates(time=np.float64(0.0))
+        # initial conditions). Constraints added after finalize are applied from the
+        # next step on.
+        if not self._adding_systems:
+            self.constrain_values(time=np.float64(0.0))
+            self.constrain_rates(time=np.float64(0.0))
 
         self._constraints_list = []
         del self._constraints_list
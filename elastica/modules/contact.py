@@ -5,7 +5,7 @@ Contact
 Provides the contact interface to apply contact forces between objects
 (rods, rigid bodies, surfaces).
 """
-from typing import Type, Any
+from typing import Type, Any, Iterable
 from typing_extensions import Self
 
 import functools
@@ -15,6 +15,7 @@ from elastica.typing import (
     StaticSystemType,
     SystemType,
 )
+from .operator_group import ModuleGroup
 from .protocol import ContactedSystemCollectionProtocol, ModuleProtocol
 
 import logging
@@ -45,6 +46,7 @@ class Contact:
         self._contacts: list[ModuleProtocol] = []
         super(Contact, self).__init__()
         self._feature_group_finalize.append(self._finalize_contact)
+        self._feature_group_open.append(self._open_contact)
 
     def detect_contact_between(
         self: ContactedSystemCollectionProtocol,
@@ -74,6 +76,36 @@ class Contact:
 
         return _contact
 
+    def detect_contact_between_pairs(
+        self: ContactedSystemCollectionProtocol,
+        pairs: Iterable[tuple[SystemType, "SystemType | StaticSystemType"]],
+    ) -> ModuleGroup:
+        """
+        This method adds the same contact detection between many pairs of
+        objects. It is equivalent to calling `detect_contact_between` for each
+        pair, and `using` on the returned group sets the contact class of all of
+        them.
+
+        Parameters
+        ----------
+        pairs : Iterable[tuple[SystemType, SystemType | StaticSystemType]]
+            Pairs of objects in contact.
+
+        Returns
+        -------
+
+        """
+        return ModuleGroup(
+            [
+                self.detect_contact_between(first_system, second_system)
+                for first_system, second_system in pairs
+            ]
+        )
+
+    def _open_contact(self: ContactedSystemCollectionProtocol) -> None:
+        # Register features again, for systems added after finalize.
+        self._contacts = []
+
     def _finalize_contact(self: ContactedSystemCollectionProtocol) -> None:
 
         # dev : the first indices stores the
@@ -82,7 +114,7 @@ class Contact:
 
         for contact in self._contacts:
             first_sys_idx, second_sys_idx = contact.id()
-            contact_instance = contact.instantiate()
+            contact_instance = self._instantiate_feature(contact)
 
             contact_instance._check_systems_validity(
                 self[first_sys_idx],
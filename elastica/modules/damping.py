@@ -9,15 +9,24 @@ on the rods. (see `dissipation.py`).
 
 """
 
-from typing import Any, Type, List
+from typing import Any, Type, List, Iterable
 from typing_extensions import Self
 
 import functools
 
 import numpy as np
 
-from elastica.dissipation import DamperBase
+from elastica.dissipation import (
+    DamperBase,
+    AnalyticalLinearDamper,
+    LaplaceDissipationFilter,
+    _BlockAnalyticalLinearDamper,
+    _BlockLaplaceDissipationFilter,
+)
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
 from elastica.typing import RodType, SystemType, SystemIdxType
+from .memory_block import locate_systems_in_blocks, schedule_block_features
+from .operator_group import ModuleGroup
 from .protocol import DampenedSystemCollectionProtocol, ModuleProtocol
 
 
@@ -37,6 +46,7 @@ class Damping:
         self._damping_list: List[ModuleProtocol] = []
         super().__init__()
         self._feature_group_finalize.append(self._finalize_dampers)
+        self._feature_group_open.append(self._open_dampers)
 
     def dampen(
         self: DampenedSystemCollectionProtocol, system: RodType
@@ -64,29 +74,120 @@ class Damping:
 
         return _damper
 
+    def dampen_many(
+        self: DampenedSystemCollectionProtocol, systems: Iterable[RodType]
+    ) -> ModuleGroup:
+        """
+        This method applies the same damping on many user-defined systems or
+        rod-like objects. It is equivalent to calling `dampen` for each system,
+        and `using` on the returned group sets the damper class of all of them.
+
+        Parameters
+        ----------
+        systems: Iterable[object]
+            Systems are rod-like objects.
+
+        Returns
+        -------
+
+        """
+        return ModuleGroup([self.dampen(system) for system in systems])
+
+    def _open_dampers(self: DampenedSystemCollectionProtocol) -> None:
+        # Register features again, for systems added after finalize.
+        self._damping_list = []
+
     def _finalize_dampers(self: DampenedSystemCollectionProtocol) -> None:
         # From stored _Damping objects, instantiate the dissipation/damping
         # inplace : https://stackoverflow.com/a/1208792
 
+        # Dampers in registration order, used below to fuse dampers on blocks.
+        registered_dampers = list(self._damping_list)
+
         # Sort from lowest id to highest id for potentially better memory access
         # _dampers contains list of tuples. First element of tuple is rod number and
         # following elements are the type of damping.
         # Thus using lambda we iterate over the list of tuples and use rod number (x[0])
         # to sort dampers.
         self._damping_list.sort(key=lambda x: x.id())
+        damping_instances = {}
         for damping in self._damping_list:
             sys_id = damping.id()
-            damping_instance = damping.instantiate(self[sys_id])
-
-            dampen_rate = functools.partial(
-                damping_instance.dampen_rates, system=self[sys_id]
+            damping_instances[id(damping)] = self._instantiate_feature(
+                damping, self[sys_id]
             )
-            self._feature_group_damping.add_operators(damping, [dampen_rate])
+
+        # Analytical dampers and Laplace filters acting on rods of the same memory
+        # block are fused into one operator over the block.
+        system_locations = locate_systems_in_blocks(self.block_systems())
+        block_indices = {self.get_system_index(block) for block in self.block_systems()}
+        schedule = schedule_block_features(
+            registered_dampers,
+            system_idx=lambda damping: damping.id(),
+            fusion_key=lambda damping: _block_fusion_key(
+                damping_instances[id(damping)],
+                system_locations.get(damping.id(), None),
+            ),
+            is_barrier=lambda damping: damping.id() in block_indices,
+        )
+
+        for anchor, groups in schedule:
+            for group in groups:
+                if len(group) == 1:
+                    (damping,) = group
+                    dampen_rate = functools.partial(
+                        damping_instances[id(damping)].dampen_rates,
+                        system=self[damping.id()],
+                    )
+                else:
+                    key = _block_fusion_key(
+                        damping_instances[id(group[0])],
+                        system_locations[group[0].id()],
+                    )
+                    assert key is not None
+                    block = key[1]
+                    dampers = [
+                        (
+                            damping_instances[id(damping)],
+                            system_locations[damping.id()][1],
+                        )
+                        for damping in group
+                    ]
+                    if key[0] is AnalyticalLinearDamper:
+                        block_damper: DamperBase = _BlockAnalyticalLinearDamper(
+                            dampers, _system=block
+                        )
+                    else:
+                        block_damper = _BlockLaplaceDissipationFilter(
+                            key[2], dampers, _system=block
+                        )
+                    dampen_rate = functools.partial(
+                        block_damper.dampen_rates, system=block
+                    )
+                self._feature_group_damping.add_operators(anchor, [dampen_rate])
 
         self._damping_list = []
         del self._damping_list
 
 
+def _block_fusion_key(
+    damper: DamperBase, rod_location: "tuple[Any, int] | None"
+) -> "tuple | None":
+    """
+    Key of the fused block damper the damper can be part of, or None if the damper
+    has to be applied on its own.
+    """
+    if rod_location is None or not isinstance(rod_location[0], MemoryBlockCosseratRod):
+        return None
+    block = rod_location[0]
+    # Subclasses may override dampen_rates, hence the exact type checks.
+    if type(damper) is AnalyticalLinearDamper:
+        return (AnalyticalLinearDamper, block)
+    if type(damper) is LaplaceDissipationFilter and not damper.system.ring_rod_flag:
+        return (LaplaceDissipationFilter, block, damper.filter_order)
+    return None
+
+
 class _Damper:
     """
     Damper module private class
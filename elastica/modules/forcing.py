@@ -5,19 +5,22 @@ Forcing
 Provides the forcing interface to apply forces and torques to rod-like objects
 (external point force, muscle torques, etc).
 """
-import logging
 import functools
-from typing import Any, Type, List
+from typing import Any, Type, List, Iterable
 from typing_extensions import Self
 
 import numpy as np
 
 from elastica.external_forces import NoForces
-from elastica.typing import SystemType, SystemIdxType
+from elastica.memory_block.memory_block_rigid_body import MemoryBlockRigidBody
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from elastica.memory_block.protocol import BlockSystemProtocol
+from elastica.rod.rod_base import RodBase
+from elastica.typing import OperatorType, SystemType, SystemIdxType
+from .memory_block import find_block_index
+from .operator_group import ModuleGroup
 from .protocol import ForcedSystemCollectionProtocol, ModuleProtocol
 
-logger = logging.getLogger(__name__)
-
 
 class Forcing:
     """
@@ -35,6 +38,7 @@ class Forcing:
         self._ext_forces_torques: List[ModuleProtocol] = []
         super().__init__()
         self._feature_group_finalize.append(self._finalize_forcing)
+        self._feature_group_open.append(self._open_forcing)
 
     def add_forcing_to(
         self: ForcedSystemCollectionProtocol, system: SystemType
@@ -62,15 +66,70 @@ class Forcing:
 
         return _ext_force_torque
 
+    def add_forcing_to_many(
+        self: ForcedSystemCollectionProtocol, systems: Iterable[SystemType]
+    ) -> ModuleGroup:
+        """
+        This method applies the same external forces and torques on many
+        user-defined systems or rod-like objects. It is equivalent to calling
+        `add_forcing_to` for each system, and `using` on the returned group sets
+        the forcing class of all of them.
+
+        Parameters
+        ----------
+        systems: Iterable[object]
+            Systems are rod-like objects.
+
+        Returns
+        -------
+
+        """
+        return ModuleGroup([self.add_forcing_to(system) for system in systems])
+
+    def add_forcing_to_block(
+        self: ForcedSystemCollectionProtocol, system_type: Type = RodBase
+    ) -> ModuleProtocol:
+        """
+        This method applies external forces and torques on the memory block that
+        collects all systems of the given type. The memory block is only created
+        at finalize, so the forcing is attached to it then. This is intended for
+        forcing that couples systems together, such as hydrodynamic interactions.
+
+        Parameters
+        ----------
+        system_type: Type
+            Type of the systems in the memory block. (default: RodBase)
+
+        Returns
+        -------
+
+        """
+        _ext_force_torque = _BlockExtForceTorque(system_type)
+        self._ext_forces_torques.append(_ext_force_torque)
+        self._feature_group_synchronize.append_id(_ext_force_torque)
+
+        return _ext_force_torque
+
+    def _open_forcing(self: ForcedSystemCollectionProtocol) -> None:
+        # Register features again, for systems added after finalize.
+        self._ext_forces_torques = []
+
     def _finalize_forcing(self: ForcedSystemCollectionProtocol) -> None:
         # From stored _ExtForceTorque objects, and instantiate a Force
         # inplace : https://stackoverflow.com/a/1208792
 
+        # Forcing on memory blocks can only be resolved now that blocks exist.
+        for external_force_and_torque in self._ext_forces_torques:
+            if isinstance(external_force_and_torque, _BlockExtForceTorque):
+                external_force_and_torque.resolve(self)
+
         # dev : the first index stores the rod index to apply the boundary condition
         # to.
         for external_force_and_torque in self._ext_forces_torques:
+            if external_force_and_torque.id() is None:
+                continue
             sys_id = external_force_and_torque.id()
-            forcing_instance = external_force_and_torque.instantiate()
+            forcing_instance = self._instantiate_feature(external_force_and_torque)
 
             apply_forces = functools.partial(
                 forcing_instance.apply_forces, system=self[sys_id]
@@ -79,14 +138,36 @@ class Forcing:
                 forcing_instance.apply_torques, system=self[sys_id]
             )
 
+            operators: list[OperatorType] = [apply_forces, apply_torques]
+            if isinstance(external_force_and_torque, _BlockExtForceTorque):
+                operators.append(
+                    functools.partial(_clear_free_slots, system=self[sys_id])
+                )
+
             self._feature_group_synchronize.add_operators(
-                external_force_and_torque, [apply_forces, apply_torques]
+                external_force_and_torque, operators
             )
 
         self._ext_forces_torques = []
         del self._ext_forces_torques
 
 
+def _clear_free_slots(system: BlockSystemProtocol, time: np.float64) -> None:
+    """
+    Resets the external loads on the free slots of a memory block (see
+    `release_systems`), so that forcing applied on the whole block ignores them.
+    """
+    for block_idx in np.flatnonzero(system.system_idx_list < 0).tolist():
+        if isinstance(system, MemoryBlockCosseratRod):
+            nodes = system._system_slice("node", block_idx)
+            elements = system._system_slice("element", block_idx)
+            system.external_forces[..., nodes] = 0.0
+            system.external_torques[..., elements] = 0.0
+        elif isinstance(system, MemoryBlockRigidBody):
+            system.external_forces[..., block_idx] = 0.0
+            system.external_torques[..., block_idx] = 0.0
+
+
 class _ExtForceTorque:
     """
     Forcing module private class
@@ -159,3 +240,33 @@ class _ExtForceTorque:
                 r"Unable to construct forcing class.\n"
                 r"Did you provide all necessary force properties?"
             )
+
+
+class _BlockExtForceTorque(_ExtForceTorque):
+    """
+    Forcing module private class for forcing applied on a memory block
+
+    Attributes
+    ----------
+    _system_type: Type
+        Type of the systems collected in the memory block.
+    """
+
+    def __init__(self, system_type: Type) -> None:
+        """
+        Parameters
+        ----------
+        system_type: Type
+        """
+        super().__init__(None)  # type: ignore[arg-type]
+        self._system_type = system_type
+
+    def resolve(self, system_collection: ForcedSystemCollectionProtocol) -> None:
+        """Find the index of the memory block once the simulator is finalized"""
+        block_idx = find_block_index(
+            system_collection,
+            self._system_type,
+            "forcing {}".format(getattr(self, "_forcing_cls", None)),
+        )
+        if block_idx is not None:
+            self._sys_idx = block_idx
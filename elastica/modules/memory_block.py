@@ -2,7 +2,14 @@ __doc__ = """
 This function is a module to construct memory blocks for different types of systems, such as
 Cosserat Rods, Rigid Body etc.
 """
-from typing import cast
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, TypeVar, cast
+from typing import TypeAlias
+
+import copy
+import logging
+
+import numpy as np
+
 from elastica.typing import (
     RodType,
     RigidBodyType,
@@ -18,15 +25,29 @@ from elastica.surface.surface_base import SurfaceBase
 from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
 from elastica.memory_block.memory_block_rigid_body import MemoryBlockRigidBody
 
+if TYPE_CHECKING:
+    from .protocol import SystemCollectionProtocol
+
+# Key of memory block slots: system base class, then the layout of the system
+SlotKey: TypeAlias = tuple[Any, ...]
+
 
 def construct_memory_block_structures(
     systems: list[StaticSystemType],
+    lean_memory: bool = False,
 ) -> list[BlockSystemType]:
     """
     This function takes the systems (rod or rigid body) appended to the simulator class and
     separates them into lists depending on if system is Cosserat rod or rigid body. Then using
     these separated out systems it creates the memory blocks for Cosserat rods and rigid bodies.
 
+    Parameters
+    ----------
+    systems: list[StaticSystemType]
+    lean_memory: bool
+        If True, memory blocks of Cosserat rods are in lean memory mode (see
+        MemoryBlockCosseratRod).
+
     Returns
     -------
 
@@ -75,6 +96,7 @@ def construct_memory_block_structures(
             MemoryBlockCosseratRod(
                 temp_list_for_cosserat_rod_systems,
                 temp_list_for_cosserat_rod_systems_idx,
+                lean_memory=lean_memory,
             )
         )
 
@@ -86,3 +108,262 @@ def construct_memory_block_structures(
         )
 
     return list(_memory_blocks)
+
+
+def block_slot_key(system: StaticSystemType) -> SlotKey | None:
+    """
+    Key of the memory block slots that can hold the system: a rod fits in the slot
+    of a rod of the same number of elements, and a rigid body in the slot of any
+    rigid body. Returns None for systems that are not stored in memory blocks.
+
+    Parameters
+    ----------
+    system: StaticSystemType
+
+    Returns
+    -------
+    SlotKey | None
+    """
+    if isinstance(system, RodBase):
+        rod_system = cast(RodType, system)
+        return (RodBase, int(rod_system.n_elems), bool(rod_system.ring_rod_flag))
+    if isinstance(system, RigidBodyBase):
+        return (RigidBodyBase,)
+    return None
+
+
+def place_systems_in_blocks(
+    systems: list[StaticSystemType],
+    system_idx_list: list[SystemIdxType],
+    free_slots: dict[SlotKey, list[tuple[BlockSystemType, int]]],
+    n_added_slots: dict[SlotKey, int],
+    lean_memory: bool = False,
+) -> list[BlockSystemType]:
+    """
+    Place systems added after finalize in memory blocks. Systems first take free
+    slots of existing blocks, left by retired systems or created in advance. Other
+    systems are gathered in new memory blocks, with free slots for later systems:
+    the number of slots of each key created after finalize is at least doubled, so
+    that the number of new memory blocks only grows logarithmically with the
+    number of added systems.
+
+    Parameters
+    ----------
+    systems: list[StaticSystemType]
+        Systems added after finalize.
+    system_idx_list: list[SystemIdxType]
+        Indices of the systems in the simulator.
+    free_slots: dict
+        Free slots (block, position in the block) by slot key. It is updated in
+        place.
+    n_added_slots: dict
+        Number of slots created after finalize by slot key. It is updated in place.
+    lean_memory: bool
+        If True, new memory blocks of Cosserat rods are in lean memory mode.
+
+    Returns
+    -------
+    list[BlockSystemType]
+        New memory blocks.
+    """
+    placements: dict[int, tuple[BlockSystemType, list[int], list, list]] = {}
+    unplaced: dict[SlotKey, list[tuple[StaticSystemType, SystemIdxType]]] = {}
+    for system, system_idx in zip(systems, system_idx_list):
+        key = block_slot_key(system)
+        if key is None:
+            if not isinstance(system, SurfaceBase):
+                raise TypeError(
+                    "{0}\n"
+                    "is not a system that can be stored in a memory block.".format(
+                        system.__class__
+                    )
+                )
+            continue
+        assert not (
+            isinstance(system, RodBase) and cast(RodType, system).ring_rod_flag
+        ), "Ring rods cannot be added after finalize."
+        if free_slots.get(key):
+            block, block_idx = free_slots[key].pop()
+            placement = placements.setdefault(id(block), (block, [], [], []))
+            placement[1].append(block_idx)
+            placement[2].append(system)
+            placement[3].append(system_idx)
+        else:
+            unplaced.setdefault(key, []).append((system, system_idx))
+
+    for block, block_indices, placed_systems, placed_idx_list in placements.values():
+        block.place_systems(block_indices, placed_systems, placed_idx_list)
+
+    # Free slots are created by copies of the added systems, which are released
+    # once the block is created.
+    new_blocks: list[BlockSystemType] = []
+    for block_type, system_type, block_kwargs in (
+        (MemoryBlockCosseratRod, RodBase, {"lean_memory": lean_memory}),
+        (MemoryBlockRigidBody, RigidBodyBase, {}),
+    ):
+        block_systems: list = []
+        block_idx_list: list[SystemIdxType] = []
+        spare_systems: list = []
+        spare_keys: list[SlotKey] = []
+        for key, entries in unplaced.items():
+            if not issubclass(key[0], system_type):
+                continue
+            n_slots = max(len(entries), n_added_slots.get(key, 0))
+            n_added_slots[key] = n_added_slots.get(key, 0) + n_slots
+            block_systems.extend(system for system, _ in entries)
+            block_idx_list.extend(system_idx for _, system_idx in entries)
+            spare_systems.extend(
+                copy.copy(entries[0][0]) for _ in range(n_slots - len(entries))
+            )
+            spare_keys.extend([key] * (n_slots - len(entries)))
+        if not block_systems:
+            continue
+
+        block = block_type(
+            block_systems + spare_systems,
+            block_idx_list + [-1] * len(spare_systems),
+            **block_kwargs,
+        )
+        spare_indices = list(
+            range(len(block_systems), len(block_systems) + len(spare_systems))
+        )
+        block.release_systems(spare_indices, spare_systems)
+        for key, block_idx in zip(spare_keys, reversed(spare_indices)):
+            free_slots.setdefault(key, []).append((block, block_idx))
+        new_blocks.append(block)
+
+    return new_blocks
+
+
+def find_block_index(
+    system_collection: "SystemCollectionProtocol",
+    system_type: type,
+    feature: Any,
+) -> SystemIdxType | None:
+    """
+    Find the index of the memory block collecting systems of a given type, for a
+    feature registered on the block before the simulator is finalized.
+
+    Parameters
+    ----------
+    system_collection: SystemCollectionProtocol
+        Finalized simulator.
+    system_type: type
+        Type of the systems collected in the memory block.
+    feature: Any
+        Feature registered on the block, reported if no block is found.
+
+    Returns
+    -------
+    SystemIdxType | None
+        Index of the memory block, or None if there is no such block.
+    """
+    for block in system_collection.block_systems():
+        if isinstance(block, system_type):
+            return system_collection.get_system_index(block)
+    logging.warning(
+        "No memory block of {0} systems was found. The {1} registered on the "
+        "block is ignored.".format(system_type, feature)
+    )
+    return None
+
+
+F = TypeVar("F")
+
+
+def locate_systems_in_blocks(
+    blocks: Iterable[BlockSystemType],
+) -> dict[SystemIdxType, tuple[BlockSystemType, int]]:
+    """
+    Map the index of every system stored in a memory block to the block and to the
+    position of the system in the block.
+
+    Parameters
+    ----------
+    blocks: Iterable[BlockSystemType]
+        Memory blocks of the simulator.
+
+    Returns
+    -------
+    dict
+        System index to (block, position of the system in the block).
+    """
+    system_locations: dict[SystemIdxType, tuple[BlockSystemType, int]] = {}
+    for block in blocks:
+        for block_idx, sys_idx in enumerate(np.asarray(block.system_idx_list).tolist()):
+            # Free slots have a negative index
+            if sys_idx >= 0:
+                system_locations[sys_idx] = (block, block_idx)
+    return system_locations
+
+
+def schedule_block_features(
+    features: list[F],
+    system_idx: Callable[[F], SystemIdxType],
+    fusion_key: Callable[[F], Hashable | None],
+    is_barrier: Callable[[F], bool],
+) -> list[tuple[F, list[list[F]]]]:
+    """
+    Schedule features, given in the order they are applied, into groups that can be
+    fused into one operator over a memory block.
+
+    Features acting on different systems commute, so only the order of the features
+    on each system has to be kept: the n-th feature of every system belongs to the
+    n-th stage, and the stages are applied one after the other. Within a stage,
+    features sharing a fusion key form one group. Barrier features, for instance
+    features acting on a whole memory block, are not reordered with respect to any
+    other feature.
+
+    Parameters
+    ----------
+    features: list
+        Features in the order they are applied.
+    system_idx: Callable
+        Index of the system the feature acts on.
+    fusion_key: Callable
+        Key of the fused operator the feature can be part of, or None.
+    is_barrier: Callable
+        Whether the feature must be applied on its own, in order.
+
+    Returns
+    -------
+    list
+        (anchor, groups) in the order they are applied. Operators built from the
+        groups should be registered under the anchor feature, which is never applied
+        before any feature of its groups.
+    """
+    schedule: list[tuple[F, list[list[F]]]] = []
+
+    def schedule_segment(segment: list[F]) -> None:
+        stages: list[dict[Hashable, list[F]]] = []
+        stage_anchors: list[int] = []
+        n_features_on_system: dict[SystemIdxType, int] = {}
+        for position, feature in enumerate(segment):
+            sys_idx = system_idx(feature)
+            stage = n_features_on_system.get(sys_idx, 0)
+            n_features_on_system[sys_idx] = stage + 1
+            if stage == len(stages):
+                stages.append({})
+                stage_anchors.append(position)
+            key = fusion_key(feature)
+            stages[stage].setdefault((id(feature),) if key is None else key, []).append(
+                feature
+            )
+            stage_anchors[stage] = position
+
+        anchor = 0
+        for stage_groups, stage_anchor in zip(stages, stage_anchors):
+            anchor = max(anchor, stage_anchor)
+            schedule.append((segment[anchor], list(stage_groups.values())))
+
+    segment: list[F] = []
+    for feature in features:
+        if is_barrier(feature):
+            schedule_segment(segment)
+            schedule.append((feature, [[feature]]))
+            segment = []
+        else:
+            segment.append(feature)
+    schedule_segment(segment)
+
+    return schedule
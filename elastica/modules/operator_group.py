@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, TypeVar, Generic, Callable, Any
+from typing import TYPE_CHECKING, TypeVar, Generic, Callable, Any, Type
+from typing_extensions import Self
 from collections.abc import Iterable, Iterator
 
 import itertools
@@ -44,6 +45,8 @@ class OperatorGroupFIFO(Iterable, Generic[T, F]):
         A list of lists of operators. Each list of operators corresponds to a feature.
     _operator_ids : list[int]
         A list of ids of the features.
+    _operator_index : dict[int, int]
+        Position of the features in the list of ids, keyed by their id.
 
     Methods
     -------
@@ -54,11 +57,16 @@ class OperatorGroupFIFO(Iterable, Generic[T, F]):
     is_last(feature)
         Checks if the feature is the last feature in the FIFO.
         Used to check if the specific feature is the last feature in the FIFO.
+    forget_features()
+        Forgets the position of the features added so far.
+    remove_operators(predicate)
+        Removes the operators for which the predicate is True.
     """
 
     def __init__(self) -> None:
         self._operator_collection: list[list[T]] = []
         self._operator_ids: list[int] = []
+        self._operator_index: dict[int, int] = {}
 
     def __iter__(self) -> Iterator[T]:
         """Returns an operator iterator to satisfy the Iterable protocol."""
@@ -68,18 +76,84 @@ class OperatorGroupFIFO(Iterable, Generic[T, F]):
 
     def append_id(self, feature: F) -> None:
         """Appends the id of the feature to the list of ids."""
+        self._operator_index.setdefault(id(feature), len(self._operator_ids))
         self._operator_ids.append(id(feature))
         self._operator_collection.append([])
 
     def add_operators(self, feature: F, operators: list[T]) -> None:
         """Adds the operators to the list of operators corresponding to the feature."""
-        idx = self._operator_ids.index(id(feature))
+        idx = self._operator_index[id(feature)]
         self._operator_collection[idx].extend(operators)
 
     def is_last(self, feature: F) -> bool:
         """Checks if the feature is the last feature in the FIFO."""
         return id(feature) == self._operator_ids[-1]
 
+    def forget_features(self) -> None:
+        """
+        Forgets the position of the features added so far, once their operators
+        are added. Features are not kept alive by the FIFO, so the id of a feature
+        added later may be the id of a former one.
+        """
+        self._operator_index.clear()
+
+    def remove_operators(self, predicate: Callable[[T], bool]) -> None:
+        """Removes the operators for which the predicate is True."""
+        for operators in self._operator_collection:
+            operators[:] = [
+                operator for operator in operators if not predicate(operator)
+            ]
+
+
+class ModuleGroup(Generic[F]):
+    """
+    Features registered together for many systems, e.g. by
+    `add_forcing_to_many`. Calling `using` sets the same class and arguments for
+    every feature of the group, and each feature instantiates its own object at
+    finalize. Arguments are not copied, so they are shared by these objects.
+
+    Examples
+    --------
+    >>> simulator.add_forcing_to_many(rods).using(
+    ...     GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+    ... )
+
+    Attributes
+    ----------
+    features : list[F]
+        Features of the group, in the order of the systems.
+    """
+
+    def __init__(self, features: list[F]) -> None:
+        self.features = features
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def __iter__(self) -> Iterator[F]:
+        return iter(self.features)
+
+    def using(self, cls: Type[Any], *args: Any, **kwargs: Any) -> Self:
+        """
+        Sets the class and arguments of every feature of the group.
+
+        Parameters
+        ----------
+        cls: Type[Any]
+            User defined class of the features.
+        *args: Any
+            Variable length argument list.
+        **kwargs: Any
+            Arbitrary keyword arguments.
+
+        Returns
+        -------
+
+        """
+        for feature in self.features:
+            feature.using(cls, *args, **kwargs)
+        return self
+
 
 if TYPE_CHECKING:
     from elastica.typing import OperatorType
@@ -1,4 +1,5 @@
 from typing import Protocol, Generator, TypeVar, Any, Type, overload, Iterator
+from typing import Callable, Iterable
 from typing import TYPE_CHECKING
 from typing_extensions import Self  # python 3.11: from typing import Self
 
@@ -22,7 +23,7 @@ from elastica.dissipation import DamperBase
 import numpy as np
 
 if TYPE_CHECKING:
-    from .operator_group import OperatorGroupFIFO
+    from .operator_group import OperatorGroupFIFO, ModuleGroup
 
 
 class MixinProtocol(Protocol):
@@ -48,6 +49,8 @@ class SystemCollectionProtocol(Protocol):
 
     def block_systems(self) -> Generator[BlockSystemType, None, None]: ...
 
+    def active_block_systems(self) -> Generator[BlockSystemType, None, None]: ...
+
     @overload
     def __getitem__(self, i: slice) -> list[SystemType]: ...
     @overload
@@ -74,9 +77,14 @@ class SystemCollectionProtocol(Protocol):
     def constrain_values(self, time: np.float64) -> None: ...
     def constrain_rates(self, time: np.float64) -> None: ...
     def apply_callbacks(self, time: np.float64, current_step: int) -> None: ...
+    def register_state(self, operator: Any) -> None: ...
+    def _instantiate_feature(self, feature: ModuleProtocol[M], *args: Any) -> M: ...
 
     # Finalize Operations
+    _finalize_flag: bool
     _feature_group_finalize: list[OperatorFinalizeType]
+    _feature_group_open: list[Callable[[], None]]
+    _adding_systems: bool
 
     def finalize(self) -> None: ...
 
@@ -88,6 +96,8 @@ class ConnectedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
 
     def _finalize_connections(self) -> None: ...
 
+    def _open_connections(self) -> None: ...
+
     def connect(
         self,
         first_rod: "RodType | RigidBodyType",
@@ -96,6 +106,13 @@ class ConnectedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
         second_connect_idx: ConnectionIndex,
     ) -> ModuleProtocol: ...
 
+    def connect_pairs(
+        self,
+        pairs: Iterable[tuple["RodType | RigidBodyType", "RodType | RigidBodyType"]],
+        first_connect_idx: ConnectionIndex,
+        second_connect_idx: ConnectionIndex,
+    ) -> "ModuleGroup": ...
+
 
 class ForcedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
     # Forcing API
@@ -103,8 +120,14 @@ class ForcedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
 
     def _finalize_forcing(self) -> None: ...
 
+    def _open_forcing(self) -> None: ...
+
     def add_forcing_to(self, system: SystemType) -> ModuleProtocol: ...
 
+    def add_forcing_to_many(self, systems: Iterable[SystemType]) -> "ModuleGroup": ...
+
+    def add_forcing_to_block(self, system_type: Type) -> ModuleProtocol: ...
+
 
 class ContactedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
     # Contact API
@@ -112,10 +135,18 @@ class ContactedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
 
     def _finalize_contact(self) -> None: ...
 
+    def _open_contact(self) -> None: ...
+
     def detect_contact_between(
-        self, first_system: SystemType, second_system: SystemType
+        self,
+        first_system: SystemType,
+        second_system: "SystemType | StaticSystemType",
     ) -> ModuleProtocol: ...
 
+    def detect_contact_between_pairs(
+        self, pairs: Iterable[tuple[SystemType, "SystemType | StaticSystemType"]]
+    ) -> "ModuleGroup": ...
+
 
 class ConstrainedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
     # Constraints API
@@ -123,8 +154,14 @@ class ConstrainedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
 
     def _finalize_constraints(self) -> None: ...
 
+    def _open_constraints(self) -> None: ...
+
     def constrain(self, system: "RodType | RigidBodyType") -> ModuleProtocol: ...
 
+    def constrain_many(
+        self, systems: Iterable["RodType | RigidBodyType"]
+    ) -> "ModuleGroup": ...
+
 
 class SystemCollectionWithCallbackProtocol(SystemCollectionProtocol, Protocol):
     # CallBack API
@@ -132,8 +169,12 @@ class SystemCollectionWithCallbackProtocol(SystemCollectionProtocol, Protocol):
 
     def _finalize_callback(self) -> None: ...
 
+    def _open_callback(self) -> None: ...
+
     def collect_diagnostics(self, system: SystemType) -> ModuleProtocol: ...
 
+    def collect_block_diagnostics(self, system_type: Type) -> ModuleProtocol: ...
+
 
 class DampenedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
     # Damping API
@@ -141,4 +182,31 @@ class DampenedSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
 
     def _finalize_dampers(self) -> None: ...
 
+    def _open_dampers(self) -> None: ...
+
     def dampen(self, system: RodType) -> ModuleProtocol: ...
+
+    def dampen_many(self, systems: Iterable[RodType]) -> "ModuleGroup": ...
+
+
+class SleepingSystemCollectionProtocol(SystemCollectionProtocol, Protocol):
+    # Sleeping API
+    _sleeping_islands: Any
+
+    @property
+    def active_fraction(self) -> float: ...
+
+    def _finalize_sleeping(self) -> None: ...
+
+    def enable_sleeping(
+        self,
+        linear_velocity_threshold: float,
+        angular_velocity_threshold: float,
+        kinetic_energy_threshold: float = np.inf,
+        n_quiet_steps: int = 100,
+        force_tolerance: float = 1e-3,
+    ) -> None: ...
+
+    def is_asleep(self, system: SystemType) -> bool: ...
+
+    def wake(self, system: SystemType) -> None: ...
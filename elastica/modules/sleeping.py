@@ -0,0 +1,633 @@
+__doc__ = """
+Sleeping
+--------
+
+Provides the interface to skip systems at rest in the time-stepping, by putting
+them asleep until they are disturbed.
+"""
+
+from typing import Any, Optional, TypeAlias, cast
+
+import functools
+
+import numpy as np
+from numba import njit
+from numpy.typing import NDArray
+
+from elastica.joint import FreeJoint
+from elastica.typing import BlockSystemType, SystemIdxType, SystemType
+from elastica.memory_block.memory_block_rigid_body import MemoryBlockRigidBody
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from .memory_block import locate_systems_in_blocks
+from .protocol import SleepingSystemCollectionProtocol
+
+
+class Sleeping:
+    """
+    The Sleeping class is a module to put the systems at rest asleep, the simulator
+    class must be derived from Sleeping class. Sleeping is enabled with
+    `enable_sleeping`.
+
+    Systems sleep and wake by islands: systems connected by joints form one
+    island. An island falls asleep when, for a number of consecutive steps, the
+    speed of every node, the angular speed of every element and the kinetic energy
+    of each of its systems stay below thresholds. Systems asleep are at rest: their
+    internal forces, accelerations and kinematic updates are skipped. Forcing,
+    contact and joints are still applied to them, and an island wakes up as soon
+    as the external forces or torques on one of its systems change from their
+    values when it fell asleep, e.g. when an awake system comes in contact, a
+    joint pulls, or a forcing varies in time.
+
+        Attributes
+        ----------
+        active_fraction: float
+            Fraction of the nodes of the memory blocks that are awake, updated at
+            every step. Each rigid body counts as one node.
+    """
+
+    def __init__(self: SleepingSystemCollectionProtocol) -> None:
+        self._sleeping_islands: Optional[_SleepingIslands] = None
+        super().__init__()
+        self._feature_group_finalize.append(self._finalize_sleeping)
+
+    @property
+    def active_fraction(self: SleepingSystemCollectionProtocol) -> float:
+        if self._sleeping_islands is None:
+            return 1.0
+        return self._sleeping_islands.active_fraction
+
+    def enable_sleeping(
+        self: SleepingSystemCollectionProtocol,
+        linear_velocity_threshold: float,
+        angular_velocity_threshold: float,
+        kinetic_energy_threshold: float = np.inf,
+        n_quiet_steps: int = 100,
+        force_tolerance: float = 1e-3,
+    ) -> None:
+        """
+        Enable sleeping of the systems at rest, before finalize.
+
+        Parameters
+        ----------
+        linear_velocity_threshold: float
+            Speed of the nodes below which a system is at rest.
+        angular_velocity_threshold: float
+            Angular speed of the elements below which a system is at rest.
+        kinetic_energy_threshold: float
+            Kinetic energy of a system below which it is at rest.
+        n_quiet_steps: int
+            Number of consecutive steps all systems of an island have to be at rest
+            before the island falls asleep.
+        force_tolerance: float
+            Change of the external forces (torques) of a system asleep, relative to
+            its largest external force (torque) when it fell asleep, above which its
+            island wakes up.
+        """
+        assert not self._finalize_flag, "Sleeping has to be enabled before finalize."
+        assert n_quiet_steps > 0, "n_quiet_steps must be positive."
+        self._sleeping_islands = _SleepingIslands(
+            linear_velocity_threshold,
+            angular_velocity_threshold,
+            kinetic_energy_threshold,
+            n_quiet_steps,
+            force_tolerance,
+        )
+
+    def is_asleep(self: SleepingSystemCollectionProtocol, system: SystemType) -> bool:
+        """
+        Checks if the system is asleep.
+
+        Parameters
+        ----------
+        system: SystemType
+        """
+        if self._sleeping_islands is None:
+            return False
+        return self._sleeping_islands.is_asleep(self.get_system_index(system))
+
+    def wake(self: SleepingSystemCollectionProtocol, system: SystemType) -> None:
+        """
+        Wake up the island of the system, e.g. before modifying its state directly.
+
+        Parameters
+        ----------
+        system: SystemType
+        """
+        if self._sleeping_islands is not None:
+            self._sleeping_islands.wake_system(self.get_system_index(system))
+
+    def _finalize_sleeping(self: SleepingSystemCollectionProtocol) -> None:
+        islands = self._sleeping_islands
+        if islands is None:
+            return
+
+        # Islands are built again when systems are added after finalize, and their
+        # operators are moved after the operators of the new features.
+        def is_island_operator(operator: Any) -> bool:
+            return getattr(operator, "__self__", None) is islands
+
+        self._feature_group_synchronize.remove_operators(is_island_operator)
+        self._feature_group_callback.remove_operators(is_island_operator)
+
+        # Joints are found among the operators of the connections finalized, and
+        # the connections still to be finalized, as features finalize in the
+        # order of the mixins.
+        joints = [
+            (
+                self.get_system_index(operator.keywords["system_one"]),
+                self.get_system_index(operator.keywords["system_two"]),
+            )
+            for operator in self._feature_group_synchronize
+            if isinstance(operator, functools.partial)
+            and isinstance(getattr(operator.func, "__self__", None), FreeJoint)
+            and "system_two" in operator.keywords
+        ]
+        joints.extend(
+            connection.id()[:2] for connection in getattr(self, "_connections", [])
+        )
+        islands.build(list(self.block_systems()), joints)
+
+        # Islands are woken up after all external forces are applied, and put
+        # asleep at the end of the steps.
+        self._feature_group_synchronize.append_id(islands)
+        self._feature_group_synchronize.add_operators(
+            islands, [islands.wake_disturbed_islands]
+        )
+        self._feature_group_callback.append_id(islands)
+        self._feature_group_callback.add_operators(
+            islands, [islands.put_quiet_islands_asleep]
+        )
+        self.register_state(islands)
+
+
+# Memory blocks are blocks of rods or of rigid bodies
+SleepingBlockType: TypeAlias = MemoryBlockCosseratRod | MemoryBlockRigidBody
+
+
+class _BlockSlots:
+    """
+    Sleeping state of the systems of a memory block.
+    """
+
+    def __init__(self, block: SleepingBlockType) -> None:
+        self.block = block
+        n_systems = block.n_systems
+        if isinstance(block, MemoryBlockCosseratRod):
+            self.node_start = block.start_idx_in_rod_nodes.astype(np.int64)
+            self.node_end = block.end_idx_in_rod_nodes.astype(np.int64)
+            self.elem_start = block.start_idx_in_rod_elems.astype(np.int64)
+            self.elem_end = block.end_idx_in_rod_elems.astype(np.int64)
+            self.dilatation = block.dilatation
+            self.mass = block.mass
+            # Lean memory blocks only store the diagonal of the inertia, and
+            # rebuild the full tensor whenever it is read.
+            self.diagonal_inertia = block.diagonal_material_flag
+            self.inertia = (
+                block.mass_second_moment_of_inertia_diagonal
+                if block.diagonal_material_flag
+                else block.mass_second_moment_of_inertia
+            )
+        else:
+            self.node_start = self.elem_start = np.arange(n_systems, dtype=np.int64)
+            self.node_end = self.elem_end = self.node_start + 1
+            self.dilatation = np.ones(n_systems)
+            # The masses of the rigid bodies, typed as the mass of one body
+            self.mass = np.asarray(block.mass)
+            self.diagonal_inertia = False
+            self.inertia = block.mass_second_moment_of_inertia
+
+        self.n_nodes = self.node_end - self.node_start
+
+        # Island of each system, -1 for free slots which are always asleep.
+        self.island = np.full(n_systems, -1, dtype=np.int64)
+        self.awake = np.ones(n_systems, dtype=np.bool_)
+        self.awake_slots = np.empty(0, dtype=np.int64)
+        self.asleep_slots = np.empty(0, dtype=np.int64)
+
+        # External loads when the systems fell asleep
+        self.reference_forces = np.zeros_like(block.external_forces)
+        self.reference_torques = np.zeros_like(block.external_torques)
+        self.force_scale = np.zeros(n_systems)
+        self.torque_scale = np.zeros(n_systems)
+
+    def put_asleep(self, slots: NDArray[np.int64]) -> None:
+        block = self.block
+        for slot in slots.tolist():
+            nodes = slice(self.node_start[slot], self.node_end[slot])
+            elems = slice(self.elem_start[slot], self.elem_end[slot])
+            block.velocity_collection[:, nodes] = 0.0
+            block.acceleration_collection[:, nodes] = 0.0
+            block.omega_collection[:, elems] = 0.0
+            block.alpha_collection[:, elems] = 0.0
+            self.reference_forces[:, nodes] = block.external_forces[:, nodes]
+            self.reference_torques[:, elems] = block.external_torques[:, elems]
+            self.force_scale[slot] = np.abs(block.external_forces[:, nodes]).max()
+            self.torque_scale[slot] = np.abs(block.external_torques[:, elems]).max()
+
+    def update_awake(self, island_asleep: NDArray[np.bool_], force: bool) -> None:
+        awake = self.island >= 0
+        awake[awake] = ~island_asleep[self.island[awake]]
+        if not force and np.array_equal(awake, self.awake):
+            return
+        self.awake = awake
+        self.awake_slots = np.flatnonzero(awake & (self.island >= 0))
+        self.asleep_slots = np.flatnonzero(~awake & (self.island >= 0))
+        self.block.set_awake(awake)
+
+
+class _SleepingIslands:
+    """
+    Islands of systems connected by joints, that sleep and wake together
+    (see Sleeping).
+    """
+
+    def __init__(
+        self,
+        linear_velocity_threshold: float,
+        angular_velocity_threshold: float,
+        kinetic_energy_threshold: float,
+        n_quiet_steps: int,
+        force_tolerance: float,
+    ) -> None:
+        self.linear_velocity_threshold = np.float64(linear_velocity_threshold)
+        self.angular_velocity_threshold = np.float64(angular_velocity_threshold)
+        self.kinetic_energy_threshold = np.float64(kinetic_energy_threshold)
+        self.n_quiet_steps = n_quiet_steps
+        self.force_tolerance = np.float64(force_tolerance)
+
+        self.blocks: list[_BlockSlots] = []
+        self.system_island: dict[SystemIdxType, int] = {}
+        self.island_asleep = np.zeros(0, dtype=np.bool_)
+        self.quiet_steps = np.zeros(0, dtype=np.int64)
+        # Per-step flags of the islands, reused between steps
+        self.island_flags = np.zeros(0, dtype=np.bool_)
+        self.active_fraction = 1.0
+
+    def build(
+        self,
+        blocks: list[BlockSystemType],
+        joints: list[tuple[SystemIdxType, SystemIdxType]],
+    ) -> None:
+        """
+        Build the islands of the systems of the memory blocks, all awake.
+        """
+        system_locations = locate_systems_in_blocks(blocks)
+
+        # Union-find of the systems connected by joints
+        parent = {sys_idx: sys_idx for sys_idx in system_locations}
+
+        def find(sys_idx: SystemIdxType) -> SystemIdxType:
+            while parent[sys_idx] != sys_idx:
+                parent[sys_idx] = parent[parent[sys_idx]]
+                sys_idx = parent[sys_idx]
+            return sys_idx
+
+        for first_idx, second_idx in joints:
+            if first_idx in parent and second_idx in parent:
+                parent[find(first_idx)] = find(second_idx)
+
+        roots: dict[SystemIdxType, int] = {}
+        self.system_island = {
+            sys_idx: roots.setdefault(find(sys_idx), len(roots))
+            for sys_idx in system_locations
+        }
+        self.island_asleep = np.zeros(len(roots), dtype=np.bool_)
+        self.quiet_steps = np.zeros(len(roots), dtype=np.int64)
+        self.island_flags = np.zeros(len(roots), dtype=np.bool_)
+
+        self.blocks = [_BlockSlots(cast(SleepingBlockType, block)) for block in blocks]
+        block_slots = {id(slots.block): slots for slots in self.blocks}
+        for sys_idx, (block, block_idx) in system_locations.items():
+            block_slots[id(block)].island[block_idx] = self.system_island[sys_idx]
+        for slots in self.blocks:
+            slots.update_awake(self.island_asleep, force=True)
+        self._update_active_fraction()
+
+    def is_asleep(self, sys_idx: SystemIdxType) -> bool:
+        island = self.system_island.get(sys_idx, None)
+        return island is not None and bool(self.island_asleep[island])
+
+    def wake_system(self, sys_idx: SystemIdxType) -> None:
+        island = self.system_island.get(sys_idx, None)
+        if island is not None and self.island_asleep[island]:
+            self.wake_islands(np.array([island]))
+
+    def wake_islands(self, islands: NDArray[np.int64]) -> None:
+        self.island_asleep[islands] = False
+        self.quiet_steps[islands] = 0
+        for slots in self.blocks:
+            slots.update_awake(self.island_asleep, force=False)
+        self._update_active_fraction()
+
+    def wake_disturbed_islands(self, time: np.float64) -> None:
+        """
+        Wake up the islands whose external forces or torques changed since they
+        fell asleep.
+        """
+        island_disturbed = self.island_flags
+        island_disturbed[:] = False
+        any_disturbed = False
+        for slots in self.blocks:
+            if slots.asleep_slots.size == 0:
+                continue
+            any_disturbed |= _find_disturbed_islands(
+                slots.asleep_slots,
+                slots.island,
+                slots.node_start,
+                slots.node_end,
+                slots.elem_start,
+                slots.elem_end,
+                slots.block.external_forces,
+                slots.block.external_torques,
+                slots.reference_forces,
+                slots.reference_torques,
+                slots.force_scale,
+                slots.torque_scale,
+                self.force_tolerance,
+                island_disturbed,
+            )
+        if any_disturbed:
+            self.wake_islands(np.flatnonzero(island_disturbed))
+
+    def put_quiet_islands_asleep(self, time: np.float64, current_step: int) -> None:
+        """
+        Put asleep the islands whose systems were at rest for the last steps.
+        """
+        island_quiet = self.island_flags
+        island_quiet[:] = True
+        for slots in self.blocks:
+            if slots.awake_slots.size == 0:
+                continue
+            block = slots.block
+            find_moving_islands = (
+                _find_moving_islands_with_diagonal_inertia
+                if slots.diagonal_inertia
+                else _find_moving_islands
+            )
+            find_moving_islands(
+                slots.awake_slots,
+                slots.island,
+                slots.node_start,
+                slots.node_end,
+                slots.elem_start,
+                slots.elem_end,
+                slots.mass,
+                block.velocity_collection,
+                slots.inertia,
+                block.omega_collection,
+                slots.dilatation,
+                self.linear_velocity_threshold,
+                self.angular_velocity_threshold,
+                self.kinetic_energy_threshold,
+                island_quiet,
+            )
+
+        if not _count_quiet_steps(
+            island_quiet, self.island_asleep, self.quiet_steps, self.n_quiet_steps
+        ):
+            return
+        falling_asleep = self.quiet_steps >= self.n_quiet_steps
+        self.island_asleep |= falling_asleep
+        self.quiet_steps[falling_asleep] = 0
+        for slots in self.blocks:
+            falling_slots = slots.awake_slots[
+                falling_asleep[slots.island[slots.awake_slots]]
+            ]
+            slots.put_asleep(falling_slots)
+            slots.update_awake(self.island_asleep, force=False)
+        self._update_active_fraction()
+
+    def _update_active_fraction(self) -> None:
+        n_nodes = 0
+        n_awake_nodes = 0
+        for slots in self.blocks:
+            n_nodes += int(slots.n_nodes.sum())
+            n_awake_nodes += int(slots.n_nodes[slots.awake].sum())
+        self.active_fraction = n_awake_nodes / n_nodes if n_nodes else 1.0
+
+    def snapshot_state(self) -> Any:
+        return (
+            self.island_asleep.copy(),
+            self.quiet_steps.copy(),
+            [
+                (
+                    slots.reference_forces.copy(),
+                    slots.reference_torques.copy(),
+                    slots.force_scale.copy(),
+                    slots.torque_scale.copy(),
+                )
+                for slots in self.blocks
+            ],
+        )
+
+    def restore_state(self, state: Any) -> None:
+        island_asleep, quiet_steps, block_states = state
+        self.island_asleep[:] = island_asleep
+        self.quiet_steps[:] = quiet_steps
+        for slots, block_state in zip(self.blocks, block_states):
+            for array, value in zip(
+                (
+                    slots.reference_forces,
+                    slots.reference_torques,
+                    slots.force_scale,
+                    slots.torque_scale,
+                ),
+                block_state,
+            ):
+                array[:] = value
+            slots.update_awake(self.island_asleep, force=True)
+        self._update_active_fraction()
+
+
+@njit(cache=True)  # type: ignore
+def _find_moving_islands(
+    slots: NDArray[np.int64],
+    island: NDArray[np.int64],
+    node_start: NDArray[np.int64],
+    node_end: NDArray[np.int64],
+    elem_start: NDArray[np.int64],
+    elem_end: NDArray[np.int64],
+    mass: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    mass_second_moment_of_inertia: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    linear_velocity_threshold: np.float64,
+    angular_velocity_threshold: np.float64,
+    kinetic_energy_threshold: np.float64,
+    island_quiet: NDArray[np.bool_],
+) -> None:
+    """
+    Marks the islands of the systems whose node speeds, element angular speeds or
+    kinetic energy are above the thresholds as not quiet.
+    """
+    for slot in slots:
+        max_speed_squared, kinetic_energy = _translational_motion(
+            node_start[slot], node_end[slot], mass, velocity_collection
+        )
+
+        max_angular_speed_squared = 0.0
+        for k in range(elem_start[slot], elem_end[slot]):
+            max_angular_speed_squared = max(
+                max_angular_speed_squared,
+                omega_collection[0, k] ** 2
+                + omega_collection[1, k] ** 2
+                + omega_collection[2, k] ** 2,
+            )
+            for i in range(3):
+                j_omega = (
+                    mass_second_moment_of_inertia[i, 0, k] * omega_collection[0, k]
+                    + mass_second_moment_of_inertia[i, 1, k] * omega_collection[1, k]
+                    + mass_second_moment_of_inertia[i, 2, k] * omega_collection[2, k]
+                )
+                kinetic_energy += 0.5 * omega_collection[i, k] * j_omega / dilatation[k]
+
+        if (
+            max_speed_squared > linear_velocity_threshold**2
+            or max_angular_speed_squared > angular_velocity_threshold**2
+            or kinetic_energy > kinetic_energy_threshold
+        ):
+            island_quiet[island[slot]] = False
+
+
+@njit(cache=True)  # type: ignore
+def _find_moving_islands_with_diagonal_inertia(
+    slots: NDArray[np.int64],
+    island: NDArray[np.int64],
+    node_start: NDArray[np.int64],
+    node_end: NDArray[np.int64],
+    elem_start: NDArray[np.int64],
+    elem_end: NDArray[np.int64],
+    mass: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    mass_second_moment_of_inertia_diagonal: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    linear_velocity_threshold: np.float64,
+    angular_velocity_threshold: np.float64,
+    kinetic_energy_threshold: np.float64,
+    island_quiet: NDArray[np.bool_],
+) -> None:
+    """
+    Same as `_find_moving_islands`, for a mass second moment of inertia given as
+    its (3, n) diagonal.
+    """
+    for slot in slots:
+        max_speed_squared, kinetic_energy = _translational_motion(
+            node_start[slot], node_end[slot], mass, velocity_collection
+        )
+
+        max_angular_speed_squared = 0.0
+        for k in range(elem_start[slot], elem_end[slot]):
+            max_angular_speed_squared = max(
+                max_angular_speed_squared,
+                omega_collection[0, k] ** 2
+                + omega_collection[1, k] ** 2
+                + omega_collection[2, k] ** 2,
+            )
+            for i in range(3):
+                kinetic_energy += (
+                    0.5
+                    * mass_second_moment_of_inertia_diagonal[i, k]
+                    * omega_collection[i, k] ** 2
+                    / dilatation[k]
+                )
+
+        if (
+            max_speed_squared > linear_velocity_threshold**2
+            or max_angular_speed_squared > angular_velocity_threshold**2
+            or kinetic_energy > kinetic_energy_threshold
+        ):
+            island_quiet[island[slot]] = False
+
+
+@njit(cache=True)  # type: ignore
+def _translational_motion(
+    start: int,
+    end: int,
+    mass: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+) -> tuple[float, float]:
+    """
+    Returns the largest squared speed and the translational kinetic energy of the
+    nodes from start to end.
+    """
+    max_speed_squared = 0.0
+    kinetic_energy = 0.0
+    for k in range(start, end):
+        speed_squared = (
+            velocity_collection[0, k] ** 2
+            + velocity_collection[1, k] ** 2
+            + velocity_collection[2, k] ** 2
+        )
+        max_speed_squared = max(max_speed_squared, speed_squared)
+        kinetic_energy += 0.5 * mass[k] * speed_squared
+    return max_speed_squared, kinetic_energy
+
+
+@njit(cache=True)  # type: ignore
+def _find_disturbed_islands(
+    slots: NDArray[np.int64],
+    island: NDArray[np.int64],
+    node_start: NDArray[np.int64],
+    node_end: NDArray[np.int64],
+    elem_start: NDArray[np.int64],
+    elem_end: NDArray[np.int64],
+    external_forces: NDArray[np.float64],
+    external_torques: NDArray[np.float64],
+    reference_forces: NDArray[np.float64],
+    reference_torques: NDArray[np.float64],
+    force_scale: NDArray[np.float64],
+    torque_scale: NDArray[np.float64],
+    force_tolerance: np.float64,
+    island_disturbed: NDArray[np.bool_],
+) -> bool:
+    """
+    Marks the islands of the systems whose external forces or torques changed
+    from their reference values by more than the tolerance as disturbed. Returns
+    True if any system is disturbed.
+    """
+    any_disturbed = False
+    for slot in slots:
+        max_force_change = 0.0
+        for k in range(node_start[slot], node_end[slot]):
+            for i in range(3):
+                max_force_change = max(
+                    max_force_change,
+                    abs(external_forces[i, k] - reference_forces[i, k]),
+                )
+        max_torque_change = 0.0
+        for k in range(elem_start[slot], elem_end[slot]):
+            for i in range(3):
+                max_torque_change = max(
+                    max_torque_change,
+                    abs(external_torques[i, k] - reference_torques[i, k]),
+                )
+        if (
+            max_force_change > force_tolerance * force_scale[slot]
+            or max_torque_change > force_tolerance * torque_scale[slot]
+        ):
+            island_disturbed[island[slot]] = True
+            any_disturbed = True
+    return any_disturbed
+
+
+@njit(cache=True)  # type: ignore
+def _count_quiet_steps(
+    island_quiet: NDArray[np.bool_],
+    island_asleep: NDArray[np.bool_],
+    quiet_steps: NDArray[np.int64],
+    n_quiet_steps: int,
+) -> bool:
+    """
+    Counts the consecutive quiet steps of the islands awake. Returns True if any
+    island was quiet for n_quiet_steps.
+    """
+    any_falling_asleep = False
+    for i in range(island_quiet.size):
+        if island_quiet[i] and not island_asleep[i]:
+            quiet_steps[i] += 1
+            any_falling_asleep |= quiet_steps[i] >= n_quiet_steps
+        else:
+            quiet_steps[i] = 0
+    return any_falling_asleep
@@ -1,10 +1,21 @@
 __doc__ = """Generate or load restart file implementations."""
-from typing import Iterable, Iterator, Any
+from typing import Iterable, Iterator, Any, Optional
 
 import numpy as np
+import gc
+import io
 import os
+import re
 import json
+import mmap
+import pickle
+import queue
+import hashlib
+import logging
+import threading
+import time as wall_clock
 from itertools import groupby
+from numpy.typing import NDArray
 
 from .memory_block import MemoryBlockCosseratRod, MemoryBlockRigidBody
 
@@ -118,3 +129,716 @@ def load_state(
         print(f"  Loaded time: {time}")
 
     return time
+
+
+CHECKPOINT_MAGIC = b"ELASTICA"
+CHECKPOINT_VERSION = 1
+# Data offsets are aligned, so that arrays can be memory mapped efficiently.
+CHECKPOINT_ALIGNMENT = 64
+
+# Dynamic state of memory blocks saved in checkpoints
+BLOCK_STATE_FIELDS = (
+    "position_collection",
+    "director_collection",
+    "velocity_collection",
+    "omega_collection",
+)
+# Rest state of rod memory blocks, saved if it is changed during the simulation
+ROD_REST_STATE_FIELDS = (
+    "rest_lengths",
+    "rest_voronoi_lengths",
+    "rest_sigma",
+    "rest_kappa",
+)
+_BLOCK_LAYOUT_KEYS = (
+    "n_nodes",
+    "n_elems",
+    "n_voronoi",
+    "start_idx_in_rod_nodes",
+    "end_idx_in_rod_nodes",
+    "start_idx_in_rod_elems",
+    "end_idx_in_rod_elems",
+    "start_idx_in_rod_voronoi",
+    "end_idx_in_rod_voronoi",
+    "periodic_boundary_nodes_idx",
+)
+
+
+def block_state_fields(block: Any, rest_state: bool = False) -> tuple[str, ...]:
+    """
+    Names of the dynamic state arrays of a memory block, i.e. the arrays that have
+    to be saved to restart the simulation.
+
+    Parameters
+    ----------
+    block : object
+        Memory block.
+    rest_state : bool
+        If True, the rest state of rods is included.
+
+    Returns
+    -------
+    tuple[str, ...]
+    """
+    fields: tuple[str, ...] = BLOCK_STATE_FIELDS
+    if rest_state:
+        fields += tuple(
+            field for field in ROD_REST_STATE_FIELDS if hasattr(block, field)
+        )
+    return fields
+
+
+def checkpoint_schema_hash(simulator: SystemCollectionType) -> str:
+    """
+    Hash of the layout of the memory blocks of a finalized simulator. Checkpoints
+    can only be loaded into simulators with the same hash.
+
+    Parameters
+    ----------
+    simulator : object
+        Simulator object.
+
+    Returns
+    -------
+    str
+    """
+    schema = []
+    for block in simulator.block_systems():
+        layout: dict[str, Any] = {
+            "type": block.__class__.__name__,
+            "system_idx_list": np.asarray(block.system_idx_list).tolist(),
+        }
+        for key in _BLOCK_LAYOUT_KEYS:
+            if hasattr(block, key):
+                layout[key] = np.asarray(getattr(block, key)).tolist()
+        schema.append(layout)
+    return hashlib.sha256(json.dumps(schema).encode()).hexdigest()
+
+
+def _checkpoint_arrays(
+    simulator: SystemCollectionType, rest_state: bool
+) -> list[tuple[int, str, NDArray[Any]]]:
+    return [
+        (block_idx, field, getattr(block, field))
+        for block_idx, block in enumerate(simulator.block_systems())
+        for field in block_state_fields(block, rest_state)
+    ]
+
+
+def _write_checkpoint(
+    path: str,
+    arrays: list[tuple[int, str, NDArray[Any]]],
+    schema_hash: str,
+    time: float,
+) -> None:
+    """
+    Write a checkpoint file: the magic bytes, the length of the JSON header, the
+    header and the raw arrays. The file is written next to `path` and renamed, so
+    that an existing checkpoint is never left partially written.
+    """
+    fields = []
+    offset = 0
+    for block_idx, field, array in arrays:
+        fields.append(
+            {
+                "block": block_idx,
+                "name": field,
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": offset,
+            }
+        )
+        offset += -(-array.nbytes // CHECKPOINT_ALIGNMENT) * CHECKPOINT_ALIGNMENT
+    header = json.dumps(
+        {
+            "version": CHECKPOINT_VERSION,
+            "schema_hash": schema_hash,
+            "time": float(time),
+            "fields": fields,
+        }
+    ).encode()
+    # Pad the header so that the data starts at an aligned offset.
+    data_offset = len(CHECKPOINT_MAGIC) + 8 + len(header)
+    padding = -data_offset % CHECKPOINT_ALIGNMENT
+    header += b" " * padding
+    data_offset += padding
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(CHECKPOINT_MAGIC)
+        file.write(np.uint64(len(header)).tobytes())
+        file.write(header)
+        for (_, _, array), spec in zip(arrays, fields):
+            file.seek(data_offset + spec["offset"])
+            file.write(np.ascontiguousarray(array).data)
+        file.truncate(data_offset + offset)
+    os.replace(temporary_path, path)
+
+
+def read_checkpoint_header(path: str) -> tuple[dict[str, Any], int]:
+    """
+    Read the header of a checkpoint file.
+
+    Parameters
+    ----------
+    path : str
+        Checkpoint file path.
+
+    Returns
+    -------
+    header : dict
+        Version, schema hash, time and the fields saved in the checkpoint.
+    data_offset : int
+        Offset of the data in the file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a checkpoint, its header is truncated, or its version
+        is not supported.
+    """
+    with open(path, "rb") as file:
+        magic = file.read(len(CHECKPOINT_MAGIC))
+        header_length_bytes = file.read(8)
+        if magic != CHECKPOINT_MAGIC or len(header_length_bytes) != 8:
+            raise ValueError(f"{path} is not a checkpoint file.")
+        header_length = int(np.frombuffer(header_length_bytes, dtype=np.uint64)[0])
+        header_bytes = file.read(header_length)
+        if len(header_bytes) != header_length:
+            raise ValueError(f"The checkpoint {path} is truncated.")
+        header: dict[str, Any] = json.loads(header_bytes)
+    if header.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {header.get('version')}.")
+    return header, len(CHECKPOINT_MAGIC) + 8 + header_length
+
+
+def save_checkpoint(
+    simulator: SystemCollectionType,
+    path: str,
+    time: np.float64 = np.float64(0.0),
+    rest_state: bool = False,
+) -> None:
+    """
+    Save the dynamic state of all memory blocks of a simulator into a single
+    binary file. Call this function after finalize method. Unlike `save_state`,
+    only the state arrays (positions, directors, velocities and angular
+    velocities) are written, each as one contiguous block array, so saving and
+    loading costs one copy per array.
+
+    Parameters
+    ----------
+    simulator : object
+        Simulator object.
+    path : str
+        Checkpoint file path.
+    time : float
+        Simulation time.
+    rest_state : bool
+        If True, the rest state of rods (rest lengths, rest voronoi lengths, rest
+        strains and rest curvatures) is also saved. Use it if the rest state is
+        changed during the simulation, e.g. by muscle actuation. (default = False)
+    """
+    _write_checkpoint(
+        path,
+        _checkpoint_arrays(simulator, rest_state),
+        checkpoint_schema_hash(simulator),
+        time,
+    )
+
+
+def load_checkpoint(simulator: SystemCollectionType, path: str) -> float:
+    """
+    Load a checkpoint written by `save_checkpoint` into the memory blocks of a
+    simulator. Call this function after finalize method. The arrays are read from
+    the file directly into the block memory. The simulator must have the same
+    systems as the simulator that saved the checkpoint, which is checked with the
+    schema hash.
+
+    Parameters
+    ----------
+    simulator : object
+        Simulator object.
+    path : str
+        Checkpoint file path.
+
+    Returns
+    ------
+    time : float
+        Simulation time of systems when they are saved.
+
+    Raises
+    ------
+    ValueError
+        If the checkpoint is invalid, truncated, or incompatible with the
+        simulator.
+    """
+    header, data_offset = read_checkpoint_header(path)
+    if header["schema_hash"] != checkpoint_schema_hash(simulator):
+        raise ValueError(
+            f"The checkpoint {path} was saved from a simulator with different "
+            "systems, and is incompatible with this simulator."
+        )
+
+    # Check every field before reading, so that the memory blocks are left
+    # untouched if the checkpoint cannot be loaded.
+    blocks = list(simulator.block_systems())
+    arrays = []
+    data_size = 0
+    for spec in header["fields"]:
+        array = getattr(blocks[spec["block"]], spec["name"])
+        if array.dtype.str != spec["dtype"] or list(array.shape) != spec["shape"]:
+            raise ValueError(
+                f"Field {spec['name']} of the checkpoint {path} does not match."
+            )
+        arrays.append(array)
+        data_size = max(data_size, spec["offset"] + array.nbytes)
+    if os.path.getsize(path) < data_offset + data_size:
+        raise ValueError(f"The checkpoint {path} is truncated.")
+
+    with open(path, "rb") as file:
+        for spec, array in zip(header["fields"], arrays):
+            if array.flags.c_contiguous:
+                file.seek(data_offset + spec["offset"])
+                file.readinto(memoryview(array).cast("B"))
+            else:
+                array[...] = np.memmap(
+                    path,
+                    dtype=array.dtype,
+                    mode="r",
+                    offset=data_offset + spec["offset"],
+                    shape=array.shape,
+                )
+
+    return header["time"]
+
+
+class Checkpointer:
+    """
+    Checkpointer saves checkpoints (see `save_checkpoint`) periodically during
+    `integrate`, every `every_n_steps` steps and/or every `every_seconds` seconds of
+    wall time. The state of the memory blocks is copied into preallocated staging
+    buffers, and the file is written by a background thread, so that stepping
+    resumes right after the copy. Files are written atomically, and only the last
+    `keep` checkpoints are kept.
+
+    To resume an interrupted simulation, load the newest valid checkpoint with
+    `resume` and pass the returned time as `restart_time` to `integrate`.
+
+        Attributes
+        ----------
+        directory: str
+            Directory of the checkpoints.
+        every_n_steps: int, optional
+            Step interval between checkpoints.
+        every_seconds: float, optional
+            Wall time interval between checkpoints.
+        keep: int
+            Number of checkpoints kept.
+        checkpoint_count: int
+            Number of checkpoints saved.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        every_n_steps: Optional[int] = None,
+        every_seconds: Optional[float] = None,
+        keep: int = 3,
+        rest_state: bool = False,
+        filename: str = "checkpoint",
+    ) -> None:
+        """
+        Parameters
+        ----------
+        directory : str
+            Directory to save the checkpoints. If directory doesn't exist, it will be
+            created.
+        every_n_steps : int, optional
+            Save a checkpoint on every step that is a multiple of every_n_steps.
+        every_seconds : float, optional
+            Save a checkpoint if every_seconds seconds of wall time passed since the
+            last one.
+        keep : int
+            Number of most recent checkpoints kept in the directory. (default = 3)
+        rest_state : bool
+            If True, the rest state of rods is also saved. (default = False)
+        filename : str
+            Name of the checkpoint files, which are saved as
+            <filename>_<step>.bin. (default = "checkpoint")
+        """
+        assert (
+            every_n_steps is not None or every_seconds is not None
+        ), "Either every_n_steps or every_seconds must be given."
+        assert (
+            every_n_steps is None or every_n_steps > 0
+        ), f"every_n_steps ({every_n_steps}) must be positive."
+        assert (
+            every_seconds is None or every_seconds > 0
+        ), f"every_seconds ({every_seconds}) must be positive."
+        assert keep > 0, f"keep ({keep}) must be positive."
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.every_n_steps = every_n_steps
+        self.every_seconds = every_seconds
+        self.keep = keep
+        self.rest_state = rest_state
+        self.filename = filename
+        self.checkpoint_count = 0
+
+        self._staging: list[tuple[int, str, NDArray[Any]]] = []
+        self._schema_hash = ""
+        self._last_wall_time = wall_clock.monotonic()
+        self._write_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._writer: Optional[threading.Thread] = None
+        self._write_error: Optional[BaseException] = None
+
+    def checkpoint_paths(self) -> list[str]:
+        """
+        Return the paths of the checkpoints in the directory, from the oldest to
+        the newest.
+        """
+        pattern = re.compile(re.escape(self.filename) + r"_(\d+)\.bin")
+        steps = []
+        for name in os.listdir(self.directory):
+            match = pattern.fullmatch(name)
+            if match is not None:
+                steps.append((int(match.group(1)), name))
+        return [os.path.join(self.directory, name) for _, name in sorted(steps)]
+
+    def latest_checkpoint(self) -> Optional[str]:
+        """
+        Return the path of the newest valid checkpoint, or None if there is no
+        valid checkpoint.
+        """
+        for path in reversed(self.checkpoint_paths()):
+            try:
+                header, data_offset = read_checkpoint_header(path)
+                n_bytes = max(
+                    (
+                        spec["offset"]
+                        + np.dtype(spec["dtype"]).itemsize * int(np.prod(spec["shape"]))
+                        for spec in header["fields"]
+                    ),
+                    default=0,
+                )
+                if os.path.getsize(path) < data_offset + n_bytes:
+                    raise ValueError(f"The checkpoint {path} is truncated.")
+            except (OSError, KeyError, ValueError) as error:
+                logging.warning(f"Skipping invalid checkpoint {path}: {error}")
+                continue
+            return path
+        return None
+
+    def resume(self, simulator: SystemCollectionType) -> float:
+        """
+        Load the newest valid checkpoint into a finalized simulator.
+
+        Parameters
+        ----------
+        simulator : object
+            Simulator object.
+
+        Returns
+        -------
+        time : float
+            Simulation time of the checkpoint, to be used as `restart_time` of
+            `integrate`. If there is no checkpoint, 0.0 is returned.
+        """
+        path = self.latest_checkpoint()
+        if path is None:
+            return 0.0
+        return load_checkpoint(simulator, path)
+
+    def is_due(self, current_step: int) -> bool:
+        """
+        Check if a checkpoint has to be saved on the step.
+        """
+        if self.every_n_steps is not None and current_step % self.every_n_steps == 0:
+            return True
+        return (
+            self.every_seconds is not None
+            and wall_clock.monotonic() - self._last_wall_time >= self.every_seconds
+        )
+
+    def checkpoint(
+        self, simulator: SystemCollectionType, time: np.float64, current_step: int
+    ) -> None:
+        """
+        Copy the state of the simulator into the staging buffers and write it in
+        the background. If the previous checkpoint is still being written, this
+        waits until it is done.
+
+        Parameters
+        ----------
+        simulator : object
+            Simulator object.
+        time : float
+            Simulation time.
+        current_step : int
+            Simulation step.
+        """
+        self.flush()
+        arrays = _checkpoint_arrays(simulator, self.rest_state)
+        if not self._staging:
+            self._staging = [
+                (block_idx, field, np.empty_like(array))
+                for block_idx, field, array in arrays
+            ]
+            self._schema_hash = checkpoint_schema_hash(simulator)
+        for (_, _, staging), (_, _, array) in zip(self._staging, arrays):
+            np.copyto(staging, array)
+
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._write_from_queue, name="CheckpointerWriter", daemon=True
+            )
+            self._writer.start()
+        path = os.path.join(self.directory, f"{self.filename}_{current_step:012d}.bin")
+        self._write_queue.put((path, float(time)))
+        self._last_wall_time = wall_clock.monotonic()
+        self.checkpoint_count += 1
+
+    def _write_from_queue(self) -> None:
+        """
+        Background writer loop. Writes queued checkpoints until None is queued,
+        and removes the checkpoints that are not kept.
+        """
+        while True:
+            item = self._write_queue.get()
+            try:
+                if item is None:
+                    return
+                if self._write_error is None:
+                    path, time = item
+                    _write_checkpoint(path, self._staging, self._schema_hash, time)
+                    for old_path in self.checkpoint_paths()[: -self.keep]:
+                        os.remove(old_path)
+            except BaseException as error:
+                self._write_error = error
+            finally:
+                self._write_queue.task_done()
+
+    def _raise_write_error(self) -> None:
+        """
+        Raise the error of a failed background write on the main thread.
+        """
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise RuntimeError("Checkpointer failed to write a checkpoint.") from error
+
+    def flush(self) -> None:
+        """
+        Wait until the pending checkpoint is written.
+        """
+        self._write_queue.join()
+        self._raise_write_error()
+
+    def close(self) -> None:
+        """
+        Write the pending checkpoint and stop the background writer.
+        """
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self._raise_write_error()
+
+
+SIMULATOR_MAGIC = b"ELASTSIM"
+SIMULATOR_VERSION = 1
+# Buffers smaller than this are kept in the pickle stream instead of being written
+# as separate aligned arrays.
+SIMULATOR_MIN_OUT_OF_BAND_NBYTES = 4096
+
+
+def _root_array(array: NDArray[Any]) -> NDArray[Any]:
+    """
+    Last numpy array in the chain of bases of an array, i.e. the array whose memory
+    is viewed by the array.
+    """
+    root = array
+    base = array.base
+    while base is not None:
+        if isinstance(base, np.ndarray):
+            root = base
+        base = getattr(base, "base", None)
+    return root
+
+
+def _rebuild_view(
+    root: NDArray[Any],
+    dtype: np.dtype,
+    shape: tuple[int, ...],
+    strides: tuple[int, ...],
+    offset: int,
+) -> NDArray[Any]:
+    return np.ndarray(shape, dtype, buffer=root, offset=offset, strides=strides)
+
+
+class _SimulatorPickler(pickle.Pickler):
+    """
+    Pickler that keeps numpy views as views. A view is pickled as its offset,
+    shape and strides in the array it views, which is pickled once. Hence, after
+    unpickling, rods are still views into their memory block, and operators still
+    refer to the same memory.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Root array and its address, keyed by the id of the base of the views.
+        # Most views share their base, e.g. the fields of the rods of a block.
+        self._roots: dict[int, tuple[Optional[NDArray[Any]], int]] = {}
+
+    def reducer_override(self, obj: Any) -> Any:
+        if type(obj) is not np.ndarray:
+            return NotImplemented
+        base = obj.base
+        if base is None:
+            return NotImplemented
+        key = id(base)
+        if key not in self._roots:
+            root_array = _root_array(obj)
+            if root_array is obj or not root_array.flags.c_contiguous:
+                self._roots[key] = (None, 0)
+            else:
+                self._roots[key] = (root_array, root_array.ctypes.data)
+        root, address = self._roots[key]
+        if root is None:
+            return NotImplemented
+        offset = obj.ctypes.data - address
+        return _rebuild_view, (root, obj.dtype, obj.shape, obj.strides, offset)
+
+
+def save_simulator(simulator: SystemCollectionType, path: str) -> None:
+    """
+    Save a finalized simulator into a single file, including its systems, memory
+    blocks, operators and the instances of its features, so that `load_simulator`
+    returns a simulator that is ready to step, without constructing the systems
+    and calling finalize again.
+
+    The simulator is pickled, and arrays are written as raw aligned buffers, which
+    can be memory mapped when loaded. Rods stay views into their memory block.
+    Classes of the simulator, systems and features are pickled by reference, so
+    they must be importable where the simulator is loaded. Features holding
+    resources that cannot be pickled, such as open files or threads, are not
+    supported.
+
+    Parameters
+    ----------
+    simulator : object
+        Finalized simulator object.
+    path : str
+        File path.
+    """
+    assert simulator._finalize_flag, "Only a finalized simulator can be saved."
+
+    buffers: list[pickle.PickleBuffer] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        # Small buffers are serialized in the pickle stream.
+        if buffer.raw().nbytes < SIMULATOR_MIN_OUT_OF_BAND_NBYTES:
+            return True
+        buffers.append(buffer)
+        return False
+
+    stream = io.BytesIO()
+    # Pickling creates many objects and no garbage, so the cyclic garbage collector
+    # is paused meanwhile, as in finalize.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        _SimulatorPickler(stream, protocol=5, buffer_callback=buffer_callback).dump(
+            simulator
+        )
+    finally:
+        if gc_enabled:
+            gc.enable()
+    stream_bytes = stream.getbuffer()
+
+    specs = []
+    offset = -(-stream_bytes.nbytes // CHECKPOINT_ALIGNMENT) * CHECKPOINT_ALIGNMENT
+    for buffer in buffers:
+        specs.append({"offset": offset, "nbytes": buffer.raw().nbytes})
+        offset += -(-buffer.raw().nbytes // CHECKPOINT_ALIGNMENT) * CHECKPOINT_ALIGNMENT
+    header = json.dumps(
+        {
+            "version": SIMULATOR_VERSION,
+            "pickle_nbytes": stream_bytes.nbytes,
+            "buffers": specs,
+        }
+    ).encode()
+    # Pad the header so that the data starts at an aligned offset.
+    data_offset = len(SIMULATOR_MAGIC) + 8 + len(header)
+    padding = -data_offset % CHECKPOINT_ALIGNMENT
+    header += b" " * padding
+    data_offset += padding
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(SIMULATOR_MAGIC)
+        file.write(np.uint64(len(header)).tobytes())
+        file.write(header)
+        file.write(stream_bytes)
+        for buffer, spec in zip(buffers, specs):
+            file.seek(data_offset + spec["offset"])
+            file.write(buffer.raw())
+        file.truncate(data_offset + offset)
+    os.replace(temporary_path, path)
+
+
+def load_simulator(path: str, memory_map: bool = True) -> SystemCollectionType:
+    """
+    Load a simulator saved by `save_simulator`. The returned simulator is finalized
+    and ready to step.
+
+    .. warning:: The simulator is unpickled, which can execute arbitrary code.
+        Only load simulator files from trusted sources, e.g. files saved by
+        yourself.
+
+    Parameters
+    ----------
+    path : str
+        File path.
+    memory_map : bool
+        If True, the arrays are memory mapped copy-on-write: they are read lazily
+        from the file, and modifications are private to the process and never
+        written to the file. This is efficient when many processes load the same
+        simulator. Otherwise, the file is read into memory. (default = True)
+
+    Returns
+    -------
+    simulator : object
+        Finalized simulator object.
+    """
+    with open(path, "rb") as file:
+        magic = file.read(len(SIMULATOR_MAGIC))
+        assert magic == SIMULATOR_MAGIC, f"{path} is not a simulator file."
+        header_length = int(np.frombuffer(file.read(8), dtype=np.uint64)[0])
+        header: dict[str, Any] = json.loads(file.read(header_length))
+        assert (
+            header["version"] == SIMULATOR_VERSION
+        ), f"Unsupported simulator file version {header['version']}."
+        data_offset = len(SIMULATOR_MAGIC) + 8 + header_length
+
+        data: memoryview
+        if memory_map:
+            data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+        else:
+            file.seek(0)
+            data = memoryview(bytearray(file.read()))
+
+    data = data[data_offset:]
+    buffers = [
+        data[spec["offset"] : spec["offset"] + spec["nbytes"]]
+        for spec in header["buffers"]
+    ]
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        simulator: SystemCollectionType = pickle.loads(
+            data[: header["pickle_nbytes"]], buffers=buffers
+        )
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return simulator
@@ -12,21 +12,22 @@ import functools
 import numba
 from elastica.rod import RodBase
 from elastica._linalg import (
-    _batch_cross,
-    _batch_norm,
     _batch_dot,
     _batch_matvec,
 )
-from elastica._rotations import _inv_rotate
+from elastica._rotations import _inv_rotate_into
 from elastica._calculus import (
-    quadrature_kernel_for_block_structure,
-    difference_kernel_for_block_structure,
+    quadrature_kernel_for_block_structure_into,
+    difference_kernel_for_block_structure_into,
     _difference,
     _average,
 )
-from .factory_function import allocate
+from .factory_function import allocate, allocate_straight_rods
 from .knot_theory import KnotTheory
 
+if TYPE_CHECKING:
+    from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
 position_difference_kernel = _difference
 position_average = _average
 
@@ -70,6 +71,195 @@ def _compute_sigma_kappa_for_blockstructure(memory_block: RodType) -> None:
     )
 
 
+class _LeanMemoryField:
+    """
+    Attribute of rods that is not stored in lean memory mode (see
+    MemoryBlockCosseratRod), and computed when it is read instead, from the state
+    of the rod, into a new array that is not kept. Only the requested attribute
+    is computed.
+
+    Rods storing the attribute, i.e. all rods outside lean memory mode, are not
+    affected, since instance attributes take precedence over this descriptor.
+    """
+
+    def __set_name__(self, owner: Type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[Type] = None) -> Any:
+        if instance is None:
+            return self
+        if "shear_matrix_diagonal" not in instance.__dict__:
+            raise AttributeError(self.name)
+        return _compute_lean_memory_field(instance, self.name)
+
+
+class _DiagonalMaterialTensor:
+    """
+    Material tensor of rods whose material tensors are stored as their diagonals,
+    i.e. rods in lean memory blocks (see MemoryBlockCosseratRod). The tensor is rebuilt from its diagonal (e.g.
+    `shear_matrix_diagonal`) when it is read, as a read-only array: the diagonal
+    is modified instead.
+
+    Rods storing the full tensor are not affected, since instance attributes take
+    precedence over this descriptor.
+    """
+
+    def __set_name__(self, owner: Type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[Type] = None) -> Any:
+        if instance is None:
+            return self
+        diagonal = instance.__dict__.get(self.name + "_diagonal")
+        if diagonal is None:
+            raise AttributeError(self.name)
+        tensor = _diagonal_tensor(diagonal)
+        tensor.setflags(write=False)
+        return tensor
+
+
+def _diagonal_tensor(diagonal: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Returns the (3, 3, n) tensor collection whose diagonals are given as (3, n).
+    """
+    tensor = np.zeros((3, 3, diagonal.shape[-1]))
+    for i in range(3):
+        tensor[i, i] = diagonal[i]
+    return tensor
+
+
+# Derived quantities that are not stored in lean memory mode, with their domain
+# and number of components.
+_LEAN_MEMORY_DERIVED_FIELDS: dict[str, tuple[str, int]] = {
+    "sigma": ("element", 3),
+    "internal_stress": ("element", 3),
+    "dilatation_rate": ("element", 1),
+    "kappa": ("voronoi", 3),
+    "internal_couple": ("voronoi", 3),
+    "voronoi_dilatation": ("voronoi", 1),
+}
+# Material tensors that are only stored as diagonals in lean memory mode.
+_DIAGONAL_MATERIAL_TENSORS = (
+    "mass_second_moment_of_inertia",
+    "inv_mass_second_moment_of_inertia",
+    "shear_matrix",
+    "bend_matrix",
+)
+
+
+def _compute_lean_memory_field(rod: Any, field: str) -> NDArray[np.float64]:
+    """
+    Compute a derived quantity that is not stored in lean memory mode, from the
+    state of the rod. Only the kernels needed for the requested quantity are run,
+    and stored quantities, e.g. lengths, are not modified.
+    """
+    domain, n_components = _LEAN_MEMORY_DERIVED_FIELDS[field]
+    n_elems = rod.rest_lengths.shape[0]
+    n = n_elems if domain == "element" else n_elems - 1
+    result: NDArray[np.float64] = np.zeros(n) if n_components == 1 else np.zeros((3, n))
+
+    if field in ("kappa", "internal_couple"):
+        kappa = result if field == "kappa" else np.zeros((3, n))
+        if field == "kappa":
+            _compute_bending_twist_strains(
+                rod.director_collection, rod.rest_voronoi_lengths, kappa
+            )
+        else:
+            _compute_internal_bending_twist_stresses_from_diagonal_model(
+                rod.director_collection,
+                rod.rest_voronoi_lengths,
+                result,
+                rod.bend_matrix_diagonal,
+                kappa,
+                rod.rest_kappa,
+            )
+        return result
+
+    # The remaining quantities depend on the geometry of the rod, which is
+    # computed into copies.
+    lengths = rod.lengths.copy()
+    tangents = rod.tangents.copy()
+    radius = rod.radius.copy()
+    dilatation = rod.dilatation.copy()
+    voronoi_dilatation = (
+        result if field == "voronoi_dilatation" else np.zeros(n_elems - 1)
+    )
+    if field in ("voronoi_dilatation", "dilatation_rate"):
+        _compute_all_dilatations(
+            rod.position_collection,
+            rod.volume,
+            lengths,
+            tangents,
+            radius,
+            dilatation,
+            rod.rest_lengths,
+            rod.rest_voronoi_lengths,
+            voronoi_dilatation,
+        )
+        if field == "dilatation_rate":
+            _compute_dilatation_rate(
+                rod.position_collection,
+                rod.velocity_collection,
+                lengths,
+                rod.rest_lengths,
+                result,
+            )
+    elif field == "sigma":
+        _compute_shear_stretch_strains(
+            rod.position_collection,
+            rod.volume,
+            lengths,
+            tangents,
+            radius,
+            rod.rest_lengths,
+            rod.rest_voronoi_lengths,
+            dilatation,
+            voronoi_dilatation,
+            rod.director_collection,
+            result,
+        )
+    else:
+        _compute_internal_shear_stretch_stresses_from_diagonal_model(
+            rod.position_collection,
+            rod.volume,
+            lengths,
+            tangents,
+            radius,
+            rod.rest_lengths,
+            rod.rest_voronoi_lengths,
+            dilatation,
+            voronoi_dilatation,
+            rod.director_collection,
+            np.zeros((3, n_elems)),
+            rod.rest_sigma,
+            rod.shear_matrix_diagonal,
+            result,
+        )
+    return result
+
+
+class _Workspace:
+    """
+    Scratch array of the internal force and torque kernels, in the element or
+    voronoi domain of the rod.
+
+    Memory blocks (see MemoryBlockCosseratRod) store a preallocated workspace, so
+    that computing internal forces and torques does not allocate memory. For
+    other rods, a new array is allocated whenever the workspace is read, since
+    instance attributes take precedence over this descriptor.
+    """
+
+    def __init__(self, domain_type: str) -> None:
+        self.domain_type = domain_type
+
+    def __get__(self, instance: Any, owner: Optional[Type] = None) -> Any:
+        if instance is None:
+            return self
+        if self.domain_type == "element":
+            return np.empty((3, instance.rest_lengths.shape[0]))
+        return np.empty((3, instance.rest_voronoi_lengths.shape[0]))
+
+
 class CosseratRod(RodBase, KnotTheory):
     """
     Cosserat Rod class. This is the preferred class for rods because it is derived from some
@@ -152,6 +342,26 @@ class CosseratRod(RodBase, KnotTheory):
 
     REQUISITE_MODULES: list[Type] = []
 
+    # Computed when they are read, if they are not stored (lean memory mode)
+    sigma = _LeanMemoryField()
+    internal_stress = _LeanMemoryField()
+    dilatation_rate = _LeanMemoryField()
+    kappa = _LeanMemoryField()
+    internal_couple = _LeanMemoryField()
+    voronoi_dilatation = _LeanMemoryField()
+    # Rebuilt from their diagonals, if only these are stored
+    mass_second_moment_of_inertia = _DiagonalMaterialTensor()
+    inv_mass_second_moment_of_inertia = _DiagonalMaterialTensor()
+    shear_matrix = _DiagonalMaterialTensor()
+    bend_matrix = _DiagonalMaterialTensor()
+    # Preallocated by memory blocks
+    element_workspace = _Workspace("element")
+    J_omega_upon_e = _Workspace("element")
+    voronoi_workspace = _Workspace("voronoi")
+    # Set on rods built by straight_rods, as views into a preallocated block
+    _preallocated_block: "MemoryBlockCosseratRod | None"
+    _preallocated_block_idx: int
+
     def __init__(
         self: CosseratRodProtocol,
         n_elements: int,
@@ -397,6 +607,159 @@ class CosseratRod(RodBase, KnotTheory):
             ring_rod_flag,
         )
 
+    @classmethod
+    def straight_rods(
+        cls,
+        n_elements: int | NDArray[np.int32],
+        start: NDArray[np.float64],
+        direction: NDArray[np.float64],
+        normal: NDArray[np.float64],
+        base_length: float | NDArray[np.float64],
+        base_radius: float | NDArray[np.float64],
+        density: float | NDArray[np.float64],
+        *,
+        youngs_modulus: float | NDArray[np.float64],
+        shear_modulus: Optional[float | NDArray[np.float64]] = None,
+    ) -> list[Self]:
+        """
+        Cosserat rod constructor for many straight rods at once.
+
+        The rods are the same as the ones built by `straight_rod`, but they are built
+        together: properties of all rods are computed and checked at once, directly
+        in the memory block used during the simulation. If exactly these rods are
+        appended to a simulator, in the same order, the memory block uses this
+        memory at finalize instead of copying the rods.
+
+        Notes
+        -----
+        Parameters, except the start of each rod, are either given for each rod or
+        once for all rods.
+
+        Parameters
+        ----------
+        n_elements : int | NDArray[np.int32]
+            Number of elements of each rod.
+        start : NDArray[np.float64]
+            2D (n_rods, 3) array. Starting coordinate of each rod in 3D
+        direction : NDArray[np.float64]
+            (3,) or (n_rods, 3) array. Direction of the rods in 3D
+        normal : NDArray[np.float64]
+            (3,) or (n_rods, 3) array. Normal vector of the rods in 3D
+        base_length : float | NDArray[np.float64]
+            Total length of each rod
+        base_radius : float | NDArray[np.float64]
+            Uniform radius of each rod
+        density : float | NDArray[np.float64]
+            Density of each rod
+        youngs_modulus : float | NDArray[np.float64]
+            Young's modulus of each rod
+        shear_modulus : float | NDArray[np.float64], optional
+            Shear modulus of each rod. If not given, it is computed assuming
+            Poisson's ratio of 0.5.
+
+        Returns
+        -------
+        list[CosseratRod]
+
+        """
+        # Memory block module depends on this module.
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        start = np.asarray(start, dtype=np.float64)
+        assert (
+            start.ndim == 2 and start.shape[1] == 3
+        ), f"Given start shape is not correct, it should be (n_rods, 3) but instead {start.shape}"
+        n_rods = start.shape[0]
+
+        def per_rod(value: Any, shape: tuple[int, ...], name: str) -> NDArray:
+            value = np.asarray(value)
+            assert value.shape in (shape, (n_rods, *shape)), (
+                f"Given {name} shape is not correct, it should be {shape} or "
+                f"{(n_rods, *shape)} but instead {value.shape}"
+            )
+            return np.broadcast_to(value, (n_rods, *shape))
+
+        n_elements_in_rods = per_rod(n_elements, (), "n_elements").astype(np.int32)
+        block = MemoryBlockCosseratRod.preallocate_straight_rods(n_elements_in_rods)
+        allocate_straight_rods(
+            block,
+            n_elements_in_rods,
+            start,
+            per_rod(direction, (3,), "direction").astype(np.float64),
+            per_rod(normal, (3,), "normal").astype(np.float64),
+            per_rod(base_length, (), "base_length").astype(np.float64),
+            per_rod(base_radius, (), "base_radius").astype(np.float64),
+            per_rod(density, (), "density").astype(np.float64),
+            per_rod(youngs_modulus, (), "youngs_modulus").astype(np.float64),
+            (
+                None
+                if shear_modulus is None
+                else per_rod(shear_modulus, (), "shear_modulus").astype(np.float64)
+            ),
+        )
+
+        # Arguments of the constructor, and the block arrays they are views into
+        rod_arrays = (
+            ("position", "position_collection", "nodes"),
+            ("velocity", "velocity_collection", "nodes"),
+            ("omega", "omega_collection", "elems"),
+            ("acceleration", "acceleration_collection", "nodes"),
+            ("angular_acceleration", "alpha_collection", "elems"),
+            ("directors", "director_collection", "elems"),
+            ("radius", "radius", "elems"),
+            ("mass_second_moment_of_inertia", "mass_second_moment_of_inertia", "elems"),
+            (
+                "inv_mass_second_moment_of_inertia",
+                "inv_mass_second_moment_of_inertia",
+                "elems",
+            ),
+            ("shear_matrix", "shear_matrix", "elems"),
+            ("bend_matrix", "bend_matrix", "voronoi"),
+            ("density_array", "density", "elems"),
+            ("volume", "volume", "elems"),
+            ("mass", "mass", "nodes"),
+            ("internal_forces", "internal_forces", "nodes"),
+            ("internal_torques", "internal_torques", "elems"),
+            ("external_forces", "external_forces", "nodes"),
+            ("external_torques", "external_torques", "elems"),
+            ("lengths", "lengths", "elems"),
+            ("rest_lengths", "rest_lengths", "elems"),
+            ("tangents", "tangents", "elems"),
+            ("dilatation", "dilatation", "elems"),
+            ("dilatation_rate", "dilatation_rate", "elems"),
+            ("voronoi_dilatation", "voronoi_dilatation", "voronoi"),
+            ("rest_voronoi_lengths", "rest_voronoi_lengths", "voronoi"),
+            ("sigma", "sigma", "elems"),
+            ("kappa", "kappa", "voronoi"),
+            ("rest_sigma", "rest_sigma", "elems"),
+            ("rest_kappa", "rest_kappa", "voronoi"),
+            ("internal_stress", "internal_stress", "elems"),
+            ("internal_couple", "internal_couple", "voronoi"),
+        )
+        rods = []
+        for k in range(n_rods):
+            domains = {
+                domain: slice(
+                    getattr(block, f"start_idx_in_rod_{domain}")[k],
+                    getattr(block, f"end_idx_in_rod_{domain}")[k],
+                )
+                for domain in ("nodes", "elems", "voronoi")
+            }
+            rod = cls(
+                int(n_elements_in_rods[k]),
+                ring_rod_flag=False,
+                **{
+                    argument: np.ndarray.view(
+                        block.__dict__[name][..., domains[domain]]
+                    )
+                    for argument, name, domain in rod_arrays
+                },
+            )
+            rod._preallocated_block = block
+            rod._preallocated_block_idx = k
+            rods.append(rod)
+        return rods
+
     @classmethod
     def ring_rod(
         cls,
@@ -579,6 +942,7 @@ class CosseratRod(RodBase, KnotTheory):
             self.internal_stress,
             self.internal_forces,
             self.ghost_elems_idx,
+            self.element_workspace,
         )
 
         _compute_internal_torques(
@@ -601,6 +965,9 @@ class CosseratRod(RodBase, KnotTheory):
             self.dilatation_rate,
             self.internal_torques,
             self.ghost_voronoi_idx,
+            self.J_omega_upon_e,
+            self.element_workspace,
+            self.voronoi_workspace,
         )
 
     # Interface to time-stepper mixins (Symplectic, Explicit), which calls this method
@@ -726,16 +1093,26 @@ def _compute_geometry_from_state(
     # Compute eq (3.3) from 2018 RSOS paper
 
     # Note : we can use the two-point difference kernel, but it needs unnecessary padding
-    # and hence will always be slower
-    position_diff = position_difference_kernel(position_collection)
-    # FIXME: Here 1E-14 is added to fix ghost lengths, which is 0, and causes division by zero error!
-    lengths[:] = _batch_norm(position_diff) + 1e-14
-    # _reset_scalar_ghost(lengths, ghost_elems_idx, 1.0)
-
+    # and hence will always be slower. Position differences are computed element by
+    # element, so that they are not allocated.
     for k in range(lengths.shape[0]):
-        tangents[0, k] = position_diff[0, k] / lengths[k]
-        tangents[1, k] = position_diff[1, k] / lengths[k]
-        tangents[2, k] = position_diff[2, k] / lengths[k]
+        position_diff_x = position_collection[0, k + 1] - position_collection[0, k]
+        position_diff_y = position_collection[1, k + 1] - position_collection[1, k]
+        position_diff_z = position_collection[2, k + 1] - position_collection[2, k]
+        # FIXME: Here 1E-14 is added to fix ghost lengths, which is 0, and causes division by zero error!
+        lengths[k] = (
+            np.sqrt(
+                position_diff_x * position_diff_x
+                + position_diff_y * position_diff_y
+                + position_diff_z * position_diff_z
+            )
+            + 1e-14
+        )
+        # _reset_scalar_ghost(lengths, ghost_elems_idx, 1.0)
+
+        tangents[0, k] = position_diff_x / lengths[k]
+        tangents[1, k] = position_diff_y / lengths[k]
+        tangents[2, k] = position_diff_z / lengths[k]
         # resize based on volume conservation
         radius[k] = np.sqrt(volume[k] / lengths[k] / np.pi)
 
@@ -763,11 +1140,10 @@ def _compute_all_dilatations(
 
     # Cmopute eq (3.4) from 2018 RSOS paper
     # Note : we can use trapezoidal kernel, but it has padding and will be slower
-    voronoi_lengths = position_average(lengths)
-
     # Cmopute eq (3.45 from 2018 RSOS paper
-    for k in range(voronoi_lengths.shape[0]):
-        voronoi_dilatation[k] = voronoi_lengths[k] / rest_voronoi_lengths[k]
+    for k in range(voronoi_dilatation.shape[0]):
+        voronoi_length = 0.5 * (lengths[k + 1] + lengths[k])
+        voronoi_dilatation[k] = voronoi_length / rest_voronoi_lengths[k]
 
 
 @numba.njit(cache=True)  # type: ignore
@@ -783,19 +1159,31 @@ def _compute_dilatation_rate(
     """
     # TODO Use the vector formula rather than separating it out
     # self.lengths = l_i = |r^{i+1} - r^{i}|
-    r_dot_v = _batch_dot(position_collection, velocity_collection)
-    r_plus_one_dot_v = _batch_dot(
-        position_collection[..., 1:], velocity_collection[..., :-1]
-    )
-    r_dot_v_plus_one = _batch_dot(
-        position_collection[..., :-1], velocity_collection[..., 1:]
-    )
-
     blocksize = lengths.shape[0]
 
     for k in range(blocksize):
+        r_dot_v = (
+            position_collection[0, k] * velocity_collection[0, k]
+            + position_collection[1, k] * velocity_collection[1, k]
+            + position_collection[2, k] * velocity_collection[2, k]
+        )
+        r_plus_one_dot_v_plus_one = (
+            position_collection[0, k + 1] * velocity_collection[0, k + 1]
+            + position_collection[1, k + 1] * velocity_collection[1, k + 1]
+            + position_collection[2, k + 1] * velocity_collection[2, k + 1]
+        )
+        r_dot_v_plus_one = (
+            position_collection[0, k] * velocity_collection[0, k + 1]
+            + position_collection[1, k] * velocity_collection[1, k + 1]
+            + position_collection[2, k] * velocity_collection[2, k + 1]
+        )
+        r_plus_one_dot_v = (
+            position_collection[0, k + 1] * velocity_collection[0, k]
+            + position_collection[1, k + 1] * velocity_collection[1, k]
+            + position_collection[2, k + 1] * velocity_collection[2, k]
+        )
         dilatation_rate[k] = (
-            (r_dot_v[k] + r_dot_v[k + 1] - r_dot_v_plus_one[k] - r_plus_one_dot_v[k])
+            (r_dot_v + r_plus_one_dot_v_plus_one - r_dot_v_plus_one - r_plus_one_dot_v)
             / lengths[k]
             / rest_lengths[k]
         )
@@ -832,8 +1220,16 @@ def _compute_shear_stretch_strains(
         voronoi_dilatation,
     )
 
-    z_vector = np.array([0.0, 0.0, 1.0]).reshape(3, -1)
-    sigma[:] = dilatation * _batch_matvec(director_collection, tangents) - z_vector
+    # sigma = e Q t - z, with z = (0, 0, 1)
+    blocksize = sigma.shape[1]
+    for k in range(blocksize):
+        for i in range(3):
+            sigma[i, k] = dilatation[k] * (
+                director_collection[i, 0, k] * tangents[0, k]
+                + director_collection[i, 1, k] * tangents[1, k]
+                + director_collection[i, 2, k] * tangents[2, k]
+            )
+        sigma[2, k] -= 1.0
 
 
 @numba.njit(cache=True)  # type: ignore
@@ -873,7 +1269,17 @@ def _compute_internal_shear_stretch_stresses_from_model(
         director_collection,
         sigma,
     )
-    internal_stress[:] = _batch_matvec(shear_matrix, sigma - rest_sigma)
+    blocksize = sigma.shape[1]
+    for k in range(blocksize):
+        strain_x = sigma[0, k] - rest_sigma[0, k]
+        strain_y = sigma[1, k] - rest_sigma[1, k]
+        strain_z = sigma[2, k] - rest_sigma[2, k]
+        for i in range(3):
+            internal_stress[i, k] = (
+                shear_matrix[i, 0, k] * strain_x
+                + shear_matrix[i, 1, k] * strain_y
+                + shear_matrix[i, 2, k] * strain_z
+            )
 
 
 @numba.njit(cache=True)  # type: ignore
@@ -885,12 +1291,12 @@ def _compute_bending_twist_strains(
     """
     Update <curvature/twist (kappa)> given <director and rest_voronoi_length>.
     """
-    temp = _inv_rotate(director_collection)
+    _inv_rotate_into(director_collection, kappa)
     blocksize = rest_voronoi_lengths.shape[0]
     for k in range(blocksize):
-        kappa[0, k] = temp[0, k] / rest_voronoi_lengths[k]
-        kappa[1, k] = temp[1, k] / rest_voronoi_lengths[k]
-        kappa[2, k] = temp[2, k] / rest_voronoi_lengths[k]
+        kappa[0, k] = kappa[0, k] / rest_voronoi_lengths[k]
+        kappa[1, k] = kappa[1, k] / rest_voronoi_lengths[k]
+        kappa[2, k] = kappa[2, k] / rest_voronoi_lengths[k]
 
 
 @numba.njit(cache=True)  # type: ignore
@@ -914,12 +1320,85 @@ def _compute_internal_bending_twist_stresses_from_model(
     )  # concept : needs to compute kappa
 
     blocksize = kappa.shape[1]
-    temp = np.empty((3, blocksize))
+    for k in range(blocksize):
+        strain_x = kappa[0, k] - rest_kappa[0, k]
+        strain_y = kappa[1, k] - rest_kappa[1, k]
+        strain_z = kappa[2, k] - rest_kappa[2, k]
+        for i in range(3):
+            internal_couple[i, k] = (
+                bend_matrix[i, 0, k] * strain_x
+                + bend_matrix[i, 1, k] * strain_y
+                + bend_matrix[i, 2, k] * strain_z
+            )
+
+
+@numba.njit(cache=True)  # type: ignore
+def _compute_internal_shear_stretch_stresses_from_diagonal_model(
+    position_collection: NDArray[np.float64],
+    volume: NDArray[np.float64],
+    lengths: NDArray[np.float64],
+    tangents: NDArray[np.float64],
+    radius: NDArray[np.float64],
+    rest_lengths: NDArray[np.float64],
+    rest_voronoi_lengths: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    voronoi_dilatation: NDArray[np.float64],
+    director_collection: NDArray[np.float64],
+    sigma: NDArray[np.float64],
+    rest_sigma: NDArray[np.float64],
+    shear_matrix_diagonal: NDArray[np.float64],
+    internal_stress: NDArray[np.float64],
+) -> None:
+    """
+    Update <internal stress> given <diagonal of shear matrix, sigma, and rest_sigma>.
+
+    Same as _compute_internal_shear_stretch_stresses_from_model, but operates on
+    the diagonal (3,n) of a diagonal shear matrix instead of the (3,3,n) tensor.
+    """
+    _compute_shear_stretch_strains(
+        position_collection,
+        volume,
+        lengths,
+        tangents,
+        radius,
+        rest_lengths,
+        rest_voronoi_lengths,
+        dilatation,
+        voronoi_dilatation,
+        director_collection,
+        sigma,
+    )
+    blocksize = sigma.shape[1]
     for i in range(3):
         for k in range(blocksize):
-            temp[i, k] = kappa[i, k] - rest_kappa[i, k]
+            internal_stress[i, k] = shear_matrix_diagonal[i, k] * (
+                sigma[i, k] - rest_sigma[i, k]
+            )
 
-    internal_couple[:] = _batch_matvec(bend_matrix, temp)
+
+@numba.njit(cache=True)  # type: ignore
+def _compute_internal_bending_twist_stresses_from_diagonal_model(
+    director_collection: NDArray[np.float64],
+    rest_voronoi_lengths: NDArray[np.float64],
+    internal_couple: NDArray[np.float64],
+    bend_matrix_diagonal: NDArray[np.float64],
+    kappa: NDArray[np.float64],
+    rest_kappa: NDArray[np.float64],
+) -> None:
+    """
+    Update <internal couple> given <curvature(kappa) and diagonal of bend_matrix>.
+
+    Same as _compute_internal_bending_twist_stresses_from_model, but operates on
+    the diagonal (3,n) of a diagonal bend matrix instead of the (3,3,n) tensor.
+    """
+    _compute_bending_twist_strains(director_collection, rest_voronoi_lengths, kappa)
+
+    blocksize = kappa.shape[1]
+    for i in range(3):
+        for k in range(blocksize):
+            internal_couple[i, k] = bend_matrix_diagonal[i, k] * (
+                kappa[i, k] - rest_kappa[i, k]
+            )
 
 
 @numba.njit(cache=True)  # type: ignore
@@ -939,10 +1418,12 @@ def _compute_internal_forces(
     shear_matrix: NDArray[np.float64],
     internal_stress: NDArray[np.float64],
     internal_forces: NDArray[np.float64],
-    ghost_elems_idx: NDArray[np.float64],
+    ghost_elems_idx: NDArray[np.int32],
+    element_workspace: NDArray[np.float64],
 ) -> None:
     """
     Update <internal force> given <director, internal_stress and velocity>.
+    The (3,n) element workspace is overwritten.
     """
 
     # Compute n_l and cache it using internal_stress
@@ -963,23 +1444,94 @@ def _compute_internal_forces(
         shear_matrix,
         internal_stress,
     )
+    _compute_internal_forces_from_stress(
+        director_collection,
+        dilatation,
+        internal_stress,
+        internal_forces,
+        ghost_elems_idx,
+        element_workspace,
+    )
+
 
+@numba.njit(cache=True)  # type: ignore
+def _compute_internal_forces_with_diagonal_material(
+    position_collection: NDArray[np.float64],
+    volume: NDArray[np.float64],
+    lengths: NDArray[np.float64],
+    tangents: NDArray[np.float64],
+    radius: NDArray[np.float64],
+    rest_lengths: NDArray[np.float64],
+    rest_voronoi_lengths: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    voronoi_dilatation: NDArray[np.float64],
+    director_collection: NDArray[np.float64],
+    sigma: NDArray[np.float64],
+    rest_sigma: NDArray[np.float64],
+    shear_matrix_diagonal: NDArray[np.float64],
+    internal_stress: NDArray[np.float64],
+    internal_forces: NDArray[np.float64],
+    ghost_elems_idx: NDArray[np.int32],
+    element_workspace: NDArray[np.float64],
+) -> None:
+    """
+    Update <internal force> for a diagonal shear matrix, given as its (3,n) diagonal.
+    The (3,n) element workspace is overwritten.
+    """
+    _compute_internal_shear_stretch_stresses_from_diagonal_model(
+        position_collection,
+        volume,
+        lengths,
+        tangents,
+        radius,
+        rest_lengths,
+        rest_voronoi_lengths,
+        dilatation,
+        voronoi_dilatation,
+        director_collection,
+        sigma,
+        rest_sigma,
+        shear_matrix_diagonal,
+        internal_stress,
+    )
+    _compute_internal_forces_from_stress(
+        director_collection,
+        dilatation,
+        internal_stress,
+        internal_forces,
+        ghost_elems_idx,
+        element_workspace,
+    )
+
+
+@numba.njit(cache=True)  # type: ignore
+def _compute_internal_forces_from_stress(
+    director_collection: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    internal_stress: NDArray[np.float64],
+    internal_forces: NDArray[np.float64],
+    ghost_elems_idx: NDArray[np.int32],
+    cosserat_internal_stress: NDArray[np.float64],
+) -> None:
+    """
+    Update <internal force> given <director and internal_stress>. The stress in
+    the lab frame is computed into the given (3,n) workspace.
+    """
     # Signifies Q^T n_L / e
     # Not using batch matvec as I don't want to take directors.T here
 
     blocksize = internal_stress.shape[1]
-    cosserat_internal_stress = np.zeros((3, blocksize))
 
-    for i in range(3):
-        for j in range(3):
-            for k in range(blocksize):
-                cosserat_internal_stress[i, k] += (
-                    director_collection[j, i, k] * internal_stress[j, k]
-                )
-
-    cosserat_internal_stress /= dilatation
-    internal_forces[:] = difference_kernel_for_block_structure(
-        cosserat_internal_stress, ghost_elems_idx
+    for k in range(blocksize):
+        for i in range(3):
+            cosserat_internal_stress[i, k] = (
+                director_collection[0, i, k] * internal_stress[0, k]
+                + director_collection[1, i, k] * internal_stress[1, k]
+                + director_collection[2, i, k] * internal_stress[2, k]
+            ) / dilatation[k]
+
+    difference_kernel_for_block_structure_into(
+        cosserat_internal_stress, ghost_elems_idx, internal_forces
     )
 
 
@@ -1004,9 +1556,13 @@ def _compute_internal_torques(
     dilatation_rate: NDArray[np.float64],
     internal_torques: NDArray[np.float64],
     ghost_voronoi_idx: NDArray[np.int32],
+    J_omega_upon_e: NDArray[np.float64],
+    element_workspace: NDArray[np.float64],
+    voronoi_workspace: NDArray[np.float64],
 ) -> None:
     """
-    Update <internal torque>.
+    Update <internal torque>. J omega / e is computed into the given (3,n) array,
+    and the (3,n) element and voronoi workspaces are overwritten.
     """
     # Compute \tau_l and cache it using internal_couple
     # Be careful about usage though
@@ -1018,58 +1574,252 @@ def _compute_internal_torques(
         kappa,
         rest_kappa,
     )
+    # I apply common sub expression elimination here, as J w / e is used in both the lagrangian and dilatation
+    # terms
+    blocksize = omega_collection.shape[1]
+    for k in range(blocksize):
+        for i in range(3):
+            J_omega_upon_e[i, k] = (
+                mass_second_moment_of_inertia[i, 0, k] * omega_collection[0, k]
+                + mass_second_moment_of_inertia[i, 1, k] * omega_collection[1, k]
+                + mass_second_moment_of_inertia[i, 2, k] * omega_collection[2, k]
+            ) / dilatation[k]
+    _compute_internal_torques_from_couple(
+        position_collection,
+        velocity_collection,
+        tangents,
+        lengths,
+        rest_lengths,
+        director_collection,
+        rest_voronoi_lengths,
+        kappa,
+        voronoi_dilatation,
+        J_omega_upon_e,
+        omega_collection,
+        internal_stress,
+        internal_couple,
+        dilatation,
+        dilatation_rate,
+        internal_torques,
+        ghost_voronoi_idx,
+        element_workspace,
+        voronoi_workspace,
+    )
+
+
+@numba.njit(cache=True)  # type: ignore
+def _compute_internal_torques_with_diagonal_material(
+    position_collection: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    tangents: NDArray[np.float64],
+    lengths: NDArray[np.float64],
+    rest_lengths: NDArray[np.float64],
+    director_collection: NDArray[np.float64],
+    rest_voronoi_lengths: NDArray[np.float64],
+    bend_matrix_diagonal: NDArray[np.float64],
+    rest_kappa: NDArray[np.float64],
+    kappa: NDArray[np.float64],
+    voronoi_dilatation: NDArray[np.float64],
+    mass_second_moment_of_inertia_diagonal: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    internal_stress: NDArray[np.float64],
+    internal_couple: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    dilatation_rate: NDArray[np.float64],
+    internal_torques: NDArray[np.float64],
+    ghost_voronoi_idx: NDArray[np.int32],
+    J_omega_upon_e: NDArray[np.float64],
+    element_workspace: NDArray[np.float64],
+    voronoi_workspace: NDArray[np.float64],
+) -> None:
+    """
+    Update <internal torque> for diagonal bend matrix and mass second moment of
+    inertia, given as their (3,n) diagonals. J omega / e is computed into the
+    given (3,n) array, and the (3,n) element and voronoi workspaces are
+    overwritten.
+    """
+    _compute_internal_bending_twist_stresses_from_diagonal_model(
+        director_collection,
+        rest_voronoi_lengths,
+        internal_couple,
+        bend_matrix_diagonal,
+        kappa,
+        rest_kappa,
+    )
+    blocksize = omega_collection.shape[1]
+    for i in range(3):
+        for k in range(blocksize):
+            J_omega_upon_e[i, k] = (
+                mass_second_moment_of_inertia_diagonal[i, k]
+                * omega_collection[i, k]
+                / dilatation[k]
+            )
+    _compute_internal_torques_from_couple(
+        position_collection,
+        velocity_collection,
+        tangents,
+        lengths,
+        rest_lengths,
+        director_collection,
+        rest_voronoi_lengths,
+        kappa,
+        voronoi_dilatation,
+        J_omega_upon_e,
+        omega_collection,
+        internal_stress,
+        internal_couple,
+        dilatation,
+        dilatation_rate,
+        internal_torques,
+        ghost_voronoi_idx,
+        element_workspace,
+        voronoi_workspace,
+    )
+
+
+@numba.njit(cache=True)  # type: ignore
+def _compute_internal_torques_from_couple(
+    position_collection: NDArray[np.float64],
+    velocity_collection: NDArray[np.float64],
+    tangents: NDArray[np.float64],
+    lengths: NDArray[np.float64],
+    rest_lengths: NDArray[np.float64],
+    director_collection: NDArray[np.float64],
+    rest_voronoi_lengths: NDArray[np.float64],
+    kappa: NDArray[np.float64],
+    voronoi_dilatation: NDArray[np.float64],
+    J_omega_upon_e: NDArray[np.float64],
+    omega_collection: NDArray[np.float64],
+    internal_stress: NDArray[np.float64],
+    internal_couple: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+    dilatation_rate: NDArray[np.float64],
+    internal_torques: NDArray[np.float64],
+    ghost_voronoi_idx: NDArray[np.int32],
+    element_workspace: NDArray[np.float64],
+    voronoi_workspace: NDArray[np.float64],
+) -> None:
+    """
+    Update <internal torque> given <internal couple, internal stress and J omega / e>.
+    The terms computed with the difference and quadrature kernels go through the
+    (3,n) element and voronoi workspaces, the other terms are computed element by
+    element.
+    """
     # Compute dilatation rate when needed, dilatation itself is done before
     # in internal_stresses
     _compute_dilatation_rate(
         position_collection, velocity_collection, lengths, rest_lengths, dilatation_rate
     )
 
-    # FIXME: change memory overload instead for the below calls!
-    voronoi_dilatation_inv_cube_cached = 1.0 / voronoi_dilatation**3
-    # Delta(\tau_L / \Epsilon^3)
-    bend_twist_couple_2D = difference_kernel_for_block_structure(
-        internal_couple * voronoi_dilatation_inv_cube_cached, ghost_voronoi_idx
-    )
-    # \mathcal{A}[ (\kappa x \tau_L ) * \hat{D} / \Epsilon^3 ]
-    bend_twist_couple_3D = quadrature_kernel_for_block_structure(
-        _batch_cross(kappa, internal_couple)
-        * rest_voronoi_lengths
-        * voronoi_dilatation_inv_cube_cached,
-        ghost_voronoi_idx,
-    )
-    # (Qt x n_L) * \hat{l}
-    shear_stretch_couple = (
-        _batch_cross(_batch_matvec(director_collection, tangents), internal_stress)
-        * rest_lengths
+    blocksize_voronoi = voronoi_dilatation.shape[0]
+
+    # Delta(\tau_L / \Epsilon^3), computed into internal_torques
+    for k in range(blocksize_voronoi):
+        voronoi_dilatation_inv_cube = 1.0 / voronoi_dilatation[k] ** 3
+        for i in range(3):
+            voronoi_workspace[i, k] = (
+                internal_couple[i, k] * voronoi_dilatation_inv_cube
+            )
+    difference_kernel_for_block_structure_into(
+        voronoi_workspace, ghost_voronoi_idx, internal_torques
     )
 
-    # I apply common sub expression elimination here, as J w / e is used in both the lagrangian and dilatation
-    # terms
-    # TODO : the _batch_matvec kernel needs to depend on the representation of J, and should be coded as such
-    J_omega_upon_e = (
-        _batch_matvec(mass_second_moment_of_inertia, omega_collection) / dilatation
+    # \mathcal{A}[ (\kappa x \tau_L ) * \hat{D} / \Epsilon^3 ], computed into the
+    # element workspace
+    for k in range(blocksize_voronoi):
+        voronoi_dilatation_inv_cube = 1.0 / voronoi_dilatation[k] ** 3
+        voronoi_workspace[0, k] = (
+            (kappa[1, k] * internal_couple[2, k] - kappa[2, k] * internal_couple[1, k])
+            * rest_voronoi_lengths[k]
+            * voronoi_dilatation_inv_cube
+        )
+        voronoi_workspace[1, k] = (
+            (kappa[2, k] * internal_couple[0, k] - kappa[0, k] * internal_couple[2, k])
+            * rest_voronoi_lengths[k]
+            * voronoi_dilatation_inv_cube
+        )
+        voronoi_workspace[2, k] = (
+            (kappa[0, k] * internal_couple[1, k] - kappa[1, k] * internal_couple[0, k])
+            * rest_voronoi_lengths[k]
+            * voronoi_dilatation_inv_cube
+        )
+    quadrature_kernel_for_block_structure_into(
+        voronoi_workspace, ghost_voronoi_idx, element_workspace
     )
 
-    # (J \omega_L / e) x \omega_L
-    # Warning : Do not do micro-optimization here : you can ignore dividing by dilatation as we later multiply by it
-    # but this causes confusion and violates SRP
-    lagrangian_transport = _batch_cross(J_omega_upon_e, omega_collection)
+    blocksize = internal_torques.shape[1]
+    for k in range(blocksize):
+        # Qt
+        director_tangent_x = (
+            director_collection[0, 0, k] * tangents[0, k]
+            + director_collection[0, 1, k] * tangents[1, k]
+            + director_collection[0, 2, k] * tangents[2, k]
+        )
+        director_tangent_y = (
+            director_collection[1, 0, k] * tangents[0, k]
+            + director_collection[1, 1, k] * tangents[1, k]
+            + director_collection[1, 2, k] * tangents[2, k]
+        )
+        director_tangent_z = (
+            director_collection[2, 0, k] * tangents[0, k]
+            + director_collection[2, 1, k] * tangents[1, k]
+            + director_collection[2, 2, k] * tangents[2, k]
+        )
 
-    # Note : in the computation of dilatation_rate, there is an optimization opportunity as dilatation rate has
-    # a dilatation-like term in the numerator, which we cancel here
-    # (J \omega_L / e^2) . (de/dt)
-    unsteady_dilatation = J_omega_upon_e * dilatation_rate / dilatation
+        # (Qt x n_L) * \hat{l}
+        shear_stretch_couple_x = (
+            director_tangent_y * internal_stress[2, k]
+            - director_tangent_z * internal_stress[1, k]
+        ) * rest_lengths[k]
+        shear_stretch_couple_y = (
+            director_tangent_z * internal_stress[0, k]
+            - director_tangent_x * internal_stress[2, k]
+        ) * rest_lengths[k]
+        shear_stretch_couple_z = (
+            director_tangent_x * internal_stress[1, k]
+            - director_tangent_y * internal_stress[0, k]
+        ) * rest_lengths[k]
+
+        # (J \omega_L / e) x \omega_L
+        # Warning : Do not do micro-optimization here : you can ignore dividing by dilatation as we later multiply by it
+        # but this causes confusion and violates SRP
+        lagrangian_transport_x = (
+            J_omega_upon_e[1, k] * omega_collection[2, k]
+            - J_omega_upon_e[2, k] * omega_collection[1, k]
+        )
+        lagrangian_transport_y = (
+            J_omega_upon_e[2, k] * omega_collection[0, k]
+            - J_omega_upon_e[0, k] * omega_collection[2, k]
+        )
+        lagrangian_transport_z = (
+            J_omega_upon_e[0, k] * omega_collection[1, k]
+            - J_omega_upon_e[1, k] * omega_collection[0, k]
+        )
 
-    blocksize = internal_torques.shape[1]
-    for i in range(3):
-        for k in range(blocksize):
-            internal_torques[i, k] = (
-                bend_twist_couple_2D[i, k]
-                + bend_twist_couple_3D[i, k]
-                + shear_stretch_couple[i, k]
-                + lagrangian_transport[i, k]
-                + unsteady_dilatation[i, k]
-            )
+        # Note : in the computation of dilatation_rate, there is an optimization opportunity as dilatation rate has
+        # a dilatation-like term in the numerator, which we cancel here
+        # (J \omega_L / e^2) . (de/dt)
+        internal_torques[0, k] = (
+            internal_torques[0, k]
+            + element_workspace[0, k]
+            + shear_stretch_couple_x
+            + lagrangian_transport_x
+            + J_omega_upon_e[0, k] * dilatation_rate[k] / dilatation[k]
+        )
+        internal_torques[1, k] = (
+            internal_torques[1, k]
+            + element_workspace[1, k]
+            + shear_stretch_couple_y
+            + lagrangian_transport_y
+            + J_omega_upon_e[1, k] * dilatation_rate[k] / dilatation[k]
+        )
+        internal_torques[2, k] = (
+            internal_torques[2, k]
+            + element_workspace[2, k]
+            + shear_stretch_couple_z
+            + lagrangian_transport_z
+            + J_omega_upon_e[2, k] * dilatation_rate[k] / dilatation[k]
+        )
 
 
 @numba.njit(cache=True)  # type: ignore
@@ -1107,6 +1857,40 @@ def _update_accelerations(
                 ) * dilatation[k]
 
 
+@numba.njit(cache=True)  # type: ignore
+def _update_accelerations_with_diagonal_material(
+    acceleration_collection: NDArray[np.float64],
+    internal_forces: NDArray[np.float64],
+    external_forces: NDArray[np.float64],
+    mass: NDArray[np.float64],
+    alpha_collection: NDArray[np.float64],
+    inv_mass_second_moment_of_inertia_diagonal: NDArray[np.float64],
+    internal_torques: NDArray[np.float64],
+    external_torques: NDArray[np.float64],
+    dilatation: NDArray[np.float64],
+) -> None:
+    """
+    Update <acceleration and angular acceleration> for a diagonal inverse mass
+    second moment of inertia, given as its (3,n) diagonal.
+    """
+
+    blocksize_acc = internal_forces.shape[1]
+    blocksize_alpha = internal_torques.shape[1]
+
+    for i in range(3):
+        for k in range(blocksize_acc):
+            acceleration_collection[i, k] = (
+                internal_forces[i, k] + external_forces[i, k]
+            ) / mass[k]
+
+    for i in range(3):
+        for k in range(blocksize_alpha):
+            alpha_collection[i, k] = (
+                inv_mass_second_moment_of_inertia_diagonal[i, k]
+                * (internal_torques[i, k] + external_torques[i, k])
+            ) * dilatation[k]
+
+
 @numba.njit(cache=True)  # type: ignore
 def _zeroed_out_external_forces_and_torques(
     external_forces: NDArray[np.float64], external_torques: NDArray[np.float64]
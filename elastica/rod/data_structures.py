@@ -5,8 +5,7 @@ from typing_extensions import Self
 import numpy as np
 from numpy.typing import NDArray
 from numba import njit
-from elastica._rotations import _get_rotation_matrix, _rotate
-from elastica._linalg import _batch_matmul
+from elastica._rotations import _get_rotation_matrix, _rotate, _rotate_into
 
 if TYPE_CHECKING:
     from elastica.systems.protocol import SymplecticSystemProtocol
@@ -252,7 +251,8 @@ class _State:
         np.einsum(
             "ijk,jlk->ilk",
             _get_rotation_matrix(
-                1.0, scaled_deriv_array[..., self.n_nodes : self.n_kinematic_rates]
+                np.float64(1.0),
+                scaled_deriv_array[..., self.n_nodes : self.n_kinematic_rates],
             ),
             self.director_collection.copy(),
             out=self.director_collection,
@@ -292,7 +292,7 @@ class _State:
         # Devs : see `_State.__iadd__` for reasons why we do matmul here
         director_collection = _rotate(
             self.director_collection,
-            1.0,
+            np.float64(1.0),
             scaled_derivative_state[..., self.n_nodes : self.n_kinematic_rates],
         )
         # (v,ω) += (dv/dt, dω/dt)*dt
@@ -458,8 +458,10 @@ def overload_operator_kinematic_numba(
     for i in range(3):
         for k in range(n_nodes):
             position_collection[i, k] += prefac * velocity_collection[i, k]
-    rotation_matrix = _get_rotation_matrix(1.0, prefac * omega_collection)
-    director_collection[:] = _batch_matmul(rotation_matrix, director_collection)
+
+    # Q = R(dt * ω) Q, rotated in place so that no rotation matrix collection is
+    # allocated.
+    _rotate_into(director_collection, prefac, omega_collection)
 
     return
 
@@ -496,6 +498,9 @@ class _DynamicState:
         self.dvdt_dwdt_collection = dvdt_dwdt_collection
         self.velocity_collection = velocity_collection
         self.omega_collection = omega_collection
+        # Scaled rates returned by `dynamic_rates`, preallocated so that time
+        # steps do not allocate memory
+        self.scaled_dvdt_dwdt_collection = np.empty_like(dvdt_dwdt_collection)
 
     def kinematic_rates(
         self, time: np.float64, prefac: np.float64
@@ -527,8 +532,11 @@ class _DynamicState:
         Doesn't return a _DynamicState with (dt*v, dt*w) as members,
         as one expects the _Dynamic __add__ operator to interact
         with another _DynamicState. This is done for efficiency purposes.
+        The returned array is overwritten by the next call.
         """
-        return prefac * self.dvdt_dwdt_collection
+        return np.multiply(
+            prefac, self.dvdt_dwdt_collection, out=self.scaled_dvdt_dwdt_collection
+        )
 
 
 @njit(cache=True)  # type: ignore
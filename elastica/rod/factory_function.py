@@ -1,5 +1,5 @@
 __doc__ = """ Factory function to allocate variables for Cosserat Rod"""
-from typing import Any, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 import logging
 import numpy as np
 from numpy.testing import assert_allclose
@@ -7,6 +7,9 @@ from numpy.typing import NDArray
 from elastica.utils import MaxDimension, Tolerance
 from elastica._linalg import _batch_cross, _batch_norm, _batch_dot
 
+if TYPE_CHECKING:
+    from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
 
 def allocate(
     n_elements: int,
@@ -194,10 +197,8 @@ def allocate(
 
     # Shear/Stretch matrix
     if not shear_modulus:
-        log.info(
-            """Shear modulus is not explicitly given.\n
-            In such case, we compute shear_modulus assuming poisson's ratio of 0.5"""
-        )
+        log.info("""Shear modulus is not explicitly given.\n
+            In such case, we compute shear_modulus assuming poisson's ratio of 0.5""")
         shear_modulus = youngs_modulus / (2.0 * (1.0 + 0.5))
 
     # Value taken based on best correlation for Poisson ratio = 0.5, from
@@ -333,6 +334,178 @@ def allocate(
     )
 
 
+def allocate_straight_rods(
+    block: "MemoryBlockCosseratRod",
+    n_elements: NDArray[np.int32],
+    start: NDArray[np.float64],
+    direction: NDArray[np.float64],
+    normal: NDArray[np.float64],
+    base_length: NDArray[np.float64],
+    base_radius: NDArray[np.float64],
+    density: NDArray[np.float64],
+    youngs_modulus: NDArray[np.float64],
+    shear_modulus: Optional[NDArray[np.float64]] = None,
+) -> None:
+    """
+    Vectorized counterpart of `allocate` for many straight rods. Properties of all
+    rods are computed at once, and written into the block memory preallocated by
+    MemoryBlockCosseratRod.preallocate_straight_rods. Validity checks are done
+    across all rods at once.
+
+    Parameters
+    ----------
+    block : MemoryBlockCosseratRod
+        Preallocated block memory of the rods.
+    n_elements : NDArray[np.int32]
+        1D (n_rods,) array. Number of elements of each rod.
+    start : NDArray[np.float64]
+        2D (n_rods, 3) array. Starting coordinate of each rod.
+    direction : NDArray[np.float64]
+        2D (n_rods, 3) array. Direction of each rod.
+    normal : NDArray[np.float64]
+        2D (n_rods, 3) array. Normal vector of each rod.
+    base_length : NDArray[np.float64]
+        1D (n_rods,) array. Total length of each rod.
+    base_radius : NDArray[np.float64]
+        1D (n_rods,) array. Uniform radius of each rod.
+    density : NDArray[np.float64]
+        1D (n_rods,) array. Density of each rod.
+    youngs_modulus : NDArray[np.float64]
+        1D (n_rods,) array. Young's modulus of each rod.
+    shear_modulus : Optional[NDArray[np.float64]]
+        1D (n_rods,) array. Shear modulus of each rod. If not given, it is
+        computed assuming Poisson's ratio of 0.5.
+
+    """
+    log = logging.getLogger()
+
+    # sanity checks here, vectorized across rods
+    assert np.all(n_elements > 1), " Number of elements has to be greater than 1."
+    assert np.all(base_length > Tolerance.atol()), " Length has to be greater than 0."
+    assert np.all(
+        _batch_norm(normal.T) > Tolerance.atol()
+    ), " Normal has to be a non-zero vector."
+    assert np.all(
+        _batch_norm(direction.T) > Tolerance.atol()
+    ), " Direction has to be a non-zero vector."
+    assert np.all(base_radius > Tolerance.atol()), " Radius has to be greater than 0."
+    assert np.all(density > Tolerance.atol()), " Density has to be greater than 0."
+
+    nodes, node_rod, node_local_idx = _rod_indices_in_block(
+        block.start_idx_in_rod_nodes, block.end_idx_in_rod_nodes
+    )
+    elems, elem_rod, _ = _rod_indices_in_block(
+        block.start_idx_in_rod_elems, block.end_idx_in_rod_elems
+    )
+    voronoi, _, _ = _rod_indices_in_block(
+        block.start_idx_in_rod_voronoi, block.end_idx_in_rod_voronoi
+    )
+
+    # Set the position array, as np.linspace does for a single rod
+    start = start.T
+    end = start + direction.T * base_length
+    step = (end - start) / n_elements
+    position = block.position_collection
+    position[:, nodes] = node_local_idx * step[:, node_rod] + start[:, node_rod]
+    position[:, block.end_idx_in_rod_nodes - 1] = end
+
+    # Compute rest lengths and tangents. Element k is between nodes k and k + 1.
+    position_diff = position[:, elems + 1] - position[:, elems]
+    rest_lengths = _batch_norm(position_diff)
+    tangents = position_diff / rest_lengths
+    normal_collection = (normal.T / _batch_norm(normal.T))[:, elem_rod]
+
+    # Check if rod normal and rod tangent are perpendicular to each other otherwise
+    # directors will be wrong!!
+    assert np.all(
+        np.abs(_batch_dot(normal_collection, tangents)) <= Tolerance.atol()
+    ), " Rod normal and tangent are not perpendicular to each other!"
+    block.director_collection[0][:, elems] = normal_collection
+    block.director_collection[1][:, elems] = _batch_cross(tangents, normal_collection)
+    block.director_collection[2][:, elems] = tangents
+
+    radius = base_radius[elem_rod]
+    density_array = density[elem_rod]
+    block.radius[elems] = radius
+    block.density[elems] = density_array
+    block.rest_lengths[elems] = rest_lengths
+
+    # Second moment of inertia
+    A0 = np.pi * radius * radius
+    I0_1 = A0 * A0 / (4.0 * np.pi)
+    I0_2 = I0_1
+    I0_3 = 2.0 * I0_2
+
+    # Mass second moment of inertia for disk cross-section
+    for i, I0 in enumerate((I0_1, I0_2, I0_3)):
+        block.mass_second_moment_of_inertia[i, i, elems] = I0 * (
+            density_array * rest_lengths
+        )
+        block.inv_mass_second_moment_of_inertia[i, i, elems] = (
+            1.0 / block.mass_second_moment_of_inertia[i, i, elems]
+        )
+    # sanity check of mass second moment of inertia
+    if np.all(block.mass_second_moment_of_inertia[0, 0, elems] < Tolerance.atol()):
+        message = "Mass moment of inertia matrix smaller than tolerance, please check provided radius, density and length."
+        log.warning(message)
+
+    # Shear/Stretch matrix
+    if shear_modulus is None:
+        log.info("""Shear modulus is not explicitly given.\n
+            In such case, we compute shear_modulus assuming poisson's ratio of 0.5""")
+        shear_modulus = youngs_modulus / (2.0 * (1.0 + 0.5))
+    youngs_modulus = youngs_modulus[elem_rod]
+    shear_modulus = shear_modulus[elem_rod]
+
+    # Value taken based on best correlation for Poisson ratio = 0.5, from
+    # "On Timoshenko's correction for shear in vibrating beams" by Kaneko, 1975
+    alpha_c = 27.0 / 28.0
+    block.shear_matrix[0, 0, elems] = alpha_c * shear_modulus * A0
+    block.shear_matrix[1, 1, elems] = alpha_c * shear_modulus * A0
+    block.shear_matrix[2, 2, elems] = youngs_modulus * A0
+
+    # Bend/Twist matrix, computed on elements then in Voronoi domain
+    bend_matrix_diagonal = np.zeros((MaxDimension.value(), block.n_elems))
+    bend_matrix_diagonal[0, elems] = youngs_modulus * I0_1
+    bend_matrix_diagonal[1, elems] = youngs_modulus * I0_2
+    bend_matrix_diagonal[2, elems] = shear_modulus * I0_3
+    assert np.all(
+        bend_matrix_diagonal[:, elems] > Tolerance.atol()
+    ), " Bend matrix has to be greater than 0."
+    rest_lengths_in_block = block.rest_lengths
+    for i in range(MaxDimension.value()):
+        block.bend_matrix[i, i, voronoi] = (
+            bend_matrix_diagonal[i, voronoi + 1] * rest_lengths_in_block[voronoi + 1]
+            + bend_matrix_diagonal[i, voronoi] * rest_lengths_in_block[voronoi]
+        ) / (rest_lengths_in_block[voronoi + 1] + rest_lengths_in_block[voronoi])
+
+    # Compute volume of elements
+    volume = np.pi * radius**2 * rest_lengths
+    block.volume[elems] = volume
+
+    # Compute mass of elements
+    block.mass[elems] += 0.5 * density_array * volume
+    block.mass[elems + 1] += 0.5 * density_array * volume
+
+    # Compute rest voronoi length
+    block.rest_voronoi_lengths[voronoi] = 0.5 * (
+        rest_lengths_in_block[voronoi + 1] + rest_lengths_in_block[voronoi]
+    )
+
+
+def _rod_indices_in_block(
+    start_idx: NDArray[np.int32], end_idx: NDArray[np.int32]
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Indices in the block of the nodes, elements or voronoi of all rods, the rod
+    they belong to and their index in the rod.
+    """
+    counts = end_idx - start_idx
+    rod = np.repeat(np.arange(counts.shape[0]), counts)
+    local_idx = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return start_idx[rod] + local_idx, rod, local_idx
+
+
 """
 Cosserat rod constructor for straight-rod or ring rod geometry.
 
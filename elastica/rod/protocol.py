@@ -47,6 +47,11 @@ class CosseratRodProtocol(
     ghost_voronoi_idx: NDArray[np.int32]
     ghost_elems_idx: NDArray[np.int32]
 
+    # Scratch arrays of the internal force and torque kernels
+    element_workspace: NDArray[np.float64]
+    J_omega_upon_e: NDArray[np.float64]
+    voronoi_workspace: NDArray[np.float64]
+
     ring_rod_flag: bool
     periodic_boundary_nodes_idx: NDArray[np.int32]
     periodic_boundary_elems_idx: NDArray[np.int32]
@@ -1,6 +1,6 @@
 __doc__ = """Timestepping utilities to be used with Rod and RigidBody classes"""
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Optional
 from elastica.typing import SystemCollectionType, SteppersOperatorsType
 
 import numpy as np
@@ -10,6 +10,9 @@ from elastica.systems import is_system_a_collection
 
 from .protocol import StepperProtocol
 
+if TYPE_CHECKING:
+    from elastica.restart import Checkpointer
+
 
 # Deprecated: Remove in the future version
 # Many script still uses this method to control timestep. Keep it for backward compatibility
@@ -36,6 +39,7 @@ def integrate(
     n_steps: int = 1000,
     restart_time: float = 0.0,
     progress_bar: bool = True,
+    checkpointer: Optional["Checkpointer"] = None,
 ) -> float:
     """
 
@@ -53,6 +57,9 @@ def integrate(
         The timestamp of the first integration step. (default: 0.0)
     progress_bar : bool
         Toggle the tqdm progress bar. (default: True)
+    checkpointer : Checkpointer, optional
+        Save checkpoints periodically in the background. Pending checkpoints are
+        written before returning. (default: None)
     """
     assert final_time > 0.0, "Final time is negative!"
     assert n_steps > 0, "Number of integration steps is negative!"
@@ -60,7 +67,18 @@ def integrate(
     dt = np.float64(float(final_time) / n_steps)
     time = np.float64(restart_time)
 
-    if is_system_a_collection(systems):
+    if is_system_a_collection(systems) and checkpointer is not None:
+        try:
+            for i in tqdm(range(n_steps), disable=(not progress_bar)):
+                time = stepper.step(systems, time, dt)
+                # Steps are counted from time, so that the checkpoint interval
+                # does not change when a simulation is resumed.
+                current_step = round(time / dt)
+                if checkpointer.is_due(current_step):
+                    checkpointer.checkpoint(systems, time, current_step)
+        finally:
+            checkpointer.close()
+    elif is_system_a_collection(systems):
         for i in tqdm(range(n_steps), disable=(not progress_bar)):
             time = stepper.step(systems, time, dt)
     else:
@@ -92,9 +92,12 @@ class SymplecticStepperMixin:
             The time after the integration step.
 
         """
+        # Kinematic updates are skipped for systems asleep or driven. Dynamic
+        # updates add zero accelerations to systems asleep, and are overwritten by
+        # the prescribed rates of driven systems.
         for kin_prefactor, kin_step, dyn_step in steps_and_prefactors[:-1]:
 
-            for system in SystemCollection.block_systems():
+            for system in SystemCollection.active_block_systems():
                 kin_step(system, time, dt)
 
             time += kin_prefactor(dt)
@@ -120,7 +123,7 @@ class SymplecticStepperMixin:
         last_kin_prefactor = steps_and_prefactors[-1][0]
         last_kin_step = steps_and_prefactors[-1][1]
 
-        for system in SystemCollection.block_systems():
+        for system in SystemCollection.active_block_systems():
             last_kin_step(system, time, dt)
         time += last_kin_prefactor(dt)
         SystemCollection.constrain_values(time)
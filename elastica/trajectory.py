@@ -0,0 +1,257 @@
+__doc__ = """Chunked, appendable and memory-mappable trajectory files."""
+from typing import Any, Optional
+from typing_extensions import Self
+
+import os
+import json
+import logging
+import numpy as np
+from numpy.typing import NDArray
+
+INDEX_FILENAME = "index.json"
+FORMAT_VERSION = 1
+
+
+def _field_path(directory: str, field: str) -> str:
+    return os.path.join(directory, f"{field}.bin")
+
+
+def _load_index(directory: str) -> dict[str, Any]:
+    with open(os.path.join(directory, INDEX_FILENAME), "r") as file:
+        index: dict[str, Any] = json.load(file)
+    assert (
+        index["version"] == FORMAT_VERSION
+    ), f"Unsupported trajectory format version {index['version']}."
+    return index
+
+
+class TrajectoryWriter:
+    """
+    Writes a trajectory, i.e. a sequence of samples of named fields, into a directory.
+
+    Each field has a fixed shape and dtype, and is stored as a raw binary file
+    `<field>.bin` containing all samples back to back. Samples are collected in a
+    preallocated chunk of `chunk_size` samples, and each full chunk is appended to
+    the field files in one write. A small JSON index (`index.json`) records the
+    shapes, dtypes and number of samples written, and is updated atomically after
+    each chunk, so that the trajectory is readable at any time by
+    TrajectoryReader.
+
+        Attributes
+        ----------
+        directory: str
+            Directory of the trajectory.
+        chunk_size: int
+            Number of samples collected before they are written.
+        n_samples: int
+            Number of samples written to disk.
+    """
+
+    def __init__(self, directory: str, chunk_size: int = 64, append: bool = False):
+        """
+        Parameters
+        ----------
+        directory : str
+            Directory to save the trajectory. If directory doesn't exist, it will
+            be created.
+        chunk_size : int
+            Number of samples collected in memory before they are appended to the
+            files. (default = 64)
+        append : bool
+            If True and a trajectory exists in the directory, new samples are
+            appended to it. Otherwise an existing trajectory is overwritten.
+            (default = False)
+        """
+        assert chunk_size > 0, f"chunk_size ({chunk_size}) must be positive."
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.n_samples = 0
+
+        self._fields: dict[str, dict[str, Any]] = {}
+        self._chunks: dict[str, NDArray[Any]] = {}
+        self._n_buffered = 0
+
+        index_path = os.path.join(directory, INDEX_FILENAME)
+        if os.path.exists(index_path):
+            index = _load_index(directory)
+            if append:
+                self._fields = index["fields"]
+                self.n_samples = index["n_samples"]
+                # Drop samples of an interrupted write, which are not in the index.
+                for field, spec in self._fields.items():
+                    with open(_field_path(directory, field), "r+b") as file:
+                        file.truncate(self.n_samples * self._sample_nbytes(spec))
+            else:
+                logging.warning(
+                    f"The trajectory in ({directory}) already exists and is overwritten."
+                )
+                for field in index["fields"]:
+                    os.remove(_field_path(directory, field))
+                os.remove(index_path)
+
+    @staticmethod
+    def _sample_nbytes(spec: dict[str, Any]) -> int:
+        return int(np.dtype(spec["dtype"]).itemsize * np.prod(spec["shape"]))
+
+    def _allocate_chunks(self, sample: dict[str, Any]) -> None:
+        """
+        Allocate chunk buffers for the fields of the first sample, and check the
+        fields against the index when appending. For a new trajectory, the field
+        files are created empty, so that stale files left without an index (e.g.
+        by a first chunk interrupted before the index was written) are not
+        appended to.
+        """
+        fields = {}
+        for field, value in sample.items():
+            value = np.asarray(value)
+            fields[field] = {"dtype": value.dtype.str, "shape": list(value.shape)}
+        if self._fields:
+            assert fields == self._fields, (
+                f"Fields {fields} do not match the fields of the trajectory "
+                f"{self._fields}."
+            )
+        else:
+            for field in fields:
+                open(_field_path(self.directory, field), "wb").close()
+        self._fields = fields
+        for field, spec in fields.items():
+            self._chunks[field] = np.empty(
+                (self.chunk_size, *spec["shape"]), dtype=spec["dtype"]
+            )
+
+    def append(self, **sample: Any) -> None:
+        """
+        Append one sample. The first sample defines the fields, their shapes and
+        dtypes. Subsequent samples must have the same fields.
+
+        Parameters
+        ----------
+        **sample
+            Field names and values of the sample.
+        """
+        if not self._chunks:
+            self._allocate_chunks(sample)
+        for field, chunk in self._chunks.items():
+            chunk[self._n_buffered] = sample[field]
+        self._n_buffered += 1
+        if self._n_buffered == self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Append the collected samples to the files and update the index.
+        """
+        if self._n_buffered == 0:
+            return
+        for field, chunk in self._chunks.items():
+            with open(_field_path(self.directory, field), "ab") as file:
+                chunk[: self._n_buffered].tofile(file)
+        self.n_samples += self._n_buffered
+        self._n_buffered = 0
+        self._write_index()
+
+    def _write_index(self) -> None:
+        index = {
+            "version": FORMAT_VERSION,
+            "chunk_size": self.chunk_size,
+            "n_samples": self.n_samples,
+            "fields": self._fields,
+        }
+        index_path = os.path.join(self.directory, INDEX_FILENAME)
+        temporary_path = index_path + ".tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(index, file)
+        os.replace(temporary_path, index_path)
+
+    def close(self) -> None:
+        """
+        Write the remaining samples.
+        """
+        self.flush()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class TrajectoryReader:
+    """
+    Reads a trajectory written by TrajectoryWriter. Fields are returned as
+    read-only memory maps of shape (n_samples, *field_shape), so any time window
+    or node subset is read from disk without copying the rest of the trajectory.
+
+        Attributes
+        ----------
+        directory: str
+            Directory of the trajectory.
+        n_samples: int
+            Number of samples in the trajectory.
+        fields: dict
+            Shapes and dtypes of the fields.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Parameters
+        ----------
+        directory : str
+            Directory of the trajectory.
+        """
+        index = _load_index(directory)
+        self.directory = directory
+        self.n_samples: int = index["n_samples"]
+        self.chunk_size: int = index["chunk_size"]
+        self.fields: dict[str, dict[str, Any]] = index["fields"]
+
+    def __getitem__(self, field: str) -> NDArray[Any]:
+        """
+        Return all samples of a field as a read-only memory map.
+        """
+        spec = self.fields[field]
+        shape = (self.n_samples, *spec["shape"])
+        if self.n_samples == 0:
+            # Empty files cannot be memory mapped.
+            return np.empty(shape, dtype=spec["dtype"])
+        return np.memmap(
+            _field_path(self.directory, field),
+            dtype=spec["dtype"],
+            mode="r",
+            shape=shape,
+        )
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.fields
+
+    def __len__(self) -> int:
+        return self.n_samples
+
+    def read(
+        self,
+        field: str,
+        samples: "slice | int" = slice(None),
+        nodes: Optional["slice | int | NDArray[np.integer]"] = None,
+    ) -> NDArray[Any]:
+        """
+        Read a time window and, optionally, a subset along the last axis (nodes or
+        elements) of a field. Slices return views into the memory map.
+
+        Parameters
+        ----------
+        field : str
+            Field name.
+        samples : slice | int
+            Samples to read.
+        nodes : slice | int | ndarray, optional
+            Indices along the last axis to read.
+
+        Returns
+        -------
+        ndarray
+        """
+        data = self[field][samples]
+        if nodes is not None:
+            data = data[..., nodes]
+        return data
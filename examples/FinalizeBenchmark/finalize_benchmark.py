@@ -0,0 +1,102 @@
+"""
+Benchmark of the finalize step of the simulator for large scenes, with the time
+spent in each phase (construction of memory blocks, then finalization of each
+module). Every rod is constrained, forced and dampened, and consecutive rods are
+connected.
+
+Usage: python finalize_benchmark.py [n_rods ...] [--individual]
+
+By default the rods are built at once with `CosseratRod.straight_rods`; with
+`--individual` they are built one by one and copied into the memory block at
+finalize.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import elastica as ea
+
+
+class FinalizeBenchmarkSimulator(
+    ea.BaseSystemCollection,
+    ea.Constraints,
+    ea.Forcing,
+    ea.Connections,
+    ea.Damping,
+    ea.CallBacks,
+):
+    pass
+
+
+def build_scene(
+    n_rods: int, n_elements: int, individual: bool
+) -> FinalizeBenchmarkSimulator:
+    simulator = FinalizeBenchmarkSimulator()
+
+    start = np.zeros((n_rods, 3))
+    start[:, 0] = np.arange(n_rods) * 0.1
+    direction = np.array([0.0, 0.0, 1.0])
+    normal = np.array([1.0, 0.0, 0.0])
+    rod_parameters = dict(
+        base_length=1.0, base_radius=0.01, density=1e3, youngs_modulus=1e6
+    )
+    if individual:
+        rods = [
+            ea.CosseratRod.straight_rod(
+                n_elements, start[k], direction, normal, **rod_parameters
+            )
+            for k in range(n_rods)
+        ]
+    else:
+        rods = ea.CosseratRod.straight_rods(
+            n_elements, start, direction, normal, **rod_parameters
+        )
+    for rod in rods:
+        simulator.append(rod)
+
+    simulator.constrain_many(rods).using(
+        ea.OneEndFixedBC, constrained_position_idx=(0,), constrained_director_idx=(0,)
+    )
+    simulator.add_forcing_to_many(rods).using(
+        ea.GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+    )
+    simulator.dampen_many(rods).using(
+        ea.AnalyticalLinearDamper, uniform_damping_constant=1.0, time_step=1e-4
+    )
+    simulator.connect_pairs(
+        zip(rods[0::2], rods[1::2]), first_connect_idx=-1, second_connect_idx=0
+    ).using(ea.FixedJoint, k=1e3, nu=0.0, kt=1e1)
+
+    return simulator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n_rods", nargs="*", type=int, default=[1_000, 10_000, 30_000])
+    parser.add_argument("--n-elements", type=int, default=10)
+    parser.add_argument("--individual", action="store_true")
+    args = parser.parse_args()
+
+    # Compile kernels used at finalize, so that their compilation is not timed.
+    build_scene(2, args.n_elements, args.individual).finalize()
+
+    for n_rods in args.n_rods:
+        tic = time.perf_counter()
+        simulator = build_scene(n_rods, args.n_elements, args.individual)
+        setup_time = time.perf_counter() - tic
+
+        tic = time.perf_counter()
+        simulator.finalize()
+        finalize_time = time.perf_counter() - tic
+
+        print(
+            f"{n_rods} rods: setup {setup_time:.3f} s, finalize {finalize_time:.3f} s"
+            f" ({1e6 * finalize_time / n_rods:.1f} us per rod)"
+        )
+        for phase, timing in simulator.finalize_timings.items():
+            print(f"    {phase:<15} {timing:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark of the batch linear algebra kernels of elastica._linalg, for block sizes
+from 10 to 10^6 elements. For each kernel, three versions are timed:
+
+* einsum: the equivalent `np.einsum` expression (or NumPy expression),
+* allocating: the current kernel, which allocates its output,
+* into: the variant writing into a preallocated output, with the 3x3 structure
+  unrolled over the contiguous last axis.
+
+Usage: python linalg_benchmark.py [block_size ...] [--repeat REPEAT]
+"""
+
+import argparse
+import timeit
+from typing import Callable
+
+import numpy as np
+
+from elastica._linalg import (
+    _batch_matvec,
+    _batch_matmul,
+    _batch_cross,
+    _batch_dot,
+    _batch_norm,
+    _batch_matrix_transpose,
+    _batch_matvec_into,
+    _batch_matmul_into,
+    _batch_cross_into,
+    _batch_dot_into,
+    _batch_norm_into,
+    _batch_matrix_transpose_into,
+)
+
+# name: (einsum version, allocating kernel, kernel into output, input shapes,
+# output shape), shapes without the element axis
+KERNELS: dict[str, tuple[Callable, Callable, Callable, list[tuple], tuple]] = {
+    "matvec": (
+        lambda a, b: np.einsum("ijk,jk->ik", a, b),
+        _batch_matvec,
+        _batch_matvec_into,
+        [(3, 3), (3,)],
+        (3,),
+    ),
+    "matmul": (
+        lambda a, b: np.einsum("ijk,jlk->ilk", a, b),
+        _batch_matmul,
+        _batch_matmul_into,
+        [(3, 3), (3, 3)],
+        (3, 3),
+    ),
+    "cross": (
+        lambda a, b: np.cross(a, b, axis=0),
+        _batch_cross,
+        _batch_cross_into,
+        [(3,), (3,)],
+        (3,),
+    ),
+    "dot": (
+        lambda a, b: np.einsum("ik,ik->k", a, b),
+        _batch_dot,
+        _batch_dot_into,
+        [(3,), (3,)],
+        (),
+    ),
+    "norm": (
+        lambda a: np.sqrt(np.einsum("ik,ik->k", a, a)),
+        _batch_norm,
+        _batch_norm_into,
+        [(3,)],
+        (),
+    ),
+    "transpose": (
+        # einsum returns a view, copy it to compare the same work
+        lambda a: np.einsum("ijk->jik", a).copy(),
+        _batch_matrix_transpose,
+        _batch_matrix_transpose_into,
+        [(3, 3)],
+        (3, 3),
+    ),
+}
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Best time of a call, in seconds, over `repeat` runs of at least 0.02 s."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, number // 10)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "block_sizes",
+        nargs="*",
+        type=int,
+        default=[10, 100, 1_000, 10_000, 100_000, 1_000_000],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(
+        f"{'kernel':<10} {'block size':>10} {'einsum (us)':>12} "
+        f"{'allocating (us)':>16} {'into (us)':>10} {'speed-up':>9}"
+    )
+    for name, (
+        einsum,
+        kernel,
+        kernel_into,
+        input_shapes,
+        output_shape,
+    ) in KERNELS.items():
+        for block_size in args.block_sizes:
+            inputs = [
+                rng.standard_normal(shape + (block_size,)) for shape in input_shapes
+            ]
+            output = np.empty(output_shape + (block_size,))
+            # Compile the kernels, so that their compilation is not timed.
+            kernel(*inputs)
+            kernel_into(*inputs, output)
+            assert np.allclose(output, einsum(*inputs))
+
+            einsum_time = best_time(lambda: einsum(*inputs), args.repeat)
+            kernel_time = best_time(lambda: kernel(*inputs), args.repeat)
+            into_time = best_time(lambda: kernel_into(*inputs, output), args.repeat)
+            print(
+                f"{name:<10} {block_size:>10} {1e6 * einsum_time:>12.2f} "
+                f"{1e6 * kernel_time:>16.2f} {1e6 * into_time:>10.2f} "
+                f"{kernel_time / into_time:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
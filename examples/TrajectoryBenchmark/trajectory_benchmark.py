@@ -0,0 +1,126 @@
+"""
+Benchmark of the throughput of saving a trajectory of rod positions, with the
+time spent writing the samples and reading back a time window of a few nodes.
+Three formats are timed:
+
+* pickle: samples collected in lists and pickled at the end, as done by the
+  callbacks of the examples,
+* npz: samples collected in lists, stacked and saved with `np.savez`,
+* trajectory: samples appended to a `TrajectoryWriter` in chunks, and read back
+  through the memory maps of a `TrajectoryReader`.
+
+Usage: python trajectory_benchmark.py [n_elements ...] [--n-samples N_SAMPLES]
+"""
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+from elastica.trajectory import TrajectoryReader, TrajectoryWriter
+
+
+def write_pickle(directory: str, samples: list[dict[str, Any]]) -> None:
+    data: dict[str, list[Any]] = {field: [] for field in samples[0]}
+    for sample in samples:
+        for field, value in sample.items():
+            data[field].append(value.copy())
+    with open(os.path.join(directory, "trajectory.pickle"), "wb") as file:
+        pickle.dump(data, file)
+
+
+def read_pickle(directory: str, window: slice, nodes: slice) -> np.ndarray:
+    with open(os.path.join(directory, "trajectory.pickle"), "rb") as file:
+        data = pickle.load(file)
+    return np.array(data["position"][window])[..., nodes]
+
+
+def write_npz(directory: str, samples: list[dict[str, Any]]) -> None:
+    data: dict[str, list[Any]] = {field: [] for field in samples[0]}
+    for sample in samples:
+        for field, value in sample.items():
+            data[field].append(value.copy())
+    stacked: dict[str, Any] = {
+        field: np.array(values) for field, values in data.items()
+    }
+    np.savez(os.path.join(directory, "trajectory.npz"), **stacked)
+
+
+def read_npz(directory: str, window: slice, nodes: slice) -> np.ndarray:
+    with np.load(os.path.join(directory, "trajectory.npz")) as data:
+        return np.array(data["position"][window, :, nodes])
+
+
+def write_trajectory(directory: str, samples: list[dict[str, Any]]) -> None:
+    with TrajectoryWriter(directory, chunk_size=64) as writer:
+        for sample in samples:
+            writer.append(**sample)
+
+
+def read_trajectory(directory: str, window: slice, nodes: slice) -> np.ndarray:
+    return np.array(TrajectoryReader(directory).read("position", window, nodes))
+
+
+FORMATS: dict[str, tuple[Callable, Callable]] = {
+    "pickle": (write_pickle, read_pickle),
+    "npz": (write_npz, read_npz),
+    "trajectory": (write_trajectory, read_trajectory),
+}
+
+
+def make_samples(n_samples: int, n_elements: int) -> list[dict[str, Any]]:
+    rng = np.random.default_rng(0)
+    position = rng.standard_normal((3, n_elements + 1))
+    velocity = rng.standard_normal((3, n_elements + 1))
+    # The same arrays are sampled at each step, as the state arrays of a rod are.
+    return [
+        {
+            "time": np.float64(0.1 * step),
+            "position": position,
+            "velocity": velocity,
+        }
+        for step in range(n_samples)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n_elements", nargs="*", type=int, default=[50, 500, 5_000])
+    parser.add_argument("--n-samples", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'format':<12} {'elements':>8} {'write (ms)':>11} {'write (MB/s)':>13} "
+        f"{'read window (ms)':>17}"
+    )
+    for n_elements in args.n_elements:
+        samples = make_samples(args.n_samples, n_elements)
+        n_bytes = sum(value.nbytes for value in samples[0].values()) * len(samples)
+        window = slice(args.n_samples // 2, args.n_samples // 2 + 100)
+        nodes = slice(0, 5)
+        reference = None
+        for name, (write, read) in FORMATS.items():
+            with tempfile.TemporaryDirectory() as directory:
+                start = time.perf_counter()
+                write(directory, samples)
+                write_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                positions = read(directory, window, nodes)
+                read_time = time.perf_counter() - start
+
+            if reference is None:
+                reference = positions
+            assert np.array_equal(positions, reference)
+            print(
+                f"{name:<12} {n_elements:>8} {1e3 * write_time:>11.1f} "
+                f"{1e-6 * n_bytes / write_time:>13.1f} {1e3 * read_time:>17.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -308,6 +308,9 @@ class CollectiveSystem:
     def block_systems(self):
         return self._memory_blocks
 
+    def active_block_systems(self):
+        return self._memory_blocks
+
     def __getitem__(self, idx):
         return self._memory_blocks[idx]
 
@@ -443,3 +446,43 @@ class SimpleSystemWithPositionsDirectors(_RodSymplecticStepperMixin, RodBase):
                 -1, 1
             )
         return analytical_solution
+
+
+def make_cosserat_rod(
+    n_elem,
+    start=None,
+    direction=None,
+    normal=None,
+    ring_rod=False,
+    base_length=1.0,
+    base_radius=0.05,
+    density=1000.0,
+    youngs_modulus=1e6,
+):
+    """
+    Cosserat rod of the tests, straight or ring shaped, along the z axis by
+    default. If no normal is given, an arbitrary normal perpendicular to the
+    direction is chosen.
+    """
+    from elastica.rod.cosserat_rod import CosseratRod
+
+    start = np.zeros(3) if start is None else np.asarray(start, dtype=np.float64)
+    if direction is None:
+        direction = np.array([0.0, 0.0, 1.0])
+        if normal is None:
+            normal = np.array([1.0, 0.0, 0.0])
+    direction = direction / np.linalg.norm(direction)
+    if normal is None:
+        normal = np.cross(direction, np.array([0.3, 0.5, 0.7]))
+        normal /= np.linalg.norm(normal)
+    factory = CosseratRod.ring_rod if ring_rod else CosseratRod.straight_rod
+    return factory(
+        n_elem,
+        start,
+        direction,
+        normal,
+        base_length=base_length,
+        base_radius=base_radius,
+        density=density,
+        youngs_modulus=youngs_modulus,
+    )
@@ -11,6 +11,7 @@ from elastica.boundary_conditions import (
     FixedConstraint,
     GeneralConstraint,
     HelicalBucklingBC,
+    PrescribedMotion,
 )
 from elastica._linalg import _batch_matvec
 from elastica.utils import Tolerance
@@ -19,6 +20,7 @@ import pytest
 from pytest import main
 from scipy.spatial.transform import Rotation
 from tests.test_rod.mock_rod import MockTestRod
+from tests.analytical import make_cosserat_rod
 
 test_built_in_boundary_condition_impls = [
     FreeBC,
@@ -482,5 +484,95 @@ def test_helical_buckling_bc(rng):
     )
 
 
+def make_rotating_trajectory(rod, times, angular_velocity, velocity):
+    """Frames of the rod rotating about the z-axis and translating along x"""
+    positions = []
+    directors = []
+    for time in times:
+        rotation = Rotation.from_rotvec([0.0, 0.0, angular_velocity * time])
+        positions.append(
+            rotation.as_matrix() @ rod.position_collection
+            + velocity * time * np.array([[1.0], [0.0], [0.0]])
+        )
+        # Directors are rows, rotated by the transpose of the rotation.
+        directors.append(
+            np.einsum("ijk,lj->ilk", rod.director_collection, rotation.as_matrix())
+        )
+    return np.array(positions), np.array(directors)
+
+
+@pytest.mark.parametrize("memory_mapped", [False, True])
+def test_prescribed_motion(tmp_path, memory_mapped):
+    def make_rod():
+        return make_cosserat_rod(5, youngs_modulus=1e5)
+
+    test_rod = make_rod()
+    angular_velocity = 2.0
+    velocity = 0.5
+    times = np.linspace(0.0, 1.0, 5)
+    positions, directors = make_rotating_trajectory(
+        test_rod, times, angular_velocity, velocity
+    )
+    if memory_mapped:
+        np.save(tmp_path / "positions.npy", positions)
+        np.save(tmp_path / "directors.npy", directors)
+        positions = np.load(tmp_path / "positions.npy", mmap_mode="r")
+        directors = np.load(tmp_path / "directors.npy", mmap_mode="r")
+    prescribed_motion = PrescribedMotion(
+        times=times, positions=positions, directors=directors, _system=test_rod
+    )
+
+    # Between frames, positions are interpolated linearly, and directors along the
+    # rotation between the frames.
+    time = np.float64(0.625)
+    prescribed_motion.constrain_values(test_rod, time)
+    prescribed_motion.constrain_rates(test_rod, time)
+    assert_allclose(test_rod.position_collection, 0.5 * (positions[2] + positions[3]))
+    expected_directors = make_rotating_trajectory(
+        make_rod(), [time], angular_velocity, velocity
+    )[1][0]
+    assert_allclose(
+        test_rod.director_collection, expected_directors, atol=Tolerance.atol()
+    )
+    assert_allclose(test_rod.velocity_collection, (positions[3] - positions[2]) / 0.25)
+    # The rod rotates about its tangent, the third director.
+    expected_omega = np.zeros((3, 5))
+    expected_omega[2] = angular_velocity
+    assert_allclose(test_rod.omega_collection, expected_omega, atol=Tolerance.atol())
+    # Geometry follows the positions.
+    assert_allclose(test_rod.lengths, 0.2)
+    assert_allclose(test_rod.tangents, np.array([[0.0], [0.0], [1.0]]) * np.ones(5))
+
+    # Out of the trajectory, the rod is at rest at the last frame.
+    time = np.float64(2.0)
+    prescribed_motion.constrain_values(test_rod, time)
+    prescribed_motion.constrain_rates(test_rod, time)
+    assert_allclose(test_rod.position_collection, positions[-1])
+    assert_allclose(test_rod.director_collection, directors[-1])
+    assert_allclose(test_rod.velocity_collection, 0.0)
+    assert_allclose(test_rod.omega_collection, 0.0)
+
+
+def test_prescribed_motion_with_wrong_shapes_throws():
+    test_rod = MockTestRod()
+    times = np.linspace(0.0, 1.0, 3)
+    positions = np.zeros((3, 3, test_rod.n_elems + 1))
+    directors = np.zeros((3, 3, 3, test_rod.n_elems))
+
+    with pytest.raises(AssertionError) as excinfo:
+        PrescribedMotion(
+            times=times, positions=positions[:2], directors=directors, _system=test_rod
+        )
+    assert "Positions must be of shape" in str(excinfo.value)
+    with pytest.raises(AssertionError) as excinfo:
+        PrescribedMotion(
+            times=times[::-1],
+            positions=positions,
+            directors=directors,
+            _system=test_rod,
+        )
+    assert "increasing" in str(excinfo.value)
+
+
 if __name__ == "__main__":
     main([__file__])
@@ -7,10 +7,19 @@ import numpy as np
 from numpy.testing import assert_allclose
 
 
-from elastica.callback_functions import CallBackBaseClass, MyCallBack, ExportCallBack
+from elastica.callback_functions import (
+    CallBackBaseClass,
+    MyCallBack,
+    ExportCallBack,
+    RecorderCallBack,
+    MemoryBlockSnapshotCallBack,
+    EventRecorderCallBack,
+    TrajectoryCallBack,
+)
 from elastica.utils import Tolerance
 import tempfile
 import pytest
+from tests.analytical import make_cosserat_rod
 
 
 class MockRod:
@@ -54,6 +63,59 @@ class TestCallBackBaseClass:
         assert_allclose(mock_rod.external_forces, 0.0, atol=Tolerance.atol())
         assert_allclose(mock_rod.external_torques, 0.0, atol=Tolerance.atol())
 
+    def test_call_back_base_class_is_due_every_step(self):
+        callbackbase = CallBackBaseClass()
+        assert [callbackbase.next_callback_step(step) for step in range(4)] == [
+            0,
+            1,
+            2,
+            3,
+        ]
+
+
+def due_steps(callback, n_steps):
+    """Steps on which a scheduler calls the callback"""
+    steps = []
+    step = callback.next_callback_step(0)
+    while step < n_steps:
+        steps.append(step)
+        step = callback.next_callback_step(step + 1)
+    return steps
+
+
+@pytest.mark.parametrize("step_skip", [1, 3, 7])
+def test_next_callback_step_of_periodic_call_backs(tmp_path, step_skip):
+    callbacks = [
+        MyCallBack(step_skip, {}),
+        RecorderCallBack(step_skip, 4),
+        MemoryBlockSnapshotCallBack(step_skip, 4),
+        EventRecorderCallBack(None, 1, 1, step_skip),
+        TrajectoryCallBack(step_skip, str(tmp_path)),
+    ]
+    for callback in callbacks:
+        assert due_steps(callback, 30) == list(range(0, 30, step_skip))
+
+
+@pytest.mark.parametrize("step_skip", [1, 3, 7])
+@pytest.mark.parametrize("file_save_interval", [1, 5, 10])
+def test_next_callback_step_of_export_call_back(
+    tmp_path, step_skip, file_save_interval
+):
+    callback = ExportCallBack(
+        step_skip,
+        "rod",
+        str(tmp_path),
+        "npz",
+        file_save_interval=file_save_interval,
+    )
+    # The callback is due whenever it records or writes data
+    expected = [
+        step
+        for step in range(50)
+        if step % step_skip == 0 or (step + 1) % file_save_interval == 0
+    ]
+    assert due_steps(callback, 50) == expected
+
 
 class TestMyCallBackClass:
     @pytest.mark.parametrize("n_elems", [2, 4, 16])
@@ -105,6 +167,341 @@ class TestMyCallBackClass:
         )
 
 
+class TestRecorderCallBackClass:
+    @staticmethod
+    def record(callback, mock_rod, n_steps):
+        positions = []
+        for step in range(n_steps):
+            mock_rod.position_collection[:] = step
+            mock_rod.velocity_collection[:] = -step
+            callback.make_callback(mock_rod, 0.5 * step, step)
+            if step % callback.step_skip == 0:
+                positions.append(mock_rod.position_collection.copy())
+        return np.array(positions)
+
+    @pytest.mark.parametrize("n_elems", [2, 16])
+    def test_recorder_call_back_preallocated_buffers(self, n_elems):
+        mock_rod = MockRodWithElements(n_elems)
+        callback = RecorderCallBack(step_skip=2, n_samples=10)
+        buffer = None
+        for step in range(10):
+            mock_rod.position_collection[:] = step
+            callback.make_callback(mock_rod, 0.5 * step, step)
+            if buffer is None:
+                buffer = callback._buffers["position"]
+            # Buffers are allocated once and filled in place
+            assert callback._buffers["position"] is buffer
+
+        assert buffer.shape == (10, 3, n_elems)
+        position = callback["position"]
+        assert np.shares_memory(position, buffer)
+        assert position.shape == (5, 3, n_elems)
+        assert_allclose(position[:, 0, 0], [0, 2, 4, 6, 8])
+        assert_allclose(callback["time"], [0.0, 1.0, 2.0, 3.0, 4.0])
+        assert_allclose(callback["step"], [0, 2, 4, 6, 8])
+        assert set(callback.data) == {
+            "time",
+            "step",
+            "position",
+            "directors",
+            "velocity",
+        }
+
+    def test_recorder_call_back_selected_fields(self):
+        mock_rod = MockRodWithElements(4)
+        callback = RecorderCallBack(
+            step_skip=1, n_samples=3, fields=("velocity", "external_forces")
+        )
+        self.record(callback, mock_rod, 3)
+        assert set(callback.data) == {"time", "step", "velocity", "external_forces"}
+        assert_allclose(callback["velocity"][:, 0, 0], [0, -1, -2])
+        assert_allclose(
+            callback["external_forces"],
+            np.repeat(mock_rod.external_forces[None], 3, axis=0),
+        )
+
+    def test_recorder_call_back_ring_buffer_keeps_latest_samples(self):
+        mock_rod = MockRodWithElements(4)
+        callback = RecorderCallBack(step_skip=1, n_samples=4)
+        positions = self.record(callback, mock_rod, 10)
+        assert callback.sample_count == 10
+        assert_allclose(callback["position"], positions[-4:])
+        assert_allclose(callback["step"], [6, 7, 8, 9])
+        assert callback.get_last_saved_path() is None
+
+    def test_recorder_call_back_spills_to_disk(self, tmp_path):
+        mock_rod = MockRodWithElements(4)
+        callback = RecorderCallBack(
+            step_skip=1, n_samples=4, directory=str(tmp_path), filename="rod"
+        )
+        positions = self.record(callback, mock_rod, 10)
+        assert callback.file_count == 2
+        assert_allclose(callback["position"], positions[8:])
+        callback.close()
+        assert callback.file_count == 3
+        assert callback.get_last_saved_path() == os.path.join(tmp_path, "rod_02.npz")
+
+        saved_position = []
+        saved_step = []
+        for file_count in range(3):
+            with np.load(os.path.join(tmp_path, f"rod_{file_count:02d}.npz")) as data:
+                saved_position.append(data["position"])
+                saved_step.append(data["step"])
+        assert_allclose(np.concatenate(saved_position), positions)
+        assert_allclose(np.concatenate(saved_step), np.arange(10))
+
+    def test_recorder_call_back_restore_state(self):
+        mock_rod = MockRodWithElements(4)
+        callback = RecorderCallBack(step_skip=1, n_samples=10)
+        self.record(callback, mock_rod, 4)
+        state = callback.snapshot_state()
+        positions = self.record(callback, mock_rod, 3)
+        callback.restore_state(state)
+        assert callback.sample_count == 4
+        assert_allclose(callback["step"], np.arange(4))
+        callback.make_callback(mock_rod, 0.4, 4)
+        assert_allclose(callback["step"], np.arange(5))
+
+    @pytest.mark.parametrize("step_skip, n_samples", [(0, 1), (1, 0)])
+    def test_recorder_call_back_invalid_arguments(self, step_skip, n_samples):
+        with pytest.raises(AssertionError):
+            RecorderCallBack(step_skip=step_skip, n_samples=n_samples)
+
+
+class TestMemoryBlockSnapshotCallBackClass:
+    @staticmethod
+    def make_rods():
+        return [
+            make_cosserat_rod(5 + 2 * k, [0.0, float(k), 0.0], base_radius=0.1)
+            for k in range(3)
+        ]
+
+    def test_snapshot_of_rod_memory_block(self, tmp_path):
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        rods = self.make_rods()
+        system_idx_list = [4, 7, 9]
+        block = MemoryBlockCosseratRod(rods, system_idx_list)
+        callback = MemoryBlockSnapshotCallBack(
+            1,
+            n_samples=2,
+            fields=("position", "directors", "kappa"),
+            directory=str(tmp_path),
+        )
+        for step in range(3):
+            block.position_collection[:] += 1.0
+            callback.make_callback(block, 0.1 * step, step)
+            # One contiguous copy of the whole block per field
+            assert callback._buffers["position"].shape[1:] == (3, block.n_nodes)
+
+        for rod, system_idx in zip(rods, system_idx_list):
+            assert_allclose(
+                callback.system_view("position", system_idx)[-1],
+                rod.position_collection,
+            )
+            assert_allclose(
+                callback.system_view("directors", system_idx)[-1],
+                rod.director_collection,
+            )
+            assert_allclose(callback.system_view("kappa", system_idx)[-1], rod.kappa)
+
+        # Spilled files carry the layout of the block
+        callback.close()
+        with np.load(callback.get_last_saved_path()) as data:
+            view = MemoryBlockSnapshotCallBack.system_view_from(data, "position", 7)
+            assert_allclose(view[-1], rods[1].position_collection)
+            assert_allclose(data["end_idx_in_rod_nodes"], block.end_idx_in_rod_nodes)
+
+        with pytest.raises(ValueError) as excinfo:
+            callback.system_view("time", 4)
+        assert "not defined on nodes" in str(excinfo.value)
+
+    @pytest.mark.parametrize("spill", [True, False])
+    def test_snapshot_layout_refreshed_on_release(self, tmp_path, caplog, spill):
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        rods = self.make_rods()
+        block = MemoryBlockCosseratRod(rods, [4, 7, 9])
+        callback = MemoryBlockSnapshotCallBack(
+            1,
+            n_samples=4,
+            fields=("position",),
+            directory=str(tmp_path) if spill else None,
+        )
+        for step in range(2):
+            callback.make_callback(block, 0.1 * step, step)
+        assert_allclose(callback.metadata["system_idx_list"], [4, 7, 9])
+
+        block.release_systems([1], [rods[1]])
+        with caplog.at_level(logging.WARNING):
+            callback.make_callback(block, 0.2, 2)
+        assert_allclose(callback.metadata["system_idx_list"], [4, -1, 9])
+        assert_allclose(callback["step"], [2])
+        if spill:
+            # Samples of the previous layout are spilled with that layout
+            with np.load(callback.get_last_saved_path()) as data:
+                assert_allclose(data["step"], [0, 1])
+                assert_allclose(data["system_idx_list"], [4, 7, 9])
+        else:
+            assert "dropped" in caplog.text
+        with pytest.raises(ValueError):
+            callback.system_view("position", 7)
+
+    def test_snapshot_of_rigid_body_memory_block(self):
+        from elastica.memory_block.memory_block_rigid_body import (
+            MemoryBlockRigidBody,
+        )
+        from elastica.rigidbody import Sphere
+
+        spheres = [
+            Sphere(np.array([float(k), 0.0, 0.0]), 0.1, 1000.0) for k in range(3)
+        ]
+        block = MemoryBlockRigidBody(spheres, [0, 1, 2])
+        callback = MemoryBlockSnapshotCallBack(1, n_samples=1)
+        callback.make_callback(block, 0.0, 0)
+        for k, sphere in enumerate(spheres):
+            assert_allclose(
+                callback.system_view("position", k)[0], sphere.position_collection
+            )
+            assert_allclose(
+                callback.system_view("directors", k)[0], sphere.director_collection
+            )
+
+
+class TestEventRecorderCallBackClass:
+    @staticmethod
+    def run(callback, trigger_steps, n_steps):
+        """Record a mock rod whose position is the step, triggering on given steps"""
+        mock_rod = MockRodWithElements(3)
+        callback.trigger = lambda system, time, step: step in trigger_steps
+        for step in range(n_steps):
+            mock_rod.position_collection[:] = step
+            callback.make_callback(mock_rod, 0.1 * step, step)
+
+    def test_event_windows(self):
+        callback = EventRecorderCallBack(None, pre_trigger=2, post_trigger=3)
+        self.run(callback, {10, 30}, 40)
+        assert callback.event_count == 2
+        assert_allclose(callback.events[0]["step"], np.arange(8, 14))
+        assert_allclose(callback.events[0]["position"][:, 0, 0], np.arange(8, 14))
+        assert_allclose(callback.events[0]["time"], 0.1 * np.arange(8, 14))
+        assert callback.events[0]["trigger_step"] == 10
+        assert_allclose(callback.events[1]["step"], np.arange(28, 34))
+
+    def test_overlapping_events_are_merged(self):
+        callback = EventRecorderCallBack(None, pre_trigger=2, post_trigger=3)
+        # Retriggering extends the post-trigger window beyond the buffers
+        self.run(callback, {5, 7, 9, 11, 13, 15}, 30)
+        assert callback.event_count == 1
+        assert_allclose(callback.events[0]["step"], np.arange(3, 19))
+        assert_allclose(callback.events[0]["position"][:, 0, 0], np.arange(3, 19))
+        assert callback.events[0]["trigger_step"] == 5
+
+    def test_event_samples_are_not_reused(self):
+        callback = EventRecorderCallBack(None, pre_trigger=4, post_trigger=1)
+        self.run(callback, {2, 5, 20}, 30)
+        assert [event["step"].tolist() for event in callback.events] == [
+            [0, 1, 2, 3],
+            [4, 5, 6],
+            [16, 17, 18, 19, 20, 21],
+        ]
+
+    def test_step_skip(self):
+        callback = EventRecorderCallBack(None, 1, 1, step_skip=3)
+        self.run(callback, {9}, 30)
+        assert_allclose(callback.events[0]["step"], [6, 9, 12])
+
+    def test_event_saved_on_close(self, tmp_path):
+        callback = EventRecorderCallBack(
+            None, 1, 5, fields=("position",), directory=str(tmp_path)
+        )
+        self.run(callback, {3, 18}, 20)
+        assert callback.events == []
+        assert callback.file_count == 1
+        callback.close()
+        assert callback.event_count == 2
+        assert callback.get_last_saved_path() == os.path.join(tmp_path, "event_01.npz")
+        with np.load(os.path.join(tmp_path, "event_00.npz")) as data:
+            assert set(data) == {"time", "step", "position", "trigger_step"}
+            assert_allclose(data["step"], np.arange(2, 9))
+        with np.load(callback.get_last_saved_path()) as data:
+            assert_allclose(data["step"], [17, 18, 19])
+
+    def test_with_trigger_on_rod(self):
+        from elastica.event_triggers import NodalSpeedTrigger
+
+        rod = TestMemoryBlockSnapshotCallBackClass.make_rods()[0]
+        callback = EventRecorderCallBack(NodalSpeedTrigger(1.0), 1, 1)
+        for step in range(10):
+            rod.velocity_collection[2, -1] = 2.0 if step == 5 else 0.0
+            callback.make_callback(rod, 0.1 * step, step)
+        assert_allclose(callback.events[0]["step"], [4, 5, 6])
+        assert_allclose(callback.events[0]["velocity"][1, 2, -1], 2.0)
+
+    def test_restore_state(self):
+        class CountingTrigger:
+            """Triggers on every third evaluation"""
+
+            def __init__(self):
+                self.n_calls = 0
+
+            def __call__(self, system, time, current_step):
+                self.n_calls += 1
+                return self.n_calls % 3 == 0
+
+            def snapshot_state(self):
+                return self.n_calls
+
+            def restore_state(self, state):
+                self.n_calls = state
+
+        mock_rod = MockRodWithElements(3)
+        callback = EventRecorderCallBack(CountingTrigger(), 1, 1)
+        for step in range(4):
+            callback.make_callback(mock_rod, 0.1 * step, step)
+        state = callback.snapshot_state()
+
+        for step in range(4, 10):
+            callback.make_callback(mock_rod, 0.1 * step, step)
+        assert callback.event_count == 3
+
+        callback.restore_state(state)
+        assert callback.trigger.n_calls == 4
+        assert callback.event_count == 1
+        assert_allclose(callback.events[0]["step"], [1, 2, 3])
+        for step in range(4, 7):
+            callback.make_callback(mock_rod, 0.1 * step, step)
+        assert_allclose(callback.events[1]["step"], [4, 5, 6])
+
+    @pytest.mark.parametrize("pre_trigger, post_trigger", [(-1, 1), (1, -1)])
+    def test_invalid_arguments(self, pre_trigger, post_trigger):
+        with pytest.raises(AssertionError):
+            EventRecorderCallBack(None, pre_trigger, post_trigger)
+
+
+class TestTrajectoryCallBackClass:
+    def test_trajectory_call_back(self, tmp_path):
+        from elastica.trajectory import TrajectoryReader
+
+        mock_rod = MockRodWithElements(6)
+        callback = TrajectoryCallBack(
+            2, str(tmp_path), fields=("position", "external_forces"), chunk_size=3
+        )
+        positions = []
+        for step in range(20):
+            mock_rod.position_collection[:] = step
+            callback.make_callback(mock_rod, 0.5 * step, step)
+            if step % 2 == 0:
+                positions.append(mock_rod.position_collection.copy())
+        callback.close()
+
+        reader = TrajectoryReader(str(tmp_path))
+        assert set(reader.fields) == {"time", "step", "position", "external_forces"}
+        assert_allclose(reader["position"], positions)
+        assert_allclose(reader["step"], np.arange(0, 20, 2))
+        assert_allclose(reader["time"], 0.5 * np.arange(0, 20, 2))
+
+
 class TestExportCallBackClass:
     @pytest.mark.parametrize("method", ["0", 1, "numba", "test", "some string", None])
     def test_export_call_back_unavailable_save_methods(self, tmp_path, method):
@@ -238,6 +635,103 @@ class TestExportCallBackClass:
             saved_path_name = callback.get_last_saved_path()
             assert os.path.exists(saved_path_name), "File is not saved."
 
+    @pytest.mark.parametrize("method", ["pickle", "npz"])
+    def test_export_call_back_asynchronous_writes(self, tmp_path, method):
+        mock_rod = MockRodWithElements(5)
+        callback = ExportCallBack(
+            1,
+            "rod",
+            tmp_path.as_posix(),
+            method,
+            file_save_interval=10,
+            asynchronous=True,
+            max_queue_size=1,
+        )
+        for step in range(35):
+            mock_rod.position_collection[:] = step
+            callback.make_callback(mock_rod, 0.1 * step, step)
+        callback.close()
+        assert not callback._writer.is_alive()
+        assert callback.file_count == 4
+
+        steps = []
+        for file_count in range(4):
+            file_path = callback.save_path.format(file_count, callback._ext)
+            if method == "npz":
+                with np.load(file_path) as data:
+                    steps.append(data["step"])
+                    assert_allclose(data["position"][:, 0, 0], data["step"])
+            else:
+                import pickle
+
+                with open(file_path, "rb") as file:
+                    steps.append(pickle.load(file)["step"])
+        assert_allclose(np.concatenate(steps), np.arange(35))
+
+    def test_export_call_back_asynchronous_backpressure(self, tmp_path):
+        import threading
+
+        release = threading.Event()
+
+        class SlowExportCallBack(ExportCallBack):
+            def _write(self, file_path, data):
+                release.wait()
+                super()._write(file_path, data)
+
+        mock_rod = MockRodWithElements(5)
+        callback = SlowExportCallBack(
+            1,
+            "rod",
+            tmp_path.as_posix(),
+            "npz",
+            file_save_interval=1,
+            asynchronous=True,
+            max_queue_size=1,
+        )
+        # One buffer is held by the writer and one waits in the queue, the
+        # third dump blocks until the writer makes progress.
+        callback.make_callback(mock_rod, 0.0, 0)
+        callback.make_callback(mock_rod, 0.0, 1)
+        blocked = threading.Thread(
+            target=callback.make_callback, args=(mock_rod, 0.0, 2)
+        )
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join()
+        callback.close()
+        assert callback.file_count == 3
+        for file_count in range(3):
+            assert os.path.exists(callback.save_path.format(file_count, "npz"))
+
+    def test_export_call_back_asynchronous_write_error(self, tmp_path):
+        class FailingExportCallBack(ExportCallBack):
+            def _write(self, file_path, data):
+                raise OSError("disk full")
+
+        mock_rod = MockRodWithElements(5)
+        callback = FailingExportCallBack(
+            1,
+            "rod",
+            tmp_path.as_posix(),
+            "npz",
+            file_save_interval=5,
+            asynchronous=True,
+        )
+        for step in range(5):
+            callback.make_callback(mock_rod, 0.0, step)
+        with pytest.raises(RuntimeError, match="failed to write") as excinfo:
+            callback.flush()
+        assert isinstance(excinfo.value.__cause__, OSError)
+
+        for step in range(5, 10):
+            callback.make_callback(mock_rod, 0.0, step)
+        with pytest.raises(RuntimeError, match="failed to write"):
+            callback.close()
+        assert not callback._writer.is_alive()
+
     @pytest.mark.parametrize("n_elems", [2, 4, 16])
     def test_export_call_back_class_tempfile_option(self, rng, tmp_path, n_elems):
         """
@@ -0,0 +1,227 @@
+__doc__ = """ Test trajectory compression """
+import os
+import pickle
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from elastica._rotations import _get_rotation_matrix
+from elastica.callback_functions import ExportCallBack
+from elastica.compression import (
+    TrajectoryCompression,
+    decompress,
+    directors_to_quaternions,
+    directors_to_rotation_vectors,
+    quaternions_to_directors,
+    rotation_vectors_to_directors,
+)
+
+
+def make_trajectory(n_samples=20, n_elems=12, seed=0):
+    rng = np.random.default_rng(seed)
+    n_nodes = n_elems + 1
+    # Smooth motion, as recorded from a simulation
+    velocity = 1e-3 * rng.standard_normal((n_samples, 3, n_nodes))
+    position = rng.standard_normal((1, 3, n_nodes)) + np.cumsum(velocity, axis=0)
+    angles = (
+        rng.uniform(-1.0, 1.0, (3, n_elems))
+        + 0.01 * np.arange(n_samples)[:, None, None]
+    )
+    directors = np.array(
+        [_get_rotation_matrix(1.0, angles[sample]) for sample in range(n_samples)]
+    )
+    return {
+        "time": 0.1 * np.arange(n_samples),
+        "step": np.arange(n_samples),
+        "position": position,
+        "velocity": velocity,
+        "directors": directors,
+    }
+
+
+class TestDirectorRepresentations:
+    def test_rotation_vectors_round_trip(self):
+        directors = make_trajectory()["directors"]
+        rotation_vectors = directors_to_rotation_vectors(directors)
+        assert rotation_vectors.shape == (20, 3, 12)
+        assert_allclose(
+            rotation_vectors_to_directors(rotation_vectors), directors, atol=1e-12
+        )
+        # Rotation vectors reproduce the directors with _get_rotation_matrix
+        assert_allclose(
+            _get_rotation_matrix(1.0, rotation_vectors[3]), directors[3], atol=1e-12
+        )
+
+    def test_quaternions_round_trip(self):
+        directors = make_trajectory()["directors"]
+        quaternions = directors_to_quaternions(directors)
+        assert quaternions.shape == (20, 4, 12)
+        assert_allclose(np.linalg.norm(quaternions, axis=-2), 1.0)
+        assert np.all(quaternions[:, 0] >= 0.0)
+        assert_allclose(quaternions_to_directors(quaternions), directors, atol=1e-12)
+
+    @pytest.mark.parametrize("angle_to_pi", [0.3, 1e-2, 1e-4, 1e-7, 0.0])
+    def test_rotation_vectors_near_pi(self, angle_to_pi):
+        rng = np.random.default_rng(2)
+        axis = rng.standard_normal((3, 5))
+        axis /= np.linalg.norm(axis, axis=0)
+        directors = _get_rotation_matrix(1.0, (np.pi - angle_to_pi) * axis)
+        # Simulated directors are slightly non-orthogonal
+        directors += 1e-14 * rng.standard_normal(directors.shape)
+        rotation_vectors = directors_to_rotation_vectors(directors)
+        assert_allclose(
+            rotation_vectors_to_directors(rotation_vectors), directors, atol=1e-11
+        )
+        assert_allclose(
+            np.linalg.norm(rotation_vectors, axis=0), np.pi - angle_to_pi, atol=1e-7
+        )
+
+    def test_identity(self):
+        directors = np.tile(np.eye(3)[:, :, None], (1, 1, 4))
+        assert_allclose(directors_to_rotation_vectors(directors), 0.0, atol=1e-12)
+        assert_allclose(directors_to_quaternions(directors)[0], np.ones(4), atol=1e-12)
+        assert_allclose(
+            quaternions_to_directors(directors_to_quaternions(directors)), directors
+        )
+
+
+class TestTrajectoryCompression:
+    def test_lossless(self):
+        data = make_trajectory()
+        decoded = decompress(TrajectoryCompression().encode(data))
+        for field in data:
+            assert_array_equal(decoded[field], data[field])
+
+    @pytest.mark.parametrize("tolerance", [1e-3, 1e-6])
+    @pytest.mark.parametrize("delta_fields", [(), ("position",)])
+    def test_fixed_point_error_bound(self, tolerance, delta_fields):
+        data = make_trajectory()
+        compression = TrajectoryCompression(
+            "fixed_point", tolerance=tolerance, delta_fields=delta_fields
+        )
+        encoded = compression.encode(data)
+        assert ("position_keyframe" in encoded) == bool(delta_fields)
+        assert np.issubdtype(encoded["position"].dtype, np.integer)
+        decoded = decompress(encoded)
+        for field in ["position", "velocity", "directors"]:
+            assert np.max(np.abs(decoded[field] - data[field])) <= tolerance * (
+                1.0 + 1e-9
+            )
+        assert_array_equal(decoded["time"], data["time"])
+        assert_array_equal(decoded["step"], data["step"])
+
+    def test_fixed_point_delta_uses_narrower_integers(self):
+        data = make_trajectory()
+        absolute = TrajectoryCompression("fixed_point", 1e-6, delta_fields=()).encode(
+            data
+        )
+        delta = TrajectoryCompression("fixed_point", 1e-6).encode(data)
+        assert delta["position"].itemsize < absolute["position"].itemsize
+
+    @pytest.mark.parametrize("delta_fields", [(), ("position",)])
+    def test_float16(self, delta_fields):
+        data = make_trajectory()
+        encoded = TrajectoryCompression("float16", delta_fields=delta_fields).encode(
+            data
+        )
+        assert encoded["position"].dtype == np.float16
+        decoded = decompress(encoded)
+        # Relative error bound of float16, and absolute error bound of subnormals
+        error_bound = 2.0**-11 * np.abs(data["velocity"]) + 2.0**-25
+        assert np.all(np.abs(decoded["velocity"] - data["velocity"]) <= error_bound)
+        # Closed loop delta encoding does not accumulate errors over time
+        position_error = np.abs(decoded["position"] - data["position"])
+        assert np.max(position_error) <= 2.0**-11 * np.max(np.abs(data["position"]))
+
+    @pytest.mark.parametrize("directors", ["rotation_vector", "quaternion"])
+    def test_directors_representation(self, directors):
+        data = make_trajectory()
+        encoded = TrajectoryCompression(
+            "fixed_point", 1e-7, directors=directors
+        ).encode(data)
+        n_components = 3 if directors == "rotation_vector" else 4
+        assert encoded["directors"].shape == (20, n_components, 12)
+        decoded = decompress(encoded)
+        assert decoded["directors"].shape == data["directors"].shape
+        assert_allclose(decoded["directors"], data["directors"], atol=1e-6)
+
+    def test_node_stride(self):
+        data = make_trajectory()
+        decoded = decompress(TrajectoryCompression(node_stride=3).encode(data))
+        assert_array_equal(decoded["position"], data["position"][..., ::3])
+        assert_array_equal(decoded["directors"], data["directors"][..., ::3])
+        assert_array_equal(decoded["step"], data["step"])
+
+    def test_report(self):
+        data = make_trajectory()
+        report = TrajectoryCompression(
+            "fixed_point", 1e-5, directors="quaternion"
+        ).report(data)
+        assert report["compression_ratio"] > 2.0
+        assert report["encode_throughput"] > 0.0
+        assert set(report["max_error"]) == {"position", "velocity", "directors"}
+        assert report["max_error"]["position"] <= 1e-5 * (1.0 + 1e-9)
+
+    def test_decompress_uncompressed_data(self):
+        data = make_trajectory()
+        decoded = decompress(data)
+        assert_array_equal(decoded["position"], data["position"])
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"quantization": "int4"},
+            {"directors": "euler"},
+            {"tolerance": 0.0},
+            {"node_stride": 0},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(AssertionError):
+            TrajectoryCompression(**kwargs)
+
+
+class TestExportCallBackWithCompression:
+    class MockRod:
+        def __init__(self, n_elems):
+            rng = np.random.default_rng(1)
+            self.position_collection = rng.standard_normal((3, n_elems + 1))
+            self.velocity_collection = rng.standard_normal((3, n_elems + 1))
+            self.director_collection = np.tile(np.eye(3)[:, :, None], (1, 1, n_elems))
+
+    @pytest.mark.parametrize("method", ["npz", "pickle"])
+    @pytest.mark.parametrize("asynchronous", [False, True])
+    def test_export_with_compression(self, tmp_path, method, asynchronous):
+        mock_rod = self.MockRod(8)
+        callback = ExportCallBack(
+            1,
+            "rod",
+            tmp_path.as_posix(),
+            method,
+            asynchronous=asynchronous,
+            compression=TrajectoryCompression(
+                "fixed_point", 1e-6, directors="quaternion"
+            ),
+        )
+        positions = []
+        for step in range(10):
+            mock_rod.position_collection += 1e-3
+            positions.append(mock_rod.position_collection.copy())
+            callback.make_callback(mock_rod, 0.1 * step, step)
+        callback.close()
+
+        saved_path = callback.get_last_saved_path()
+        assert os.path.exists(saved_path)
+        if method == "npz":
+            with np.load(saved_path) as data:
+                assert "position_keyframe" in data
+                decoded = decompress(data)
+        else:
+            with open(saved_path, "rb") as file:
+                decoded = decompress(pickle.load(file))
+        assert np.max(np.abs(decoded["position"] - np.array(positions))) <= 1e-6
+        assert_allclose(
+            decoded["directors"], np.array([mock_rod.director_collection] * 10)
+        )
+        assert_array_equal(decoded["step"], np.arange(10))
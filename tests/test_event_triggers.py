@@ -0,0 +1,156 @@
+__doc__ = """ Test event triggers """
+import numpy as np
+import pytest
+
+from elastica.event_triggers import (
+    TriggerBase,
+    NodalSpeedTrigger,
+    KineticEnergyChangeTrigger,
+    RegionTrigger,
+    PlanePenetrationTrigger,
+)
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from tests.analytical import make_cosserat_rod
+
+
+def make_rod(n_elems=6, offset=0.0):
+    return make_cosserat_rod(n_elems, [offset, 0.0, 0.0], base_radius=0.1)
+
+
+def make_block():
+    rods = [make_rod(4, 1.0), make_rod(5, 2.0), make_rod(6, 3.0)]
+    return MemoryBlockCosseratRod(rods, [0, 1, 2]), rods
+
+
+def test_trigger_base():
+    assert not TriggerBase()(make_rod(), np.float64(0.0), 0)
+
+
+class TestNodalSpeedTrigger:
+    def test_nodal_speed(self):
+        rod = make_rod()
+        trigger = NodalSpeedTrigger(max_speed=1.0)
+        assert not trigger(rod, np.float64(0.0), 0)
+        rod.velocity_collection[:, 3] = [0.6, 0.6, 0.6]
+        assert trigger(rod, np.float64(0.0), 1)
+
+    def test_nodal_speed_in_memory_block(self):
+        block, rods = make_block()
+        trigger = NodalSpeedTrigger(max_speed=1.0)
+        # Ghost nodes are ignored
+        block.velocity_collection[:, block.ghost_nodes_idx] = 10.0
+        assert not trigger(block, np.float64(0.0), 0)
+        rods[2].velocity_collection[0, -1] = 2.0
+        assert trigger(block, np.float64(0.0), 1)
+
+
+class TestKineticEnergyChangeTrigger:
+    def test_kinetic_energy(self):
+        rod = make_rod()
+        trigger = KineticEnergyChangeTrigger(relative_change=0.5)
+        rod.velocity_collection[:] = 1.0
+        rod.omega_collection[:] = 2.0
+        # The first evaluation sets the reference energy
+        assert not trigger(rod, np.float64(0.0), 0)
+        assert np.isclose(
+            trigger.kinetic_energy,
+            rod.compute_translational_energy() + rod.compute_rotational_energy(),
+        )
+        rod.velocity_collection[:] *= 1.1
+        assert not trigger(rod, np.float64(0.0), 1)
+        rod.velocity_collection[:] *= 2.0
+        assert trigger(rod, np.float64(0.0), 2)
+        # Energy is compared to the last evaluation
+        assert not trigger(rod, np.float64(0.0), 3)
+
+        state = trigger.snapshot_state()
+        rod.velocity_collection[:] = 0.0
+        trigger(rod, np.float64(0.0), 4)
+        trigger.restore_state(state)
+        rod.velocity_collection[:] = 2.2
+        assert not trigger(rod, np.float64(0.0), 4)
+
+    def test_kinetic_energy_in_memory_block(self):
+        block, rods = make_block()
+        trigger = KineticEnergyChangeTrigger(relative_change=0.1)
+        for rod in rods:
+            rod.velocity_collection[:] = 1.0
+        trigger(block, np.float64(0.0), 0)
+        assert np.isclose(
+            trigger.kinetic_energy,
+            sum(rod.compute_translational_energy() for rod in rods),
+        )
+
+    def test_kinetic_energy_in_lean_memory_block(self):
+        energies = []
+        for lean_memory in [False, True]:
+            rods = [make_rod(4, 1.0), make_rod(5, 2.0)]
+            block = MemoryBlockCosseratRod(rods, [0, 1], lean_memory=lean_memory)
+            block.velocity_collection[:] = 1.0
+            block.omega_collection[:] = 2.0
+            trigger = KineticEnergyChangeTrigger(relative_change=0.1)
+            trigger(block, np.float64(0.0), 0)
+            assert trigger._diagonal_inertia == lean_memory
+            energies.append(trigger.kinetic_energy)
+        assert np.isclose(energies[0], energies[1], rtol=1e-12)
+
+    def test_absolute_change_of_system_at_rest(self):
+        rod = make_rod()
+        trigger = KineticEnergyChangeTrigger(relative_change=0.1, absolute_change=1e-8)
+        trigger(rod, np.float64(0.0), 0)
+        rod.velocity_collection[:] = 1e-6
+        assert not trigger(rod, np.float64(0.0), 1)
+        rod.velocity_collection[:] = 1.0
+        assert trigger(rod, np.float64(0.0), 2)
+
+
+class TestRegionTrigger:
+    def test_region(self):
+        rod = make_rod()
+        trigger = RegionTrigger([0.5, -1.0, 0.0], [1.5, 1.0, 1.0])
+        assert not trigger(rod, np.float64(0.0), 0)
+        rod.position_collection[0, 2] = 1.0
+        assert trigger(rod, np.float64(0.0), 1)
+
+    def test_region_in_memory_block(self):
+        block, rods = make_block()
+        # Ghost nodes are at the origin
+        trigger = RegionTrigger([-0.1, -0.1, -0.1], [0.1, 0.1, 0.1])
+        assert not trigger(block, np.float64(0.0), 0)
+        rods[1].position_collection[:, 0] = 0.0
+        assert trigger(block, np.float64(0.0), 1)
+
+    def test_invalid_region(self):
+        with pytest.raises(AssertionError):
+            RegionTrigger([1.0, 0.0, 0.0], [0.0, 1.0, 1.0])
+
+
+class TestPlanePenetrationTrigger:
+    @pytest.mark.parametrize("threshold", [0.0, 0.05])
+    def test_plane_penetration(self, threshold):
+        rod = make_rod()
+        # Rod along z, with a radius of 0.1
+        trigger = PlanePenetrationTrigger([-0.2, 0.0, 0.0], [2.0, 0.0, 0.0], threshold)
+        assert not trigger(rod, np.float64(0.0), 0)
+        rod.position_collection[0, 3:5] = -0.2 + 0.1 - threshold + 0.01
+        assert not trigger(rod, np.float64(0.0), 1)
+        rod.position_collection[0, 3:5] = -0.2 + 0.1 - threshold - 0.01
+        assert trigger(rod, np.float64(0.0), 2)
+
+    def test_plane_penetration_in_memory_block(self):
+        block, rods = make_block()
+        trigger = PlanePenetrationTrigger([0.5, 0.0, 0.0], [1.0, 0.0, 0.0])
+        # Ghost elements are ignored
+        block.radius[block.ghost_elems_idx] = 10.0
+        assert not trigger(block, np.float64(0.0), 0)
+        rods[0].position_collection[0, :] = 0.55
+        assert trigger(block, np.float64(0.0), 1)
+
+    def test_plane_penetration_of_rigid_body_throws(self):
+        from elastica.rigidbody import Sphere
+
+        sphere = Sphere(np.zeros(3), 0.1, 1000.0)
+        trigger = PlanePenetrationTrigger([0.5, 0.0, 0.0], [1.0, 0.0, 0.0])
+        with pytest.raises(TypeError) as excinfo:
+            trigger(sphere, np.float64(0.0), 0)
+        assert "requires a rod" in str(excinfo.value)
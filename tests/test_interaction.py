@@ -16,6 +16,7 @@ from elastica.contact_utils import (
 )
 
 from tests.test_rod.mock_rod import MockTestRod
+from tests.analytical import make_cosserat_rod
 
 
 class BaseRodClass(MockTestRod):
@@ -878,3 +879,387 @@ class TestSlenderBody:
         slender_body_theory.apply_forces(rod)
 
         assert_allclose(correct_forces, rod.external_forces, atol=Tolerance.atol())
+
+
+class TestRegularizedStokesletForces:
+    @staticmethod
+    def make_rod(start, direction, n_elem, rng):
+        rod = make_cosserat_rod(n_elem, start, direction, base_radius=0.02)
+        rod.velocity_collection[:] = rng.standard_normal((3, n_elem + 1))
+        return rod
+
+    @pytest.fixture
+    def load_block(self, rng):
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        n_rods = 12
+        rods = [
+            self.make_rod(
+                rng.random(3) * 2.0, rng.standard_normal(3), rng.randint(5, 15), rng
+            )
+            for _ in range(n_rods)
+        ]
+        return MemoryBlockCosseratRod(rods, list(range(n_rods))), rods
+
+    @staticmethod
+    def compute_forces(system, **kwargs):
+        from elastica.interaction import RegularizedStokesletForces
+
+        system.external_forces[:] = 0.0
+        kwargs.setdefault("dynamic_viscosity", 0.1)
+        kwargs.setdefault("regularization_length", 0.02)
+        RegularizedStokesletForces(**kwargs).apply_forces(system)
+        return system.external_forces.copy()
+
+    def test_element_body_index(self, load_block):
+        from elastica.interaction import _element_body_index
+
+        block, rods = load_block
+        element_body_index = _element_body_index(block)
+
+        assert np.all(element_body_index[block.ghost_elems_idx] == -1)
+        for k, rod in enumerate(rods):
+            assert np.all(
+                element_body_index[
+                    block.start_idx_in_rod_elems[k] : block.end_idx_in_rod_elems[k]
+                ]
+                == k
+            )
+
+    @pytest.mark.parametrize("method", ["direct", "tree"])
+    @pytest.mark.parametrize("n_elem", [2, 5, 20])
+    def test_isolated_rod_matches_slender_body_theory(self, n_elem, method, rng):
+        rod = self.make_rod(np.zeros(3), rng.standard_normal(3), n_elem, rng)
+
+        SlenderBodyTheory(dynamic_viscosity=0.1).apply_forces(rod)
+        correct_forces = rod.external_forces.copy()
+
+        assert_allclose(
+            self.compute_forces(rod, method=method), correct_forces, atol=1e-14
+        )
+
+    @pytest.mark.parametrize("method", ["direct", "tree"])
+    def test_far_apart_rods_match_slender_body_theory(self, method, rng):
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        rods = [
+            self.make_rod(np.zeros(3), rng.standard_normal(3), 10, rng)
+            for _ in range(3)
+        ]
+        correct_forces = []
+        for k, rod in enumerate(rods):
+            rod.position_collection[0] += 1e8 * k
+            SlenderBodyTheory(dynamic_viscosity=0.1).apply_forces(rod)
+            correct_forces.append(rod.external_forces.copy())
+        block = MemoryBlockCosseratRod(rods, list(range(3)))
+
+        self.compute_forces(block, method=method)
+        for rod, correct_force in zip(rods, correct_forces):
+            assert_allclose(rod.external_forces, correct_force, atol=1e-8)
+
+    def test_direct_summation(self, load_block):
+        from elastica.interaction import (
+            _element_body_index,
+            _regularized_stokeslet_velocity_direct,
+        )
+
+        block, _ = load_block
+        rng = np.random.default_rng(0)
+        position = rng.standard_normal((3, block.n_elems))
+        strength = rng.standard_normal((3, block.n_elems))
+        element_body_index = _element_body_index(block)
+        epsilon = 0.1
+
+        induced_velocity = np.empty((3, block.n_elems))
+        _regularized_stokeslet_velocity_direct(
+            position, strength, element_body_index, epsilon, induced_velocity
+        )
+
+        correct_velocity = np.zeros((3, block.n_elems))
+        for i in range(block.n_elems):
+            for j in range(block.n_elems):
+                if (
+                    element_body_index[i] < 0
+                    or element_body_index[j] < 0
+                    or element_body_index[i] == element_body_index[j]
+                ):
+                    continue
+                r = position[:, i] - position[:, j]
+                r_sq = r @ r
+                stokeslet = ((r_sq + 2 * epsilon**2) * np.eye(3) + np.outer(r, r)) / (
+                    r_sq + epsilon**2
+                ) ** 1.5
+                correct_velocity[:, i] += stokeslet @ strength[:, j]
+
+        assert_allclose(induced_velocity, correct_velocity, atol=1e-12)
+
+    @pytest.mark.parametrize("leaf_size", [1, 4, 32])
+    def test_tree_with_zero_opening_angle_is_exact(self, load_block, leaf_size):
+        block, _ = load_block
+        correct_forces = self.compute_forces(block, method="direct")
+
+        assert_allclose(
+            self.compute_forces(
+                block, method="tree", opening_angle=0.0, leaf_size=leaf_size
+            ),
+            correct_forces,
+            atol=1e-12,
+        )
+
+    def test_tree_error_decreases_with_opening_angle(self, load_block):
+        block, _ = load_block
+        correct_forces = self.compute_forces(block, method="direct")
+        scale = np.abs(correct_forces).max()
+
+        errors = [
+            np.abs(
+                self.compute_forces(
+                    block, method="tree", opening_angle=opening_angle, leaf_size=1
+                )
+                - correct_forces
+            ).max()
+            / scale
+            for opening_angle in [1.0, 0.5, 0.25]
+        ]
+        assert errors[0] < 0.1
+        assert errors[2] < 1e-2
+        assert errors[2] <= errors[1] <= errors[0]
+
+    def test_forces_on_ghost_nodes_are_zero(self, load_block):
+        block, _ = load_block
+        forces = self.compute_forces(block)
+
+        assert_allclose(forces[:, block.ghost_nodes_idx], 0.0, atol=1e-14)
+
+    @pytest.mark.parametrize("method", ["direct", "tree"])
+    def test_free_slots_are_skipped(self, load_block, method):
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        block, rods = load_block
+        block.release_systems([0], [rods[0]])
+        self.compute_forces(block, method=method)
+        forces = [rod.external_forces.copy() for rod in rods[1:]]
+
+        assert_allclose(block.external_forces[..., block._system_slice("node", 0)], 0.0)
+        block = MemoryBlockCosseratRod(rods[1:], list(range(1, len(rods))))
+        self.compute_forces(block, method=method)
+        for rod, force in zip(rods[1:], forces):
+            assert_allclose(rod.external_forces, force, atol=1e-12)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(method="fmm"),
+            dict(regularization_length=0.0),
+            dict(opening_angle=-1.0),
+            dict(leaf_size=0),
+        ],
+    )
+    def test_illegal_parameters_throw(self, kwargs):
+        from elastica.interaction import RegularizedStokesletForces
+
+        kwargs.setdefault("regularization_length", 0.02)
+        with pytest.raises(AssertionError):
+            RegularizedStokesletForces(dynamic_viscosity=0.1, **kwargs)
+
+
+class TestGriddedFlowForces:
+    @staticmethod
+    def make_rods(n_rods, rng):
+        rods = []
+        for _ in range(n_rods):
+            direction = rng.standard_normal(3)
+            rod = make_cosserat_rod(
+                rng.randint(3, 10),
+                direction=direction,
+                base_length=0.5,
+                base_radius=0.02,
+            )
+            rod.position_collection += rng.random((3, 1)) + 0.5
+            rod.velocity_collection[:] = rng.standard_normal(
+                rod.velocity_collection.shape
+            )
+            rods.append(rod)
+        return rods
+
+    @pytest.fixture(params=[1, 4])
+    def load_system(self, request, rng):
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        rods = self.make_rods(request.param, rng)
+        if len(rods) == 1:
+            return rods[0], rods
+        return MemoryBlockCosseratRod(rods, list(range(len(rods)))), rods
+
+    @staticmethod
+    def linear_field(grid, coefficients):
+        # coefficients: (4, 3), field = [x, y, z, 1] @ coefficients
+        x, y, z = np.meshgrid(grid, grid, grid, indexing="ij")
+        return np.stack([x, y, z, np.ones_like(x)], axis=-1) @ coefficients
+
+    @staticmethod
+    def element_centers(rod):
+        return 0.5 * (rod.position_collection[:, 1:] + rod.position_collection[:, :-1])
+
+    def test_interpolation_of_linear_field_is_exact(self, load_system, rng):
+        from elastica.interaction import GriddedFlowForces
+
+        system, rods = load_system
+        coefficients = rng.standard_normal((4, 3))
+        grid = np.linspace(-1.0, 3.0, 9)
+        forcing = GriddedFlowForces(
+            self.linear_field(grid, coefficients), np.full(3, -1.0), 0.5
+        )
+
+        forcing.interpolate(system)
+        for rod in rods:
+            centers = self.element_centers(rod)
+            correct_field = (
+                np.vstack([centers, np.ones(centers.shape[1])]).T @ coefficients
+            ).T
+            assert_allclose(
+                forcing.interpolate(rod), correct_field, atol=Tolerance.atol()
+            )
+
+    def test_interpolation_outside_grid_is_clamped(self):
+        from elastica.interaction import GriddedFlowForces
+
+        rod = self.make_rods(1, np.random.RandomState(0))[0]
+        rod.position_collection[0] += 100.0
+        field = np.zeros((2, 2, 2, 3))
+        field[1, ..., 0] = 1.0
+        forcing = GriddedFlowForces(field, np.zeros(3), 1.0)
+
+        interpolated_field = forcing.interpolate(rod)
+        assert_allclose(interpolated_field[0], 1.0)
+        assert_allclose(interpolated_field[1:], 0.0)
+
+    @pytest.mark.parametrize(
+        "time, correct_value",
+        [(-1.0, 1.0), (0.0, 1.0), (0.25, 1.5), (1.5, 4.0), (2.0, 5.0), (10.0, 5.0)],
+    )
+    def test_interpolation_in_time(self, time, correct_value):
+        from elastica.interaction import GriddedFlowForces
+
+        rod = self.make_rods(1, np.random.RandomState(0))[0]
+        field_time = np.array([0.0, 1.0, 2.0])
+        field = (
+            np.ones((3, 3, 3, 3, 3))
+            * np.array([1.0, 3.0, 5.0])[:, None, None, None, None]
+        )
+        forcing = GriddedFlowForces(field, np.zeros(3), 1.0, field_time=field_time)
+
+        assert_allclose(forcing.interpolate(rod, np.float64(time)), correct_value)
+
+    def test_drag_in_uniform_flow(self, load_system, rng):
+        from elastica.interaction import GriddedFlowForces
+
+        system, rods = load_system
+        flow_velocity = rng.standard_normal(3)
+        forcing = GriddedFlowForces(
+            np.ones((2, 2, 2, 3)) * flow_velocity,
+            np.zeros(3),
+            1.0,
+            normal_drag_coefficient=2.0,
+            tangential_drag_coefficient=0.5,
+        )
+        correct_forces = []
+        for rod in rods:
+            momentum = rod.mass * rod.velocity_collection
+            element_velocity = (momentum[:, 1:] + momentum[:, :-1]) / (
+                rod.mass[1:] + rod.mass[:-1]
+            )
+            relative_velocity = element_velocity - flow_velocity[:, None]
+            tangential_velocity = np.einsum("ik,ik->k", rod.tangents, relative_velocity)
+            element_forces = -rod.lengths * (
+                2.0 * relative_velocity
+                + (0.5 - 2.0) * tangential_velocity * rod.tangents
+            )
+            nodal_forces = np.zeros_like(rod.external_forces)
+            nodal_forces[:, :-1] += 0.5 * element_forces
+            nodal_forces[:, 1:] += 0.5 * element_forces
+            correct_forces.append(nodal_forces)
+
+        forcing.apply_forces(system)
+        for rod, correct_force in zip(rods, correct_forces):
+            assert_allclose(rod.external_forces, correct_force, atol=Tolerance.atol())
+
+    def test_free_slots_are_not_forced(self, rng):
+        from elastica.interaction import GriddedFlowForces
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        rods = self.make_rods(3, rng)
+        block = MemoryBlockCosseratRod(rods, list(range(3)))
+        forcing = GriddedFlowForces(
+            np.ones((2, 2, 2, 3)), np.zeros(3), 1.0, normal_drag_coefficient=1.0
+        )
+        forcing.apply_forces(block)
+        block.release_systems([1], [rods[1]])
+        block.external_forces[:] = 0.0
+
+        forcing.apply_forces(block)
+        assert_allclose(block.external_forces[..., block._system_slice("node", 1)], 0.0)
+        assert np.all(rods[0].external_forces != 0.0)
+
+    def test_default_tangential_drag_coefficient(self):
+        from elastica.interaction import GriddedFlowForces
+
+        forcing = GriddedFlowForces(
+            np.zeros((2, 2, 2, 3)), np.zeros(3), 1.0, normal_drag_coefficient=3.0
+        )
+        assert forcing.tangential_drag_coefficient == 1.5
+
+    def test_force_density_from_memory_mapped_file(self, load_system, tmp_path, rng):
+        from elastica.interaction import GriddedFlowForces
+
+        system, rods = load_system
+        force_density = rng.standard_normal(3)
+        file_name = tmp_path / "force_density.npy"
+        np.save(file_name, np.ones((4, 4, 4, 3), dtype=np.float32) * force_density)
+        forcing = GriddedFlowForces(
+            str(file_name), np.zeros(3), 1.0, field_type="force_density"
+        )
+
+        forcing.apply_forces(system)
+        for rod in rods:
+            assert_allclose(
+                rod.external_forces.sum(axis=1),
+                force_density.astype(np.float32) * rod.volume.sum(),
+                rtol=1e-6,
+            )
+        if len(rods) > 1:
+            assert_allclose(system.external_forces[:, system.ghost_nodes_idx], 0.0)
+
+    @pytest.mark.parametrize(
+        "shape, field_time",
+        [
+            ((2, 2, 2, 2), None),
+            ((2, 2, 2), None),
+            ((2, 2, 2, 2, 3), None),
+            ((2, 2, 2, 3), np.array([0.0, 1.0])),
+            ((3, 2, 2, 2, 3), np.array([0.0, 1.0])),
+        ],
+    )
+    def test_illegal_field_shape_throws(self, shape, field_time):
+        from elastica.interaction import GriddedFlowForces
+
+        with pytest.raises(AssertionError):
+            GriddedFlowForces(np.zeros(shape), np.zeros(3), 1.0, field_time=field_time)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(field_type="pressure"),
+            dict(spacing=0.0),
+            dict(normal_drag_coefficient=-1.0),
+            dict(tangential_drag_coefficient=-1.0),
+            dict(field_time=np.array([1.0, 0.0])),
+        ],
+    )
+    def test_illegal_parameters_throw(self, kwargs):
+        from elastica.interaction import GriddedFlowForces
+
+        kwargs.setdefault("spacing", 1.0)
+        field_shape = (2, 2, 2, 2, 3) if "field_time" in kwargs else (2, 2, 2, 3)
+        with pytest.raises(AssertionError):
+            GriddedFlowForces(np.zeros(field_shape), np.zeros(3), **kwargs)
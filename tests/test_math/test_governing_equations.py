@@ -373,6 +373,7 @@ class TestingClass:
             test_rod.internal_stress,
             test_rod.internal_forces,
             ghost_elems_idx=np.empty((0), dtype=np.int32),
+            element_workspace=test_rod.element_workspace,
         )
 
         assert_allclose(
@@ -539,6 +540,9 @@ class TestingClass:
             test_rod.dilatation_rate,
             test_rod.internal_torques,
             test_rod.ghost_voronoi_idx,
+            test_rod.J_omega_upon_e,
+            test_rod.element_workspace,
+            test_rod.voronoi_workspace,
         )
 
         assert_allclose(
@@ -626,6 +630,9 @@ class TestingClass:
             test_rod.dilatation_rate,
             test_rod.internal_torques,
             test_rod.ghost_voronoi_idx,
+            test_rod.J_omega_upon_e,
+            test_rod.element_workspace,
+            test_rod.voronoi_workspace,
         )
 
         assert_allclose(
@@ -697,6 +704,7 @@ class TestingClass:
             test_rod.internal_stress,
             test_rod.internal_forces,
             test_rod.ghost_elems_idx,
+            test_rod.element_workspace,
         )
 
         # Lets set angular velocity omega to arbitray numbers
@@ -726,6 +734,9 @@ class TestingClass:
             test_rod.dilatation_rate,
             test_rod.internal_torques,
             ghost_voronoi_idx=np.empty((0), dtype=np.int32),
+            J_omega_upon_e=test_rod.J_omega_upon_e,
+            element_workspace=test_rod.element_workspace,
+            voronoi_workspace=test_rod.voronoi_workspace,
         )
 
         # computed internal torques has to be zero. Internal torques created by Lagrangian
@@ -778,6 +789,9 @@ class TestingClass:
             test_rod.dilatation_rate,
             test_rod.internal_torques,
             test_rod.ghost_voronoi_idx,
+            test_rod.J_omega_upon_e,
+            test_rod.element_workspace,
+            test_rod.voronoi_workspace,
         )
 
         # Total internal torque has to be equal to angular velocity omega.
@@ -1171,6 +1185,7 @@ class TestingClass:
             test_rod.internal_stress,
             test_rod.internal_forces,
             test_rod.ghost_elems_idx,
+            test_rod.element_workspace,
         )
         test_shear_energy = test_rod.compute_shear_energy()
 
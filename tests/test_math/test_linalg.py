@@ -18,6 +18,12 @@ from elastica._linalg import (
     _batch_product_k_ik_to_ik,
     _batch_vector_sum,
     _batch_matrix_transpose,
+    _batch_matvec_into,
+    _batch_matmul_into,
+    _batch_cross_into,
+    _batch_dot_into,
+    _batch_norm_into,
+    _batch_matrix_transpose_into,
 )
 
 
@@ -195,3 +201,46 @@ def test_batch_matrix_transpose(blocksize, rng):
     correct_matrix_collection = np.einsum("ijk->jik", input_matrix_collection)
 
     assert_allclose(test_matrix_collection, correct_matrix_collection)
+
+
+@pytest.mark.parametrize("blocksize", [1, 8, 33])
+@pytest.mark.parametrize(
+    "kernel, kernel_into, input_shapes, output_shape",
+    [
+        (_batch_matvec, _batch_matvec_into, [(3, 3), (3,)], (3,)),
+        (_batch_matmul, _batch_matmul_into, [(3, 3), (3, 3)], (3, 3)),
+        (_batch_cross, _batch_cross_into, [(3,), (3,)], (3,)),
+        (_batch_dot, _batch_dot_into, [(3,), (3,)], ()),
+        (_batch_norm, _batch_norm_into, [(3,)], ()),
+        (_batch_matrix_transpose, _batch_matrix_transpose_into, [(3, 3)], (3, 3)),
+    ],
+)
+def test_batch_kernels_into_output(
+    blocksize, kernel, kernel_into, input_shapes, output_shape, rng
+):
+    inputs = [rng.standard_normal(shape + (blocksize,)) for shape in input_shapes]
+    output = np.full(output_shape + (blocksize,), np.nan)
+
+    kernel_into(*inputs, output)
+
+    assert_allclose(output, kernel(*inputs))
+
+
+@pytest.mark.parametrize(
+    "kernel, kernel_into, input_shapes, output_idx",
+    [
+        (_batch_matvec, _batch_matvec_into, [(3, 3), (3,)], 1),
+        (_batch_matmul, _batch_matmul_into, [(3, 3), (3, 3)], 0),
+        (_batch_matmul, _batch_matmul_into, [(3, 3), (3, 3)], 1),
+        (_batch_cross, _batch_cross_into, [(3,), (3,)], 0),
+        (_batch_cross, _batch_cross_into, [(3,), (3,)], 1),
+    ],
+)
+def test_batch_kernels_into_input(kernel, kernel_into, input_shapes, output_idx, rng):
+    blocksize = 16
+    inputs = [rng.standard_normal(shape + (blocksize,)) for shape in input_shapes]
+    correct_output = kernel(*inputs)
+
+    kernel_into(*inputs, inputs[output_idx])
+
+    assert_allclose(inputs[output_idx], correct_output)
@@ -337,6 +337,63 @@ def test_block_structure_dynamic_update(n_rods, rng):
     )  # omega collection
 
 
+@pytest.mark.parametrize(
+    "diagonal_material, lean_memory", [(True, False), (False, False), (True, True)]
+)
+def test_block_structure_time_step_does_not_allocate(diagonal_material, lean_memory):
+    """
+    This function is testing that time steps of memory blocks of rods do not
+    allocate arrays once they are in steady state: kernels write their temporaries
+    into the workspace of the block. Arrays allocated by numba kernels are traced
+    as well, so the memory peak during the steps is compared with the size of a
+    single (3, n_elems) array.
+    """
+    import tracemalloc
+    import elastica as ea
+
+    class Simulator(ea.BaseSystemCollection):
+        pass
+
+    simulator = Simulator()
+    n_rods, n_elems = 8, 200
+    for k in range(n_rods):
+        rod = ea.CosseratRod.straight_rod(
+            n_elems,
+            np.array([0.0, 0.0, float(k)]),
+            np.array([1.0, 0.0, 0.0]),
+            np.array([0.0, 0.0, 1.0]),
+            1.0,
+            0.05,
+            1000.0,
+            youngs_modulus=1e6,
+        )
+        rod.omega_collection[:] = 1.0
+        if not diagonal_material:
+            rod.shear_matrix[0, 1] = 1.0
+        simulator.append(rod)
+    simulator.finalize(lean_memory=lean_memory)
+    (block,) = simulator.block_systems()
+    assert block.diagonal_material_flag == lean_memory
+
+    time_stepper = ea.PositionVerlet()
+    time, dt = np.float64(0.0), np.float64(1e-5)
+    # Warm up, e.g. compilation of the kernels
+    for _ in range(3):
+        time = time_stepper.step(simulator, time, dt)
+
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(20):
+            time = time_stepper.step(simulator, time, dt)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak - start < 3 * n_rods * n_elems * np.dtype(np.float64).itemsize
+
+
 if __name__ == "__main__":
     from pytest import main
 
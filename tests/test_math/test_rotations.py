@@ -7,6 +7,7 @@ from numpy.testing import assert_allclose
 from elastica._rotations import (
     _get_rotation_matrix,
     _rotate,
+    _rotate_into,
     _inv_rotate,
 )
 
@@ -224,6 +225,25 @@ def test_rotate_correctness():
     )
 
 
+@pytest.mark.parametrize("scale", [0.0, 0.1, 1.0])
+def test_rotate_into_matches_rotate(scale, rng):
+    blocksize = 16
+    director_collection = _rotate(
+        np.tile(np.eye(3).reshape(3, 3, 1), blocksize),
+        1.0,
+        rng.standard_normal((3, blocksize)),
+    )
+    axis_collection = rng.standard_normal((3, blocksize))
+    axis_collection[:, 0] = 0.0
+
+    correct_director_collection = _rotate(director_collection, scale, axis_collection)
+    _rotate_into(director_collection, scale, axis_collection)
+
+    assert_allclose(
+        director_collection, correct_director_collection, atol=Tolerance.atol()
+    )
+
+
 def test_inv_rotate_correctness_simple_in_three_dimensions():
     # A rotation of 120 degrees about x=y=z gives
     # the permutation matrix P
@@ -3,8 +3,10 @@ from numpy.testing import assert_allclose
 
 
 from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from elastica.rod.cosserat_rod import CosseratRod
 import pytest
 from elastica.utils import Tolerance
+from tests.analytical import make_cosserat_rod
 
 
 class MockRod:
@@ -1050,3 +1052,84 @@ def test_periodic_boundary_one_ring_one_straight_rod():
         block_structure.end_idx_in_rod_voronoi,
         atol=Tolerance.atol(),
     )
+
+
+class TestPreallocatedStraightRods:
+    @staticmethod
+    def make_rods(n_rods, n_elements=6):
+        start = np.zeros((n_rods, 3))
+        start[:, 0] = np.arange(n_rods)
+        return CosseratRod.straight_rods(
+            n_elements,
+            start,
+            np.array([0.0, 0.0, 1.0]),
+            np.array([1.0, 0.0, 0.0]),
+            1.0,
+            0.1,
+            1000.0,
+            youngs_modulus=1e6,
+        )
+
+    @staticmethod
+    def copy_rods(rods):
+        return [
+            make_cosserat_rod(
+                rod.n_elems, rod.position_collection[:, 0].copy(), base_radius=0.1
+            )
+            for rod in rods
+        ]
+
+    @staticmethod
+    def assert_same_block(block, reference_block):
+        for name in ["mass", "position_collection", "director_collection", "sigma"]:
+            assert_allclose(block.__dict__[name], reference_block.__dict__[name])
+        assert_allclose(block.rest_kappa, reference_block.rest_kappa)
+        assert_allclose(block.bend_matrix, reference_block.bend_matrix)
+        assert_allclose(block.rate_collection, reference_block.rate_collection)
+
+    def test_block_uses_preallocated_memory(self):
+        rods = self.make_rods(4)
+        rods[1].velocity_collection[:] = 2.0
+        position = rods[2].position_collection
+        block = MemoryBlockCosseratRod(rods, list(range(4)))
+
+        assert block._preallocated_block is rods[0]._preallocated_block
+        # Rods are not copied
+        assert rods[2].position_collection is position
+        assert np.shares_memory(block.position_collection, position)
+        assert np.shares_memory(block.v_w_collection, rods[1].velocity_collection)
+        assert_allclose(
+            block.velocity_collection[:, block.start_idx_in_rod_nodes[1]], 2.0
+        )
+        reference_rods = self.copy_rods(rods)
+        reference_rods[1].velocity_collection[:] = 2.0
+        self.assert_same_block(
+            block, MemoryBlockCosseratRod(reference_rods, list(range(4)))
+        )
+
+    def test_reassigned_attributes_are_copied(self):
+        rods = self.make_rods(3)
+        rods[1].rest_kappa = np.full((3, rods[1].n_elems - 1), 0.2)
+        block = MemoryBlockCosseratRod(rods, list(range(3)))
+
+        assert block._preallocated_block is not None
+        assert np.shares_memory(block.rest_kappa, rods[1].rest_kappa)
+        assert_allclose(rods[1].rest_kappa, 0.2)
+        assert_allclose(rods[0].rest_kappa, 0.0)
+
+    @pytest.mark.parametrize("selection", [[1, 0, 2], [0, 1], [0, 1, 2, "other"]])
+    def test_other_systems_are_copied(self, selection):
+        rods = self.make_rods(3)
+        other_rod = self.make_rods(1, n_elements=4)[0]
+        systems = [other_rod if k == "other" else rods[k] for k in selection]
+        reference_block = MemoryBlockCosseratRod(
+            self.copy_rods(systems), list(range(len(systems)))
+        )
+        block = MemoryBlockCosseratRod(systems, list(range(len(systems))))
+
+        assert block._preallocated_block is None
+        for system in systems:
+            assert np.shares_memory(
+                block.position_collection, system.position_collection
+            )
+        self.assert_same_block(block, reference_block)
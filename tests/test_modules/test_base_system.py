@@ -10,6 +10,7 @@ from elastica.modules import (
     Connections,
     CallBacks,
 )
+from tests.analytical import make_cosserat_rod
 
 
 class TestBaseSystemCollection:
@@ -150,6 +151,32 @@ class TestBaseSystemCollection:
         del load_collection[0]
         assert load_collection[0] == 3
 
+    def test_get_sys_index_follows_changes_of_the_collection(self, mock_rod):
+        MockRod = mock_rod.__class__
+        rods = [MockRod() for _ in range(5)]
+        bsc = BaseSystemCollection()
+        bsc.extend(rods[:3])
+        assert [bsc.get_system_index(rod) for rod in rods[:3]] == [0, 1, 2]
+
+        bsc.insert(0, rods[3])
+        assert bsc.get_system_index(rods[0]) == 1
+        assert bsc.get_system_index(rods[3]) == 0
+        del bsc[1]
+        assert bsc.get_system_index(rods[1]) == 1
+        with pytest.raises(ValueError):
+            bsc.get_system_index(rods[0])
+        bsc[1] = rods[4]
+        assert bsc.get_system_index(rods[4]) == 1
+        with pytest.raises(ValueError):
+            bsc.get_system_index(rods[1])
+
+    def test_get_sys_index_of_system_appended_twice(self, mock_rod):
+        bsc = BaseSystemCollection()
+        bsc.append(mock_rod)
+        bsc.append(mock_rod.__class__())
+        bsc.append(mock_rod)
+        assert bsc.get_system_index(mock_rod) == 0
+
 
 class GenericSimulatorClass(
     BaseSystemCollection, Constraints, Forcing, Connections, CallBacks
@@ -245,3 +272,382 @@ class TestBaseSystemWithFeaturesUsingCosseratRod:
 
         # TODO: this is a dummy test for apply_callbacks find a better way to test them
         simulator_class.apply_callbacks(time=0, current_step=0)
+
+    def test_finalize_timings(self, load_collection):
+        simulator_class, rod = load_collection
+        assert simulator_class.finalize_timings == {}
+        simulator_class.finalize()
+        assert set(simulator_class.finalize_timings) == {
+            "memory_blocks",
+            "constraints",
+            "forcing",
+            "connections",
+            "callback",
+        }
+        assert all(
+            timing >= 0.0 for timing in simulator_class.finalize_timings.values()
+        )
+
+    @pytest.mark.parametrize("gc_enabled", [True, False])
+    def test_finalize_keeps_garbage_collector_state(self, load_collection, gc_enabled):
+        import gc
+
+        simulator_class, rod = load_collection
+        gc_was_enabled = gc.isenabled()
+        if gc_enabled:
+            gc.enable()
+        else:
+            gc.disable()
+        try:
+            simulator_class.finalize()
+            assert gc.isenabled() == gc_enabled
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+            else:
+                gc.disable()
+
+
+class TestSnapshotAndRestore:
+    from elastica.external_forces import NoForces
+
+    class StatefulForce(NoForces):
+        """Force whose magnitude grows every time it is applied"""
+
+        def __init__(self):
+            self.n_calls = 0
+
+        def apply_forces(self, system, time=np.float64(0.0)):
+            self.n_calls += 1
+            system.external_forces[1, -1] += 1e-3 * self.n_calls
+
+        def snapshot_state(self):
+            return self.n_calls
+
+        def restore_state(self, state):
+            self.n_calls = state
+
+    @pytest.fixture(scope="function")
+    def load_simulator(self):
+        from collections import defaultdict
+        import elastica as ea
+
+        simulator_class = GenericSimulatorClass()
+        systems = [
+            ea.CosseratRod.straight_rod(
+                8,
+                np.zeros(3),
+                np.array([0.0, 0.0, 1.0]),
+                np.array([1.0, 0.0, 0.0]),
+                base_length=1.0,
+                base_radius=0.05,
+                density=1000.0,
+                youngs_modulus=1e5,
+            ),
+            ea.Sphere(np.array([1.0, 0.0, 0.0]), 0.1, 1000.0),
+        ]
+        callback_params = defaultdict(list)
+        for system in systems:
+            simulator_class.append(system)
+            simulator_class.add_forcing_to(system).using(
+                ea.GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+            )
+        simulator_class.add_forcing_to(systems[0]).using(self.StatefulForce)
+        simulator_class.collect_diagnostics(systems[0]).using(
+            ea.MyCallBack, step_skip=5, callback_params=callback_params
+        )
+        simulator_class.finalize()
+        return simulator_class, systems, callback_params
+
+    @staticmethod
+    def rollout(simulator_class, time, n_steps):
+        import elastica as ea
+
+        stepper = ea.PositionVerlet()
+        for _ in range(n_steps):
+            time = stepper.step(simulator_class, time, np.float64(1e-4))
+        return time
+
+    def test_rollout_and_rewind(self, load_simulator):
+        simulator_class, systems, callback_params = load_simulator
+        time = self.rollout(simulator_class, np.float64(0.0), 20)
+        snapshot = simulator_class.snapshot(time=time)
+        assert len(callback_params["step"]) == 5
+
+        end_time = self.rollout(simulator_class, time, 30)
+        positions = [system.position_collection.copy() for system in systems]
+        recorded_steps = list(callback_params["step"])
+
+        for _ in range(3):
+            restart_time = simulator_class.restore(snapshot)
+            assert restart_time == time
+            assert callback_params["step"] == [0, 5, 10, 15, 20]
+            assert self.rollout(simulator_class, restart_time, 30) == end_time
+            for system, position in zip(systems, positions):
+                np.testing.assert_array_equal(system.position_collection, position)
+            assert callback_params["step"] == recorded_steps
+
+    def test_snapshot_into_preallocated_slot(self, load_simulator):
+        simulator_class, systems, _ = load_simulator
+        snapshot = simulator_class.snapshot()
+        arrays = list(snapshot.arrays)
+        position = systems[0].position_collection.copy()
+
+        self.rollout(simulator_class, np.float64(0.0), 10)
+        assert simulator_class.snapshot(out=snapshot) is snapshot
+        assert all(a is b for a, b in zip(snapshot.arrays, arrays))
+        assert not np.array_equal(snapshot.arrays[0][:, :9], position)
+
+    def test_rest_state(self, load_simulator):
+        simulator_class, systems, _ = load_simulator
+        snapshot = simulator_class.snapshot(rest_state=True)
+        systems[0].rest_kappa[0] = 1.0
+        simulator_class.restore(snapshot)
+        np.testing.assert_array_equal(systems[0].rest_kappa, 0.0)
+
+    def test_register_state(self, load_simulator):
+        simulator_class, _, _ = load_simulator
+        from elastica.callback_functions import MyCallBack
+
+        # StatefulForce and MyCallBack are registered at finalize
+        assert {type(operator) for operator in simulator_class._stateful_operators} == {
+            self.StatefulForce,
+            MyCallBack,
+        }
+        stateful = self.StatefulForce()
+        simulator_class.register_state(stateful)
+        simulator_class.register_state(stateful)
+        assert simulator_class._stateful_operators[-1] is stateful
+        assert len(simulator_class._stateful_operators) == 3
+
+        snapshot = simulator_class.snapshot()
+        stateful.n_calls = 10
+        simulator_class.restore(snapshot)
+        assert stateful.n_calls == 0
+
+        with pytest.raises(AssertionError) as excinfo:
+            simulator_class.register_state(object())
+        assert "does not implement" in str(excinfo.value)
+
+    def test_restore_snapshot_of_other_collection_throws(self, load_simulator):
+        simulator_class, _, _ = load_simulator
+        snapshot = simulator_class.snapshot()
+        simulator_class.register_state(self.StatefulForce())
+        with pytest.raises(AssertionError) as excinfo:
+            simulator_class.restore(snapshot)
+        assert "not taken from this system collection" in str(excinfo.value)
+
+
+class TestRetireAndAddSystems:
+    import elastica as ea
+
+    class SimulatorClass(
+        BaseSystemCollection, Constraints, Forcing, Connections, CallBacks, ea.Damping
+    ):
+        pass
+
+    @staticmethod
+    def make_rod(x, n_elements=10):
+        return make_cosserat_rod(n_elements, [x, 0.0, 0.0], youngs_modulus=1e5)
+
+    @staticmethod
+    def add_features(simulator_class, rod):
+        import elastica as ea
+
+        simulator_class.add_forcing_to(rod).using(
+            ea.GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+        )
+        simulator_class.constrain(rod).using(
+            ea.OneEndFixedBC,
+            constrained_position_idx=(0,),
+            constrained_director_idx=(0,),
+        )
+        simulator_class.dampen(rod).using(
+            ea.AnalyticalLinearDamper, damping_constant=0.1, time_step=1e-4
+        )
+
+    def build(self, xs):
+        simulator_class = self.SimulatorClass()
+        rods = [self.make_rod(x) for x in xs]
+        for rod in rods:
+            simulator_class.append(rod)
+            self.add_features(simulator_class, rod)
+        return simulator_class, rods
+
+    @staticmethod
+    def rollout(simulator_class, n_steps=100):
+        import elastica as ea
+
+        stepper = ea.PositionVerlet()
+        time = np.float64(0.0)
+        for _ in range(n_steps):
+            time = stepper.step(simulator_class, time, np.float64(1e-4))
+
+    def test_retire(self):
+        from collections import defaultdict
+        import elastica as ea
+
+        reference, reference_rods = self.build([0.0, 2.0])
+        reference.finalize()
+        self.rollout(reference)
+
+        simulator_class, rods = self.build([0.0, 1.0, 2.0])
+        callback_params = defaultdict(list)
+        simulator_class.collect_diagnostics(rods[1]).using(
+            ea.MyCallBack, step_skip=1, callback_params=callback_params
+        )
+        simulator_class.connect(rods[0], rods[1]).using(
+            ea.FixedJoint, k=1e3, nu=0.0, kt=1e2
+        )
+        simulator_class.finalize()
+        position = rods[1].position_collection.copy()
+
+        simulator_class.retire(rods[1])
+        assert simulator_class.is_retired(rods[1])
+        assert not simulator_class.is_retired(rods[0])
+        assert simulator_class.get_system_index(rods[2]) == 2
+        self.rollout(simulator_class)
+
+        # Retired rod is detached from the block, and its slot is left at rest.
+        np.testing.assert_array_equal(rods[1].position_collection, position)
+        (block,) = simulator_class.block_systems()
+        slot = slice(block.start_idx_in_rod_nodes[1], block.end_idx_in_rod_nodes[1])
+        np.testing.assert_array_equal(block.position_collection[:, slot], position)
+        np.testing.assert_array_equal(block.velocity_collection[:, slot], 0.0)
+        assert callback_params["step"] == [0]
+        for rod, reference_rod in zip(rods[::2], reference_rods):
+            np.testing.assert_array_equal(
+                rod.position_collection, reference_rod.position_collection
+            )
+
+        with pytest.raises(AssertionError) as excinfo:
+            simulator_class.retire(rods[1])
+        assert "already retired" in str(excinfo.value)
+        with pytest.raises(AssertionError) as excinfo:
+            simulator_class.retire(block)
+        assert "Memory blocks cannot be retired" in str(excinfo.value)
+
+    def test_additions_match_systems_appended_before_finalize(self):
+        reference, reference_rods = self.build([0.0, 1.0, 2.0])
+        reference.finalize()
+        self.rollout(reference)
+
+        simulator_class, rods = self.build([0.0, 2.0])
+        simulator_class.finalize()
+        with simulator_class.additions():
+            rods.insert(1, self.make_rod(1.0))
+            simulator_class.append(rods[1])
+            self.add_features(simulator_class, rods[1])
+        assert len(list(simulator_class.block_systems())) == 2
+        self.rollout(simulator_class)
+
+        for rod, reference_rod in zip(rods, reference_rods):
+            np.testing.assert_array_equal(
+                rod.position_collection, reference_rod.position_collection
+            )
+
+    def test_lean_memory_matches_default(self):
+        reference, reference_rods = self.build([0.0, 1.0, 2.0])
+        reference.finalize()
+        self.rollout(reference)
+
+        simulator_class, rods = self.build([0.0, 1.0, 2.0])
+        simulator_class.finalize(lean_memory=True)
+        (block,) = simulator_class.block_systems()
+        assert block.lean_memory
+        # Rods added in a free slot are stored in lean memory mode too.
+        simulator_class.retire(rods[1])
+        rods[1] = self.make_rod(1.0)
+        with simulator_class.additions():
+            simulator_class.append(rods[1])
+            self.add_features(simulator_class, rods[1])
+        assert "sigma" not in rods[1].__dict__
+        self.rollout(simulator_class)
+
+        for rod, reference_rod in zip(rods, reference_rods):
+            np.testing.assert_array_equal(
+                rod.position_collection, reference_rod.position_collection
+            )
+
+    def test_added_rod_takes_free_slot(self):
+        simulator_class, rods = self.build([0.0, 1.0])
+        simulator_class.finalize()
+        (block,) = simulator_class.block_systems()
+        simulator_class.retire(rods[1])
+
+        rod = self.make_rod(1.0)
+        with simulator_class.additions():
+            simulator_class.append(rod)
+            self.add_features(simulator_class, rod)
+        assert list(simulator_class.block_systems()) == [block]
+        assert block.system_idx_list.tolist() == [0, 3]
+        assert np.shares_memory(rod.position_collection, block.position_collection)
+
+        self.rollout(simulator_class, 10)
+        # The rod is fixed at the origin and falls under gravity.
+        np.testing.assert_array_equal(rod.position_collection[:, 0], [1.0, 0.0, 0.0])
+        assert np.all(rod.velocity_collection[1, 1:] < 0.0)
+
+    def test_added_slots_are_doubled(self):
+        simulator_class, _ = self.build([0.0])
+        simulator_class.finalize()
+        for x in range(1, 8):
+            with simulator_class.additions():
+                simulator_class.append(self.make_rod(float(x)))
+        # The number of slots created after finalize is doubled at each growth.
+        blocks = list(simulator_class.block_systems())
+        assert [block.n_systems for block in blocks] == [1, 1, 1, 2, 4]
+        assert [idx for block in blocks for idx in block.system_idx_list] == [
+            0, 2, 4, 6, 8, 9, 11, 12, -1,
+        ]  # fmt: skip
+
+        with simulator_class.additions():
+            simulator_class.append(self.make_rod(8.0, n_elements=5))
+        assert list(simulator_class.block_systems())[-1].n_elems == 5
+
+    def test_add_and_retire_rigid_body(self):
+        import elastica as ea
+
+        simulator_class, _ = self.build([0.0])
+        sphere = ea.Sphere(np.array([1.0, 0.0, 0.0]), 0.1, 1000.0)
+        simulator_class.append(sphere)
+        simulator_class.finalize()
+        simulator_class.retire(sphere)
+
+        new_sphere = ea.Sphere(np.array([2.0, 0.0, 0.0]), 0.1, 1000.0)
+        with simulator_class.additions():
+            simulator_class.append(new_sphere)
+            simulator_class.add_forcing_to(new_sphere).using(
+                ea.GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+            )
+        self.rollout(simulator_class, 10)
+        np.testing.assert_array_equal(sphere.position_collection[:, 0], [1, 0, 0])
+        np.testing.assert_allclose(
+            new_sphere.velocity_collection[:, 0], [0.0, -9.81e-3, 0.0]
+        )
+
+    def test_append_after_finalize_throws(self):
+        simulator_class, _ = self.build([0.0])
+        simulator_class.finalize()
+        with pytest.raises(AssertionError) as excinfo:
+            simulator_class.append(self.make_rod(1.0))
+        assert "within additions" in str(excinfo.value)
+
+    def test_additions_discard_systems_on_error(self):
+        simulator_class, _ = self.build([0.0])
+        simulator_class.finalize()
+        with pytest.raises(RuntimeError):
+            with simulator_class.additions():
+                simulator_class.append(self.make_rod(1.0))
+                raise RuntimeError()
+        assert len(simulator_class) == 2
+        assert not simulator_class._adding_systems
+
+    def test_restore_snapshot_taken_before_changes_throws(self):
+        simulator_class, rods = self.build([0.0, 1.0])
+        simulator_class.finalize()
+        snapshot = simulator_class.snapshot()
+        simulator_class.retire(rods[1])
+        with pytest.raises(AssertionError) as excinfo:
+            simulator_class.restore(snapshot)
+        assert "since the snapshot was taken" in str(excinfo.value)
@@ -199,3 +199,121 @@ class TestCallBacksMixin:
         assert spy.call_count == 1
         assert spy.call_args[1]["time"] == np.float64(0.0)
         assert spy.call_args[1]["current_step"] == 0
+
+    @pytest.fixture
+    def load_simulator_with_rods(self):
+        from elastica.modules import Constraints
+        from elastica.rod.cosserat_rod import CosseratRod
+
+        # Ring rods make Constraints a requisite module of every Cosserat rod.
+        class SystemCollectionWithCallBacksAndConstraints(
+            self.BaseSystemCollection, Constraints, CallBacks
+        ):
+            pass
+
+        sim = SystemCollectionWithCallBacksAndConstraints()
+        rods = [
+            CosseratRod.straight_rod(
+                4 + k,
+                np.zeros(3),
+                np.array([0.0, 0.0, 1.0]),
+                np.array([1.0, 0.0, 0.0]),
+                base_length=1.0,
+                base_radius=0.1,
+                density=1000.0,
+                youngs_modulus=1e6,
+            )
+            for k in range(3)
+        ]
+        for rod in rods:
+            sim.append(rod)
+        return sim, rods
+
+    def test_collect_block_diagnostics(self, load_simulator_with_rods):
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+
+        sim, rods = load_simulator_with_rods
+        recorded = []
+
+        class MockCallBack(self.CallBackBaseClass):
+            def make_callback(self, system, time, current_step):
+                recorded.append(system)
+
+        sim.collect_block_diagnostics(self.RodBase).using(MockCallBack)
+        sim.finalize()
+
+        # Callbacks are executed once during finalize
+        assert len(recorded) == 1
+        assert isinstance(recorded[0], MemoryBlockCosseratRod)
+
+    def test_collect_block_diagnostics_without_block_is_ignored(
+        self, load_simulator_with_rods, caplog
+    ):
+        from elastica.rigidbody import RigidBodyBase
+
+        sim, rods = load_simulator_with_rods
+        recorded = []
+
+        class MockCallBack(self.CallBackBaseClass):
+            def make_callback(self, system, time, current_step):
+                recorded.append(system)
+
+        sim.collect_block_diagnostics(RigidBodyBase).using(MockCallBack)
+        sim.finalize()
+        assert len(recorded) == 0
+        assert "No memory block" in caplog.text
+
+    def test_scheduled_callbacks_are_called_when_due(self, load_simulator_with_rods):
+        sim, rods = load_simulator_with_rods
+        calls = []
+
+        class EveryStepCallBack(self.CallBackBaseClass):
+            def make_callback(self, system, time, current_step):
+                calls.append(("every", current_step))
+
+        class PeriodicCallBack(self.CallBackBaseClass):
+            def __init__(self, name, period, last_step=np.inf):
+                self.name = name
+                self.period = period
+                self.last_step = last_step
+
+            def make_callback(self, system, time, current_step):
+                calls.append((self.name, current_step))
+
+            def next_callback_step(self, current_step):
+                next_step = -(-current_step // self.period) * self.period
+                return next_step if next_step <= self.last_step else None
+
+        sim.collect_diagnostics(rods[0]).using(PeriodicCallBack, "three", 3)
+        sim.collect_diagnostics(rods[1]).using(EveryStepCallBack)
+        sim.collect_diagnostics(rods[2]).using(PeriodicCallBack, "two", 2, 4)
+        sim.finalize()
+        for step in range(1, 8):
+            sim.apply_callbacks(time=np.float64(0.1 * step), current_step=step)
+
+        assert [step for name, step in calls if name == "every"] == list(range(8))
+        assert [step for name, step in calls if name == "three"] == [0, 3, 6]
+        # Callbacks returning None are not called anymore
+        assert [step for name, step in calls if name == "two"] == [0, 2, 4]
+        # Callbacks due on the same step are called in the order they were added
+        assert [name for name, step in calls if step == 0] == ["three", "two", "every"]
+        assert [name for name, step in calls if step == 6] == ["three", "every"]
+
+        # Callbacks are scheduled again when steps go back, e.g. on restart
+        calls.clear()
+        sim.apply_callbacks(time=np.float64(0.3), current_step=3)
+        sim.apply_callbacks(time=np.float64(0.3), current_step=3)
+        assert calls == [("three", 3), ("every", 3)] * 2
+
+    def test_scheduled_callbacks_skip_steps(self, load_simulator_with_rods):
+        from elastica.callback_functions import MyCallBack
+        from collections import defaultdict
+
+        sim, rods = load_simulator_with_rods
+        callback_params = defaultdict(list)
+        sim.collect_diagnostics(rods[0]).using(MyCallBack, 4, callback_params)
+        sim.finalize()
+        # Overdue callbacks are called once, on the next step they are applied on
+        for step in [1, 2, 9, 10, 11, 12]:
+            sim.apply_callbacks(time=np.float64(step), current_step=step)
+        assert callback_params["step"] == [0, 12]
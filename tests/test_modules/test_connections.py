@@ -341,6 +341,29 @@ class TestConnectionsMixin:
 
         assert not hasattr(system_collection_with_connections, "_connections")
 
+    def test_connect_pairs(self, load_system_with_connects):
+        system_collection_with_connections = load_system_with_connects
+        systems = list(system_collection_with_connections)
+        pairs = list(zip(systems[:-1], systems[1:]))
+
+        group = system_collection_with_connections.connect_pairs(
+            pairs, first_connect_idx=-1, second_connect_idx=0
+        ).using(self.FreeJoint, k=1.0, nu=0.0)
+        assert system_collection_with_connections._connections == list(group)
+        for (first_rod, second_rod), _connect in zip(pairs, group):
+            assert _connect.id() == (
+                system_collection_with_connections.get_system_index(first_rod),
+                system_collection_with_connections.get_system_index(second_rod),
+                -1,
+                0,
+            )
+            assert _connect._connect_cls == self.FreeJoint
+
+        system_collection_with_connections._finalize_connections()
+        assert len(
+            list(system_collection_with_connections._feature_group_synchronize)
+        ) == 2 * len(pairs)
+
     @pytest.fixture
     def load_rod_with_connects_and_indices(self, load_system_with_connects):
         system_collection_with_connections_and_indices = load_system_with_connects
@@ -5,6 +5,7 @@ import pytest
 
 from elastica.modules import Constraints
 from elastica.modules.constraints import _Constraint
+from tests.analytical import make_cosserat_rod
 
 
 class TestConstraint:
@@ -285,6 +286,18 @@ class TestConstraintsMixin:
         assert _mock_constraint in scwc._constraints_list
         assert _mock_constraint.__class__ == _Constraint
 
+    def test_constrain_many_registers_and_returns_Constraints(
+        self, load_system_with_constraints
+    ):
+        scwc = load_system_with_constraints
+        systems = list(scwc)
+
+        group = scwc.constrain_many(systems)
+        assert scwc._constraints_list == list(group)
+        for system, _constraint in zip(systems, group):
+            assert _constraint.__class__ == _Constraint
+            assert _constraint.id() == scwc.get_system_index(system)
+
     from elastica.boundary_conditions import ConstraintBase
 
     @pytest.fixture
@@ -350,3 +363,220 @@ class TestConstraintsMixin:
     def test_constrain_call_on_systems(self):
         # TODO Finish after the architecture is complete
         pass
+
+
+class TestConstraintsOnMemoryBlock:
+    from elastica.modules import BaseSystemCollection
+
+    class SystemCollectionWithConstraintsMixedin(BaseSystemCollection, Constraints):
+        pass
+
+    @staticmethod
+    def make_rods(n_elems, ring_rod_flags):
+        rng = np.random.default_rng(0)
+        rods = []
+        for n_elem, ring_rod_flag in zip(n_elems, ring_rod_flags):
+            direction = rng.standard_normal(3)
+            rods.append(
+                make_cosserat_rod(
+                    n_elem, rng.random(3), direction, ring_rod=ring_rod_flag
+                )
+            )
+        return rods
+
+    @staticmethod
+    def perturb(rods, seed):
+        rng = np.random.default_rng(seed)
+        for rod in rods:
+            rod.position_collection += rng.standard_normal(
+                rod.position_collection.shape
+            )
+            rod.director_collection[:] = np.linalg.qr(
+                rng.standard_normal((rod.n_elems, 3, 3))
+            )[0].transpose(1, 2, 0)
+            rod.velocity_collection[:] = rng.standard_normal(
+                rod.velocity_collection.shape
+            )
+            rod.omega_collection[:] = rng.standard_normal(rod.omega_collection.shape)
+
+    def run_constraints(self, n_elems, ring_rod_flags, registrations):
+        """Constrain the rods through the simulator and through each constraint alone."""
+        sim = self.SystemCollectionWithConstraintsMixedin()
+        rods = self.make_rods(n_elems, ring_rod_flags)
+        reference_rods = self.make_rods(n_elems, ring_rod_flags)
+        reference_constraints = []
+        for rod in rods:
+            sim.append(rod)
+        for rod_idx, constraint_cls, kwargs in registrations:
+            sim.constrain(rods[rod_idx]).using(constraint_cls, **kwargs)
+            reference_constraints.append(
+                (
+                    reference_rods[rod_idx],
+                    _Constraint(rod_idx)
+                    .using(constraint_cls, **kwargs)
+                    .instantiate(reference_rods[rod_idx]),
+                )
+            )
+        sim.finalize()
+        n_operators = len(list(sim._feature_group_constrain_values))
+
+        self.perturb(rods, seed=1)
+        self.perturb(reference_rods, seed=1)
+        time = np.float64(0.5)
+        sim.constrain_values(time)
+        sim.constrain_rates(time)
+        for rod, constraint in reference_constraints:
+            constraint.constrain_values(rod, time)
+        for rod, constraint in reference_constraints:
+            constraint.constrain_rates(rod, time)
+
+        for rod, reference_rod in zip(rods, reference_rods):
+            for attr in [
+                "position_collection",
+                "director_collection",
+                "velocity_collection",
+                "omega_collection",
+            ]:
+                assert_allclose(
+                    getattr(rod, attr), getattr(reference_rod, attr), atol=1e-14
+                )
+        return n_operators
+
+    def test_constraints_are_gathered_on_block(self):
+        from elastica.boundary_conditions import (
+            OneEndFixedBC,
+            FixedConstraint,
+            GeneralConstraint,
+        )
+
+        registrations = [
+            (
+                0,
+                OneEndFixedBC,
+                dict(constrained_position_idx=(0,), constrained_director_idx=(0,)),
+            ),
+            (
+                1,
+                FixedConstraint,
+                dict(constrained_position_idx=(0, -1), constrained_director_idx=(-1,)),
+            ),
+            (
+                2,
+                GeneralConstraint,
+                dict(
+                    constrained_position_idx=(1,),
+                    constrained_director_idx=(2, -2),
+                    translational_constraint_selector=np.array([True, False, True]),
+                    rotational_constraint_selector=np.array([False, True, False]),
+                ),
+            ),
+            (3, FixedConstraint, dict(constrained_director_idx=(1,))),
+        ]
+        n_operators = self.run_constraints([4, 6, 5, 7], [False] * 4, registrations)
+        assert n_operators == 1
+
+    def test_order_of_constraints_on_each_rod_is_kept(self):
+        from elastica.boundary_conditions import (
+            FixedConstraint,
+            GeneralConstraint,
+            HelicalBucklingBC,
+        )
+
+        helical_buckling = dict(
+            constrained_position_idx=(0, -1),
+            constrained_director_idx=(0, -1),
+            twisting_time=1.0,
+            slack=0.1,
+            number_of_rotations=2.0,
+        )
+        registrations = [
+            (0, HelicalBucklingBC, helical_buckling),
+            (0, FixedConstraint, dict(constrained_position_idx=(0,))),
+            (1, FixedConstraint, dict(constrained_position_idx=(-1,))),
+            (1, HelicalBucklingBC, helical_buckling),
+            (
+                1,
+                GeneralConstraint,
+                dict(
+                    constrained_position_idx=(-1,),
+                    constrained_director_idx=(-1,),
+                    translational_constraint_selector=np.array([False, False, True]),
+                ),
+            ),
+            (2, FixedConstraint, dict(constrained_director_idx=(0, 2))),
+        ]
+        self.run_constraints([4, 6, 5], [False] * 3, registrations)
+
+    def test_constraints_on_ring_rods(self):
+        from elastica.boundary_conditions import FixedConstraint
+
+        registrations = [
+            (0, FixedConstraint, dict(constrained_position_idx=(0,))),
+            (1, FixedConstraint, dict(constrained_position_idx=(3,))),
+            (2, FixedConstraint, dict(constrained_director_idx=(-1,))),
+        ]
+        n_operators = self.run_constraints(
+            [4, 6, 5], [False, True, True], registrations
+        )
+        # gathered constraint and periodic boundary synchronization
+        assert n_operators == 2
+
+    def test_prescribed_motion_drives_rod_in_block(self):
+        # The driven rod follows its trajectory and is skipped in the dynamics of
+        # the block, while the rods around it evolve as if it were not there.
+        from elastica.boundary_conditions import PrescribedMotion
+        from elastica.external_forces import GravityForces
+        from elastica.modules import BaseSystemCollection, Forcing
+        from elastica.timestepper.symplectic_steppers import PositionVerlet
+
+        class SystemCollection(BaseSystemCollection, Constraints, Forcing):
+            pass
+
+        def make_simulator(driven):
+            sim = SystemCollection()
+            rods = self.make_rods([4, 6, 5], [False] * 3)
+            for rod in rods:
+                sim.append(rod)
+                sim.add_forcing_to(rod).using(
+                    GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+                )
+            if driven:
+                times = np.array([0.0, 1.0])
+                positions = np.array(
+                    [rods[1].position_collection, rods[1].position_collection + 1.0]
+                )
+                directors = np.array([rods[1].director_collection] * 2)
+                sim.constrain(rods[1]).using(
+                    PrescribedMotion,
+                    times=times,
+                    positions=positions,
+                    directors=directors,
+                )
+            sim.finalize()
+            return sim, rods
+
+        reference_sim, reference_rods = make_simulator(driven=False)
+        sim, rods = make_simulator(driven=True)
+        (block,) = sim.block_systems()
+        np.testing.assert_array_equal(block.driven, [False, True, False])
+        assert [segment.n_systems for segment in block.awake_segments] == [1, 1]
+
+        initial_position = rods[1].position_collection.copy()
+        stepper = PositionVerlet()
+        time = np.float64(0.0)
+        for _ in range(20):
+            stepper.step(reference_sim, time, np.float64(1e-3))
+            time = stepper.step(sim, time, np.float64(1e-3))
+
+        assert_allclose(rods[1].position_collection, initial_position + time)
+        assert_allclose(rods[1].velocity_collection, 1.0)
+        assert_allclose(rods[1].internal_forces, 0.0)
+        for rod_idx in (0, 2):
+            assert_allclose(
+                rods[rod_idx].position_collection,
+                reference_rods[rod_idx].position_collection,
+            )
+            assert_allclose(
+                rods[rod_idx].velocity_collection,
+                reference_rods[rod_idx].velocity_collection,
+            )
@@ -225,6 +225,20 @@ class TestContactMixin:
         assert _mock_contact in system_collection_with_contacts._contacts
         assert _mock_contact.__class__ == _Contact
 
+    def test_detect_contact_between_pairs(self, load_system_with_contacts):
+        system_collection_with_contacts = load_system_with_contacts
+        systems = list(system_collection_with_contacts)
+        pairs = list(zip(systems[:-1], systems[1:]))
+
+        group = system_collection_with_contacts.detect_contact_between_pairs(pairs)
+        assert system_collection_with_contacts._contacts == list(group)
+        for (first_system, second_system), _contact in zip(pairs, group):
+            assert _contact.__class__ == _Contact
+            assert _contact.id() == (
+                system_collection_with_contacts.get_system_index(first_system),
+                system_collection_with_contacts.get_system_index(second_system),
+            )
+
     from elastica.contact_forces import NoContact
 
     @pytest.fixture
@@ -4,6 +4,7 @@ import pytest
 
 from elastica.modules import Damping
 from elastica.modules.damping import _Damper
+from tests.analytical import make_cosserat_rod
 
 
 class TestDamper:
@@ -157,6 +158,16 @@ class TestDampingMixin:
         assert _mock_damper in scwd._damping_list
         assert _mock_damper.__class__ == _Damper
 
+    def test_dampen_many_registers_and_returns_Dampers(self, load_system_with_dampers):
+        scwd = load_system_with_dampers
+        systems = list(scwd)
+
+        group = scwd.dampen_many(systems)
+        assert scwd._damping_list == list(group)
+        for system, _damper in zip(systems, group):
+            assert _damper.__class__ == _Damper
+            assert _damper.id() == scwd.get_system_index(system)
+
     from elastica.dissipation import DamperBase
 
     @pytest.fixture
@@ -205,3 +216,128 @@ class TestDampingMixin:
         for x, _ in scwd._dampers:
             assert num < x
             num = x
+
+
+class TestDampingOnMemoryBlock:
+    from elastica.modules import BaseSystemCollection, Constraints
+
+    class SystemCollectionWithDampingMixedin(
+        BaseSystemCollection, Constraints, Damping
+    ):
+        pass
+
+    @staticmethod
+    def make_rods(n_elems, ring_rod_flags, seed):
+        rng = np.random.default_rng(seed)
+        rods = []
+        for n_elem, ring_rod_flag in zip(n_elems, ring_rod_flags):
+            rod = make_cosserat_rod(n_elem, ring_rod=ring_rod_flag)
+            rod.velocity_collection[:] = rng.random(rod.velocity_collection.shape)
+            rod.omega_collection[:] = rng.random(rod.omega_collection.shape)
+            rods.append(rod)
+        return rods
+
+    @staticmethod
+    def make_damper(kind, rod):
+        from elastica.dissipation import (
+            AnalyticalLinearDamper,
+            LaplaceDissipationFilter,
+        )
+
+        if kind == "uniform":
+            return AnalyticalLinearDamper, dict(
+                uniform_damping_constant=2.0, time_step=0.1
+            )
+        if kind == "physical":
+            return AnalyticalLinearDamper, dict(
+                translational_damping_constant=rod.mass.mean(),
+                rotational_damping_constant=0.5
+                / rod.inv_mass_second_moment_of_inertia[0, 0].mean(),
+                time_step=0.1,
+            )
+        if kind == "deprecated":
+            return AnalyticalLinearDamper, dict(damping_constant=0.5, time_step=1e-4)
+        return LaplaceDissipationFilter, dict(filter_order=int(kind[-1]))
+
+    def run_damping(self, n_elems, ring_rod_flags, registrations):
+        """Dampen the rods through the simulator and through each damper alone."""
+        sim = self.SystemCollectionWithDampingMixedin()
+        rods = self.make_rods(n_elems, ring_rod_flags, seed=0)
+        reference_rods = self.make_rods(n_elems, ring_rod_flags, seed=0)
+        for rod in rods:
+            sim.append(rod)
+        for rod_idx, kind in registrations:
+            damper_cls, kwargs = self.make_damper(kind, rods[rod_idx])
+            sim.dampen(rods[rod_idx]).using(damper_cls, **kwargs)
+        sim.finalize()
+        n_operators = len(list(sim._feature_group_damping))
+        for rod, reference_rod in zip(rods, reference_rods):
+            reference_rod.velocity_collection[:] = rod.velocity_collection
+            reference_rod.omega_collection[:] = rod.omega_collection
+            rod.dilatation[:] = 1.0 + 0.1 * np.sin(np.arange(rod.n_elems))
+            reference_rod.dilatation[:] = rod.dilatation
+        sim.constrain_rates(np.float64(0.0))
+
+        for rod_idx, kind in registrations:
+            rod = reference_rods[rod_idx]
+            damper_cls, kwargs = self.make_damper(kind, rod)
+            damper_cls(_system=rod, **kwargs).dampen_rates(rod, np.float64(0.0))
+
+        for rod, reference_rod in zip(rods, reference_rods):
+            np.testing.assert_allclose(
+                rod.velocity_collection, reference_rod.velocity_collection, rtol=1e-13
+            )
+            np.testing.assert_allclose(
+                rod.omega_collection, reference_rod.omega_collection, rtol=1e-13
+            )
+        return n_operators
+
+    def test_analytical_dampers_are_fused(self):
+        registrations = list(
+            enumerate(["uniform", "physical", "deprecated", "uniform"])
+        )
+        n_operators = self.run_damping(
+            [4, 7, 5, 3], [False, False, False, True], registrations
+        )
+        assert n_operators == 1
+
+    def test_laplace_filters_with_same_order_are_fused(self):
+        registrations = [
+            (0, "laplace_3"),
+            (1, "laplace_5"),
+            (2, "laplace_3"),
+            (3, "laplace_5"),
+            (4, "laplace_3"),
+        ]
+        n_operators = self.run_damping([6, 9, 2, 4, 8], [False] * 5, registrations)
+        assert n_operators == 2
+
+    def test_laplace_filter_on_ring_rod_is_not_fused(self):
+        registrations = [(0, "laplace_3"), (1, "laplace_3"), (2, "laplace_3")]
+        n_operators = self.run_damping([6, 9, 8], [False, True, False], registrations)
+        assert n_operators == 2
+
+    def test_order_of_dampers_on_each_rod_is_kept(self):
+        registrations = [
+            (0, "physical"),
+            (0, "laplace_2"),
+            (1, "laplace_2"),
+            (1, "physical"),
+            (2, "laplace_2"),
+            (0, "uniform"),
+            (2, "deprecated"),
+        ]
+        self.run_damping([5, 6, 7], [False] * 3, registrations)
+
+    def test_undamped_rods_are_untouched(self):
+        registrations = [(1, "physical"), (3, "physical"), (1, "laplace_4")]
+        self.run_damping([5, 6, 7, 8], [False] * 4, registrations)
+
+    def test_dampers_registered_rod_by_rod_are_fused(self):
+        registrations = [
+            (rod_idx, kind)
+            for rod_idx in range(4)
+            for kind in ["physical", "laplace_3"]
+        ]
+        n_operators = self.run_damping([5, 6, 7, 8], [False] * 4, registrations)
+        assert n_operators == 2
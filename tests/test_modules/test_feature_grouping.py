@@ -1,4 +1,4 @@
-from elastica.modules.operator_group import OperatorGroupFIFO
+from elastica.modules.operator_group import OperatorGroupFIFO, ModuleGroup
 import functools
 
 
@@ -140,3 +140,107 @@ class TestOperatorGroupingWithCallableModules:
 
         assert op_a.value == 1
         assert op_b.value2 == -1
+
+
+class TestScheduleBlockFeatures:
+    class Feature:
+        def __init__(self, sys_idx, key=None, barrier=False):
+            self.sys_idx = sys_idx
+            self.key = key
+            self.barrier = barrier
+
+        def __repr__(self):
+            return f"Feature({self.sys_idx}, {self.key})"
+
+    @staticmethod
+    def schedule(features):
+        from elastica.modules.memory_block import schedule_block_features
+
+        return schedule_block_features(
+            features,
+            system_idx=lambda f: f.sys_idx,
+            fusion_key=lambda f: f.key,
+            is_barrier=lambda f: f.barrier,
+        )
+
+    def check_order_on_each_system(self, features, schedule):
+        applied = [
+            feature
+            for anchor, groups in schedule
+            for group in groups
+            for feature in group
+        ]
+        assert sorted(map(id, applied)) == sorted(map(id, features))
+        for sys_idx in {f.sys_idx for f in features}:
+            assert [f for f in applied if f.sys_idx == sys_idx] == [
+                f for f in features if f.sys_idx == sys_idx
+            ]
+        # Anchors never precede the features of their groups
+        position = {id(f): k for k, f in enumerate(features)}
+        anchors = [position[id(anchor)] for anchor, _ in schedule]
+        assert anchors == sorted(anchors)
+        for anchor, groups in schedule:
+            for group in groups:
+                assert all(position[id(f)] <= position[id(anchor)] for f in group)
+
+    def test_features_registered_system_by_system_are_fused(self):
+        F = self.Feature
+        features = [F(sys_idx, key) for sys_idx in range(4) for key in "ab"]
+        schedule = self.schedule(features)
+
+        assert [[len(group) for group in groups] for _, groups in schedule] == [
+            [4],
+            [4],
+        ]
+        self.check_order_on_each_system(features, schedule)
+
+    def test_features_without_key_are_not_fused(self):
+        F = self.Feature
+        features = [F(0, "a"), F(1), F(2), F(3, "a")]
+        schedule = self.schedule(features)
+
+        assert len(schedule) == 1
+        assert sorted(len(group) for group in schedule[0][1]) == [1, 1, 2]
+        self.check_order_on_each_system(features, schedule)
+
+    def test_barrier_is_not_reordered(self):
+        F = self.Feature
+        features = [F(0, "a"), F(1, "a"), F(9, barrier=True), F(2, "a"), F(0, "a")]
+        schedule = self.schedule(features)
+
+        assert [[len(group) for group in groups] for _, groups in schedule] == [
+            [2],
+            [1],
+            [2],
+        ]
+        assert schedule[1][0] is features[2]
+        self.check_order_on_each_system(features, schedule)
+
+    def test_order_with_random_registrations(self):
+        import random
+
+        random.seed(0)
+        F = self.Feature
+        for _ in range(50):
+            features = [
+                F(random.randrange(5), random.choice(["a", "b", None]))
+                for _ in range(random.randrange(1, 20))
+            ]
+            self.check_order_on_each_system(features, self.schedule(features))
+
+
+def test_module_group_using():
+    class Feature:
+        def using(self, cls, *args, **kwargs):
+            self.cls, self.args, self.kwargs = cls, args, kwargs
+            return self
+
+    features = [Feature() for _ in range(3)]
+    group = ModuleGroup(features)
+    assert group.using(int, 1, 2, base=3) is group
+    assert len(group) == 3
+    for feature, group_feature in zip(features, group):
+        assert group_feature is feature
+        assert feature.cls is int
+        assert feature.args == (1, 2)
+        assert feature.kwargs == {"base": 3}
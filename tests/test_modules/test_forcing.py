@@ -215,6 +215,20 @@ class TestForcingMixin:
             assert isinstance(x, int)
             assert isinstance(y, forcing_cls)
 
+    def test_add_forcing_to_many(self, load_system_with_forcings):
+        scwf = load_system_with_forcings
+        systems = list(scwf)[::-1]
+
+        group = scwf.add_forcing_to_many(systems).using(self.NoForces)
+        assert len(group) == len(systems)
+        assert scwf._ext_forces_torques == list(group)
+        for system, _forcing in zip(systems, group):
+            assert _forcing.id() == scwf.get_system_index(system)
+            assert _forcing._forcing_cls == self.NoForces
+
+        scwf._finalize_forcing()
+        assert len(list(scwf._feature_group_synchronize)) == 2 * len(systems)
+
     @pytest.mark.xfail
     def test_constrain_finalize_sorted(self, load_rod_with_forcings):
         scwf, forcing_cls = load_rod_with_forcings
@@ -227,6 +241,103 @@ class TestForcingMixin:
             assert num < x
             num = x
 
+    @pytest.fixture
+    def load_simulator_with_block_forcing(self):
+        from elastica.modules import Constraints
+        from elastica.rod.cosserat_rod import CosseratRod
+
+        # Ring rods make Constraints a requisite module of every Cosserat rod.
+        class SystemCollectionWithForcingAndConstraints(
+            self.BaseSystemCollection, Constraints, Forcing
+        ):
+            pass
+
+        sim = SystemCollectionWithForcingAndConstraints()
+        rods = [
+            CosseratRod.straight_rod(
+                5,
+                np.zeros(3),
+                np.array([0.0, 0.0, 1.0]),
+                np.array([1.0, 0.0, 0.0]),
+                base_length=1.0,
+                base_radius=0.1,
+                density=1000.0,
+                youngs_modulus=1e6,
+            )
+            for _ in range(3)
+        ]
+        for rod in rods:
+            sim.append(rod)
+
+        return sim, rods
+
+    def test_add_forcing_to_block_targets_memory_block(
+        self, load_simulator_with_block_forcing
+    ):
+        from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+        from elastica.rod.cosserat_rod import CosseratRod
+
+        sim, rods = load_simulator_with_block_forcing
+        applied_to = []
+
+        class MockForcing(self.NoForces):
+            def apply_forces(self, system, time=0.0):
+                applied_to.append(system)
+
+        sim.add_forcing_to_block(CosseratRod).using(MockForcing)
+        sim.finalize()
+        sim.synchronize(0.0)
+
+        assert len(applied_to) == 1
+        assert isinstance(applied_to[0], MemoryBlockCosseratRod)
+        assert applied_to[0] is sim[sim.get_system_index(applied_to[0])]
+
+    def test_add_forcing_to_block_ignores_free_slots(
+        self, load_simulator_with_block_forcing
+    ):
+        from elastica.rod.cosserat_rod import CosseratRod
+
+        sim, rods = load_simulator_with_block_forcing
+
+        class MockForcing(self.NoForces):
+            def apply_forces(self, system, time=0.0):
+                system.external_forces[:] = 1.0
+
+            def apply_torques(self, system, time=0.0):
+                system.external_torques[:] = 1.0
+
+        sim.add_forcing_to_block(CosseratRod).using(MockForcing)
+        sim.finalize()
+        (block,) = sim.block_systems()
+        sim.retire(rods[1])
+        sim.synchronize(0.0)
+
+        assert np.all(block.external_forces[..., block._system_slice("node", 1)] == 0)
+        assert np.all(
+            block.external_torques[..., block._system_slice("element", 1)] == 0
+        )
+        for rod in [rods[0], rods[2]]:
+            assert np.all(rod.external_forces == 1.0)
+            assert np.all(rod.external_torques == 1.0)
+
+    def test_add_forcing_to_block_without_block_is_ignored(
+        self, load_simulator_with_block_forcing
+    ):
+        from elastica.rigidbody import RigidBodyBase
+
+        sim, rods = load_simulator_with_block_forcing
+        applied_to = []
+
+        class MockForcing(self.NoForces):
+            def apply_forces(self, system, time=0.0):
+                applied_to.append(system)
+
+        sim.add_forcing_to_block(RigidBodyBase).using(MockForcing)
+        sim.finalize()
+        sim.synchronize(0.0)
+
+        assert len(applied_to) == 0
+
     def test_constrain_call_on_systems(self):
         # TODO Finish after the architecture is complete
         pass
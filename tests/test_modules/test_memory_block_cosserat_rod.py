@@ -8,6 +8,7 @@ from numpy.testing import assert_array_equal
 from elastica.rod import RodBase
 from elastica.modules.memory_block import construct_memory_block_structures
 from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from tests.analytical import make_cosserat_rod
 
 
 class BaseRodForTesting(RodBase):
@@ -228,3 +229,186 @@ def test_memory_block_rod(n_straight_rods, n_ring_rods):
                 memory_block.__dict__[attr_x],
                 memory_block.__dict__[attr_y],
             )
+
+
+def _make_cosserat_rods(n_straight_rods, n_ring_rods):
+    rods = [make_cosserat_rod(10 + k) for k in range(n_straight_rods)] + [
+        make_cosserat_rod(12 + k, ring_rod=True, base_length=2.0)
+        for k in range(n_ring_rods)
+    ]
+    rng = np.random.default_rng(0)
+    for rod in rods:
+        rod.position_collection += 1e-3 * rng.standard_normal(
+            rod.position_collection.shape
+        )
+        rod.velocity_collection[:] = rng.standard_normal(rod.velocity_collection.shape)
+        rod.omega_collection[:] = rng.standard_normal(rod.omega_collection.shape)
+        rod.external_forces[:] = rng.standard_normal(rod.external_forces.shape)
+        rod.external_torques[:] = rng.standard_normal(rod.external_torques.shape)
+    return rods
+
+
+@pytest.mark.parametrize("n_straight_rods, n_ring_rods", [(3, 0), (2, 2)])
+def test_memory_block_rod_stores_full_material_tensors(n_straight_rods, n_ring_rods):
+    """
+    Outside lean memory mode, material tensors are stored as full tensors, even if
+    they are diagonal, and the rods can modify them.
+    """
+    rods = _make_cosserat_rods(n_straight_rods, n_ring_rods)
+    memory_block = MemoryBlockCosseratRod(
+        systems=rods, system_idx_list=list(range(len(rods)))
+    )
+    assert not memory_block.diagonal_material_flag
+    for field in [
+        "mass_second_moment_of_inertia",
+        "inv_mass_second_moment_of_inertia",
+        "shear_matrix",
+        "bend_matrix",
+    ]:
+        assert field + "_diagonal" not in memory_block.__dict__
+        assert field + "_diagonal" not in rods[0].__dict__
+
+    rods[0].shear_matrix[2, 2, :] *= 2.0
+    rods[0].shear_matrix[0, 1, :] = 1.0
+    start = memory_block.start_idx_in_rod_elems[0]
+    end = memory_block.end_idx_in_rod_elems[0]
+    assert_array_equal(memory_block.shear_matrix[..., start:end], rods[0].shear_matrix)
+
+
+def test_memory_block_rod_diagonal_material_detection():
+    rods = _make_cosserat_rods(2, 0)
+    rods[1].shear_matrix[0, 1, 3] = 1.0
+    with pytest.raises(AssertionError):
+        MemoryBlockCosseratRod(systems=rods, system_idx_list=[0, 1], lean_memory=True)
+
+
+def test_memory_block_rod_lean_memory_only_stores_diagonals():
+    blocks = []
+    for scale_before_block in [False, True]:
+        rods = _make_cosserat_rods(2, 0)
+        if scale_before_block:
+            rods[1].shear_matrix[2, 2, :] *= 2.0
+        blocks.append(
+            (
+                MemoryBlockCosseratRod(
+                    systems=rods, system_idx_list=[0, 1], lean_memory=True
+                ),
+                rods,
+            )
+        )
+    (memory_block, rods), (reference_block, _) = blocks
+    assert memory_block.diagonal_material_flag
+    for field in [
+        "mass_second_moment_of_inertia",
+        "inv_mass_second_moment_of_inertia",
+        "shear_matrix",
+        "bend_matrix",
+    ]:
+        assert field not in memory_block.__dict__
+        assert field not in rods[1].__dict__
+
+    # Material tensors are rebuilt from their diagonals, and cannot be modified.
+    assert_array_equal(
+        np.einsum("iik->ik", rods[1].shear_matrix), rods[1].shear_matrix_diagonal
+    )
+    with pytest.raises(ValueError):
+        rods[1].shear_matrix[2, 2, :] *= 2.0
+
+    # Diagonals stored by the rods are views into the block.
+    rods[1].shear_matrix_diagonal[2] *= 2.0
+    for block in [memory_block, reference_block]:
+        block.compute_internal_forces_and_torques(np.float64(0.0))
+    assert_array_equal(memory_block.internal_forces, reference_block.internal_forces)
+
+
+@pytest.mark.parametrize("chunk_elems", [2**14, 15])
+def test_memory_block_rod_lean_memory_matches_default(monkeypatch, chunk_elems):
+    """
+    In lean memory mode, derived quantities are computed chunk by chunk into a
+    workspace, which must give the same rates as the default mode.
+    """
+    monkeypatch.setattr(MemoryBlockCosseratRod, "LEAN_MEMORY_CHUNK_ELEMS", chunk_elems)
+    rods_list = [_make_cosserat_rods(4, 0) for _ in range(2)]
+    default_block = MemoryBlockCosseratRod(rods_list[0], list(range(4)))
+    lean_block = MemoryBlockCosseratRod(rods_list[1], list(range(4)), lean_memory=True)
+    assert len(lean_block._lean_memory_chunks) == (1 if chunk_elems > 100 else 4)
+    if chunk_elems < 100:
+        # The workspace is smaller than the derived quantities it replaces.
+        assert (
+            lean_block.nbytes_per_element() < 0.9 * default_block.nbytes_per_element()
+        )
+    for field in ["sigma", "kappa", "shear_matrix", "mass_second_moment_of_inertia"]:
+        assert field not in lean_block.__dict__
+        assert field not in rods_list[1][0].__dict__
+
+    # Rods asleep are skipped in both modes
+    for block in (default_block, lean_block):
+        block.set_awake(np.array([True, False, True, True]))
+        block.compute_internal_forces_and_torques(np.float64(0.0))
+        block.update_accelerations(np.float64(0.0))
+    for attr in [
+        "internal_forces",
+        "internal_torques",
+        "acceleration_collection",
+        "alpha_collection",
+    ]:
+        assert_array_equal(lean_block.__dict__[attr], default_block.__dict__[attr])
+
+    # Derived quantities and material tensors are computed when they are read.
+    # Derived quantities stored by the rod asleep are not up to date.
+    for default_rod, lean_rod in zip(rods_list[0][::2], rods_list[1][::2]):
+        for attr in [
+            "sigma",
+            "kappa",
+            "internal_stress",
+            "internal_couple",
+            "dilatation_rate",
+            "voronoi_dilatation",
+            "mass_second_moment_of_inertia",
+            "inv_mass_second_moment_of_inertia",
+            "shear_matrix",
+            "bend_matrix",
+        ]:
+            np.testing.assert_allclose(
+                getattr(lean_rod, attr), getattr(default_rod, attr), rtol=1e-12
+            )
+        assert default_rod.compute_bending_energy() == pytest.approx(
+            lean_rod.compute_bending_energy(), rel=1e-12
+        )
+        with pytest.raises(ValueError):
+            lean_rod.shear_matrix[0, 0, 0] = 1.0
+
+
+def test_memory_block_rod_lean_memory_computes_requested_field(monkeypatch):
+    """
+    Reading a derived quantity in lean memory mode only runs the kernels it
+    depends on.
+    """
+    import elastica.rod.cosserat_rod as cosserat_rod
+
+    rods = _make_cosserat_rods(2, 0)
+    MemoryBlockCosseratRod(rods, [0, 1], lean_memory=True)
+    kappa = rods[0].kappa.copy()
+
+    def fail(*args):
+        raise AssertionError("Shear kernels must not run for bending quantities.")
+
+    for kernel in [
+        "_compute_all_dilatations",
+        "_compute_shear_stretch_strains",
+        "_compute_internal_shear_stretch_stresses_from_diagonal_model",
+    ]:
+        monkeypatch.setattr(cosserat_rod, kernel, fail)
+    assert_array_equal(rods[0].kappa, kappa)
+    assert rods[0].internal_couple.shape == kappa.shape
+
+
+def test_memory_block_rod_lean_memory_requirements():
+    rods = _make_cosserat_rods(2, 0)
+    rods[1].shear_matrix[0, 1, 3] = 1.0
+    with pytest.raises(AssertionError, match="diagonal material tensors"):
+        MemoryBlockCosseratRod(rods, [0, 1], lean_memory=True)
+
+    rods = _make_cosserat_rods(1, 1)
+    with pytest.raises(AssertionError, match="straight rods only"):
+        MemoryBlockCosseratRod(rods, [0, 1], lean_memory=True)
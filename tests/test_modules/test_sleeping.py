@@ -0,0 +1,268 @@
+__doc__ = """ Test sleeping of systems at rest """
+
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+import elastica as ea
+from elastica.external_forces import NoForces
+from tests.analytical import make_cosserat_rod
+from elastica.modules import (
+    BaseSystemCollection,
+    Connections,
+    Constraints,
+    Forcing,
+    Sleeping,
+)
+
+
+class SleepingSimulator(
+    BaseSystemCollection, Constraints, Connections, Forcing, Sleeping
+):
+    pass
+
+
+class SleepingFirstSimulator(
+    BaseSystemCollection, Sleeping, Constraints, Connections, Forcing
+):
+    pass
+
+
+class DelayedForce(NoForces):
+    """Force on the last node of the system from the given time on"""
+
+    def __init__(self, start_time, force):
+        self.start_time = start_time
+        self.force = force
+
+    def apply_forces(self, system, time=np.float64(0.0)):
+        if time >= self.start_time:
+            system.external_forces[:, -1] += self.force
+
+
+def make_rod(x_position):
+    return make_cosserat_rod(6, [x_position, 0.0, 0.0], youngs_modulus=1e5)
+
+
+def put_asleep(simulator, systems):
+    """Put the islands of the systems asleep, whether they are at rest or not"""
+    islands = simulator._sleeping_islands
+    # Loads on the systems are not known yet, so that they are not woken up by them.
+    islands.force_tolerance = np.inf
+    for system in systems:
+        island = islands.system_island[simulator.get_system_index(system)]
+        islands.island_asleep[island] = True
+    for slots in islands.blocks:
+        slots.put_asleep(
+            slots.awake_slots[islands.island_asleep[slots.island[slots.awake_slots]]]
+        )
+        slots.update_awake(islands.island_asleep, force=False)
+
+
+def run(simulator, n_steps, time=np.float64(0.0), dt=np.float64(1e-4)):
+    stepper = ea.PositionVerlet()
+    for _ in range(n_steps):
+        time = stepper.step(simulator, time, dt)
+    return time
+
+
+class TestSleeping:
+    def test_sleeping_disabled(self):
+        simulator = SleepingSimulator()
+        rod = make_rod(0.0)
+        simulator.append(rod)
+        simulator.finalize()
+        run(simulator, 20)
+
+        assert simulator.active_fraction == 1.0
+        assert not simulator.is_asleep(rod)
+
+    def test_enable_sleeping_after_finalize_throws(self):
+        simulator = SleepingSimulator()
+        simulator.append(make_rod(0.0))
+        simulator.finalize()
+
+        with pytest.raises(AssertionError) as excinfo:
+            simulator.enable_sleeping(1e-3, 1e-3)
+        assert "before finalize" in str(excinfo.value)
+
+    @pytest.mark.parametrize("lean_memory", [False, True])
+    @pytest.mark.parametrize("n_quiet_steps", [1, 10])
+    def test_systems_at_rest_fall_asleep(self, n_quiet_steps, lean_memory):
+        simulator = SleepingSimulator()
+        rods = [make_rod(float(i)) for i in range(3)]
+        for rod in rods:
+            simulator.append(rod)
+        simulator.add_forcing_to(rods[1]).using(
+            ea.GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+        )
+        simulator.enable_sleeping(1e-6, 1e-6, n_quiet_steps=n_quiet_steps)
+        simulator.finalize(lean_memory=lean_memory)
+        assert simulator._sleeping_islands.blocks[0].diagonal_inertia == lean_memory
+
+        run(simulator, n_quiet_steps - 1)
+        assert not any(simulator.is_asleep(rod) for rod in rods)
+        assert simulator.active_fraction == 1.0
+
+        run(simulator, 1)
+        assert [simulator.is_asleep(rod) for rod in rods] == [True, False, True]
+        assert_allclose(simulator.active_fraction, 1.0 / 3.0)
+
+    @pytest.mark.parametrize("energy_scale", [0.99, 1.01])
+    def test_diagonal_inertia_matches_full_inertia(self, energy_scale):
+        from elastica.modules.sleeping import (
+            _find_moving_islands,
+            _find_moving_islands_with_diagonal_inertia,
+        )
+
+        rng = np.random.default_rng(0)
+        n_elems = 6
+        inertia_diagonal = rng.random((3, n_elems))
+        inertia = np.zeros((3, 3, n_elems))
+        for i in range(3):
+            inertia[i, i] = inertia_diagonal[i]
+        omega = rng.standard_normal((3, n_elems))
+        dilatation = 1.0 + rng.random(n_elems)
+        kinetic_energy = 0.5 * np.sum(inertia_diagonal * omega**2 / dilatation)
+
+        island_quiet = []
+        for find_moving_islands, mass_second_moment_of_inertia in [
+            (_find_moving_islands, inertia),
+            (_find_moving_islands_with_diagonal_inertia, inertia_diagonal),
+        ]:
+            island_quiet.append(np.ones(1, dtype=np.bool_))
+            find_moving_islands(
+                np.zeros(1, dtype=np.int64),
+                np.zeros(1, dtype=np.int64),
+                np.zeros(1, dtype=np.int64),
+                np.full(1, n_elems + 1, dtype=np.int64),
+                np.zeros(1, dtype=np.int64),
+                np.full(1, n_elems, dtype=np.int64),
+                np.ones(n_elems + 1),
+                np.zeros((3, n_elems + 1)),
+                mass_second_moment_of_inertia,
+                omega,
+                dilatation,
+                np.float64(np.inf),
+                np.float64(np.inf),
+                np.float64(energy_scale * kinetic_energy),
+                island_quiet[-1],
+            )
+        assert island_quiet[0][0] == island_quiet[1][0] == (energy_scale > 1.0)
+
+    def test_systems_asleep_are_skipped(self):
+        # Rods asleep do not move, even under gravity, while the rods awake in
+        # between them evolve as if all rods were awake.
+        def make_simulator():
+            simulator = SleepingSimulator()
+            rods = [make_rod(float(i)) for i in range(5)]
+            for rod in rods:
+                simulator.append(rod)
+                simulator.add_forcing_to(rod).using(
+                    ea.GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+                )
+            simulator.enable_sleeping(1e-6, 1e-6)
+            simulator.finalize()
+            return simulator, rods
+
+        reference_simulator, reference_rods = make_simulator()
+        run(reference_simulator, 50)
+
+        simulator, rods = make_simulator()
+        asleep_rods = rods[0::2]
+        put_asleep(simulator, asleep_rods)
+        initial_positions = [rod.position_collection.copy() for rod in asleep_rods]
+        run(simulator, 50)
+
+        for rod, initial_position in zip(asleep_rods, initial_positions):
+            assert simulator.is_asleep(rod)
+            assert_allclose(rod.position_collection, initial_position)
+            assert_allclose(rod.velocity_collection, 0.0)
+        for rod, reference_rod in zip(rods[1::2], reference_rods[1::2]):
+            assert not simulator.is_asleep(rod)
+            assert_allclose(rod.position_collection, reference_rod.position_collection)
+            assert_allclose(rod.director_collection, reference_rod.director_collection)
+            assert_allclose(rod.velocity_collection, reference_rod.velocity_collection)
+
+    def test_change_of_forces_wakes_up_system(self):
+        simulator = SleepingSimulator()
+        rods = [make_rod(float(i)) for i in range(2)]
+        for rod in rods:
+            simulator.append(rod)
+        simulator.add_forcing_to(rods[0]).using(
+            DelayedForce, start_time=2e-3, force=np.array([1.0, 0.0, 0.0])
+        )
+        simulator.enable_sleeping(1e-6, 1e-6, n_quiet_steps=5)
+        simulator.finalize()
+
+        time = run(simulator, 10)
+        assert all(simulator.is_asleep(rod) for rod in rods)
+        assert simulator.active_fraction == 0.0
+
+        run(simulator, 15, time)
+        assert not simulator.is_asleep(rods[0])
+        assert simulator.is_asleep(rods[1])
+        assert np.abs(rods[0].velocity_collection).max() > 0.0
+
+    # Features finalize in the reverse order of the mixins.
+    @pytest.mark.parametrize(
+        "simulator_class", [SleepingSimulator, SleepingFirstSimulator]
+    )
+    def test_joint_connects_islands(self, simulator_class):
+        simulator = simulator_class()
+        rods = [make_rod(float(i)) for i in range(3)]
+        for rod in rods:
+            simulator.append(rod)
+        simulator.connect(rods[0], rods[1], -1, -1).using(ea.FreeJoint, k=0.0, nu=0.0)
+        simulator.enable_sleeping(1e-6, 1e-6, n_quiet_steps=1)
+        simulator.finalize()
+        run(simulator, 1)
+        assert all(simulator.is_asleep(rod) for rod in rods)
+
+        simulator.wake(rods[1])
+        assert not simulator.is_asleep(rods[0])
+        assert not simulator.is_asleep(rods[1])
+        assert simulator.is_asleep(rods[2])
+        assert_allclose(simulator.active_fraction, 2.0 / 3.0)
+
+    def test_rigid_bodies_sleep(self):
+        simulator = SleepingSimulator()
+        spheres = [
+            ea.Sphere(np.array([float(i), 0.0, 0.0]), 0.1, 1000.0) for i in range(3)
+        ]
+        for sphere in spheres:
+            simulator.append(sphere)
+        simulator.add_forcing_to(spheres[2]).using(
+            DelayedForce, start_time=1e-3, force=np.array([1.0, 0.0, 0.0])
+        )
+        simulator.enable_sleeping(1e-6, 1e-6, n_quiet_steps=2)
+        simulator.finalize()
+
+        time = run(simulator, 2)
+        assert all(simulator.is_asleep(sphere) for sphere in spheres)
+        initial_position = spheres[2].position_collection.copy()
+
+        run(simulator, 10, time)
+        assert simulator.is_asleep(spheres[0])
+        assert not simulator.is_asleep(spheres[2])
+        assert spheres[2].position_collection[0, 0] > initial_position[0, 0]
+
+    def test_snapshot_and_restore_sleeping_state(self):
+        simulator = SleepingSimulator()
+        rods = [make_rod(float(i)) for i in range(2)]
+        for rod in rods:
+            simulator.append(rod)
+        simulator.enable_sleeping(1e-6, 1e-6, n_quiet_steps=3)
+        simulator.finalize()
+
+        snapshot = simulator.snapshot()
+        run(simulator, 3)
+        assert all(simulator.is_asleep(rod) for rod in rods)
+
+        simulator.restore(snapshot)
+        assert not any(simulator.is_asleep(rod) for rod in rods)
+        assert simulator.active_fraction == 1.0
+        run(simulator, 2)
+        assert not any(simulator.is_asleep(rod) for rod in rods)
+        run(simulator, 1)
+        assert all(simulator.is_asleep(rod) for rod in rods)
@@ -1,5 +1,7 @@
 __doc__ = """Test restart functionality """
 
+import os
+
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -256,3 +258,412 @@ class TestRestartFunctionsWithFeaturesUsingRigidBodies:
                 test_value = getattr(test_cylinder, key)
 
                 assert_allclose(test_value, correct_value)
+
+
+class TestCheckpoint:
+    @staticmethod
+    def make_simulator(n_rods=3, n_cylinders=2):
+        simulator_class = GenericSimulatorClass()
+        systems = []
+        for k in range(n_rods):
+            rod = ea.CosseratRod.straight_rod(
+                n_elements=6 + k,
+                start=np.array([float(k), 0.0, 0.0]),
+                direction=np.array([0, 1, 0.0]),
+                normal=np.array([1, 0, 0.0]),
+                base_length=1,
+                base_radius=0.1,
+                density=1,
+                youngs_modulus=1e3,
+            )
+            simulator_class.append(rod)
+            systems.append(rod)
+        ring_rod = ea.CosseratRod.ring_rod(
+            n_elements=10,
+            ring_center_position=np.zeros((3)),
+            direction=np.array([0, 1, 0.0]),
+            normal=np.array([1, 0, 0.0]),
+            base_length=1,
+            base_radius=0.1,
+            density=1,
+            youngs_modulus=1e3,
+        )
+        simulator_class.append(ring_rod)
+        systems.append(ring_rod)
+        for _ in range(n_cylinders):
+            cylinder = ea.Cylinder(
+                start=np.zeros((3)),
+                direction=np.array([0, 1, 0.0]),
+                normal=np.array([1, 0, 0.0]),
+                base_length=1,
+                base_radius=1,
+                density=1,
+            )
+            simulator_class.append(cylinder)
+            systems.append(cylinder)
+        for system in systems:
+            simulator_class.add_forcing_to(system).using(
+                ea.GravityForces, acc_gravity=np.array([0.0, -9.81, 0.3])
+            )
+        simulator_class.finalize()
+        return simulator_class, systems
+
+    @staticmethod
+    def block_state(simulator_class, rest_state=False):
+        from elastica.restart import block_state_fields
+
+        return [
+            getattr(block, field).copy()
+            for block in simulator_class.block_systems()
+            for field in block_state_fields(block, rest_state)
+        ]
+
+    def test_save_and_load(self, tmp_path):
+        from elastica.restart import CHECKPOINT_ALIGNMENT, read_checkpoint_header
+
+        simulator_class, systems = self.make_simulator()
+        ea.integrate(ea.PositionVerlet(), simulator_class, 1e-2, 10)
+        state = self.block_state(simulator_class)
+        path = (tmp_path / "checkpoint.bin").as_posix()
+        ea.save_checkpoint(simulator_class, path, time=np.float64(1e-2))
+
+        header, data_offset = read_checkpoint_header(path)
+        assert data_offset % CHECKPOINT_ALIGNMENT == 0
+        assert {spec["name"] for spec in header["fields"]} == {
+            "position_collection",
+            "director_collection",
+            "velocity_collection",
+            "omega_collection",
+        }
+
+        ea.integrate(ea.PositionVerlet(), simulator_class, 1e-2, 10)
+        assert ea.load_checkpoint(simulator_class, path) == 1e-2
+        for loaded, saved in zip(self.block_state(simulator_class), state):
+            np.testing.assert_array_equal(loaded, saved)
+        # Systems are views of the memory blocks
+        np.testing.assert_array_equal(
+            systems[0].position_collection,
+            state[0][:, : systems[0].n_elems + 1],
+        )
+
+    def test_rest_state(self, tmp_path):
+        simulator_class, systems = self.make_simulator()
+        path = (tmp_path / "checkpoint.bin").as_posix()
+        systems[1].rest_kappa[0] = 0.5
+        ea.save_checkpoint(simulator_class, path, rest_state=True)
+        systems[1].rest_kappa[0] = 0.0
+        systems[1].rest_lengths *= 2.0
+        ea.load_checkpoint(simulator_class, path)
+        assert_allclose(systems[1].rest_kappa[0], 0.5)
+        assert_allclose(systems[1].rest_lengths, 1.0 / 7)
+
+    def test_restart_matches_full_simulation(self, tmp_path):
+        path = (tmp_path / "checkpoint.bin").as_posix()
+        simulator_class, _ = self.make_simulator()
+        time = ea.integrate(ea.PositionVerlet(), simulator_class, 0.05, 50)
+        ea.save_checkpoint(simulator_class, path, time)
+
+        simulator_class, _ = self.make_simulator()
+        restart_time = ea.load_checkpoint(simulator_class, path)
+        ea.integrate(
+            ea.PositionVerlet(),
+            simulator_class,
+            0.05,
+            50,
+            restart_time=restart_time,
+        )
+        restarted_state = self.block_state(simulator_class)
+
+        simulator_class, _ = self.make_simulator()
+        ea.integrate(ea.PositionVerlet(), simulator_class, 0.1, 100)
+        for restarted, full in zip(restarted_state, self.block_state(simulator_class)):
+            assert_allclose(restarted, full, rtol=1e-12, atol=1e-14)
+
+    @pytest.mark.parametrize("n_rods, n_cylinders", [(2, 2), (3, 1)])
+    def test_incompatible_simulator_throws(self, tmp_path, n_rods, n_cylinders):
+        path = (tmp_path / "checkpoint.bin").as_posix()
+        simulator_class, _ = self.make_simulator()
+        ea.save_checkpoint(simulator_class, path)
+
+        simulator_class, _ = self.make_simulator(n_rods, n_cylinders)
+        with pytest.raises(ValueError) as excinfo:
+            ea.load_checkpoint(simulator_class, path)
+        assert "incompatible" in str(excinfo.value)
+
+    def test_truncated_checkpoint_throws(self, tmp_path):
+        path = (tmp_path / "checkpoint.bin").as_posix()
+        simulator_class, _ = self.make_simulator()
+        ea.save_checkpoint(simulator_class, path)
+        with open(path, "rb") as file:
+            data = file.read()
+        with open(path, "wb") as file:
+            file.write(data[: len(data) // 2])
+
+        ea.integrate(ea.PositionVerlet(), simulator_class, 1e-2, 10)
+        state = self.block_state(simulator_class)
+        with pytest.raises(ValueError) as excinfo:
+            ea.load_checkpoint(simulator_class, path)
+        assert "truncated" in str(excinfo.value)
+        # Memory blocks are left untouched
+        for block_state, saved in zip(self.block_state(simulator_class), state):
+            np.testing.assert_array_equal(block_state, saved)
+
+    def test_not_a_checkpoint_throws(self, tmp_path):
+        path = (tmp_path / "checkpoint.bin").as_posix()
+        with open(path, "wb") as file:
+            file.write(b"\x00" * 64)
+        simulator_class, _ = self.make_simulator()
+        with pytest.raises(ValueError) as excinfo:
+            ea.load_checkpoint(simulator_class, path)
+        assert "not a checkpoint" in str(excinfo.value)
+
+
+class TestCheckpointer:
+    # Exactly representable time step
+    dt = 2.0**-10
+
+    def integrate(self, simulator_class, n_steps, restart_time=0.0, **kwargs):
+        return ea.integrate(
+            ea.PositionVerlet(),
+            simulator_class,
+            n_steps * self.dt,
+            n_steps,
+            restart_time=restart_time,
+            progress_bar=False,
+            **kwargs,
+        )
+
+    def test_periodic_checkpoints_keep_latest(self, tmp_path):
+        simulator_class, _ = TestCheckpoint.make_simulator()
+        checkpointer = ea.Checkpointer(str(tmp_path), every_n_steps=10, keep=2)
+        self.integrate(simulator_class, 45, checkpointer=checkpointer)
+        assert checkpointer.checkpoint_count == 4
+        assert [os.path.basename(path) for path in checkpointer.checkpoint_paths()] == [
+            "checkpoint_000000000030.bin",
+            "checkpoint_000000000040.bin",
+        ]
+        assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path))
+
+    def test_resume_matches_full_simulation(self, tmp_path):
+        simulator_class, _ = TestCheckpoint.make_simulator()
+        checkpointer = ea.Checkpointer(str(tmp_path), every_n_steps=20)
+        # Interrupted after the checkpoint on step 40
+        self.integrate(simulator_class, 50, checkpointer=checkpointer)
+
+        simulator_class, _ = TestCheckpoint.make_simulator()
+        restart_time = checkpointer.resume(simulator_class)
+        assert restart_time == 40 * self.dt
+        self.integrate(simulator_class, 60, restart_time, checkpointer=checkpointer)
+        # The interval is kept after resuming
+        assert os.path.basename(checkpointer.latest_checkpoint()) == (
+            "checkpoint_000000000100.bin"
+        )
+        resumed_state = TestCheckpoint.block_state(simulator_class)
+
+        simulator_class, _ = TestCheckpoint.make_simulator()
+        self.integrate(simulator_class, 100)
+        for resumed, full in zip(
+            resumed_state, TestCheckpoint.block_state(simulator_class)
+        ):
+            np.testing.assert_array_equal(resumed, full)
+
+    @pytest.mark.parametrize("truncated_length", ["half", "magic", "header"])
+    def test_resume_skips_invalid_checkpoints(self, tmp_path, caplog, truncated_length):
+        from elastica.restart import CHECKPOINT_MAGIC
+
+        simulator_class, _ = TestCheckpoint.make_simulator()
+        checkpointer = ea.Checkpointer(str(tmp_path), every_n_steps=10)
+        self.integrate(simulator_class, 20, checkpointer=checkpointer)
+        # Truncated copy of the newest checkpoint, e.g. from a node killed while
+        # copying files.
+        with open(checkpointer.latest_checkpoint(), "rb") as file:
+            data = file.read()
+        length = {
+            "half": len(data) // 2,
+            "magic": len(CHECKPOINT_MAGIC),
+            "header": len(CHECKPOINT_MAGIC) + 12,
+        }[truncated_length]
+        with open(os.path.join(tmp_path, "checkpoint_000000000030.bin"), "wb") as f:
+            f.write(data[:length])
+
+        simulator_class, _ = TestCheckpoint.make_simulator()
+        assert checkpointer.resume(simulator_class) == 20 * self.dt
+        assert "Skipping invalid checkpoint" in caplog.text
+
+    def test_resume_without_checkpoint(self, tmp_path):
+        simulator_class, _ = TestCheckpoint.make_simulator()
+        checkpointer = ea.Checkpointer(str(tmp_path), every_n_steps=10)
+        assert checkpointer.latest_checkpoint() is None
+        assert checkpointer.resume(simulator_class) == 0.0
+
+    def test_wall_time_interval(self, tmp_path):
+        simulator_class, _ = TestCheckpoint.make_simulator()
+        checkpointer = ea.Checkpointer(str(tmp_path), every_seconds=1e-9, keep=1)
+        self.integrate(simulator_class, 5, checkpointer=checkpointer)
+        assert checkpointer.checkpoint_count == 5
+        assert len(checkpointer.checkpoint_paths()) == 1
+
+    def test_write_error_is_raised(self, tmp_path, monkeypatch):
+        import elastica.restart
+
+        def failing_write(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(elastica.restart, "_write_checkpoint", failing_write)
+        simulator_class, _ = TestCheckpoint.make_simulator()
+        checkpointer = ea.Checkpointer(str(tmp_path), every_n_steps=5)
+        with pytest.raises(RuntimeError) as excinfo:
+            self.integrate(simulator_class, 20, checkpointer=checkpointer)
+        assert "failed to write" in str(excinfo.value)
+        assert isinstance(excinfo.value.__cause__, OSError)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"every_n_steps": 0},
+            {"every_seconds": -1.0},
+            {"every_n_steps": 1, "keep": 0},
+        ],
+    )
+    def test_invalid_arguments(self, tmp_path, kwargs):
+        with pytest.raises(AssertionError):
+            ea.Checkpointer(str(tmp_path), **kwargs)
+
+
+class FullSimulatorClass(
+    BaseSystemCollection,
+    Constraints,
+    Forcing,
+    Connections,
+    CallBacks,
+    ea.Damping,
+    ea.Contact,
+):
+    pass
+
+
+class TestSaveSimulator:
+    @staticmethod
+    def make_simulator():
+        simulator_class = FullSimulatorClass()
+        rods = ea.CosseratRod.straight_rods(
+            n_elements=8,
+            start=np.array([[0.0, 0.0, 0.0], [0.5, 0.0, 0.0]]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1e3,
+            youngs_modulus=1e6,
+        )
+        ring_rod = ea.CosseratRod.ring_rod(
+            n_elements=10,
+            ring_center_position=np.array([2.0, 0.0, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1e3,
+            youngs_modulus=1e6,
+        )
+        cylinder = ea.Cylinder(
+            start=np.array([0.0, 0.3, 0.0]),
+            direction=np.array([0.0, 0.0, 1.0]),
+            normal=np.array([1.0, 0.0, 0.0]),
+            base_length=1.0,
+            base_radius=0.2,
+            density=1e3,
+        )
+        for system in [*rods, ring_rod, cylinder]:
+            simulator_class.append(system)
+
+        simulator_class.constrain(rods[0]).using(
+            ea.OneEndFixedBC,
+            constrained_position_idx=(0,),
+            constrained_director_idx=(0,),
+        )
+        simulator_class.add_forcing_to_many([*rods, ring_rod]).using(
+            ea.GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+        )
+        simulator_class.dampen(rods[1]).using(
+            ea.AnalyticalLinearDamper, damping_constant=0.1, time_step=1e-4
+        )
+        simulator_class.dampen(ring_rod).using(
+            ea.LaplaceDissipationFilter, filter_order=2
+        )
+        simulator_class.connect(rods[0], rods[1], -1, 0).using(
+            ea.FixedJoint, k=1e2, nu=0.0, kt=1.0
+        )
+        simulator_class.detect_contact_between(rods[0], cylinder).using(
+            ea.RodCylinderContact, k=1e2, nu=0.0
+        )
+        simulator_class.detect_contact_between(rods[1], rods[0]).using(
+            ea.RodRodContact, k=1e2, nu=0.0
+        )
+        simulator_class.finalize()
+        return simulator_class
+
+    @staticmethod
+    def integrate(simulator_class, n_steps=50):
+        ea.integrate(
+            ea.PositionVerlet(),
+            simulator_class,
+            n_steps * 1e-4,
+            n_steps,
+            progress_bar=False,
+        )
+
+    @pytest.mark.parametrize("memory_map", [True, False])
+    def test_save_and_load(self, tmp_path, memory_map):
+        path = (tmp_path / "simulator.bin").as_posix()
+        simulator_class = self.make_simulator()
+        ea.save_simulator(simulator_class, path)
+        loaded = ea.load_simulator(path, memory_map=memory_map)
+
+        assert type(loaded) is FullSimulatorClass
+        assert loaded._finalize_flag
+        assert len(loaded) == len(simulator_class)
+        # Systems are still views of their memory blocks
+        rod_block = next(loaded.block_systems())
+        for rod in loaded[:2]:
+            assert np.shares_memory(
+                rod.position_collection, rod_block.position_collection
+            )
+            assert rod.position_collection.flags.writeable
+        assert loaded.get_system_index(loaded[1]) == 1
+
+        self.integrate(simulator_class)
+        self.integrate(loaded)
+        for system, loaded_system in zip(simulator_class, loaded):
+            np.testing.assert_array_equal(
+                loaded_system.position_collection, system.position_collection
+            )
+            np.testing.assert_array_equal(
+                loaded_system.director_collection, system.director_collection
+            )
+
+    def test_memory_mapped_file_is_not_modified(self, tmp_path):
+        path = (tmp_path / "simulator.bin").as_posix()
+        ea.save_simulator(self.make_simulator(), path)
+        with open(path, "rb") as file:
+            data = file.read()
+
+        loaded = ea.load_simulator(path)
+        self.integrate(loaded)
+        with open(path, "rb") as file:
+            assert file.read() == data
+
+    def test_not_finalized_throws(self, tmp_path):
+        with pytest.raises(AssertionError) as excinfo:
+            ea.save_simulator(
+                FullSimulatorClass(), (tmp_path / "simulator.bin").as_posix()
+            )
+        assert "finalized" in str(excinfo.value)
+
+    def test_not_a_simulator_file_throws(self, tmp_path):
+        path = (tmp_path / "simulator.bin").as_posix()
+        ea.save_checkpoint(TestCheckpoint.make_simulator()[0], path)
+        with pytest.raises(AssertionError) as excinfo:
+            ea.load_simulator(path)
+        assert "not a simulator file" in str(excinfo.value)
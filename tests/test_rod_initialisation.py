@@ -1310,3 +1310,105 @@ def test_straight_rod(n_elems, rng):
         )
     for i in range(n_elems - 1):
         assert_allclose(mockrod.bend_matrix[..., i], bend_matrix, atol=Tolerance.atol())
+
+
+def make_straight_rods_inputs(rng, n_rods):
+    directions = rng.standard_normal((n_rods, 3))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    normals = np.cross(directions, rng.standard_normal((n_rods, 3)))
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    return {
+        "n_elements": rng.randint(2, 30, n_rods),
+        "start": rng.standard_normal((n_rods, 3)),
+        "direction": directions,
+        "normal": normals,
+        "base_length": rng.uniform(0.5, 2.0, n_rods),
+        "base_radius": rng.uniform(0.01, 0.1, n_rods),
+        "density": rng.uniform(500.0, 2000.0, n_rods),
+        "youngs_modulus": rng.uniform(1e5, 1e7, n_rods),
+    }
+
+
+@pytest.mark.parametrize("n_rods", [1, 4])
+@pytest.mark.parametrize("shear_modulus", [None, 3e5])
+def test_straight_rods_same_as_straight_rod(n_rods, shear_modulus, rng):
+    inputs = make_straight_rods_inputs(rng, n_rods)
+    rods = ea.CosseratRod.straight_rods(**inputs, shear_modulus=shear_modulus)
+
+    assert len(rods) == n_rods
+    for k, rod in enumerate(rods):
+        reference_rod = ea.CosseratRod.straight_rod(
+            int(inputs["n_elements"][k]),
+            inputs["start"][k],
+            inputs["direction"][k],
+            inputs["normal"][k].copy(),
+            inputs["base_length"][k],
+            inputs["base_radius"][k],
+            inputs["density"][k],
+            youngs_modulus=inputs["youngs_modulus"][k],
+            shear_modulus=shear_modulus,
+        )
+        assert rod.n_elems == reference_rod.n_elems
+        # Material tensors of the rods are rebuilt from their diagonals
+        for name, value in reference_rod.__dict__.items():
+            if isinstance(value, np.ndarray) and name not in (
+                "ghost_elems_idx",
+                "ghost_voronoi_idx",
+            ):
+                assert getattr(rod, name).shape == value.shape, name
+                assert_allclose(
+                    getattr(rod, name),
+                    value,
+                    rtol=1e-12,
+                    atol=Tolerance.atol(),
+                    err_msg=name,
+                )
+
+
+def test_straight_rods_with_shared_parameters():
+    start = np.zeros((3, 3))
+    start[:, 0] = np.arange(3)
+    rods = ea.CosseratRod.straight_rods(
+        10,
+        start,
+        np.array([0.0, 0.0, 1.0]),
+        np.array([0.0, 1.0, 0.0]),
+        1.0,
+        0.1,
+        1000.0,
+        youngs_modulus=1e6,
+    )
+    for k, rod in enumerate(rods):
+        assert rod.n_elems == 10
+        assert_allclose(rod.position_collection[0], k)
+        assert_allclose(rod.position_collection[2], np.linspace(0.0, 1.0, 11))
+        assert_allclose(rod.radius, 0.1)
+        assert_allclose(rod.director_collection[1, 0], -1.0)
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("start", np.zeros(3)),
+        ("direction", np.zeros((2, 4))),
+        ("normal", np.array([0.0, 0.0, 1.0])),
+        ("base_length", np.array([1.0, 0.0])),
+        ("base_radius", np.array([0.1, -0.1])),
+        ("density", 0.0),
+        ("n_elements", 1),
+    ],
+)
+def test_straight_rods_invalid_inputs(name, value):
+    inputs = {
+        "n_elements": 5,
+        "start": np.zeros((2, 3)),
+        "direction": np.array([0.0, 0.0, 1.0]),
+        "normal": np.array([1.0, 0.0, 0.0]),
+        "base_length": 1.0,
+        "base_radius": 0.1,
+        "density": 1000.0,
+        "youngs_modulus": 1e6,
+    }
+    inputs[name] = value
+    with pytest.raises(AssertionError):
+        ea.CosseratRod.straight_rods(**inputs)
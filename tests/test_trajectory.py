@@ -0,0 +1,121 @@
+__doc__ = """ Test chunked trajectory files """
+import os
+import json
+import logging
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from elastica.trajectory import INDEX_FILENAME, TrajectoryReader, TrajectoryWriter
+
+
+def write_samples(writer, start, stop, n_nodes=7):
+    positions = []
+    for step in range(start, stop):
+        position = np.arange(3 * n_nodes, dtype=np.float64).reshape(3, n_nodes) + step
+        writer.append(time=0.1 * step, step=np.int64(step), position=position)
+        positions.append(position)
+    return np.array(positions)
+
+
+class TestTrajectory:
+    @pytest.mark.parametrize("chunk_size", [1, 4, 64])
+    def test_write_and_read(self, tmp_path, chunk_size):
+        with TrajectoryWriter(str(tmp_path), chunk_size=chunk_size) as writer:
+            positions = write_samples(writer, 0, 10)
+
+        reader = TrajectoryReader(str(tmp_path))
+        assert len(reader) == 10
+        assert "position" in reader
+        assert reader.fields["position"]["shape"] == [3, 7]
+        assert_array_equal(reader["position"], positions)
+        assert_array_equal(reader["step"], np.arange(10))
+        assert_array_equal(reader["time"], 0.1 * np.arange(10))
+
+    def test_read_window_and_nodes_without_copy(self, tmp_path):
+        with TrajectoryWriter(str(tmp_path), chunk_size=3) as writer:
+            positions = write_samples(writer, 0, 10)
+
+        reader = TrajectoryReader(str(tmp_path))
+        window = reader.read("position", slice(2, 8), slice(1, 5))
+        assert_array_equal(window, positions[2:8, :, 1:5])
+        assert isinstance(window, np.memmap)
+        assert not window.flags.writeable
+        assert_array_equal(reader.read("position", 4, 0), positions[4, :, 0])
+
+    def test_index_only_counts_flushed_chunks(self, tmp_path):
+        writer = TrajectoryWriter(str(tmp_path), chunk_size=4)
+        write_samples(writer, 0, 6)
+        assert len(TrajectoryReader(str(tmp_path))) == 4
+        writer.close()
+        assert len(TrajectoryReader(str(tmp_path))) == 6
+
+    def test_append(self, tmp_path):
+        with TrajectoryWriter(str(tmp_path), chunk_size=4) as writer:
+            positions = write_samples(writer, 0, 6)
+        with TrajectoryWriter(str(tmp_path), chunk_size=4, append=True) as writer:
+            positions = np.concatenate((positions, write_samples(writer, 6, 9)))
+
+        reader = TrajectoryReader(str(tmp_path))
+        assert_array_equal(reader["position"], positions)
+        assert_array_equal(reader["step"], np.arange(9))
+
+    def test_append_drops_samples_missing_from_index(self, tmp_path):
+        with TrajectoryWriter(str(tmp_path), chunk_size=2) as writer:
+            positions = write_samples(writer, 0, 4)
+        # Simulate a write interrupted before the index was updated.
+        with open(os.path.join(tmp_path, "position.bin"), "ab") as file:
+            file.write(b"\x00" * 10)
+
+        with TrajectoryWriter(str(tmp_path), chunk_size=2, append=True) as writer:
+            positions = np.concatenate((positions, write_samples(writer, 4, 6)))
+        assert_array_equal(TrajectoryReader(str(tmp_path))["position"], positions)
+
+    def test_append_with_different_fields_throws(self, tmp_path):
+        with TrajectoryWriter(str(tmp_path)) as writer:
+            write_samples(writer, 0, 2)
+        writer = TrajectoryWriter(str(tmp_path), append=True)
+        with pytest.raises(AssertionError) as excinfo:
+            write_samples(writer, 2, 3, n_nodes=8)
+        assert "do not match" in str(excinfo.value)
+
+    def test_overwrite(self, tmp_path, caplog):
+        with TrajectoryWriter(str(tmp_path)) as writer:
+            write_samples(writer, 0, 5)
+        with caplog.at_level(logging.WARNING):
+            with TrajectoryWriter(str(tmp_path)) as writer:
+                positions = write_samples(writer, 10, 12)
+        assert "overwritten" in caplog.text
+
+        reader = TrajectoryReader(str(tmp_path))
+        assert_array_equal(reader["position"], positions)
+
+    @pytest.mark.parametrize("append", [False, True])
+    def test_new_trajectory_truncates_files_without_index(self, tmp_path, append):
+        # Field files of a first chunk interrupted before the index was written.
+        with open(os.path.join(tmp_path, "position.bin"), "wb") as file:
+            file.write(b"\x00" * 100)
+
+        with TrajectoryWriter(str(tmp_path), chunk_size=2, append=append) as writer:
+            positions = write_samples(writer, 0, 3)
+        assert_array_equal(TrajectoryReader(str(tmp_path))["position"], positions)
+        assert os.path.getsize(os.path.join(tmp_path, "position.bin")) == 3 * 21 * 8
+
+    def test_empty_trajectory(self, tmp_path):
+        writer = TrajectoryWriter(str(tmp_path), chunk_size=4)
+        write_samples(writer, 0, 1)
+        writer._write_index()
+
+        reader = TrajectoryReader(str(tmp_path))
+        assert reader["position"].shape == (0, 3, 7)
+
+    def test_index_file(self, tmp_path):
+        with TrajectoryWriter(str(tmp_path), chunk_size=5) as writer:
+            write_samples(writer, 0, 3)
+        with open(os.path.join(tmp_path, INDEX_FILENAME)) as file:
+            index = json.load(file)
+        assert index["n_samples"] == 3
+        assert index["chunk_size"] == 5
+        assert index["fields"]["step"] == {"dtype": "<i8", "shape": []}
+        assert os.path.getsize(os.path.join(tmp_path, "position.bin")) == 3 * 21 * 8